@@ -23,6 +23,7 @@ from freqtrade.commands.deploy_commands import (
     start_install_ui,
     start_new_strategy,
 )
+from freqtrade.commands.freqai_commands import start_freqai_benchmark
 from freqtrade.commands.hyperopt_commands import start_hyperopt_list, start_hyperopt_show
 from freqtrade.commands.list_commands import (
     start_list_exchanges,
@@ -43,5 +44,5 @@ from freqtrade.commands.optimize_commands import (
 from freqtrade.commands.pairlist_commands import start_test_pairlist
 from freqtrade.commands.plot_commands import start_plot_dataframe, start_plot_profit
 from freqtrade.commands.strategy_utils_commands import start_strategy_update
-from freqtrade.commands.trade_commands import start_trading
+from freqtrade.commands.trade_commands import start_market_data_sidecar, start_trading
 from freqtrade.commands.webserver_commands import start_webserver
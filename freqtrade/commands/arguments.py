@@ -244,9 +244,23 @@ ARGS_LOOKAHEAD_ANALYSIS = [
     for a in ARGS_BACKTEST
     if a
     not in ("position_stacking", "use_max_market_positions", "backtest_cache", "backtest_breakdown")
-] + ["minimum_trade_amount", "targeted_trade_amount", "lookahead_analysis_exportfilename"]
+] + [
+    "minimum_trade_amount",
+    "targeted_trade_amount",
+    "lookahead_analysis_exportfilename",
+    "analysis_jobs",
+]
+
+ARGS_RECURSIVE_ANALYSIS = [
+    "timeframe",
+    "timerange",
+    "dataformat_ohlcv",
+    "pairs",
+    "startup_candle",
+    "analysis_jobs",
+]
 
-ARGS_RECURSIVE_ANALYSIS = ["timeframe", "timerange", "dataformat_ohlcv", "pairs", "startup_candle"]
+ARGS_FREQAI_BENCHMARK = ["timeframe", "freqai_benchmark_pairs", "freqai_benchmark_candles"]
 
 # Command level configs - keep at the bottom of the above definitions
 NO_CONF_REQURIED = [
@@ -358,6 +372,7 @@ class Arguments:
             start_create_userdir,
             start_download_data,
             start_edge,
+            start_freqai_benchmark,
             start_hyperopt,
             start_hyperopt_list,
             start_hyperopt_show,
@@ -369,6 +384,7 @@ class Arguments:
             start_list_strategies,
             start_list_timeframes,
             start_lookahead_analysis,
+            start_market_data_sidecar,
             start_new_config,
             start_new_strategy,
             start_plot_dataframe,
@@ -396,6 +412,14 @@ class Arguments:
         trade_cmd.set_defaults(func=start_trading)
         self._build_args(optionlist=ARGS_TRADE, parser=trade_cmd)
 
+        # Add market-data-sidecar subcommand
+        market_data_sidecar_cmd = subparsers.add_parser(
+            "market-data-sidecar",
+            help="Share market data and the exchange rate limit between bots on this host.",
+            parents=[_common_parser],
+        )
+        market_data_sidecar_cmd.set_defaults(func=start_market_data_sidecar)
+
         # add create-userdir subcommand
         create_userdir_cmd = subparsers.add_parser(
             "create-userdir",
@@ -670,3 +694,13 @@ class Arguments:
         recursive_analayis_cmd.set_defaults(func=start_recursive_analysis)
 
         self._build_args(optionlist=ARGS_RECURSIVE_ANALYSIS, parser=recursive_analayis_cmd)
+
+        # Add freqai_benchmark subcommand
+        freqai_benchmark_cmd = subparsers.add_parser(
+            "freqai-benchmark",
+            help="Benchmark FreqAI training and inference on synthetic data.",
+            parents=[_common_parser, _strategy_parser],
+        )
+        freqai_benchmark_cmd.set_defaults(func=start_freqai_benchmark)
+
+        self._build_args(optionlist=ARGS_FREQAI_BENCHMARK, parser=freqai_benchmark_cmd)
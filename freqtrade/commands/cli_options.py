@@ -755,6 +755,21 @@ AVAILABLE_CLI_OPTIONS = {
     "freqai_backtest_live_models": Arg(
         "--freqai-backtest-live-models", help="Run backtest with ready models.", action="store_true"
     ),
+    "freqai_benchmark_pairs": Arg(
+        "--benchmark-pairs",
+        help="Number of synthetic pairs to benchmark FreqAI on (default: `%(default)s`).",
+        type=check_int_positive,
+        metavar="INT",
+        default=1,
+    ),
+    "freqai_benchmark_candles": Arg(
+        "--benchmark-candles",
+        help="Number of synthetic candles per pair in the base timeframe "
+        "(default: `%(default)s`).",
+        type=check_int_positive,
+        metavar="INT",
+        default=10000,
+    ),
     "minimum_trade_amount": Arg(
         "--minimum-trade-amount",
         help="Minimum trade amount for lookahead-analysis",
@@ -777,6 +792,16 @@ AVAILABLE_CLI_OPTIONS = {
         help="Specify startup candles to be checked (`199`, `499`, `999`, `1999`).",
         nargs="+",
     ),
+    "analysis_jobs": Arg(
+        "-j",
+        "--job-workers",
+        help="The number of concurrently running backtests for the analysis "
+        "(worker processes). "
+        "If -1, all CPUs are used, for -2, all CPUs but one are used, etc. "
+        "If 1 (default) is given, no parallel computing code is used at all.",
+        type=int,
+        metavar="JOBS",
+    ),
     "show_sensitive": Arg(
         "--show-sensitive",
         help="Show secrets in the output.",
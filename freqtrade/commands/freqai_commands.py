@@ -0,0 +1,22 @@
+import logging
+from typing import Any, Dict
+
+from freqtrade.configuration import setup_utils_configuration
+from freqtrade.enums import RunMode
+
+
+logger = logging.getLogger(__name__)
+
+
+def start_freqai_benchmark(args: Dict[str, Any]) -> None:
+    """
+    Benchmark FreqAI training and inference on synthetic data
+    :param args: Cli args from Arguments()
+    :return: None
+    """
+    from freqtrade.freqai.benchmark import FreqaiBenchmark
+
+    config = setup_utils_configuration(args, RunMode.UTIL_NO_EXCHANGE)
+    benchmark = FreqaiBenchmark(config)
+    benchmark.start()
+    benchmark.print_results()
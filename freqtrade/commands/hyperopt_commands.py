@@ -31,8 +31,8 @@ def start_hyperopt_list(args: Dict[str, Any]) -> None:
         config["user_data_dir"] / "hyperopt_results", config.get("hyperoptexportfilename")
     )
 
-    # Previous evaluations
-    epochs, total_epochs = HyperoptTools.load_filtered_results(results_file, config)
+    # Previous evaluations - listing and filtering only needs the epoch index
+    epochs, total_epochs = HyperoptTools.load_filtered_index(results_file, config)
 
     if not export_csv:
         try:
@@ -49,12 +49,14 @@ def start_hyperopt_list(args: Dict[str, Any]) -> None:
             print("User interrupted..")
 
     if epochs and not no_details:
-        sorted_epochs = sorted(epochs, key=itemgetter("loss"))
-        results = sorted_epochs[0]
+        best = min(epochs, key=itemgetter("loss"))
+        results = HyperoptTools.load_epochs(results_file, [best])[0]
         HyperoptTools.show_epoch_details(results, total_epochs, print_json, no_header)
 
     if epochs and export_csv:
-        HyperoptTools.export_csv_file(config, epochs, export_csv)
+        HyperoptTools.export_csv_file(
+            config, HyperoptTools.load_epochs(results_file, epochs), export_csv
+        )
 
 
 def start_hyperopt_show(args: Dict[str, Any]) -> None:
@@ -74,7 +76,7 @@ def start_hyperopt_show(args: Dict[str, Any]) -> None:
     n = config.get("hyperopt_show_index", -1)
 
     # Previous evaluations
-    epochs, total_epochs = HyperoptTools.load_filtered_results(results_file, config)
+    epochs, total_epochs = HyperoptTools.load_filtered_index(results_file, config)
 
     filtered_epochs = len(epochs)
 
@@ -92,17 +94,19 @@ def start_hyperopt_show(args: Dict[str, Any]) -> None:
         n -= 1
 
     if epochs:
-        val = epochs[n]
+        val = HyperoptTools.load_epochs(results_file, [epochs[n]])[0]
 
         metrics = val["results_metrics"]
         if "strategy_name" in metrics:
             strategy_name = metrics["strategy_name"]
-            show_backtest_result(
-                strategy_name,
-                metrics,
-                metrics["stake_currency"],
-                config.get("backtest_breakdown", []),
-            )
+            if "results_per_pair" in metrics:
+                # Epochs which never became the best epoch only have lean statistics.
+                show_backtest_result(
+                    strategy_name,
+                    metrics,
+                    metrics["stake_currency"],
+                    config.get("backtest_breakdown", []),
+                )
 
             HyperoptTools.try_export_params(config, strategy_name, val)
 
@@ -28,3 +28,36 @@ def start_trading(args: Dict[str, Any]) -> int:
             logger.info("worker found ... calling exit")
             worker.exit()
     return 0
+
+
+def start_market_data_sidecar(args: Dict[str, Any]) -> int:
+    """
+    Serve market data and the shared rate limit to all bots on this host
+    """
+    from freqtrade.configuration import setup_utils_configuration
+    from freqtrade.enums import RunMode
+    from freqtrade.exchange.market_data_sidecar import MarketDataSidecar, default_socket_path
+    from freqtrade.resolvers import ExchangeResolver
+
+    def term_handler(signum, frame):
+        # Raise KeyboardInterrupt - so we can handle it in the same way as Ctrl-C
+        raise KeyboardInterrupt()
+
+    config = setup_utils_configuration(args, RunMode.UTIL_EXCHANGE)
+    # The sidecar itself talks to the exchange directly
+    sidecar_conf = config["exchange"].pop("market_data_sidecar", {})
+    exchange = ExchangeResolver.load_exchange(config, validate=False)
+    sidecar = MarketDataSidecar(
+        exchange,
+        sidecar_conf.get("socket")
+        or default_socket_path(config["exchange"]["name"], exchange.trading_mode),
+    )
+    try:
+        signal.signal(signal.SIGTERM, term_handler)
+        sidecar.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("SIGINT received, stopping market data sidecar.")
+    finally:
+        sidecar.stop()
+        exchange.close()
+    return 0
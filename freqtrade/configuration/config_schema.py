@@ -13,6 +13,8 @@ from freqtrade.constants import (
     ORDERTYPE_POSSIBILITIES,
     PRICING_SIDES,
     REQUIRED_ORDERTIF,
+    SQLITE_JOURNAL_MODES,
+    SQLITE_SYNCHRONOUS_LEVELS,
     STOPLOSS_PRICE_TYPES,
     SUPPORTED_FIAT,
     TELEGRAM_SETTING_OPTIONS,
@@ -201,6 +203,14 @@ CONF_SCHEMA = {
             "uniqueItems": True,
             "default": [199, 399, 499, 999, 1999],
         },
+        "analysis_jobs": {
+            "description": (
+                "Number of worker processes for lookahead and recursive analysis backtests. "
+                "-1 uses all CPUs, 1 disables parallel jobs."
+            ),
+            "type": "integer",
+            "default": 1,
+        },
         "liquidation_buffer": {
             "description": "Buffer ratio for liquidation.",
             "type": "number",
@@ -709,6 +719,27 @@ CONF_SCHEMA = {
             "description": "Database connection URL.",
             "type": "string",
         },
+        "db_options": {
+            "description": "Database tuning options.",
+            "type": "object",
+            "properties": {
+                "sqlite_journal_mode": {
+                    "description": "SQLite journal mode. `WAL` avoids blocking readers on writes.",
+                    "type": "string",
+                    "enum": SQLITE_JOURNAL_MODES,
+                },
+                "sqlite_synchronous": {
+                    "description": "SQLite synchronous level (how often SQLite syncs to disk).",
+                    "type": "string",
+                    "enum": SQLITE_SYNCHRONOUS_LEVELS,
+                },
+                "batch_commits": {
+                    "description": "Commit database changes once per bot loop phase.",
+                    "type": "boolean",
+                    "default": False,
+                },
+            },
+        },
         "export": {
             "description": "Type of data to export.",
             "type": "string",
@@ -749,6 +780,23 @@ CONF_SCHEMA = {
                     "description": "Enable systemd notify.",
                     "type": "boolean",
                 },
+                "candle_close_scheduling": {
+                    "description": (
+                        "Run the full bot iteration once per candle, right after candle close. "
+                        "Open orders are managed in between."
+                    ),
+                    "type": "boolean",
+                    "default": False,
+                },
+                "candle_close_offset": {
+                    "description": (
+                        "Seconds to wait after candle close before refreshing candles, "
+                        "to allow for exchange delays."
+                    ),
+                    "type": "number",
+                    "minimum": 0,
+                    "default": 1,
+                },
             },
         },
         "dataformat_ohlcv": {
@@ -899,6 +947,36 @@ CONF_SCHEMA = {
                     "description": "CCXT asynchronous configuration settings.",
                     "type": "object",
                 },
+                "market_data_sidecar": {
+                    "description": (
+                        "Share markets, tickers, candles and the rate limit with other bots "
+                        "on this host through a market data sidecar."
+                    ),
+                    "type": "object",
+                    "properties": {
+                        "enabled": {
+                            "description": "Use the market data sidecar.",
+                            "type": "boolean",
+                            "default": False,
+                        },
+                        "socket": {
+                            "description": (
+                                "Path of the sidecar's unix socket. Its directory must only be "
+                                "accessible by the current user. Defaults to a per-user "
+                                "directory in the temp directory."
+                            ),
+                            "type": "string",
+                        },
+                        "shared_rate_limit": {
+                            "description": (
+                                "Throttle all requests to the exchange through the sidecar's "
+                                "shared rate limiter."
+                            ),
+                            "type": "boolean",
+                            "default": True,
+                        },
+                    },
+                },
             },
             "required": ["name"],
         },
@@ -1023,6 +1101,15 @@ CONF_SCHEMA = {
                     "type": ["boolean", "number"],
                     "default": 2,
                 },
+                "model_cache_size_mb": {
+                    "description": (
+                        "Maximum memory (in MB) used to keep loaded models, pipelines and "
+                        "metadata in memory. 0 disables the cache."
+                    ),
+                    "type": "number",
+                    "minimum": 0,
+                    "default": 512,
+                },
                 "conv_width": {
                     "description": "The width of a neural network input tensor.",
                     "type": "integer",
@@ -418,6 +418,7 @@ class Configuration:
             ("minimum_trade_amount", "Minimum Trade amount: {}"),
             ("lookahead_analysis_exportfilename", "Path to store lookahead-analysis-results: {}"),
             ("startup_candle", "Startup candle to be used on recursive analysis: {}"),
+            ("analysis_jobs", "Number of parallel jobs for lookahead / recursive analysis: {}"),
         ]
         self._args_to_config_loop(config, configurations)
 
@@ -448,6 +449,18 @@ class Configuration:
             config, argname="freqaimodel_path", logstring="Using freqaimodel path: {}"
         )
 
+        self._args_to_config(
+            config,
+            argname="freqai_benchmark_pairs",
+            logstring="Benchmarking FreqAI on {} synthetic pairs ...",
+        )
+
+        self._args_to_config(
+            config,
+            argname="freqai_benchmark_candles",
+            logstring="Benchmarking FreqAI on {} synthetic candles per pair ...",
+        )
+
         return
 
     def _args_to_config(
@@ -18,6 +18,8 @@ TIMEOUT_UNITS = ["minutes", "seconds"]
 EXPORT_OPTIONS = ["none", "trades", "signals"]
 DEFAULT_DB_PROD_URL = "sqlite:///tradesv3.sqlite"
 DEFAULT_DB_DRYRUN_URL = "sqlite:///tradesv3.dryrun.sqlite"
+SQLITE_JOURNAL_MODES = ["DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"]
+SQLITE_SYNCHRONOUS_LEVELS = ["OFF", "NORMAL", "FULL", "EXTRA"]
 UNLIMITED_STAKE_AMOUNT = "unlimited"
 DEFAULT_AMOUNT_RESERVE_PERCENT = 0.05
 REQUIRED_ORDERTIF = ["entry", "exit"]
@@ -16,6 +16,14 @@ from freqtrade.exceptions import ConfigurationError, OperationalException
 from freqtrade.ft_types import BacktestHistoryEntryType, BacktestResultType
 from freqtrade.misc import file_dump_json, json_load
 from freqtrade.optimize.backtest_caching import get_backtest_metadata_filename
+from freqtrade.optimize.backtest_result_container import (
+    BT_CONTAINER_SUFFIX,
+    get_container_strategies,
+    load_backtest_container,
+    load_container_comparison,
+    load_container_strategy,
+    load_container_trades,
+)
 from freqtrade.persistence import LocalTrade, Trade, init_db
 
 
@@ -154,21 +162,47 @@ def load_backtest_metadata(filename: Union[Path, str]) -> Dict[str, Any]:
         raise OperationalException("Unexpected error while loading backtest metadata.") from e
 
 
-def load_backtest_stats(filename: Union[Path, str]) -> BacktestResultType:
+def _resolve_backtest_filename(filename: Union[Path, str]) -> Path:
     """
-    Load backtest statistics file.
-    :param filename: pathlib.Path object, or string pointing to the file.
-    :return: a dictionary containing the resulting file.
+    Resolve a backtest result directory to its latest result.
+    Falls back to the zip container for json filenames of results stored as zip.
+    :raise: ValueError if the file does not exist.
     """
-    if isinstance(filename, str):
-        filename = Path(filename)
+    filename = Path(filename)
     if filename.is_dir():
         filename = filename / get_latest_backtest_filename(filename)
+    if not filename.is_file() and filename.with_suffix(BT_CONTAINER_SUFFIX).is_file():
+        filename = filename.with_suffix(BT_CONTAINER_SUFFIX)
     if not filename.is_file():
         raise ValueError(f"File {filename} does not exist.")
+    return filename
+
+
+def get_backtest_result_file(directory: Path, name: str) -> Path:
+    """
+    Get the backtest result file for a result name (filename without suffix).
+    Prefers the zip container over a (legacy) json file.
+    """
+    filename = (directory / name).with_suffix(BT_CONTAINER_SUFFIX)
+    if filename.is_file():
+        return filename
+    return filename.with_suffix(".json")
+
+
+def load_backtest_stats(filename: Union[Path, str]) -> BacktestResultType:
+    """
+    Load backtest statistics file.
+    :param filename: pathlib.Path object, or string pointing to the file.
+    :return: a dictionary containing the resulting file.
+    """
+    filename = _resolve_backtest_filename(filename)
     logger.info(f"Loading backtest result from {filename}")
-    with filename.open() as file:
-        data = json_load(file)
+    data: Any
+    if filename.suffix == BT_CONTAINER_SUFFIX:
+        data = load_backtest_container(filename)
+    else:
+        with filename.open() as file:
+            data = json_load(file)
 
     # Legacy list format does not contain metadata.
     if isinstance(data, dict):
@@ -183,12 +217,18 @@ def load_and_merge_backtest_result(strategy_name: str, filename: Path, results:
     :param filename: Backtest-result-filename to load
     :param results: dict to merge the result to.
     """
-    bt_data = load_backtest_stats(filename)
-    k: Literal["metadata", "strategy"]
-    for k in ("metadata", "strategy"):
-        results[k][strategy_name] = bt_data[k][strategy_name]
+    if filename.suffix == BT_CONTAINER_SUFFIX:
+        # Only load this strategy from the container.
+        results["metadata"][strategy_name] = load_backtest_metadata(filename)[strategy_name]
+        results["strategy"][strategy_name] = load_container_strategy(filename, strategy_name)
+        comparison = load_container_comparison(filename)
+    else:
+        bt_data = load_backtest_stats(filename)
+        k: Literal["metadata", "strategy"]
+        for k in ("metadata", "strategy"):
+            results[k][strategy_name] = bt_data[k][strategy_name]
+        comparison = bt_data["strategy_comparison"]
     results["metadata"][strategy_name]["filename"] = filename.stem
-    comparison = bt_data["strategy_comparison"]
     for i in range(len(comparison)):
         if comparison[i]["key"] == strategy_name:
             results["strategy_comparison"].append(comparison[i])
@@ -197,7 +237,13 @@ def load_and_merge_backtest_result(strategy_name: str, filename: Path, results:
 
 def _get_backtest_files(dirname: Path) -> List[Path]:
     # Weird glob expression here avoids including .meta.json files.
-    return list(reversed(sorted(dirname.glob("backtest-result-*-[0-9][0-9].json"))))
+    return sorted(
+        [
+            *dirname.glob("backtest-result-*-[0-9][0-9].json"),
+            *dirname.glob(f"backtest-result-*-[0-9][0-9]{BT_CONTAINER_SUFFIX}"),
+        ],
+        reverse=True,
+    )
 
 
 def _extract_backtest_result(filename: Path) -> List[BacktestHistoryEntryType]:
@@ -353,6 +399,23 @@ def load_backtest_data(filename: Union[Path, str], strategy: Optional[str] = Non
     :return: a dataframe with the analysis results
     :raise: ValueError if loading goes wrong.
     """
+    filename = _resolve_backtest_filename(filename)
+    if filename.suffix == BT_CONTAINER_SUFFIX:
+        # Only load the trades of this strategy
+        if not strategy:
+            strategies = get_container_strategies(filename)
+            if len(strategies) != 1:
+                raise ValueError(
+                    "Detected backtest result with more than one strategy. "
+                    "Please specify a strategy."
+                )
+            strategy = strategies[0]
+        df = pd.DataFrame(load_container_trades(filename, strategy))
+        if not df.empty:
+            df = _load_backtest_data_df_compatibility(df)
+            df = df.sort_values("open_date").reset_index(drop=True)
+        return df
+
     data = load_backtest_stats(filename)
     if not isinstance(data, list):
         # new, nested format
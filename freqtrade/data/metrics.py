@@ -2,6 +2,7 @@ import logging
 import math
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
 from typing import Dict, Tuple
 
 import numpy as np
@@ -114,25 +115,202 @@ def create_cum_profit(
     return df
 
 
-def _calc_drawdown_series(
-    profit_results: pd.DataFrame, *, date_col: str, value_col: str, starting_balance: float
-) -> pd.DataFrame:
-    max_drawdown_df = pd.DataFrame()
-    max_drawdown_df["cumulative"] = profit_results[value_col].cumsum()
-    max_drawdown_df["high_value"] = max_drawdown_df["cumulative"].cummax()
-    max_drawdown_df["drawdown"] = max_drawdown_df["cumulative"] - max_drawdown_df["high_value"]
-    max_drawdown_df["date"] = profit_results.loc[:, date_col]
-    if starting_balance:
-        cumulative_balance = starting_balance + max_drawdown_df["cumulative"]
-        max_balance = starting_balance + max_drawdown_df["high_value"]
-        max_drawdown_df["drawdown_relative"] = (max_balance - cumulative_balance) / max_balance
-    else:
-        # NOTE: This is not completely accurate,
-        # but might good enough if starting_balance is not available
-        max_drawdown_df["drawdown_relative"] = (
-            max_drawdown_df["high_value"] - max_drawdown_df["cumulative"]
-        ) / max_drawdown_df["high_value"]
-    return max_drawdown_df
+@dataclass()
+class DrawDownResult:
+    drawdown_abs: float = 0.0
+    high_date: pd.Timestamp = None
+    low_date: pd.Timestamp = None
+    high_value: float = 0.0
+    low_value: float = 0.0
+    relative_account_drawdown: float = 0.0
+
+
+class TradeMetrics:
+    """
+    Metrics kernel for a set of trades.
+    Extracts the trade columns to numpy arrays once, sorts them by date once
+    and shares the resulting drawdown series between all drawdown based metrics.
+    Use one instance to calculate multiple metrics for the same trades.
+    """
+
+    def __init__(
+        self,
+        trades: pd.DataFrame,
+        *,
+        date_col: str = "close_date",
+        value_col: str = "profit_abs",
+        starting_balance: float = 0.0,
+    ) -> None:
+        """
+        :param trades: DataFrame containing trades (requires columns date_col, value_col
+                       and profit_abs)
+        :param date_col: Column in DataFrame to use for dates (defaults to 'close_date')
+        :param value_col: Column in DataFrame to use for drawdown values
+                          (defaults to 'profit_abs')
+        :param starting_balance: Portfolio starting balance
+        """
+        self._trades = trades
+        self._date_col = date_col
+        self._value_col = value_col
+        self.starting_balance = starting_balance
+        self.trade_count = len(trades)
+
+    @cached_property
+    def profit_abs(self) -> np.ndarray:
+        return self._trades["profit_abs"].to_numpy(dtype=np.float64)
+
+    @cached_property
+    def _sorted_dates(self) -> pd.Series:
+        """Dates sorted - in the same (unstable) order as DataFrame.sort_values()"""
+        return self._trades[self._date_col].reset_index(drop=True).sort_values()
+
+    @cached_property
+    def _drawdown_series(self) -> Dict[str, np.ndarray]:
+        if self.trade_count == 0:
+            raise ValueError("Trade dataframe empty.")
+        order = self._sorted_dates.index.to_numpy()
+        cumulative = np.cumsum(self._trades[self._value_col].to_numpy(dtype=np.float64)[order])
+        high_value = np.maximum.accumulate(cumulative)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if self.starting_balance:
+                max_balance = self.starting_balance + high_value
+                drawdown_relative = (
+                    max_balance - (self.starting_balance + cumulative)
+                ) / max_balance
+            else:
+                # NOTE: This is not completely accurate,
+                # but might good enough if starting_balance is not available
+                drawdown_relative = (high_value - cumulative) / high_value
+        return {
+            "cumulative": cumulative,
+            "high_value": high_value,
+            "drawdown": cumulative - high_value,
+            "drawdown_relative": drawdown_relative,
+        }
+
+    def underwater(self) -> pd.DataFrame:
+        """
+        Drawdown series of the trades, sorted by date.
+        :raise: ValueError if trade-dataframe was found empty.
+        """
+        series = self._drawdown_series
+        return pd.DataFrame(
+            {
+                "cumulative": series["cumulative"],
+                "high_value": series["high_value"],
+                "drawdown": series["drawdown"],
+                "date": self._sorted_dates.reset_index(drop=True),
+                "drawdown_relative": series["drawdown_relative"],
+            }
+        )
+
+    def max_drawdown(self, relative: bool = False) -> DrawDownResult:
+        """
+        Max drawdown and the corresponding dates.
+        :param relative: Use the max relative drawdown instead of the max absolute drawdown
+        :raise: ValueError if trade-dataframe was found empty or has no drawdown.
+        """
+        series = self._drawdown_series
+        if relative:
+            drawdown_relative = series["drawdown_relative"]
+            idxmin = (
+                0 if np.isnan(drawdown_relative).all() else int(np.nanargmax(drawdown_relative))
+            )
+        else:
+            idxmin = int(np.argmin(series["drawdown"]))
+        if idxmin == 0:
+            raise ValueError("No losing trade, therefore no drawdown.")
+        high_idx = int(np.argmax(series["high_value"][:idxmin]))
+        dates = self._sorted_dates
+        return DrawDownResult(
+            drawdown_abs=abs(series["drawdown"][idxmin]),
+            high_date=dates.iloc[high_idx],
+            low_date=dates.iloc[idxmin],
+            high_value=series["cumulative"][high_idx],
+            low_value=series["cumulative"][idxmin],
+            relative_account_drawdown=series["drawdown_relative"][idxmin],
+        )
+
+    def expectancy(self) -> Tuple[float, float]:
+        """
+        :return: expectancy, expectancy_ratio
+        """
+        expectancy = 0
+        expectancy_ratio = 100
+
+        if self.trade_count > 0:
+            profit_abs = self.profit_abs
+            winning = profit_abs[profit_abs > 0]
+            losing = profit_abs[profit_abs < 0]
+            nb_win_trades = len(winning)
+            nb_loss_trades = len(losing)
+
+            average_win = (winning.sum() / nb_win_trades) if nb_win_trades > 0 else 0
+            average_loss = (abs(losing.sum()) / nb_loss_trades) if nb_loss_trades > 0 else 0
+            winrate = nb_win_trades / self.trade_count
+            loserate = nb_loss_trades / self.trade_count
+
+            expectancy = (winrate * average_win) - (loserate * average_loss)
+            if average_loss > 0:
+                risk_reward_ratio = average_win / average_loss
+                expectancy_ratio = ((1 + risk_reward_ratio) * winrate) - 1
+
+        return expectancy, expectancy_ratio
+
+    def _no_period(self, min_date: datetime, max_date: datetime) -> bool:
+        return self.trade_count == 0 or min_date is None or max_date is None or min_date == max_date
+
+    def sortino(self, min_date: datetime, max_date: datetime) -> float:
+        if self._no_period(min_date, max_date):
+            return 0
+
+        total_profit = self.profit_abs / self.starting_balance
+        days_period = max(1, (max_date - min_date).days)
+
+        expected_returns_mean = total_profit.sum() / days_period
+        losses = total_profit[self.profit_abs < 0]
+        down_stdev = np.std(losses) if len(losses) else np.nan
+
+        if down_stdev != 0 and not np.isnan(down_stdev):
+            return expected_returns_mean / down_stdev * np.sqrt(365)
+        # Define high (negative) sortino ratio to be clear that this is NOT optimal.
+        return -100
+
+    def sharpe(self, min_date: datetime, max_date: datetime) -> float:
+        if self._no_period(min_date, max_date):
+            return 0
+
+        total_profit = self.profit_abs / self.starting_balance
+        days_period = max(1, (max_date - min_date).days)
+
+        expected_returns_mean = total_profit.sum() / days_period
+        up_stdev = np.std(total_profit)
+
+        if up_stdev != 0:
+            return expected_returns_mean / up_stdev * np.sqrt(365)
+        # Define high (negative) sharpe ratio to be clear that this is NOT optimal.
+        return -100
+
+    def calmar(self, min_date: datetime, max_date: datetime) -> float:
+        if self._no_period(min_date, max_date):
+            return 0
+
+        total_profit = self.profit_abs.sum() / self.starting_balance
+        days_period = max(1, (max_date - min_date).days)
+
+        # adding slippage of 0.1% per trade
+        # total_profit = total_profit - 0.0005
+        expected_returns_mean = total_profit / days_period * 100
+
+        try:
+            max_drawdown = self.max_drawdown().relative_account_drawdown
+        except ValueError:
+            max_drawdown = 0
+
+        if max_drawdown != 0:
+            return expected_returns_mean / max_drawdown * math.sqrt(365)
+        # Define high (negative) calmar ratio to be clear that this is NOT optimal.
+        return -100
 
 
 def calculate_underwater(
@@ -151,24 +329,9 @@ def calculate_underwater(
              high and low time and high and low value.
     :raise: ValueError if trade-dataframe was found empty.
     """
-    if len(trades) == 0:
-        raise ValueError("Trade dataframe empty.")
-    profit_results = trades.sort_values(date_col).reset_index(drop=True)
-    max_drawdown_df = _calc_drawdown_series(
-        profit_results, date_col=date_col, value_col=value_col, starting_balance=starting_balance
-    )
-
-    return max_drawdown_df
-
-
-@dataclass()
-class DrawDownResult:
-    drawdown_abs: float = 0.0
-    high_date: pd.Timestamp = None
-    low_date: pd.Timestamp = None
-    high_value: float = 0.0
-    low_value: float = 0.0
-    relative_account_drawdown: float = 0.0
+    return TradeMetrics(
+        trades, date_col=date_col, value_col=value_col, starting_balance=starting_balance
+    ).underwater()
 
 
 def calculate_max_drawdown(
@@ -190,36 +353,9 @@ def calculate_max_drawdown(
              and the relative account drawdown
     :raise: ValueError if trade-dataframe was found empty.
     """
-    if len(trades) == 0:
-        raise ValueError("Trade dataframe empty.")
-    profit_results = trades.sort_values(date_col).reset_index(drop=True)
-    max_drawdown_df = _calc_drawdown_series(
-        profit_results, date_col=date_col, value_col=value_col, starting_balance=starting_balance
-    )
-
-    idxmin = (
-        max_drawdown_df["drawdown_relative"].idxmax()
-        if relative
-        else max_drawdown_df["drawdown"].idxmin()
-    )
-    if idxmin == 0:
-        raise ValueError("No losing trade, therefore no drawdown.")
-    high_date = profit_results.loc[max_drawdown_df.iloc[:idxmin]["high_value"].idxmax(), date_col]
-    low_date = profit_results.loc[idxmin, date_col]
-    high_val = max_drawdown_df.loc[
-        max_drawdown_df.iloc[:idxmin]["high_value"].idxmax(), "cumulative"
-    ]
-    low_val = max_drawdown_df.loc[idxmin, "cumulative"]
-    max_drawdown_rel = max_drawdown_df.loc[idxmin, "drawdown_relative"]
-
-    return DrawDownResult(
-        drawdown_abs=abs(max_drawdown_df.loc[idxmin, "drawdown"]),
-        high_date=high_date,
-        low_date=low_date,
-        high_value=high_val,
-        low_value=low_val,
-        relative_account_drawdown=max_drawdown_rel,
-    )
+    return TradeMetrics(
+        trades, date_col=date_col, value_col=value_col, starting_balance=starting_balance
+    ).max_drawdown(relative=relative)
 
 
 def calculate_csum(trades: pd.DataFrame, starting_balance: float = 0) -> Tuple[float, float]:
@@ -261,29 +397,7 @@ def calculate_expectancy(trades: pd.DataFrame) -> Tuple[float, float]:
     :param trades: DataFrame containing trades (requires columns close_date and profit_abs)
     :return: expectancy, expectancy_ratio
     """
-
-    expectancy = 0
-    expectancy_ratio = 100
-
-    if len(trades) > 0:
-        winning_trades = trades.loc[trades["profit_abs"] > 0]
-        losing_trades = trades.loc[trades["profit_abs"] < 0]
-        profit_sum = winning_trades["profit_abs"].sum()
-        loss_sum = abs(losing_trades["profit_abs"].sum())
-        nb_win_trades = len(winning_trades)
-        nb_loss_trades = len(losing_trades)
-
-        average_win = (profit_sum / nb_win_trades) if nb_win_trades > 0 else 0
-        average_loss = (loss_sum / nb_loss_trades) if nb_loss_trades > 0 else 0
-        winrate = nb_win_trades / len(trades)
-        loserate = nb_loss_trades / len(trades)
-
-        expectancy = (winrate * average_win) - (loserate * average_loss)
-        if average_loss > 0:
-            risk_reward_ratio = average_win / average_loss
-            expectancy_ratio = ((1 + risk_reward_ratio) * winrate) - 1
-
-    return expectancy, expectancy_ratio
+    return TradeMetrics(trades).expectancy()
 
 
 def calculate_sortino(
@@ -294,24 +408,7 @@ def calculate_sortino(
     :param trades: DataFrame containing trades (requires columns profit_abs)
     :return: sortino
     """
-    if (len(trades) == 0) or (min_date is None) or (max_date is None) or (min_date == max_date):
-        return 0
-
-    total_profit = trades["profit_abs"] / starting_balance
-    days_period = max(1, (max_date - min_date).days)
-
-    expected_returns_mean = total_profit.sum() / days_period
-
-    down_stdev = np.std(trades.loc[trades["profit_abs"] < 0, "profit_abs"] / starting_balance)
-
-    if down_stdev != 0 and not np.isnan(down_stdev):
-        sortino_ratio = expected_returns_mean / down_stdev * np.sqrt(365)
-    else:
-        # Define high (negative) sortino ratio to be clear that this is NOT optimal.
-        sortino_ratio = -100
-
-    # print(expected_returns_mean, down_stdev, sortino_ratio)
-    return sortino_ratio
+    return TradeMetrics(trades, starting_balance=starting_balance).sortino(min_date, max_date)
 
 
 def calculate_sharpe(
@@ -322,23 +419,7 @@ def calculate_sharpe(
     :param trades: DataFrame containing trades (requires column profit_abs)
     :return: sharpe
     """
-    if (len(trades) == 0) or (min_date is None) or (max_date is None) or (min_date == max_date):
-        return 0
-
-    total_profit = trades["profit_abs"] / starting_balance
-    days_period = max(1, (max_date - min_date).days)
-
-    expected_returns_mean = total_profit.sum() / days_period
-    up_stdev = np.std(total_profit)
-
-    if up_stdev != 0:
-        sharp_ratio = expected_returns_mean / up_stdev * np.sqrt(365)
-    else:
-        # Define high (negative) sharpe ratio to be clear that this is NOT optimal.
-        sharp_ratio = -100
-
-    # print(expected_returns_mean, up_stdev, sharp_ratio)
-    return sharp_ratio
+    return TradeMetrics(trades, starting_balance=starting_balance).sharpe(min_date, max_date)
 
 
 def calculate_calmar(
@@ -349,30 +430,4 @@ def calculate_calmar(
     :param trades: DataFrame containing trades (requires columns close_date and profit_abs)
     :return: calmar
     """
-    if (len(trades) == 0) or (min_date is None) or (max_date is None) or (min_date == max_date):
-        return 0
-
-    total_profit = trades["profit_abs"].sum() / starting_balance
-    days_period = max(1, (max_date - min_date).days)
-
-    # adding slippage of 0.1% per trade
-    # total_profit = total_profit - 0.0005
-    expected_returns_mean = total_profit / days_period * 100
-
-    # calculate max drawdown
-    try:
-        drawdown = calculate_max_drawdown(
-            trades, value_col="profit_abs", starting_balance=starting_balance
-        )
-        max_drawdown = drawdown.relative_account_drawdown
-    except ValueError:
-        max_drawdown = 0
-
-    if max_drawdown != 0:
-        calmar_ratio = expected_returns_mean / max_drawdown * math.sqrt(365)
-    else:
-        # Define high (negative) calmar ratio to be clear that this is NOT optimal.
-        calmar_ratio = -100
-
-    # print(expected_returns_mean, max_drawdown, calmar_ratio)
-    return calmar_ratio
+    return TradeMetrics(trades, starting_balance=starting_balance).calmar(min_date, max_date)
@@ -7,11 +7,25 @@ import asyncio
 import inspect
 import logging
 import signal
+import time
+from contextlib import contextmanager
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from math import floor, isnan
 from threading import Lock
-from typing import Any, Coroutine, Dict, List, Literal, Optional, Tuple, Union
+from typing import (
+    Any,
+    Coroutine,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 import ccxt
 import ccxt.pro as ccxt_pro
@@ -54,6 +68,7 @@ from freqtrade.exceptions import (
     ConfigurationError,
     DDosProtection,
     ExchangeError,
+    FreqtradeException,
     InsufficientFundsError,
     InvalidOrderException,
     OperationalException,
@@ -97,6 +112,14 @@ from freqtrade.exchange.exchange_utils_timeframe import (
     timeframe_to_seconds,
 )
 from freqtrade.exchange.exchange_ws import ExchangeWS
+from freqtrade.exchange.leverage_tiers import LeverageTiers
+from freqtrade.exchange.market_data_sidecar import (
+    SHARED_TICKERS_MAX_AGE,
+    MarketDataClient,
+    OHLCVJob,
+    default_socket_path,
+    install_shared_throttler,
+)
 from freqtrade.misc import (
     chunks,
     deep_merge_dicts,
@@ -156,6 +179,10 @@ class Exchange:
         "exchange_has_overrides": {},  # Dictionary overriding ccxt's "has".
         # Expected to be in the format {"fetchOHLCV": True} or {"fetchOHLCV": False}
         "ws_enabled": False,  # Set to true for exchanges with tested websocket support
+        "fetch_orders_bulk": True,  # Reconcile open orders via fetch_open_orders
+        "open_orders_all_pairs": False,  # fetch_open_orders works without symbol
+        "stoploss_query_bulk": True,  # fetch_stoploss_order is a plain fetch_order
+        "order_concurrency": 5,  # Max. orders in flight when placing orders concurrently
     }
     _ft_has: FtHas = {}
     _ft_has_futures: FtHas = {}
@@ -181,9 +208,14 @@ class Exchange:
         self._api_async: ccxt_pro.Exchange
         self._ws_async: ccxt_pro.Exchange = None
         self._exchange_ws: Optional[ExchangeWS] = None
+        self._market_data: Optional[MarketDataClient] = None
+        # OHLCV requests to the market data sidecar, sent as one batch
+        self._market_data_jobs: List[Tuple[OHLCVJob, asyncio.Future]] = []
+        self._market_data_tasks: Set[asyncio.Task] = set()
         self._markets: Dict = {}
         self._trading_fees: Dict[str, Any] = {}
         self._leverage_tiers: Dict[str, List[Dict]] = {}
+        self._compiled_leverage_tiers: Dict[str, LeverageTiers] = {}
         # Lock event loop. This is necessary to avoid race-conditions when using force* commands
         # Due to funding fee fetching.
         self._loop_lock = Lock()
@@ -271,6 +303,16 @@ class Exchange:
             self._ws_async = self._init_ccxt(exchange_conf, False, ccxt_async_config)
             self._exchange_ws = ExchangeWS(self._config, self._ws_async)
 
+        sidecar_conf = exchange_conf.get("market_data_sidecar", {})
+        if sidecar_conf.get("enabled", False):
+            socket_path = sidecar_conf.get("socket") or default_socket_path(
+                exchange_conf["name"], self.trading_mode
+            )
+            logger.info(f"Using market data sidecar at {socket_path}.")
+            self._market_data = MarketDataClient(socket_path)
+            if sidecar_conf.get("shared_rate_limit", True):
+                install_shared_throttler(self._market_data, self._api, self._api_async)
+
         logger.info(f'Using Exchange "{self.name}"')
         self.required_candle_call_count = 1
         if validate:
@@ -297,9 +339,38 @@ class Exchange:
         """
         self.close()
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Pickle support - used to pass the exchange to worker processes.
+        Async connections, the event loop and locks can't be pickled and are dropped -
+        the unpickled copy has the loaded markets and the synchronous api.
+        """
+        state = self.__dict__.copy()
+        state.update(
+            {
+                "_api_async": None,
+                "_ws_async": None,
+                "_exchange_ws": None,
+                "_market_data": None,
+                "_market_data_jobs": [],
+                "_market_data_tasks": set(),
+            }
+        )
+        for attr in ("loop", "_loop_lock", "_cache_lock"):
+            state.pop(attr, None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._loop_lock = Lock()
+        self._cache_lock = Lock()
+        self.loop = self._init_async_loop()
+
     def close(self):
         if self._exchange_ws:
             self._exchange_ws.cleanup()
+        if self._market_data:
+            self._market_data.close()
         logger.debug("Exchange object destroyed, closing async loop")
         if (
             getattr(self, "_api_async", None)
@@ -643,6 +714,26 @@ class Exchange:
             logger.warning("Could not load markets. Reason: %s", e)
             raise TemporaryError from e
 
+    def _load_shared_markets(self) -> bool:
+        """
+        Load markets from the market data sidecar.
+        :return: False if the sidecar is not available
+        """
+        try:
+            shared = self._market_data.markets()  # type: ignore[union-attr]
+        except ConnectionError as e:
+            logger.warning(f"{e}. Loading markets directly.")
+            return False
+        if shared["exchange"] != self.id or shared["trading_mode"] != self.trading_mode:
+            raise OperationalException(
+                f"Market data sidecar serves {shared['exchange']} ({shared['trading_mode']}), "
+                f"but this bot uses {self.id} ({self.trading_mode})."
+            )
+        self._api_async.set_markets(shared["markets"], shared["currencies"])
+        self._api_async.options = shared["options"]
+        self._markets = self._api_async.markets
+        return True
+
     def reload_markets(self, force: bool = False, *, load_leverage_tiers: bool = True) -> None:
         """
         Reload / Initialize markets both sync and async if refresh interval has passed
@@ -660,8 +751,9 @@ class Exchange:
         try:
             # on initial load, we retry 3 times to ensure we get the markets
             retries: int = 3 if force else 0
-            # Reload async markets, then assign them to sync api
-            self._markets = retrier(self._load_async_markets, retries=retries)(reload=True)
+            if not (self._market_data and self._load_shared_markets()):
+                # Reload async markets, then assign them to sync api
+                self._markets = retrier(self._load_async_markets, retries=retries)(reload=True)
             self._api.set_markets(self._api_async.markets, self._api_async.currencies)
             # Assign options array, as it contains some temporary information from the exchange.
             self._api.options = self._api_async.options
@@ -1256,7 +1348,7 @@ class Exchange:
 
         params = self._get_params(side, ordertype, leverage, reduceOnly, time_in_force)
 
-        try:
+        with self._create_order_errors(pair, ordertype, side, amount, rate):
             # Set the precision for amount and price(rate) as accepted by the exchange
             amount = self.amount_to_precision(pair, self._amount_to_contracts(pair, amount))
             needs_price = self._order_needs_price(ordertype)
@@ -1273,17 +1365,17 @@ class Exchange:
                 rate_for_order,
                 params,
             )
-            if order.get("status") is None:
-                # Map empty status to open.
-                order["status"] = "open"
-
-            if order.get("type") is None:
-                order["type"] = ordertype
-
-            self._log_exchange_response("create_order", order)
-            order = self._order_contracts_to_amount(order)
-            return order
+            return self._finalize_created_order(order, ordertype)
 
+    @contextmanager
+    def _create_order_errors(
+        self, pair: str, ordertype: str, side: BuySell, amount: float, rate: float
+    ) -> Iterator[None]:
+        """
+        Translate ccxt exceptions raised while placing an order to freqtrade exceptions.
+        """
+        try:
+            yield
         except ccxt.InsufficientFunds as e:
             raise InsufficientFundsError(
                 f"Insufficient funds to create {ordertype} {side} order on market {pair}. "
@@ -1305,6 +1397,91 @@ class Exchange:
         except ccxt.BaseError as e:
             raise OperationalException(e) from e
 
+    def _finalize_created_order(self, order: Dict, ordertype: str) -> Dict:
+        if order.get("status") is None:
+            # Map empty status to open.
+            order["status"] = "open"
+
+        if order.get("type") is None:
+            order["type"] = ordertype
+
+        self._log_exchange_response("create_order", order)
+        return self._order_contracts_to_amount(order)
+
+    def create_orders(self, orders: List[Dict[str, Any]]) -> List[Union[Dict, BaseException]]:
+        """
+        Place multiple independent orders concurrently.
+        Orders are submitted through the async api, with at most `order_concurrency`
+        requests in flight - ccxt's rate limiter spaces the requests as required by the exchange.
+        Dry-run orders and single orders are placed via create_order().
+        :param orders: List of keyword-arguments for create_order()
+        :return: List of created orders (or the exception raised placing the order),
+                 in the same order as the orders argument.
+        """
+        if self._config["dry_run"] or len(orders) < 2:
+            results: List[Union[Dict, BaseException]] = []
+            for order in orders:
+                try:
+                    results.append(self.create_order(**order))
+                except FreqtradeException as e:
+                    results.append(e)
+            return results
+
+        prepared: List[Union[Dict, Exception]] = []
+        for order in orders:
+            try:
+                # Leverage / margin mode must be set before the order is placed.
+                if not order.get("reduceOnly", False):
+                    self._lev_prep(order["pair"], order["leverage"], order["side"])
+                prepared.append(order)
+            except FreqtradeException as e:
+                prepared.append(e)
+
+        with self._loop_lock:
+            return self.loop.run_until_complete(self._async_create_orders(prepared))
+
+    async def _async_create_orders(
+        self, orders: List[Union[Dict, Exception]]
+    ) -> List[Union[Dict, BaseException]]:
+        semaphore = asyncio.Semaphore(self._ft_has["order_concurrency"])
+
+        async def _create(order: Union[Dict, Exception]) -> Dict:
+            if isinstance(order, Exception):
+                raise order
+            async with semaphore:
+                return await self._async_create_order(**order)
+
+        return await asyncio.gather(*[_create(o) for o in orders], return_exceptions=True)
+
+    async def _async_create_order(
+        self,
+        *,
+        pair: str,
+        ordertype: str,
+        side: BuySell,
+        amount: float,
+        rate: float,
+        leverage: float,
+        reduceOnly: bool = False,
+        time_in_force: str = "GTC",
+    ) -> Dict:
+        params = self._get_params(side, ordertype, leverage, reduceOnly, time_in_force)
+
+        with self._create_order_errors(pair, ordertype, side, amount, rate):
+            amount = self.amount_to_precision(pair, self._amount_to_contracts(pair, amount))
+            needs_price = self._order_needs_price(ordertype)
+            rate_for_order = self.price_to_precision(pair, rate) if needs_price else None
+
+            order = await self._api_async.create_order(
+                pair,
+                ordertype,
+                side,
+                amount,
+                rate_for_order,
+                params,
+            )
+            return self._finalize_created_order(order, ordertype)
+
     def stoploss_adjust(self, stop_loss: float, order: Dict, side: str) -> bool:
         """
         Verify stop_loss against stoploss-order value (limit or price)
@@ -1467,14 +1644,12 @@ class Exchange:
         try:
             order = self._api.fetch_open_order(order_id, pair, params=params)
             self._log_exchange_response("fetch_open_order", order)
-            order = self._order_contracts_to_amount(order)
-            return order
+            return self._parse_fetched_order(order)
         except ccxt.OrderNotFound:
             try:
                 order = self._api.fetch_closed_order(order_id, pair, params=params)
                 self._log_exchange_response("fetch_closed_order", order)
-                order = self._order_contracts_to_amount(order)
-                return order
+                return self._parse_fetched_order(order)
             except ccxt.OrderNotFound as e:
                 raise RetryableOrderError(
                     f"Order not found (pair: {pair} id: {order_id}). Message: {e}"
@@ -1492,19 +1667,13 @@ class Exchange:
         except ccxt.BaseError as e:
             raise OperationalException(e) from e
 
-    @retrier(retries=API_FETCH_ORDER_RETRY_COUNT)
-    def fetch_order(self, order_id: str, pair: str, params: Optional[Dict] = None) -> Dict:
-        if self._config["dry_run"]:
-            return self.fetch_dry_run_order(order_id)
-        if params is None:
-            params = {}
+    @contextmanager
+    def _fetch_order_errors(self, order_id: str, pair: str) -> Iterator[None]:
+        """
+        Translate ccxt exceptions raised while fetching an order to freqtrade exceptions.
+        """
         try:
-            if not self.exchange_has("fetchOrder"):
-                return self.fetch_order_emulated(order_id, pair, params)
-            order = self._api.fetch_order(order_id, pair, params=params)
-            self._log_exchange_response("fetch_order", order)
-            order = self._order_contracts_to_amount(order)
-            return order
+            yield
         except ccxt.OrderNotFound as e:
             raise RetryableOrderError(
                 f"Order not found (pair: {pair} id: {order_id}). Message: {e}"
@@ -1522,6 +1691,33 @@ class Exchange:
         except ccxt.BaseError as e:
             raise OperationalException(e) from e
 
+    def _parse_fetched_order(self, order: Dict) -> Dict:
+        """
+        Post-process an order received from the exchange (via REST or websocket).
+        Applies to all ways orders are fetched (fetch_order, bulk reconciliation, ...) -
+        exchange subclasses may override this to fix up exchange specific quirks.
+        """
+        return self._order_contracts_to_amount(order)
+
+    @retrier(retries=API_FETCH_ORDER_RETRY_COUNT)
+    def fetch_order(self, order_id: str, pair: str, params: Optional[Dict] = None) -> Dict:
+        if self._config["dry_run"]:
+            return self.fetch_dry_run_order(order_id)
+        if params is None:
+            params = {}
+        if self._exchange_ws and not params:
+            self._exchange_ws.schedule_private_streams()
+            if cached_order := self._exchange_ws.get_order(order_id):
+                return self._parse_fetched_order(cached_order)
+        with self._fetch_order_errors(order_id, pair):
+            if not self.exchange_has("fetchOrder"):
+                return self.fetch_order_emulated(order_id, pair, params)
+            order = self._api.fetch_order(order_id, pair, params=params)
+            self._log_exchange_response("fetch_order", order)
+            if self._exchange_ws and not params:
+                self._exchange_ws.store_order(order)
+            return self._parse_fetched_order(order)
+
     def fetch_stoploss_order(self, order_id: str, pair: str, params: Optional[Dict] = None) -> Dict:
         return self.fetch_order(order_id, pair, params)
 
@@ -1539,6 +1735,104 @@ class Exchange:
             return self.fetch_stoploss_order(order_id, pair)
         return self.fetch_order(order_id, pair)
 
+    def wait_for_order_update(self, timeout: float) -> bool:
+        """
+        Sleep for up to timeout seconds - returning early if an order update arrives
+        via the websocket order stream.
+        :return: True if an order update arrived
+        """
+        if self._exchange_ws and self._exchange_ws.order_stream_running:
+            return self._exchange_ws.wait_for_order_update(timeout)
+        time.sleep(timeout)
+        return False
+
+    def fetch_orders_bulk(self, orders: List[Tuple[str, str, bool]]) -> Dict[str, Dict]:
+        """
+        Fetch the state of multiple orders with as few round-trips as possible.
+        Open orders are fetched in bulk via fetch_open_orders (per pair, or account-wide if
+        the exchange supports it). Orders which are no longer open are fetched concurrently
+        via fetch_order.
+        Orders which could not be fetched are missing from the result - callers must fall back
+        to fetch_order() / fetch_stoploss_order() for these.
+        :param orders: List of (order_id, pair, stoploss_order) tuples
+        :return: Dict of order_id -> order
+        """
+        if (
+            self._config["dry_run"]
+            or not self._ft_has["fetch_orders_bulk"]
+            or not self.exchange_has("fetchOrder")
+        ):
+            return {}
+        wanted = {
+            order_id: pair
+            for order_id, pair, stoploss_order in orders
+            if order_id and (not stoploss_order or self._ft_has["stoploss_query_bulk"])
+        }
+        result: Dict[str, Dict] = {}
+        if self._exchange_ws:
+            # Order states received via websocket don't need to be fetched at all
+            self._exchange_ws.schedule_private_streams()
+            for order_id in list(wanted):
+                if order := self._exchange_ws.get_order(order_id):
+                    result[order_id] = self._parse_fetched_order(order)
+                    del wanted[order_id]
+        if not wanted:
+            return result
+        with self._loop_lock:
+            result.update(self.loop.run_until_complete(self._async_fetch_orders_bulk(wanted)))
+        return result
+
+    async def _async_fetch_orders_bulk(self, wanted: Dict[str, str]) -> Dict[str, Dict]:
+        result: Dict[str, Dict] = {}
+        if self.exchange_has("fetchOpenOrders"):
+            symbols: List[Optional[str]] = [None]
+            if not self._ft_has["open_orders_all_pairs"]:
+                symbols = [pair for pair in sorted(set(wanted.values()))]
+            open_orders: List[Union[List[Dict], BaseException]] = await asyncio.gather(
+                *[self._async_fetch_open_orders(symbol) for symbol in symbols],
+                return_exceptions=True,
+            )
+            for res in open_orders:
+                if isinstance(res, BaseException):
+                    logger.warning(f"Could not fetch open orders: {repr(res)}")
+                    continue
+                for order in res:
+                    if order.get("id") in wanted:
+                        result[order["id"]] = order
+
+        # Orders which are no longer open (filled, cancelled, ...)
+        missing = [order_id for order_id in wanted if order_id not in result]
+        orders: List[Union[Dict, BaseException]] = await asyncio.gather(
+            *[self._async_fetch_order(order_id, wanted[order_id]) for order_id in missing],
+            return_exceptions=True,
+        )
+        for order_id, order_res in zip(missing, orders):
+            if isinstance(order_res, BaseException):
+                logger.debug(f"Could not fetch order {order_id}: {repr(order_res)}")
+                continue
+            result[order_id] = order_res
+        return result
+
+    async def _async_fetch_open_orders(self, pair: Optional[str]) -> List[Dict]:
+        try:
+            orders = await self._api_async.fetch_open_orders(pair)
+            self._log_exchange_response("fetch_open_orders", orders)
+            return [self._parse_fetched_order(o) for o in orders]
+        except ccxt.DDoSProtection as e:
+            raise DDosProtection(e) from e
+        except (ccxt.OperationFailed, ccxt.ExchangeError) as e:
+            raise TemporaryError(
+                f"Could not fetch open orders due to {e.__class__.__name__}. Message: {e}"
+            ) from e
+        except ccxt.BaseError as e:
+            raise OperationalException(e) from e
+
+    async def _async_fetch_order(self, order_id: str, pair: str) -> Dict:
+        with self._fetch_order_errors(order_id, pair):
+            order = await self._api_async.fetch_order(order_id, pair)
+            self._log_exchange_response("fetch_order", order)
+            return self._parse_fetched_order(order)
+
     def check_order_canceled_empty(self, order: Dict) -> bool:
         """
         Verify if an order has been cancelled without being partially filled
@@ -1642,6 +1936,10 @@ class Exchange:
 
     @retrier
     def get_balances(self) -> CcxtBalances:
+        if self._exchange_ws and not self._config["dry_run"]:
+            self._exchange_ws.schedule_private_streams()
+            if (ws_balances := self._exchange_ws.get_balances()) is not None:
+                return ws_balances
         try:
             balances = self._api.fetch_balance()
             # Remove additional info from ccxt results
@@ -1649,6 +1947,8 @@ class Exchange:
             balances.pop("free", None)
             balances.pop("total", None)
             balances.pop("used", None)
+            if self._exchange_ws and not self._config["dry_run"]:
+                self._exchange_ws.store_balances(balances)
 
             return balances
         except ccxt.DDoSProtection as e:
@@ -1802,6 +2102,14 @@ class Exchange:
                 tickers = self._fetch_tickers_cache.get("fetch_tickers")  # type: ignore
             if tickers:
                 return tickers
+        if self._market_data and not symbols:
+            try:
+                tickers = self._market_data.tickers(SHARED_TICKERS_MAX_AGE)
+                with self._cache_lock:
+                    self._fetch_tickers_cache["fetch_tickers"] = tickers
+                return tickers
+            except ConnectionError as e:
+                logger.warning(f"{e}. Fetching tickers directly.")
         try:
             tickers = self._api.fetch_tickers(symbols)
             with self._cache_lock:
@@ -1836,6 +2144,10 @@ class Exchange:
         try:
             if pair not in self.markets or self.markets[pair].get("active", False) is False:
                 raise ExchangeError(f"Pair {pair} not available")
+            if self._exchange_ws:
+                self._exchange_ws.schedule_ticker(pair)
+                if ws_ticker := self._exchange_ws.get_ticker(pair):
+                    return cast(Ticker, ws_ticker)
             data: Ticker = self._api.fetch_ticker(pair)
             return data
         except ccxt.DDoSProtection as e:
@@ -1875,6 +2187,10 @@ class Exchange:
         limit1 = self.get_next_limit_in_list(
             limit, self._ft_has["l2_limit_range"], self._ft_has["l2_limit_range_required"]
         )
+        if self._exchange_ws:
+            self._exchange_ws.schedule_order_book(pair, self._get_ws_order_book_depth())
+            if (ws_order_book := self._exchange_ws.get_order_book(pair, limit)) is not None:
+                return cast(OrderBook, ws_order_book)
         try:
             return self._api.fetch_l2_order_book(pair, limit1)
         except ccxt.NotSupported as e:
@@ -1890,6 +2206,25 @@ class Exchange:
         except ccxt.BaseError as e:
             raise OperationalException(e) from e
 
+    def _get_ws_order_book_depth(self) -> Optional[int]:
+        """
+        Depth of watched order books - deep enough for all order book requests of the bot
+        (pricing and depth of market checks), so they can be served from the websocket.
+        """
+        depth = max(
+            self._config.get("entry_pricing", {}).get("order_book_top", 1),
+            self._config.get("exit_pricing", {}).get("order_book_top", 1),
+        )
+        if (
+            self._config.get("entry_pricing", {})
+            .get("check_depth_of_market", {})
+            .get("enabled", False)
+        ):
+            depth = max(depth, 1000)
+        return self.get_next_limit_in_list(
+            depth, self._ft_has["l2_limit_range"], self._ft_has["l2_limit_range_required"]
+        )
+
     def _get_price_side(self, side: str, is_short: bool, conf_strategy: Dict) -> BidAsk:
         price_side = conf_strategy["price_side"]
 
@@ -2359,6 +2694,8 @@ class Exchange:
             now = timeframe_to_next_date(timeframe)
             since_ms = dt_ts(now - timedelta(seconds=move_to // 1000))
 
+        if self._market_data:
+            return self._async_get_shared_candle_history(pair, timeframe, candle_type, since_ms)
         if since_ms:
             return self._async_get_historic_ohlcv(
                 pair, timeframe, since_ms=since_ms, raise_=True, candle_type=candle_type
@@ -2369,6 +2706,56 @@ class Exchange:
                 pair, timeframe, since_ms=since_ms, candle_type=candle_type
             )
 
+    async def _async_get_shared_candle_history(
+        self, pair: str, timeframe: str, candle_type: CandleType, since_ms: Optional[int]
+    ) -> OHLCVResponse:
+        """
+        Get candles from the market data sidecar.
+        Requests of all pairs refreshed together are collected, and sent as one batch.
+        Falls back to fetching the candles directly if the sidecar is not available.
+        """
+        job: OHLCVJob = (pair, timeframe, candle_type, since_ms)
+        future = self.loop.create_future()
+        self._market_data_jobs.append((job, future))
+        if len(self._market_data_jobs) == 1:
+            # First job of this batch - send once all other coroutines queued their jobs.
+            self.loop.call_soon(self._schedule_shared_jobs)
+        try:
+            return await future
+        except ConnectionError:
+            if since_ms:
+                return await self._async_get_historic_ohlcv(
+                    pair, timeframe, since_ms=since_ms, raise_=True, candle_type=candle_type
+                )
+            return await self._async_get_candle_history(
+                pair, timeframe, since_ms=since_ms, candle_type=candle_type
+            )
+
+    def _schedule_shared_jobs(self) -> None:
+        task = asyncio.ensure_future(self._async_send_shared_jobs())
+        # Keep a reference, so the task isn't garbage collected before it completes.
+        self._market_data_tasks.add(task)
+        task.add_done_callback(self._market_data_tasks.discard)
+
+    async def _async_send_shared_jobs(self) -> None:
+        batch = self._market_data_jobs
+        self._market_data_jobs = []
+        try:
+            results = await self.loop.run_in_executor(
+                None,
+                self._market_data.ohlcv,  # type: ignore[union-attr]
+                [job for job, _ in batch],
+            )
+        except Exception as e:
+            if isinstance(e, ConnectionError):
+                logger.warning(f"{e}. Fetching candles directly.")
+            results = [e] * len(batch)
+        for (_, future), res in zip(batch, results):
+            if isinstance(res, Exception):
+                future.set_exception(res)
+            else:
+                future.set_result(res)
+
     def _build_ohlcv_dl_jobs(
         self, pair_list: ListPairsWithTimeframes, since_ms: Optional[int], cache: bool
     ) -> Tuple[List[Coroutine], List[PairWithTimeframe]]:
@@ -3193,12 +3580,25 @@ class Exchange:
                 logger.exception("Error loading cached leverage tiers. Refreshing.")
         return None
 
+    def _load_shared_leverage_tiers(self) -> Optional[Dict[str, List[Dict]]]:
+        """
+        Load leverage tiers from the market data sidecar.
+        :return: None if the sidecar is not used or not available
+        """
+        if not self._market_data or self.trading_mode != TradingMode.FUTURES:
+            return None
+        try:
+            return self._market_data.leverage_tiers()
+        except ConnectionError as e:
+            logger.warning(f"{e}. Loading leverage tiers directly.")
+            return None
+
     def fill_leverage_tiers(self) -> None:
         """
         Assigns property _leverage_tiers to a dictionary of information about the leverage
         allowed on each pair
         """
-        leverage_tiers = self.load_leverage_tiers()
+        leverage_tiers = self._load_shared_leverage_tiers() or self.load_leverage_tiers()
         for pair, tiers in leverage_tiers.items():
             pair_tiers = []
             for tier in tiers:
@@ -3215,6 +3615,20 @@ class Exchange:
             "maintAmt": float(info["cum"]) if "cum" in info else None,
         }
 
+    def get_compiled_leverage_tiers(self, pair: str) -> Optional[LeverageTiers]:
+        """
+        Leverage tiers of a pair, compiled for fast lookups.
+        Compiled once per pair - and again whenever _leverage_tiers is replaced.
+        :return: LeverageTiers, or None if there are no tiers for this pair
+        """
+        tiers = self._leverage_tiers.get(pair)
+        if not tiers:
+            return None
+        compiled = self._compiled_leverage_tiers.get(pair)
+        if compiled is None or compiled.source is not tiers:
+            compiled = self._compiled_leverage_tiers[pair] = LeverageTiers(tiers)
+        return compiled
+
     def get_max_leverage(self, pair: str, stake_amount: Optional[float]) -> float:
         """
         Returns the maximum leverage that a pair can be traded at
@@ -3232,53 +3646,33 @@ class Exchange:
                     f"{self.name}.get_max_leverage requires argument stake_amount"
                 )
 
-            if pair not in self._leverage_tiers:
+            tiers = self.get_compiled_leverage_tiers(pair)
+            if tiers is None:
                 # Maybe raise exception because it can't be traded on futures?
                 return 1.0
 
-            pair_tiers = self._leverage_tiers[pair]
-
-            if stake_amount == 0:
-                return self._leverage_tiers[pair][0]["maxLeverage"]  # Max lev for lowest amount
-
-            for tier_index in range(len(pair_tiers)):
-                tier = pair_tiers[tier_index]
-                lev = tier["maxLeverage"]
-
-                if tier_index < len(pair_tiers) - 1:
-                    next_tier = pair_tiers[tier_index + 1]
-                    next_floor = next_tier["minNotional"] / next_tier["maxLeverage"]
-                    if next_floor > stake_amount:  # Next tier min too high for stake amount
-                        return min((tier["maxNotional"] / stake_amount), lev)
-                        #
-                        # With the two leverage tiers below,
-                        # - a stake amount of 150 would mean a max leverage of (10000 / 150) = 66.66
-                        # - stakes below 133.33 = max_lev of 75
-                        # - stakes between 133.33-200 = max_lev of 10000/stake = 50.01-74.99
-                        # - stakes from 200 + 1000 = max_lev of 50
-                        #
-                        # {
-                        #     "min": 0,      # stake = 0.0
-                        #     "max": 10000,  # max_stake@75 = 10000/75 = 133.33333333333334
-                        #     "lev": 75,
-                        # },
-                        # {
-                        #     "min": 10000,  # stake = 200.0
-                        #     "max": 50000,  # max_stake@50 = 50000/50 = 1000.0
-                        #     "lev": 50,
-                        # }
-                        #
-
-                else:  # if on the last tier
-                    if stake_amount > tier["maxNotional"]:
-                        # If stake is > than max tradeable amount
-                        raise InvalidOrderException(f"Amount {stake_amount} too high for {pair}")
-                    else:
-                        return tier["maxLeverage"]
-
-            raise OperationalException(
-                "Looped through all tiers without finding a max leverage. Should never be reached"
-            )
+            # With the two leverage tiers below,
+            # - a stake amount of 150 would mean a max leverage of (10000 / 150) = 66.66
+            # - stakes below 133.33 = max_lev of 75
+            # - stakes between 133.33-200 = max_lev of 10000/stake = 50.01-74.99
+            # - stakes from 200 + 1000 = max_lev of 50
+            #
+            # {
+            #     "min": 0,      # stake = 0.0
+            #     "max": 10000,  # max_stake@75 = 10000/75 = 133.33333333333334
+            #     "lev": 75,
+            # },
+            # {
+            #     "min": 10000,  # stake = 200.0
+            #     "max": 50000,  # max_stake@50 = 50000/50 = 1000.0
+            #     "lev": 50,
+            # }
+            #
+            max_leverage = tiers.get_max_leverage(stake_amount)
+            if max_leverage is None:
+                # If stake is > than max tradeable amount
+                raise InvalidOrderException(f"Amount {stake_amount} too high for {pair}")
+            return max_leverage
 
         elif self.trading_mode == TradingMode.MARGIN:  # Search markets.limits for max lev
             market = self.markets[pair]
@@ -3651,19 +4045,17 @@ class Exchange:
             or self.exchange_has("fetchLeverageTiers")
             or self.exchange_has("fetchMarketLeverageTiers")
         ):
-            if pair not in self._leverage_tiers:
+            tiers = self.get_compiled_leverage_tiers(pair)
+            if tiers is None:
                 raise InvalidOrderException(
                     f"Maintenance margin rate for {pair} is unavailable for {self.name}"
                 )
-
-            pair_tiers = self._leverage_tiers[pair]
-
-            for tier in reversed(pair_tiers):
-                if notional_value >= tier["minNotional"]:
-                    return (tier["maintenanceMarginRate"], tier["maintAmt"])
-
-            raise ExchangeError("nominal value can not be lower than 0")
-            # The lowest notional_floor for any pair in fetch_leverage_tiers is always 0 because it
-            # describes the min amt for a tier, and the lowest tier will always go down to 0
+            try:
+                return tiers.maintenance_ratio_and_amt(notional_value)
+            except ValueError as e:
+                # The lowest notional_floor for any pair in fetch_leverage_tiers is always 0
+                # because it describes the min amt for a tier, and the lowest tier will always
+                # go down to 0
+                raise ExchangeError(str(e)) from e
         else:
             raise ExchangeError(f"Cannot get maintenance ratio using {self.name}")
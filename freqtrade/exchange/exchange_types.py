@@ -46,6 +46,13 @@ class FtHas(TypedDict, total=False):
     needs_trading_fees: bool
     order_props_in_contracts: List[str]
 
+    # Order reconciliation
+    fetch_orders_bulk: bool
+    open_orders_all_pairs: bool
+    stoploss_query_bulk: bool
+    # Order placement
+    order_concurrency: int
+
     # Websocket control
     ws_enabled: bool
 
@@ -25,9 +25,13 @@ from freqtrade.exchange.common import (
     EXCHANGE_HAS_REQUIRED,
     SUPPORTED_EXCHANGES,
 )
+from freqtrade.exchange.exchange_utils_precision import (
+    compile_precision,
+    precise_div,
+    precise_mul,
+)
 from freqtrade.exchange.exchange_utils_timeframe import timeframe_to_minutes, timeframe_to_prev_date
 from freqtrade.ft_types import ValidExchangesType
-from freqtrade.util import FtPrecise
 
 
 CcxtModuleType = Any
@@ -174,7 +178,7 @@ def amount_to_contracts(amount: float, contract_size: Optional[float]) -> float:
     :return: num-contracts
     """
     if contract_size and contract_size != 1:
-        return float(FtPrecise(amount) / FtPrecise(contract_size))
+        return precise_div(amount, contract_size)
     else:
         return amount
 
@@ -188,7 +192,7 @@ def contracts_to_amount(num_contracts: float, contract_size: Optional[float]) ->
     """
 
     if contract_size and contract_size != 1:
-        return float(FtPrecise(num_contracts) * FtPrecise(contract_size))
+        return precise_mul(num_contracts, contract_size)
     else:
         return num_contracts
 
@@ -208,7 +212,9 @@ def amount_to_precision(
     :return: truncated amount
     """
     if amount_precision is not None and precisionMode is not None:
-        precision = int(amount_precision) if precisionMode != TICK_SIZE else amount_precision
+        if precisionMode in (DECIMAL_PLACES, TICK_SIZE):
+            return compile_precision(amount_precision, precisionMode).to_precision(amount, TRUNCATE)
+        precision = int(amount_precision)
         # precision must be an int for non-ticksize inputs.
         amount = float(
             decimal_to_precision(
@@ -307,6 +313,10 @@ def price_to_precision(
     """
     if price_precision is not None and precisionMode is not None:
         if rounding_mode not in (ROUND_UP, ROUND_DOWN):
+            if precisionMode in (DECIMAL_PLACES, TICK_SIZE):
+                return compile_precision(price_precision, precisionMode).to_precision(
+                    price, rounding_mode
+                )
             # Use CCXT code where possible.
             return float(
                 decimal_to_precision(
@@ -318,16 +328,10 @@ def price_to_precision(
             )
 
         if precisionMode == TICK_SIZE:
-            precision = FtPrecise(price_precision)
-            price_str = FtPrecise(price)
-            missing = price_str % precision
-            if not missing == FtPrecise("0"):
-                if rounding_mode == ROUND_UP:
-                    res = price_str - missing + precision
-                elif rounding_mode == ROUND_DOWN:
-                    res = price_str - missing
-                return round(float(str(res)), 14)
-            return price
+            res = compile_precision(price_precision, TICK_SIZE).to_precision(price, rounding_mode)
+            if res == price:
+                return price
+            return round(res, 14)
         elif precisionMode == DECIMAL_PLACES:
             ndigits = round(price_precision)
             ticks = price * (10**ndigits)
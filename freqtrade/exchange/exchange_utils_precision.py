@@ -0,0 +1,128 @@
+"""
+Exact, integer based precision arithmetic.
+Results match ccxt's decimal_to_precision() and Precise - without their string / Decimal math.
+"""
+
+from functools import lru_cache
+from typing import Tuple
+
+from ccxt import DECIMAL_PLACES, ROUND, ROUND_DOWN, ROUND_UP, TICK_SIZE, TRUNCATE
+
+
+# ccxt's Precise.div() truncates results to this many decimals
+PRECISE_DIV_DECIMALS = 18
+# ccxt limits DECIMAL_PLACES precision to the Decimal context precision (28) - 2
+MAX_DECIMAL_PLACES = 26
+
+
+def decimal_parts(value) -> Tuple[int, int]:
+    """
+    Split a number into an integer and a base 10 exponent, so that
+    value == integer * 10 ** exponent.
+    Uses the shortest string representation of the number, like ccxt does.
+    :raises ValueError: for non-finite numbers
+    """
+    mantissa, _, exponent = str(value).lower().partition("e")
+    whole, _, fraction = mantissa.partition(".")
+    return int(whole + fraction), (int(exponent) if exponent else 0) - len(fraction)
+
+
+def parts_to_float(integer: int, exponent: int) -> float:
+    """
+    Convert integer * 10 ** exponent to the closest float - identical to float(str(decimal)).
+    """
+    return float(f"{integer}e{exponent}")
+
+
+def precise_div(numerator: float, denominator: float) -> float:
+    """
+    Same result as float(FtPrecise(numerator) / FtPrecise(denominator)).
+    """
+    num, num_exp = decimal_parts(numerator)
+    den, den_exp = decimal_parts(denominator)
+    distance = PRECISE_DIV_DECIMALS + num_exp - den_exp
+    if distance < 0:
+        num = num // 10**-distance
+    else:
+        num = num * 10**distance
+    result, mod = divmod(num, den)
+    if result < 0 and mod:
+        # Truncate towards zero
+        result += 1
+    return parts_to_float(result, -PRECISE_DIV_DECIMALS)
+
+
+def precise_mul(left: float, right: float) -> float:
+    """
+    Same result as float(FtPrecise(left) * FtPrecise(right)).
+    """
+    left_int, left_exp = decimal_parts(left)
+    right_int, right_exp = decimal_parts(right)
+    return parts_to_float(left_int * right_int, left_exp + right_exp)
+
+
+class CompiledPrecision:
+    """
+    Amount or price precision of a market, compiled to a tick of tick * 10 ** tick_exp.
+    Supports the DECIMAL_PLACES and TICK_SIZE counting modes.
+    """
+
+    __slots__ = ("tick", "tick_exp", "half_num", "half_den")
+
+    def __init__(self, precision: float, counting_mode: int) -> None:
+        if counting_mode == TICK_SIZE:
+            self.tick, self.tick_exp = decimal_parts(precision)
+            if self.tick <= 0:
+                raise ValueError(f"Invalid tick size {precision}")
+            # ccxt compares the remainder with the float value of precision / 2.
+            self.half_num, self.half_den = (float(precision) / 2).as_integer_ratio()
+        elif counting_mode == DECIMAL_PLACES:
+            self.tick, self.tick_exp = 1, -min(int(precision), MAX_DECIMAL_PLACES)
+            # Half of 10 ** tick_exp - rounds half away from zero.
+            self.half_num, self.half_den = (
+                (10**self.tick_exp, 2) if self.tick_exp >= 0 else (1, 2 * 10**-self.tick_exp)
+            )
+        else:
+            raise ValueError(f"Unsupported counting mode {counting_mode}")
+
+    def to_precision(self, value: float, rounding_mode: int = ROUND) -> float:
+        """
+        Round value to a multiple of the tick.
+        :param rounding_mode: TRUNCATE (towards zero), ROUND (half away from zero),
+                              ROUND_UP (towards +inf) or ROUND_DOWN (towards -inf)
+        """
+        integer, exponent = decimal_parts(value)
+        # Bring both to the smaller exponent
+        common_exp = min(exponent, self.tick_exp)
+        scaled = integer * 10 ** (exponent - common_exp)
+        tick = self.tick * 10 ** (self.tick_exp - common_exp)
+
+        missing = abs(scaled) % tick
+        if not missing:
+            return parts_to_float(scaled, common_exp)
+        sign = -1 if scaled < 0 else 1
+        if rounding_mode == TRUNCATE:
+            away = False
+        elif rounding_mode == ROUND:
+            # missing * 10 ** common_exp >= half_num / half_den
+            if common_exp >= 0:
+                away = missing * self.half_den * 10**common_exp >= self.half_num
+            else:
+                away = missing * self.half_den >= self.half_num * 10**-common_exp
+        elif rounding_mode == ROUND_UP:
+            away = sign > 0
+        elif rounding_mode == ROUND_DOWN:
+            away = sign < 0
+        else:
+            raise ValueError(f"Unknown rounding_mode {rounding_mode}")
+
+        rounded = abs(scaled) - missing + (tick if away else 0)
+        return parts_to_float(sign * rounded, common_exp)
+
+
+@lru_cache(maxsize=4096)
+def compile_precision(precision: float, counting_mode: int) -> CompiledPrecision:
+    """
+    Cached CompiledPrecision - markets share few distinct precisions.
+    """
+    return CompiledPrecision(precision, counting_mode)
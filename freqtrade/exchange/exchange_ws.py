@@ -3,12 +3,12 @@ import logging
 import time
 from copy import deepcopy
 from functools import partial
-from threading import Thread
-from typing import Dict, Set
+from threading import Event, Thread
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 import ccxt
 
-from freqtrade.constants import Config, PairWithTimeframe
+from freqtrade.constants import NON_OPEN_EXCHANGE_STATES, Config, PairWithTimeframe
 from freqtrade.enums.candletype import CandleType
 from freqtrade.exchange.exchange import timeframe_to_seconds
 from freqtrade.exchange.exchange_types import OHLCVResponse
@@ -17,6 +17,16 @@ from freqtrade.util import dt_ts, format_ms_time
 
 logger = logging.getLogger(__name__)
 
+# Order / balance states older than this are refreshed via REST - even if the stream is running.
+# Streams only send updates on changes, so this is a safety net against silently stalled streams.
+PRIVATE_STREAM_TTL = 300
+# Minimum delay (seconds) before restarting a private stream which stopped.
+PRIVATE_STREAM_RESTART_DELAY = 60
+# Tickers / order books without update for this many seconds are fetched via REST.
+MARKET_DATA_MAX_AGE = 30
+# Ticker / order book streams not requested for this many seconds are unsubscribed.
+MARKET_DATA_EXPIRY = 300
+
 
 class ExchangeWS:
     def __init__(self, config: Config, ccxt_object: ccxt.Exchange) -> None:
@@ -28,6 +38,24 @@ class ExchangeWS:
         self._klines_scheduled: Set[PairWithTimeframe] = set()
         self.klines_last_refresh: Dict[PairWithTimeframe, float] = {}
         self.klines_last_request: Dict[PairWithTimeframe, float] = {}
+
+        self._private_watching = False
+        self._private_scheduled: Set[str] = set()
+        self._private_stopped: Dict[str, int] = {}
+        self._orders: Dict[str, Dict[str, Any]] = {}
+        self._orders_last_update: Dict[str, int] = {}
+        # Set whenever the order or trade stream delivers an update
+        self._order_update = Event()
+        self._balances: Optional[Dict[str, Any]] = None
+        self.balances_last_refresh = 0
+
+        # Ticker and order book streams, keyed by ("ticker" | "orderbook", pair).
+        # The value of _market_data_watching is the order book depth (None for tickers).
+        self._market_data_watching: Dict[Tuple[str, str], Optional[int]] = {}
+        self._market_data_scheduled: Set[Tuple[str, str]] = set()
+        self._market_data: Dict[Tuple[str, str], Tuple[Optional[int], Dict[str, Any]]] = {}
+        self.market_data_last_refresh: Dict[Tuple[str, str], int] = {}
+        self.market_data_last_request: Dict[Tuple[str, str], int] = {}
         self._thread = Thread(name="ccxt_ws", target=self._start_forever)
         self._thread.start()
         self.__cleanup_called = False
@@ -43,6 +71,8 @@ class ExchangeWS:
     def cleanup(self) -> None:
         logger.debug("Cleanup called - stopping")
         self._klines_watching.clear()
+        self._market_data_watching.clear()
+        self._private_watching = False
         for task in self._background_tasks:
             task.cancel()
         if hasattr(self, "_loop") and not self._loop.is_closed():
@@ -73,6 +103,9 @@ class ExchangeWS:
             # Clear the cache.
             # Not doing this will cause problems on startup with dynamic pairlists
             self.ccxt_object.ohlcvs.clear()
+            self._orders.clear()
+            self._balances = None
+            self._market_data.clear()
         except Exception:
             logger.exception("Exception in _cleanup_async")
         finally:
@@ -193,3 +226,251 @@ class ExchangeWS:
             f"candle_date={format_ms_time(candle_date)}, {drop_hint=}"
         )
         return pair, timeframe, candle_type, candles, drop_hint
+
+    @property
+    def _private_streams(self) -> Dict[str, Tuple[str, Callable, Callable]]:
+        """
+        Private (account) streams - stream name: (ccxt has key, watch method, handler)
+        """
+        return {
+            "orders": ("watchOrders", self.ccxt_object.watch_orders, self._handle_orders),
+            "my_trades": ("watchMyTrades", self.ccxt_object.watch_my_trades, self._handle_trades),
+            "balance": ("watchBalance", self.ccxt_object.watch_balance, self._handle_balance),
+        }
+
+    def schedule_private_streams(self) -> None:
+        """
+        Subscribe to the order, trade and balance streams of the account.
+        Streams which stopped (e.g. due to a connection error) are restarted.
+        """
+        self._private_watching = True
+        asyncio.run_coroutine_threadsafe(self._schedule_private_streams(), loop=self._loop)
+
+    async def _schedule_private_streams(self) -> None:
+        for stream, (has_key, _, _) in self._private_streams.items():
+            if stream in self._private_scheduled or not self.ccxt_object.has.get(has_key):
+                continue
+            if dt_ts() - self._private_stopped.get(stream, 0) < PRIVATE_STREAM_RESTART_DELAY * 1000:
+                # Don't hammer the exchange if the stream keeps failing
+                continue
+            self._private_scheduled.add(stream)
+            task = asyncio.create_task(self._continuously_async_watch_private(stream))
+            self._background_tasks.add(task)
+            task.add_done_callback(partial(self._private_stream_stopped, stream=stream))
+
+    def _private_stream_stopped(self, task: asyncio.Task, stream: str) -> None:
+        self._background_tasks.discard(task)
+        self._private_scheduled.discard(stream)
+        self._private_stopped[stream] = dt_ts()
+        # Updates may have been missed - the cached states can no longer be trusted.
+        if stream in ("orders", "my_trades"):
+            self._orders.clear()
+            self._orders_last_update.clear()
+        else:
+            self._balances = None
+        logger.info(f"{stream} - private stream finished")
+
+    async def _continuously_async_watch_private(self, stream: str) -> None:
+        _, watch, handler = self._private_streams[stream]
+        try:
+            while self._private_watching:
+                handler(await watch())
+        except ccxt.ExchangeClosedByUser:
+            logger.debug("Exchange connection closed by user")
+        except ccxt.BaseError:
+            logger.exception(f"Exception in continuously_async_watch_private for {stream}")
+
+    def _handle_orders(self, orders: List[Dict[str, Any]]) -> None:
+        now = dt_ts()
+        for order in orders:
+            self.store_order(order, now)
+        self._order_update.set()
+
+    def _handle_trades(self, trades: List[Dict[str, Any]]) -> None:
+        # A fill happened - drop the cached order so fill details (fees, average)
+        # are fetched via REST, unless the order update arrives afterwards.
+        for trade in trades:
+            if order_id := trade.get("order"):
+                self._orders.pop(order_id, None)
+                self._orders_last_update.pop(order_id, None)
+        self._order_update.set()
+
+    def _handle_balance(self, balance: Dict[str, Any]) -> None:
+        self.store_balances(balance)
+
+    def store_order(self, order: Dict[str, Any], update_time: Optional[int] = None) -> None:
+        """
+        Store an order state (as returned by ccxt), e.g. from a REST call.
+        """
+        if order_id := order.get("id"):
+            if (cached := self._orders.get(order_id)) and self._is_outdated(order, cached):
+                # The stream delivered a newer state while the REST call was in flight.
+                return
+            self._orders[order_id] = deepcopy(order)
+            self._orders_last_update[order_id] = update_time or dt_ts()
+
+    @staticmethod
+    def _is_outdated(order: Dict[str, Any], cached: Dict[str, Any]) -> bool:
+        """
+        Check if order is an older state of the cached order.
+        Closed / canceled orders never become open again, and filled amounts don't decrease.
+        """
+        new_ts = order.get("lastUpdateTimestamp")
+        cached_ts = cached.get("lastUpdateTimestamp")
+        if new_ts and cached_ts and new_ts != cached_ts:
+            return new_ts < cached_ts
+        if cached.get("status") in NON_OPEN_EXCHANGE_STATES and order.get("status") == "open":
+            return True
+        return (order.get("filled") or 0.0) < (cached.get("filled") or 0.0)
+
+    @property
+    def order_stream_running(self) -> bool:
+        return "orders" in self._private_scheduled
+
+    def wait_for_order_update(self, timeout: float) -> bool:
+        """
+        Block until the order or trade stream delivers an update, or timeout seconds passed.
+        :return: True if an update arrived
+        """
+        updated = self._order_update.wait(timeout)
+        self._order_update.clear()
+        return updated
+
+    def get_order(self, order_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the cached order state, if the order stream is running and the state
+        is not older than PRIVATE_STREAM_TTL.
+        """
+        if not self.order_stream_running:
+            return None
+        if dt_ts() - self._orders_last_update.get(order_id, 0) > PRIVATE_STREAM_TTL * 1000:
+            return None
+        order = self._orders.get(order_id)
+        return deepcopy(order) if order else None
+
+    def store_balances(self, balances: Dict[str, Any]) -> None:
+        balances = deepcopy(balances)
+        # Remove additional info from ccxt results
+        for key in ("info", "free", "total", "used"):
+            balances.pop(key, None)
+        self._balances = balances
+        self.balances_last_refresh = dt_ts()
+
+    def get_balances(self) -> Optional[Dict[str, Any]]:
+        """
+        Returns the cached balances, if the balance stream is running and the balances
+        are not older than PRIVATE_STREAM_TTL.
+        """
+        if (
+            "balance" not in self._private_scheduled
+            or self._balances is None
+            or dt_ts() - self.balances_last_refresh > PRIVATE_STREAM_TTL * 1000
+        ):
+            return None
+        return deepcopy(self._balances)
+
+    def schedule_ticker(self, pair: str) -> None:
+        """
+        Schedule the ticker of a pair to be watched
+        """
+        if self.ccxt_object.has.get("watchTicker"):
+            self._schedule_market_data(("ticker", pair), None)
+
+    def schedule_order_book(self, pair: str, depth: Optional[int]) -> None:
+        """
+        Schedule the order book of a pair to be watched
+        :param depth: Order book depth to subscribe to (None for the full order book).
+            The depth of an existing subscription is not changed.
+        """
+        if self.ccxt_object.has.get("watchOrderBook"):
+            self._schedule_market_data(("orderbook", pair), depth)
+
+    def _schedule_market_data(self, key: Tuple[str, str], depth: Optional[int]) -> None:
+        self.market_data_last_request[key] = dt_ts()
+        if key not in self._market_data_watching:
+            self._market_data_watching[key] = depth
+            asyncio.run_coroutine_threadsafe(self._schedule_market_data_async(), loop=self._loop)
+        self.cleanup_expired_market_data()
+
+    def cleanup_expired_market_data(self) -> None:
+        """
+        Remove tickers / order books from the watchlist if they've not been requested within
+        MARKET_DATA_EXPIRY seconds (no open trade or signal for the pair anymore).
+        """
+        for key in list(self._market_data_watching):
+            last_request = self.market_data_last_request.get(key, 0)
+            if dt_ts() - last_request > MARKET_DATA_EXPIRY * 1000:
+                logger.info(f"Removing {key[0]} {key[1]} from websocket watchlist.")
+                self._market_data_watching.pop(key, None)
+                self._market_data.pop(key, None)
+
+    async def _schedule_market_data_async(self) -> None:
+        for key in list(self._market_data_watching):
+            if key not in self._market_data_scheduled:
+                self._market_data_scheduled.add(key)
+                task = asyncio.create_task(self._continuously_async_watch_market_data(key))
+                self._background_tasks.add(task)
+                task.add_done_callback(partial(self._market_data_stopped, key=key))
+
+    def _market_data_stopped(self, task: asyncio.Task, key: Tuple[str, str]) -> None:
+        self._background_tasks.discard(task)
+        self._market_data_scheduled.discard(key)
+        self._market_data.pop(key, None)
+        logger.info(f"{key[0]} {key[1]} - Task finished")
+
+    async def _continuously_async_watch_market_data(self, key: Tuple[str, str]) -> None:
+        stream, pair = key
+        try:
+            while key in self._market_data_watching:
+                depth = self._market_data_watching.get(key)
+                if stream == "ticker":
+                    data = await self.ccxt_object.watch_ticker(pair)
+                else:
+                    data = await self.ccxt_object.watch_order_book(pair, depth)
+                self._market_data[key] = (depth, data)
+                self.market_data_last_refresh[key] = dt_ts()
+        except ccxt.ExchangeClosedByUser:
+            logger.debug("Exchange connection closed by user")
+        except ccxt.BaseError:
+            logger.exception(f"Exception in continuously_async_watch_market_data for {key}")
+        finally:
+            self._market_data_watching.pop(key, None)
+
+    def _get_market_data(self, key: Tuple[str, str]) -> Optional[Tuple[Optional[int], Any]]:
+        if dt_ts() - self.market_data_last_refresh.get(key, 0) > MARKET_DATA_MAX_AGE * 1000:
+            return None
+        return self._market_data.get(key)
+
+    def get_ticker(self, pair: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the watched ticker of a pair, if it's recent and contains prices.
+        """
+        entry = self._get_market_data(("ticker", pair))
+        if entry is None:
+            return None
+        ticker = entry[1]
+        if ticker.get("bid") is None or ticker.get("ask") is None or ticker.get("last") is None:
+            # Some exchanges don't provide bid/ask through the ticker stream
+            return None
+        return deepcopy(ticker)
+
+    def get_order_book(self, pair: str, limit: Optional[int]) -> Optional[Dict[str, Any]]:
+        """
+        Returns the watched order book of a pair, if it's recent and deep enough.
+        :param limit: Number of levels required (None for the full order book)
+        """
+        entry = self._get_market_data(("orderbook", pair))
+        if entry is None:
+            return None
+        depth, order_book = entry
+        if depth is not None and (limit is None or limit > depth):
+            return None
+        # Copy the levels - the order book is updated in place as new messages arrive
+        return {
+            "symbol": pair,
+            "bids": [list(level) for level in order_book["bids"][:limit]],
+            "asks": [list(level) for level in order_book["asks"][:limit]],
+            "timestamp": order_book.get("timestamp"),
+            "datetime": order_book.get("datetime"),
+            "nonce": order_book.get("nonce"),
+        }
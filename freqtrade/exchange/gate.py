@@ -33,6 +33,7 @@ class Gate(Exchange):
         "stop_price_prop": "stopPrice",
         "marketOrderRequiresPrice": True,
         "trades_has_history": False,  # Endpoint would support this - but ccxt doesn't.
+        "stoploss_query_bulk": False,  # Stoploss orders require special handling
     }
 
     _ft_has_futures: FtHas = {
@@ -0,0 +1,102 @@
+"""
+Leverage tiers of one pair, compiled to sorted arrays for fast lookups.
+"""
+
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class LeverageTiers:
+    """
+    Compiled form of the parsed leverage tiers of a pair (see Exchange.parse_leverage_tier()).
+    Scalar lookups bisect plain lists (cheaper than numpy for single values),
+    the *_array methods use np.searchsorted on the same data.
+    """
+
+    def __init__(self, tiers: List[Dict]) -> None:
+        if not tiers:
+            raise ValueError("At least one leverage tier is required.")
+        self.source = tiers
+        self.min_notional = np.array([t["minNotional"] for t in tiers], dtype=np.float64)
+        self.max_notional = np.array([t["maxNotional"] for t in tiers], dtype=np.float64)
+        self.maintenance_rate = np.array(
+            [t["maintenanceMarginRate"] for t in tiers], dtype=np.float64
+        )
+        self.max_leverage = np.array([t["maxLeverage"] for t in tiers], dtype=np.float64)
+        self.maintenance_amt = np.array(
+            [np.nan if t["maintAmt"] is None else t["maintAmt"] for t in tiers], dtype=np.float64
+        )
+        # Lowest stake amount of each tier, starting with the 2nd tier.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.stake_floors = self.min_notional[1:] / self.max_leverage[1:]
+
+        self._min_notional = self.min_notional.tolist()
+        self._stake_floors = self.stake_floors.tolist()
+        # Exchanges return tiers sorted - keep the (slower) scan for anything else.
+        self._sorted = bool(np.all(np.diff(self.min_notional) >= 0))
+        self._floors_sorted = bool(np.all(np.diff(self.stake_floors) >= 0))
+
+    def _tier_index(self, notional_value: float) -> int:
+        """
+        Index of the highest tier with minNotional <= notional_value, -1 if there's none.
+        """
+        if self._sorted:
+            return bisect_right(self._min_notional, notional_value) - 1
+        for index in range(len(self._min_notional) - 1, -1, -1):
+            if notional_value >= self._min_notional[index]:
+                return index
+        return -1
+
+    def maintenance_ratio_and_amt(self, notional_value: float) -> Tuple[float, Optional[float]]:
+        """
+        :return: (maintenance margin ratio, maintenance amount) for a position of this size
+        :raises ValueError: for notional values below the lowest tier
+        """
+        index = self._tier_index(notional_value)
+        if index < 0:
+            raise ValueError("nominal value can not be lower than 0")
+        tier = self.source[index]
+        return tier["maintenanceMarginRate"], tier["maintAmt"]
+
+    def maintenance_ratio_and_amt_array(
+        self, notional_values: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized maintenance_ratio_and_amt().
+        Maintenance amounts the exchange doesn't provide are NaN.
+        :raises ValueError: for notional values below the lowest tier
+        """
+        notional_values = np.asarray(notional_values, dtype=np.float64)
+        if self._sorted:
+            indexes = np.searchsorted(self.min_notional, notional_values, side="right") - 1
+        else:
+            reverse = self.min_notional[::-1]
+            matches = notional_values[..., None] >= reverse
+            indexes = np.where(matches.any(axis=-1), len(reverse) - 1 - matches.argmax(axis=-1), -1)
+        if np.any(indexes < 0):
+            raise ValueError("nominal value can not be lower than 0")
+        return self.maintenance_rate[indexes], self.maintenance_amt[indexes]
+
+    def get_max_leverage(self, stake_amount: float) -> Optional[float]:
+        """
+        Maximum leverage for a stake amount.
+        :return: max leverage, None if stake_amount exceeds the highest tier.
+        """
+        if stake_amount == 0:
+            return self.source[0]["maxLeverage"]
+        floors = self._stake_floors
+        if self._floors_sorted:
+            # First tier whose successor's lowest stake is above stake_amount
+            index = bisect_right(floors, stake_amount)
+        else:
+            index = next((i for i, floor in enumerate(floors) if floor > stake_amount), len(floors))
+
+        tier = self.source[index]
+        if index < len(floors):
+            return min(tier["maxNotional"] / stake_amount, tier["maxLeverage"])
+        # On the last tier
+        if stake_amount > tier["maxNotional"]:
+            return None
+        return tier["maxLeverage"]
@@ -0,0 +1,449 @@
+"""
+Market data sidecar - shares the market data and the rate limit of one exchange
+between multiple bots running on the same host.
+"""
+
+import asyncio
+import getpass
+import logging
+import os
+import secrets
+import socket
+import stat
+import tempfile
+import time
+from multiprocessing.connection import Client, Connection, Listener
+from multiprocessing.context import AuthenticationError
+from pathlib import Path
+from threading import Event, Lock, Thread, get_ident
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from freqtrade.enums import CandleType
+from freqtrade.exchange.exchange_types import OHLCVResponse, Tickers
+from freqtrade.exchange.exchange_utils_timeframe import timeframe_to_prev_date
+from freqtrade.util import dt_ts
+
+
+if TYPE_CHECKING:
+    from freqtrade.exchange import Exchange
+
+logger = logging.getLogger(__name__)
+
+# Maximum age (in seconds) of tickers served to the bots
+SHARED_TICKERS_MAX_AGE = 10
+
+# (pair, timeframe, candle_type, since_ms)
+OHLCVJob = Tuple[str, str, CandleType, Optional[int]]
+
+
+def default_socket_path(exchange_name: str, trading_mode: str) -> str:
+    """
+    Socket path within a directory private to the current user.
+    """
+    return str(
+        Path(tempfile.gettempdir())
+        / f"freqtrade-{getpass.getuser()}"
+        / f"{exchange_name.lower()}_{trading_mode}.sock"
+    )
+
+
+def _check_private(path: Path) -> None:
+    """
+    Ensure path is owned by the current user and not accessible by anybody else.
+    :raises PermissionError: if the path may be tampered with by other users
+    """
+    st = path.stat()
+    if hasattr(os, "getuid") and st.st_uid != os.getuid():
+        raise PermissionError(f"{path} is not owned by the current user.")
+    if stat.S_IMODE(st.st_mode) & 0o077:
+        raise PermissionError(f"{path} is accessible by other users.")
+
+
+def _authkey_path(socket_path: str) -> Path:
+    return Path(f"{socket_path}.key")
+
+
+def _read_authkey(socket_path: str) -> bytes:
+    """
+    Read the key written by the sidecar - which proves that both sides run as the same user.
+    """
+    key_path = _authkey_path(socket_path)
+    _check_private(key_path)
+    return key_path.read_bytes()
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter.
+    Tokens are consumed on request, which allows the bucket to go "into debt" - the returned
+    delay is the time the caller has to wait until its request may be sent.
+    This keeps the order of requests without having to block within the bucket.
+    """
+
+    def __init__(self, refill_rate: float, capacity: float = 1.0) -> None:
+        """
+        :param refill_rate: Tokens added per second
+        :param capacity: Maximum amount of tokens (burst)
+        """
+        self.refill_rate = refill_rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = Lock()
+
+    def acquire(self, cost: float = 1.0) -> float:
+        """
+        Consume tokens for one request.
+        :return: Seconds to wait before the request may be sent
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last_refill) * self.refill_rate
+            )
+            self._last_refill = now
+            self._tokens -= cost
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.refill_rate
+
+
+class MarketDataSidecar:
+    """
+    Serves markets, tickers, leverage tiers and candles of one exchange to all bots
+    on this host, fetching each of them only once.
+    Also hosts the token bucket all bots use to throttle their requests to the exchange.
+
+    Bots connect via a unix socket (using multiprocessing.connection), see MarketDataClient.
+    """
+
+    def __init__(self, exchange: "Exchange", socket_path: str) -> None:
+        self._exchange = exchange
+        self.socket_path = socket_path
+        # Same rate as ccxt's own rate limiter would apply - but shared between all bots.
+        self.bucket = TokenBucket(1000 / exchange._api.rateLimit)
+        # Serializes the use of the exchange object
+        self._lock = Lock()
+        self._stop = Event()
+        self._listener: Optional[Listener] = None
+        self._authkey = b""
+        self._connections: Set[Connection] = set()
+
+        self._tickers: Tickers = {}
+        self._tickers_time = 0.0
+        self._leverage_tiers: Dict[str, List[Dict]] = {}
+        self._leverage_tiers_time = 0
+        # (pair, timeframe, candle_type) -> response
+        self._ohlcv: Dict[Tuple[str, str, CandleType], OHLCVResponse] = {}
+
+        # The sidecar's own requests are subject to the shared limit as well
+        install_shared_throttler(
+            InProcessMarketDataClient(self), exchange._api, exchange._api_async
+        )
+
+    def handle(self, method: str, *args: Any) -> Any:
+        if method == "throttle":
+            # Not serialized - throttling must not wait for requests in progress
+            return self.bucket.acquire(*args)
+        handlers: Dict[str, Callable[..., Any]] = {
+            "markets": self._markets,
+            "tickers": self._tickers_handler,
+            "leverage_tiers": self._leverage_tiers_handler,
+            "ohlcv": self._ohlcv_handler,
+        }
+        handler = handlers.get(method)
+        if not handler:
+            raise ValueError(f"Unknown method {method}")
+        with self._lock:
+            return handler(*args)
+
+    def _markets(self) -> Dict[str, Any]:
+        self._exchange.reload_markets(load_leverage_tiers=False)
+        return {
+            "exchange": self._exchange.id,
+            "trading_mode": self._exchange.trading_mode,
+            "markets": self._exchange._api_async.markets,
+            "currencies": self._exchange._api_async.currencies,
+            "options": self._exchange._api_async.options,
+        }
+
+    def _tickers_handler(self, max_age: float) -> Tickers:
+        if time.monotonic() - self._tickers_time > max_age:
+            self._tickers = self._exchange.get_tickers()
+            self._tickers_time = time.monotonic()
+        return self._tickers
+
+    def _leverage_tiers_handler(self) -> Dict[str, List[Dict]]:
+        if (
+            not self._leverage_tiers
+            or self._leverage_tiers_time + self._exchange.markets_refresh_interval < dt_ts()
+        ):
+            self._leverage_tiers = self._exchange.load_leverage_tiers()
+            self._leverage_tiers_time = dt_ts()
+        return self._leverage_tiers
+
+    def _get_cached_ohlcv(self, job: OHLCVJob) -> Optional[OHLCVResponse]:
+        pair, timeframe, candle_type, since_ms = job
+        cached = self._ohlcv.get((pair, timeframe, candle_type))
+        if not cached or not cached[3]:
+            return None
+        ticks = cached[3]
+        candle_date = int(timeframe_to_prev_date(timeframe).timestamp() * 1000)
+        # Usable if it contains the current candle - and the requested history.
+        if ticks[-1][0] >= candle_date and (since_ms is None or ticks[0][0] <= since_ms):
+            return cached
+        return None
+
+    def _ohlcv_handler(self, jobs: List[OHLCVJob]) -> List[Union[OHLCVResponse, Exception]]:
+        """
+        Serve candles for multiple pairs - fetching all pairs which are not cached
+        for the current candle concurrently.
+        """
+        results: List[Union[OHLCVResponse, Exception, None]] = [
+            self._get_cached_ohlcv(job) for job in jobs
+        ]
+        missing = [i for i, res in enumerate(results) if res is None]
+        if missing:
+            coros = []
+            for i in missing:
+                pair, timeframe, candle_type, since_ms = jobs[i]
+                if since_ms:
+                    coros.append(
+                        self._exchange._async_get_historic_ohlcv(
+                            pair, timeframe, since_ms=since_ms, raise_=True, candle_type=candle_type
+                        )
+                    )
+                else:
+                    coros.append(
+                        self._exchange._async_get_candle_history(
+                            pair, timeframe, candle_type=candle_type
+                        )
+                    )
+
+            async def gather_coroutines(coros):
+                return await asyncio.gather(*coros, return_exceptions=True)
+
+            with self._exchange._loop_lock:
+                responses = self._exchange.loop.run_until_complete(gather_coroutines(coros))
+            for i, res in zip(missing, responses):
+                if not isinstance(res, Exception):
+                    pair, timeframe, candle_type, _ = jobs[i]
+                    self._ohlcv[(pair, timeframe, candle_type)] = res
+                results[i] = res
+        return results  # type: ignore[return-value]
+
+    def _serve_connection(self, conn: Connection) -> None:
+        with conn:
+            self._serve_requests(conn)
+        self._connections.discard(conn)
+
+    def _serve_requests(self, conn: Connection) -> None:
+        while not self._stop.is_set():
+            try:
+                method, args = conn.recv()
+            except (EOFError, OSError):
+                break
+            try:
+                response: Tuple[bool, Any] = (True, self.handle(method, *args))
+            except Exception as e:
+                logger.warning(f"Market data sidecar: {method} failed: {e}")
+                response = (False, e)
+            try:
+                conn.send(response)
+            except (EOFError, OSError):
+                break
+
+    def _create_authkey(self) -> bytes:
+        """
+        Prepare the private socket directory, and write a new random key only the current
+        user can read. Connections are authenticated using this key before any message
+        is unpickled.
+        """
+        socket_dir = Path(self.socket_path).parent
+        socket_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        _check_private(socket_dir)
+        # Remove leftovers of a previous run
+        Path(self.socket_path).unlink(missing_ok=True)
+        key_path = _authkey_path(self.socket_path)
+        key_path.unlink(missing_ok=True)
+        authkey = secrets.token_bytes(32)
+        fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(authkey)
+        return authkey
+
+    def serve_forever(self) -> None:
+        self._authkey = self._create_authkey()
+        self._listener = Listener(self.socket_path, family="AF_UNIX", authkey=self._authkey)
+        logger.info(
+            f"Market data sidecar for {self._exchange.name} listening on {self.socket_path}."
+        )
+        try:
+            while not self._stop.is_set():
+                try:
+                    conn = self._listener.accept()
+                except (AuthenticationError, EOFError):
+                    logger.warning("Market data sidecar: rejected unauthenticated connection.")
+                    continue
+                except OSError:
+                    # Listener closed
+                    break
+                self._connections.add(conn)
+                Thread(target=self._serve_connection, args=(conn,), daemon=True).start()
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._listener:
+            try:
+                # Wake up accept()
+                Client(self.socket_path, family="AF_UNIX", authkey=self._authkey).close()
+            except OSError:
+                pass
+            self._listener.close()
+            self._listener = None
+            # Disconnect all bots - they fall back to fetching data themselves.
+            for conn in list(self._connections):
+                _shutdown(conn)
+            Path(self.socket_path).unlink(missing_ok=True)
+            _authkey_path(self.socket_path).unlink(missing_ok=True)
+
+
+def _shutdown(conn: Connection) -> None:
+    """
+    Shut the socket of a connection down - which wakes up a thread blocked in conn.recv().
+    """
+    try:
+        with socket.socket(fileno=os.dup(conn.fileno())) as sock:
+            sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+
+
+class MarketDataClient:
+    """
+    Connection of one bot to the market data sidecar.
+    Raises ConnectionError if the sidecar is not reachable - callers are expected to fall back
+    to fetching the data themselves.
+    Connections are per thread, so concurrent requests (e.g. from the api server) don't block
+    each other.
+    """
+
+    def __init__(self, socket_path: str) -> None:
+        self.socket_path = socket_path
+        self._connections: Dict[int, Connection] = {}
+        self._lock = Lock()
+
+    def _connection(self) -> Connection:
+        ident = get_ident()
+        with self._lock:
+            conn = self._connections.get(ident)
+        if conn is None:
+            conn = Client(
+                self.socket_path, family="AF_UNIX", authkey=_read_authkey(self.socket_path)
+            )
+            with self._lock:
+                self._connections[ident] = conn
+        return conn
+
+    def _drop_connection(self) -> None:
+        with self._lock:
+            conn = self._connections.pop(get_ident(), None)
+        if conn:
+            conn.close()
+
+    def _request(self, method: str, *args: Any) -> Any:
+        try:
+            conn = self._connection()
+            conn.send((method, args))
+            success, result = conn.recv()
+        except (EOFError, OSError, AuthenticationError) as e:
+            self._drop_connection()
+            raise ConnectionError(f"Market data sidecar not available: {e}") from e
+        if not success:
+            raise result
+        return result
+
+    def markets(self) -> Dict[str, Any]:
+        return self._request("markets")
+
+    def tickers(self, max_age: float = SHARED_TICKERS_MAX_AGE) -> Tickers:
+        return self._request("tickers", max_age)
+
+    def leverage_tiers(self) -> Dict[str, List[Dict]]:
+        return self._request("leverage_tiers")
+
+    def ohlcv(self, jobs: List[OHLCVJob]) -> List[Union[OHLCVResponse, Exception]]:
+        return self._request("ohlcv", jobs)
+
+    def throttle(self, cost: Optional[float] = None) -> float:
+        return self._request("throttle", 1.0 if cost is None else cost)
+
+    def close(self) -> None:
+        with self._lock:
+            for conn in self._connections.values():
+                conn.close()
+            self._connections = {}
+
+
+class InProcessMarketDataClient(MarketDataClient):
+    """
+    Stand-in for MarketDataClient, calling a sidecar in the same process.
+    """
+
+    def __init__(self, sidecar: MarketDataSidecar) -> None:
+        super().__init__(sidecar.socket_path)
+        self._sidecar = sidecar
+
+    def _request(self, method: str, *args: Any) -> Any:
+        return self._sidecar.handle(method, *args)
+
+
+class _AsyncSharedThrottler:
+    """
+    Replaces ccxt's async Throttler, waiting for the shared token bucket.
+    Falls back to ccxt's throttler if the sidecar is not available.
+    """
+
+    def __init__(self, client: MarketDataClient, local_throttler: Any) -> None:
+        self._client = client
+        self._local = local_throttler
+
+    @property
+    def loop(self):
+        return self._local.loop
+
+    @loop.setter
+    def loop(self, value):
+        # Assigned by ccxt when the session is opened
+        self._local.loop = value
+
+    async def __call__(self, cost: Optional[float] = None) -> None:
+        try:
+            # Don't block the event loop (and other requests in flight) on the socket.
+            delay = await asyncio.get_running_loop().run_in_executor(
+                None, self._client.throttle, cost
+            )
+        except ConnectionError:
+            return await self._local(cost)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def install_shared_throttler(client: MarketDataClient, api: Any, api_async: Any) -> None:
+    """
+    Throttle all requests of the given ccxt objects through the sidecar's token bucket.
+    """
+    local_throttle = api.throttle
+
+    def throttle(cost: Optional[float] = None) -> None:
+        try:
+            delay = client.throttle(cost)
+        except ConnectionError:
+            return local_throttle(cost)
+        if delay > 0:
+            time.sleep(delay)
+
+    api.throttle = throttle
+    api_async.throttle = _AsyncSharedThrottler(client, api_async.throttle)
@@ -36,6 +36,7 @@ class Okx(Exchange):
         "stoploss_on_exchange": True,
         "trades_has_history": False,  # Endpoint doesn't have a "since" parameter
         "ws_enabled": True,
+        "stoploss_query_bulk": False,  # Stoploss orders require special handling
     }
     _ft_has_futures: FtHas = {
         "tickers_have_quoteVolume": False,
@@ -1,10 +1,13 @@
 import logging
 from abc import ABC, abstractmethod
+from typing import Dict
 
 import torch
 
+from freqtrade.freqai.data_kitchen import FreqaiDataKitchen
 from freqtrade.freqai.freqai_interface import IFreqaiModel
 from freqtrade.freqai.torch.PyTorchDataConvertor import PyTorchDataConvertor
+from freqtrade.freqai.torch.PyTorchTrainerInterface import PyTorchTrainerInterface
 
 
 logger = logging.getLogger(__name__)
@@ -24,6 +27,28 @@ class BasePyTorchModel(IFreqaiModel, ABC):
         test_size = self.freqai_info.get("data_split_parameters", {}).get("test_size")
         self.splits = ["train", "test"] if test_size != 0 else ["train"]
         self.window_size = self.freqai_info.get("conv_width", 1)
+        trainer_kwargs = self.freqai_info.get("model_training_parameters", {}).get(
+            "trainer_kwargs", {}
+        )
+        self.use_feature_store: bool = trainer_kwargs.get("use_feature_store", False)
+
+    def fit_trainer(
+        self, trainer: PyTorchTrainerInterface, data_dictionary: Dict, dk: FreqaiDataKitchen
+    ) -> None:
+        """
+        Fit the trainer on the data dictionary. With `trainer_kwargs.use_feature_store`,
+        features are written to a memory-mapped feature store and streamed batch-wise
+        during training, which caps the training memory for large datasets.
+        """
+        if not self.use_feature_store:
+            trainer.fit(data_dictionary, self.splits)
+            return
+
+        feature_store = dk.write_feature_store(data_dictionary, self.splits)
+        try:
+            trainer.fit(data_dictionary, self.splits, feature_store)
+        finally:
+            dk.remove_feature_store()
 
     @property
     @abstractmethod
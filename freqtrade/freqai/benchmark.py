@@ -0,0 +1,303 @@
+import logging
+import shutil
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from copy import deepcopy
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+import psutil
+from pandas import DataFrame
+
+from freqtrade.constants import Config
+from freqtrade.exceptions import OperationalException
+from freqtrade.exchange import timeframe_to_seconds
+from freqtrade.freqai.data_kitchen import FreqaiDataKitchen
+from freqtrade.freqai.utils import get_tb_logger
+from freqtrade.resolvers import StrategyResolver
+from freqtrade.util import print_rich_table
+
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_STAGES = [
+    "generate_data",
+    "populate_features",
+    "data_cleaning_train",
+    "train",
+    "data_cleaning_predict",
+    "predict",
+]
+
+
+class StageProfiler:
+    """
+    Measures time and peak memory of (nested) benchmark stages.
+    Time and memory within a nested stage are only attributed to the nested stage - so the
+    model's fit() can be timed within the surrounding train() call.
+    Peak memory is measured twice: allocations of the Python allocator (tracemalloc), and
+    the resident set size of the process, sampled on a separate thread - which includes
+    native allocations (e.g. of LightGBM or torch).
+    """
+
+    def __init__(self, sample_interval: float = 0.005) -> None:
+        self.results: Dict[str, List[Dict[str, float]]] = {s: [] for s in BENCHMARK_STAGES}
+        self._sample_interval = sample_interval
+        self._process = psutil.Process()
+        # Stages currently entered, innermost last
+        self._stack: List[Dict[str, float]] = []
+        # Measurements of the current run, per stage
+        self._run: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._peak_rss = 0
+        self._segment_start = 0.0
+        self._segment_traced = 0
+        self._segment_rss = 0
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "StageProfiler":
+        tracemalloc.start()
+        self._stop.clear()
+        self._sampler = threading.Thread(target=self._sample_rss, daemon=True)
+        self._sampler.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._stop.set()
+        if self._sampler:
+            self._sampler.join()
+        tracemalloc.stop()
+
+    def _sample_rss(self) -> None:
+        while not self._stop.wait(self._sample_interval):
+            rss = self._process.memory_info().rss
+            with self._lock:
+                self._peak_rss = max(self._peak_rss, rss)
+
+    def _open_segment(self) -> None:
+        tracemalloc.reset_peak()
+        self._segment_traced = tracemalloc.get_traced_memory()[0]
+        rss = self._process.memory_info().rss
+        with self._lock:
+            self._peak_rss = rss
+        self._segment_rss = rss
+        self._segment_start = perf_counter()
+
+    def _close_segment(self) -> None:
+        duration = perf_counter() - self._segment_start
+        traced_peak = tracemalloc.get_traced_memory()[1]
+        rss = self._process.memory_info().rss
+        with self._lock:
+            peak_rss = max(self._peak_rss, rss)
+        record = self._stack[-1]
+        record["time"] += duration
+        record["memory"] = max(record["memory"], traced_peak - self._segment_traced)
+        record["rss"] = max(record["rss"], peak_rss - self._segment_rss)
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """
+        Time the wrapped block and measure its peak memory.
+        """
+        if self._stack:
+            self._close_segment()
+        self._stack.append({"time": 0.0, "memory": 0, "rss": 0})
+        self._open_segment()
+        try:
+            yield
+        finally:
+            self._close_segment()
+            record = self._stack.pop()
+            if stage in self._run:
+                # Stage measured multiple times within this run
+                run = self._run[stage]
+                run["time"] += record["time"]
+                run["memory"] = max(run["memory"], record["memory"])
+                run["rss"] = max(run["rss"], record["rss"])
+            else:
+                self._run[stage] = record
+            if self._stack:
+                self._open_segment()
+
+    def finish_run(self) -> None:
+        """
+        Store the measurements of all stages since the last run (e.g. of one pair).
+        """
+        for stage, record in self._run.items():
+            self.results[stage].append(record)
+        self._run = {}
+
+    @contextmanager
+    def instrument(self, obj: Any, method: str, stage: str) -> Iterator[None]:
+        """
+        Measure all calls of obj.method as stage, while the wrapped block runs.
+        """
+        original = getattr(obj, method)
+        instance_attr = method in vars(obj)
+
+        def measured(*args, **kwargs):
+            with self.measure(stage):
+                return original(*args, **kwargs)
+
+        setattr(obj, method, measured)
+        try:
+            yield
+        finally:
+            if instance_attr:
+                setattr(obj, method, original)
+            else:
+                # Remove the instance attribute, exposing the class' method again
+                delattr(obj, method)
+
+
+class FreqaiBenchmark:
+    """
+    Measures the throughput of the FreqAI pipeline on synthetic OHLCV data, independent
+    of an exchange or of downloaded data.
+    Every stage of the real pipeline (feature population through the strategy, the
+    feature pipeline, training and prediction of the configured freqaimodel) is timed,
+    and its peak memory is measured.
+    """
+
+    def __init__(self, config: Config) -> None:
+        if not config.get("freqai", {}).get("enabled", False):
+            raise OperationalException("FreqAI must be enabled in the config to benchmark it.")
+
+        self.config = deepcopy(config)
+        self.num_pairs: int = self.config.get("freqai_benchmark_pairs", 1)
+        self.num_candles: int = self.config.get("freqai_benchmark_candles", 10000)
+        self.pairs = [f"BENCH{i}/USDT" for i in range(self.num_pairs)]
+        # Keep benchmark models apart from the models of the configured identifier.
+        self.config["freqai"]["identifier"] = "freqai-benchmark"
+        self.config["exchange"]["pair_whitelist"] = self.pairs
+
+        self.ft_params = self.config["freqai"]["feature_parameters"]
+        self.timeframes: List[str] = list(
+            dict.fromkeys([self.config["timeframe"], *self.ft_params["include_timeframes"]])
+        )
+        self.corr_pairs: List[str] = self.ft_params.get("include_corr_pairlist", [])
+
+        self.strategy = StrategyResolver.load_strategy(self.config)
+        self.strategy.ft_bot_start()
+        self.freqai = self.strategy.freqai
+        self.freqai.live = True
+        self.end_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self.rng = np.random.default_rng(42)
+        self.profiler = StageProfiler()
+
+    @property
+    def results(self) -> Dict[str, List[Dict[str, float]]]:
+        return self.profiler.results
+
+    def generate_ohlcv(self, timeframe: str) -> DataFrame:
+        """
+        Generate a geometric random walk covering the benchmark period in the given timeframe.
+        """
+        tf_seconds = timeframe_to_seconds(timeframe)
+        base_seconds = timeframe_to_seconds(self.config["timeframe"])
+        candles = max(int(self.num_candles * base_seconds / tf_seconds), 1)
+        dates = pd.date_range(
+            end=self.end_date, periods=candles, freq=f"{tf_seconds}s", tz="UTC", name="date"
+        )
+        close = 100 * np.exp(np.cumsum(self.rng.normal(0, 0.005, candles)))
+        open_ = np.concatenate([[close[0]], close[:-1]])
+        spread = np.abs(self.rng.normal(0, 0.002, candles)) * close
+        return DataFrame(
+            {
+                "date": dates,
+                "open": open_,
+                "high": np.maximum(open_, close) + spread,
+                "low": np.minimum(open_, close) - spread,
+                "close": close,
+                "volume": self.rng.uniform(100, 10000, candles),
+            }
+        )
+
+    def benchmark_pair(self, pair: str, corr_dataframes: Dict[str, Dict[str, DataFrame]]) -> None:
+        dk = FreqaiDataKitchen(
+            self.config, live=True, pair=pair, feature_cache=self.freqai.dd.feature_cache
+        )
+        dk.set_paths(pair, int(self.end_date.timestamp()))
+        self.freqai.dk = dk
+
+        measure = self.profiler.measure
+        with measure("generate_data"):
+            base_dataframes = {tf: self.generate_ohlcv(tf) for tf in self.timeframes}
+
+        with measure("populate_features"):
+            dataframe = dk.use_strategy_to_populate_indicators(
+                self.strategy, corr_dataframes, base_dataframes, pair
+            )
+        dk.find_features(dataframe)
+        dk.find_labels(dataframe)
+
+        # train() filters and splits the data and fits the pipelines - and passes the
+        # prepared data to fit(), which is measured separately.
+        self.freqai.tb_logger = get_tb_logger(self.freqai.dd.model_type, dk.data_path, False)
+        with self.profiler.instrument(self.freqai, "fit", "train"):
+            with measure("data_cleaning_train"):
+                self.freqai.model = self.freqai.train(dataframe, pair, dk)
+        self.freqai.tb_logger.close()
+
+        # predict() filters and transforms the features before running the model.
+        with self.profiler.instrument(dk, "filter_features", "data_cleaning_predict"):
+            with self.profiler.instrument(
+                dk.feature_pipeline, "transform", "data_cleaning_predict"
+            ):
+                with measure("predict"):
+                    self.freqai.predict(dataframe, dk)
+
+        self.profiler.finish_run()
+
+    def start(self) -> Dict[str, List[Dict[str, float]]]:
+        logger.info(
+            f"Benchmarking {self.freqai.__class__.__name__} on {self.num_pairs} pairs with "
+            f"{self.num_candles} synthetic {self.config['timeframe']} candles."
+        )
+        try:
+            with self.profiler:
+                corr_dataframes = {
+                    p: {tf: self.generate_ohlcv(tf) for tf in self.timeframes}
+                    for p in self.corr_pairs
+                }
+                for pair in self.pairs:
+                    self.benchmark_pair(pair, corr_dataframes)
+        finally:
+            shutil.rmtree(self.freqai.full_path, ignore_errors=True)
+
+        return self.results
+
+    def print_results(self) -> None:
+        rows = []
+        for stage in BENCHMARK_STAGES:
+            if not self.results[stage]:
+                continue
+            times = [r["time"] for r in self.results[stage]]
+            rows.append(
+                [
+                    stage,
+                    f"{sum(times):.3f}",
+                    f"{np.mean(times):.3f}",
+                    f"{max(r['memory'] for r in self.results[stage]) / 1024 / 1024:.1f}",
+                    f"{max(r['rss'] for r in self.results[stage]) / 1024 / 1024:.1f}",
+                ]
+            )
+        print_rich_table(
+            rows,
+            [
+                "Stage",
+                "Total time (s)",
+                "Mean time per pair (s)",
+                "Peak Python memory (MiB)",
+                "Peak RSS increase (MiB)",
+            ],
+            summary=(
+                f"FreqAI benchmark - {self.freqai.__class__.__name__}, {self.num_pairs} pairs, "
+                f"{self.num_candles} candles"
+            ),
+        )
@@ -0,0 +1,123 @@
+import logging
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+
+logger = logging.getLogger(__name__)
+
+
+def _to_datetime64(value: datetime) -> np.datetime64:
+    """
+    Convert a (timezone aware) datetime to a naive UTC datetime64, as stored in the buffer.
+    """
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert("UTC").tz_localize(None)
+    return ts.to_datetime64()
+
+
+class CandleBuffer:
+    """
+    Growable columnar buffer holding the candle history of one pair/timeframe.
+    Appending new candles only copies the new rows (the arrays grow by doubling their
+    capacity), and trimming old candles only moves the start offset - so per-candle
+    updates are O(new rows) and don't copy the full history.
+    Old rows are released when the buffer is compacted while growing, which keeps the
+    memory bounded by twice the retained history.
+    """
+
+    def __init__(self, dataframe: DataFrame, min_capacity: int = 1024):
+        self.columns = list(dataframe.columns)
+        self._min_capacity = min_capacity
+        self._tz = {col: getattr(dataframe[col].dtype, "tz", None) for col in self.columns}
+        rows = len(dataframe)
+        capacity = max(min_capacity, rows * 2)
+        self._data: Dict[str, np.ndarray] = {}
+        for col in self.columns:
+            values = dataframe[col].values
+            self._data[col] = np.empty(capacity, dtype=values.dtype)
+            self._data[col][:rows] = values
+        self._start = 0
+        self._end = rows
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data[self.columns[0]]) if self.columns else 0
+
+    @property
+    def dates(self) -> np.ndarray:
+        return self._data["date"][self._start : self._end]
+
+    @property
+    def last_date(self) -> Optional[pd.Timestamp]:
+        if len(self) == 0:
+            return None
+        last_date = pd.Timestamp(self.dates[-1])
+        if self._tz["date"] is not None:
+            last_date = last_date.tz_localize("UTC").tz_convert(self._tz["date"])
+        return last_date
+
+    def append(self, dataframe: DataFrame) -> None:
+        """
+        Append new candles to the end of the buffer.
+        :param dataframe: candles to append, must contain all buffer columns
+        """
+        rows = len(dataframe)
+        if rows == 0:
+            return
+        if self._end + rows > self.capacity:
+            self._grow(rows)
+        for col in self.columns:
+            self._data[col][self._end : self._end + rows] = dataframe[col].values
+        self._end += rows
+
+    def _grow(self, rows: int) -> None:
+        """
+        Compact the buffer (dropping trimmed rows) and double its capacity.
+        """
+        length = len(self)
+        capacity = max(self._min_capacity, (length + rows) * 2)
+        for col in self.columns:
+            new = np.empty(capacity, dtype=self._data[col].dtype)
+            new[:length] = self._data[col][self._start : self._end]
+            self._data[col] = new
+        self._start = 0
+        self._end = length
+
+    def trim(self, min_date: datetime) -> None:
+        """
+        Drop all candles older than min_date.
+        """
+        self._start += int(np.searchsorted(self.dates, _to_datetime64(min_date), side="left"))
+
+    def to_dataframe(
+        self, start: Optional[datetime] = None, stop: Optional[datetime] = None
+    ) -> DataFrame:
+        """
+        Return (a slice of) the buffer as dataframe.
+        :param start: first candle date to include (inclusive)
+        :param stop: last candle date to include (exclusive)
+        :return: dataframe with a fresh RangeIndex, not sharing memory with the buffer
+        """
+        dates = self.dates
+        first = 0
+        last = len(dates)
+        if start is not None:
+            first = int(np.searchsorted(dates, _to_datetime64(start), side="left"))
+        if stop is not None:
+            last = int(np.searchsorted(dates, _to_datetime64(stop), side="left"))
+        data = {}
+        for col in self.columns:
+            values = self._data[col][self._start + first : self._start + last].copy()
+            if self._tz[col] is not None:
+                data[col] = pd.Series(values).dt.tz_localize("UTC").dt.tz_convert(self._tz[col])
+            else:
+                data[col] = values
+        return DataFrame(data, columns=self.columns)
@@ -7,7 +7,7 @@ import threading
 import warnings
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, Tuple, TypedDict
+from typing import Any, Dict, Set, Tuple, TypedDict
 
 import numpy as np
 import pandas as pd
@@ -22,7 +22,11 @@ from freqtrade.constants import Config
 from freqtrade.data.history import load_pair_history
 from freqtrade.enums import CandleType
 from freqtrade.exceptions import OperationalException
+from freqtrade.exchange import timeframe_to_seconds
+from freqtrade.freqai.candle_buffer import CandleBuffer
 from freqtrade.freqai.data_kitchen import FreqaiDataKitchen
+from freqtrade.freqai.feature_cache import FeatureCache
+from freqtrade.freqai.model_cache import CachedModel, ModelCache
 from freqtrade.strategy.interface import IStrategy
 
 
@@ -75,8 +79,11 @@ class FreqaiDataDrawer:
         # all additional metadata that we want to keep in ram
         self.meta_data_dictionary: Dict[str, Dict[str, Any]] = {}
         self.model_return_values: Dict[str, DataFrame] = {}
-        self.historic_data: Dict[str, Dict[str, DataFrame]] = {}
+        # candle history per pair and timeframe, used for training in dry/live
+        self.historic_data: Dict[str, Dict[str, CandleBuffer]] = {}
         self.historic_predictions: Dict[str, DataFrame] = {}
+        # populated corr pair features, shared between all base pairs
+        self.feature_cache = FeatureCache()
         self.full_path = full_path
         self.historic_predictions_path = Path(self.full_path / "historic_predictions.pkl")
         self.historic_predictions_bkp_path = Path(
@@ -90,6 +97,8 @@ class FreqaiDataDrawer:
         self.metric_tracker: Dict[str, Dict[str, Dict[str, list]]] = {}
         self.load_metric_tracker_from_disk()
         self.training_queue: Dict[str, int] = {}
+        # Pairs currently trained - their model files must not be read by the prefetcher.
+        self.pairs_in_training: Set[str] = set()
         self.history_lock = threading.Lock()
         self.save_lock = threading.Lock()
         self.pair_dict_lock = threading.Lock()
@@ -102,6 +111,8 @@ class FreqaiDataDrawer:
             "extras": {},
         }
         self.model_type = self.freqai_info.get("model_save_type", "joblib")
+        # models, pipelines and metadata loaded from disk, bounded by memory size
+        self.model_cache = ModelCache(self.freqai_info.get("model_cache_size_mb", 512))
 
     def update_metric_tracker(self, metric: str, value: float, pair: str) -> None:
         """
@@ -545,6 +556,12 @@ class FreqaiDataDrawer:
         )
 
         self.model_dictionary[coin] = model
+        # a new model was trained, models of this pair in the cache are outdated
+        self.model_cache.invalidate_pair(coin)
+        self.model_cache.store(
+            ModelCache.build_key(dk.data_path, dk.model_filename),
+            self._build_cache_entry(coin, model, dk),
+        )
         self.pair_dict[coin]["model_filename"] = dk.model_filename
         self.pair_dict[coin]["data_path"] = str(dk.data_path)
 
@@ -567,9 +584,11 @@ class FreqaiDataDrawer:
             dk.training_features_list = dk.data["training_features_list"]
             dk.label_list = dk.data["label_list"]
 
-    def load_data(self, coin: str, dk: FreqaiDataKitchen) -> Any:  # noqa: C901
+    def load_data(self, coin: str, dk: FreqaiDataKitchen) -> Any:
         """
         loads all data required to make a prediction on a sub-train time range
+        Models, pipelines and metadata loaded from disk are kept in the model cache,
+        avoiding repeated disk reads and unpickling.
         :returns:
         :model: User trained model which can be inferenced for new predictions
         """
@@ -581,18 +600,19 @@ class FreqaiDataDrawer:
             dk.model_filename = self.pair_dict[coin]["model_filename"]
             dk.data_path = Path(self.pair_dict[coin]["data_path"])
 
+        cache_key = ModelCache.build_key(dk.data_path, dk.model_filename)
+        cached = self.model_cache.get(cache_key)
+
         if coin in self.meta_data_dictionary:
             dk.data = self.meta_data_dictionary[coin][METADATA]
             dk.feature_pipeline = self.meta_data_dictionary[coin][FEATURE_PIPELINE]
             dk.label_pipeline = self.meta_data_dictionary[coin][LABEL_PIPELINE]
+        elif cached is not None:
+            dk.data = cached["metadata"]
+            dk.feature_pipeline = cached["feature_pipeline"]
+            dk.label_pipeline = cached["label_pipeline"]
         else:
-            with (dk.data_path / f"{dk.model_filename}_{METADATA}.json").open("r") as fp:
-                dk.data = rapidjson.load(fp, number_mode=rapidjson.NM_NATIVE)
-
-            with (dk.data_path / f"{dk.model_filename}_{FEATURE_PIPELINE}.pkl").open("rb") as fp:
-                dk.feature_pipeline = cloudpickle.load(fp)
-            with (dk.data_path / f"{dk.model_filename}_{LABEL_PIPELINE}.pkl").open("rb") as fp:
-                dk.label_pipeline = cloudpickle.load(fp)
+            self._load_metadata_and_pipelines(dk)
 
         dk.training_features_list = dk.data["training_features_list"]
         dk.label_list = dk.data["label_list"]
@@ -600,7 +620,83 @@ class FreqaiDataDrawer:
         # try to access model in memory instead of loading object from disk to save time
         if dk.live and coin in self.model_dictionary:
             model = self.model_dictionary[coin]
-        elif self.model_type == "joblib":
+        elif cached is not None:
+            model = cached["model"]
+        else:
+            model = self._load_model(dk)
+
+        if not model:
+            raise OperationalException(
+                f"Unable to load model, ensure model exists at {dk.data_path} "
+            )
+
+        if cached is None:
+            self.model_cache.store(cache_key, self._build_cache_entry(coin, model, dk))
+
+        # load it into ram if it was loaded from disk
+        if coin not in self.model_dictionary:
+            self.model_dictionary[coin] = model
+
+        return model
+
+    def needs_prefetch(self, coin: str) -> bool:
+        """
+        Check if the current model of a pair can be prefetched, and isn't cached yet.
+        Pairs in training are skipped, as their model files are about to be (re)written.
+        """
+        if (
+            not self.model_cache.enabled
+            or coin in self.pairs_in_training
+            or coin not in self.pair_dict
+            or not self.pair_dict[coin].get("model_filename")
+        ):
+            return False
+        cache_key = ModelCache.build_key(
+            Path(self.pair_dict[coin]["data_path"]), self.pair_dict[coin]["model_filename"]
+        )
+        return cache_key not in self.model_cache
+
+    def prefetch_data(self, coin: str, dk: FreqaiDataKitchen) -> None:
+        """
+        Warm the model cache with the current model of a pair, so a following
+        `load_data()` call for this pair doesn't need to access the disk.
+        """
+        if not self.needs_prefetch(coin):
+            return
+        dk.model_filename = self.pair_dict[coin]["model_filename"]
+        dk.data_path = Path(self.pair_dict[coin]["data_path"])
+        cache_key = ModelCache.build_key(dk.data_path, dk.model_filename)
+        try:
+            self._load_metadata_and_pipelines(dk)
+            model = self._load_model(dk)
+        except Exception as e:
+            logger.warning(f"Could not prefetch model for {coin}: {e}")
+            return
+        if model:
+            self.model_cache.store(cache_key, self._build_cache_entry(coin, model, dk))
+
+    def _build_cache_entry(self, coin: str, model: Any, dk: FreqaiDataKitchen) -> CachedModel:
+        return {
+            "pair": coin,
+            "model": model,
+            "metadata": dk.data,
+            "feature_pipeline": dk.feature_pipeline,
+            "label_pipeline": dk.label_pipeline,
+            "size": ModelCache.estimate_size(dk.data_path, dk.model_filename),
+        }
+
+    def _load_metadata_and_pipelines(self, dk: FreqaiDataKitchen) -> None:
+        with (dk.data_path / f"{dk.model_filename}_{METADATA}.json").open("r") as fp:
+            dk.data = rapidjson.load(fp, number_mode=rapidjson.NM_NATIVE)
+
+        with (dk.data_path / f"{dk.model_filename}_{FEATURE_PIPELINE}.pkl").open("rb") as fp:
+            dk.feature_pipeline = cloudpickle.load(fp)
+        with (dk.data_path / f"{dk.model_filename}_{LABEL_PIPELINE}.pkl").open("rb") as fp:
+            dk.label_pipeline = cloudpickle.load(fp)
+
+    def _load_model(self, dk: FreqaiDataKitchen) -> Any:
+        model = None
+        if self.model_type == "joblib":
             with (dk.data_path / f"{dk.model_filename}_model.joblib").open("rb") as fp:
                 model = cloudpickle.load(fp)
         elif "stable_baselines" in self.model_type or "sb3_contrib" == self.model_type:
@@ -615,70 +711,77 @@ class FreqaiDataDrawer:
             zipfile = torch.load(dk.data_path / f"{dk.model_filename}_model.zip")
             model = zipfile["pytrainer"]
             model = model.load_from_checkpoint(zipfile)
-
-        if not model:
-            raise OperationalException(
-                f"Unable to load model, ensure model exists at {dk.data_path} "
-            )
-
-        # load it into ram if it was loaded from disk
-        if coin not in self.model_dictionary:
-            self.model_dictionary[coin] = model
-
         return model
 
+    def get_history_retention(self) -> timedelta:
+        """
+        Amount of candle history to keep in memory - the training window plus the additional
+        candles required to populate indicators (see `check_if_new_training_required()`).
+        """
+        feat_params = self.freqai_info["feature_parameters"]
+        max_tf_seconds = max(
+            timeframe_to_seconds(tf) for tf in feat_params.get("include_timeframes")
+        )
+        additional_seconds = self.config.get("startup_candle_count", 20) * 2 * max_tf_seconds
+        return timedelta(
+            days=self.freqai_info.get("train_period_days", 0), seconds=additional_seconds
+        )
+
     def update_historic_data(self, strategy: IStrategy, dk: FreqaiDataKitchen) -> None:
         """
         Append new candles to our stores historic data (in memory) so that
         we do not need to load candle history from disk and we dont need to
         pinging exchange multiple times for the same candle.
+        Only new candles are appended, and candles older than the history retention
+        are trimmed, so the history doesn't grow unbounded.
         :param dataframe: DataFrame = strategy provided dataframe
         """
         feat_params = self.freqai_info["feature_parameters"]
+        retention = self.get_history_retention()
         with self.history_lock:
             history_data = self.historic_data
 
             for pair in dk.all_pairs:
                 for tf in feat_params.get("include_timeframes"):
-                    hist_df = history_data[pair][tf]
+                    hist_buffer = history_data[pair][tf]
                     # check if newest candle is already appended
                     df_dp = strategy.dp.get_pair_dataframe(pair, tf)
                     if len(df_dp.index) == 0:
                         continue
-                    if str(hist_df.iloc[-1]["date"]) == str(df_dp.iloc[-1:]["date"].iloc[-1]):
+                    hist_last_date = hist_buffer.last_date
+                    if hist_last_date is None:
+                        hist_buffer.append(df_dp)
+                        continue
+                    if hist_last_date == df_dp["date"].iloc[-1]:
                         continue
 
-                    try:
-                        index = df_dp.loc[df_dp["date"] == hist_df.iloc[-1]["date"]].index[0] + 1
-                    except IndexError:
-                        if hist_df.iloc[-1]["date"] < df_dp["date"].iloc[0]:
-                            raise OperationalException(
-                                "In memory historical data is older than "
-                                f"oldest DataProvider candle for {pair} on "
-                                f"timeframe {tf}"
-                            )
-                        else:
-                            index = -1
-                            logger.warning(
-                                f"No common dates in historical data and dataprovider for {pair}. "
-                                f"Appending latest dataprovider candle to historical data "
-                                "but please be aware that there is likely a gap in the historical "
-                                "data. \n"
-                                f"Historical data ends at {hist_df.iloc[-1]['date']} "
-                                f"while dataprovider starts at {df_dp['date'].iloc[0]} and"
-                                f"ends at {df_dp['date'].iloc[0]}."
-                            )
-
-                    history_data[pair][tf] = pd.concat(
-                        [
-                            hist_df,
-                            df_dp.iloc[index:],
-                        ],
-                        ignore_index=True,
-                        axis=0,
-                    )
-
-            self.current_candle = history_data[dk.pair][self.config["timeframe"]].iloc[-1]["date"]
+                    pos = int(df_dp["date"].searchsorted(hist_last_date, side="left"))
+                    if pos < len(df_dp) and df_dp["date"].iloc[pos] == hist_last_date:
+                        index = pos + 1
+                    elif hist_last_date < df_dp["date"].iloc[0]:
+                        raise OperationalException(
+                            "In memory historical data is older than "
+                            f"oldest DataProvider candle for {pair} on "
+                            f"timeframe {tf}"
+                        )
+                    else:
+                        index = -1
+                        logger.warning(
+                            f"No common dates in historical data and dataprovider for {pair}. "
+                            f"Appending latest dataprovider candle to historical data "
+                            "but please be aware that there is likely a gap in the historical "
+                            "data. \n"
+                            f"Historical data ends at {hist_last_date} "
+                            f"while dataprovider starts at {df_dp['date'].iloc[0]} and"
+                            f"ends at {df_dp['date'].iloc[0]}."
+                        )
+
+                    hist_buffer.append(df_dp.iloc[index:])
+                    last_date = hist_buffer.last_date
+                    if retention.total_seconds() > 0 and last_date is not None:
+                        hist_buffer.trim(last_date - retention)
+
+            self.current_candle = history_data[dk.pair][self.config["timeframe"]].last_date
 
     def load_all_pair_histories(self, timerange: TimeRange, dk: FreqaiDataKitchen) -> None:
         """
@@ -693,13 +796,15 @@ class FreqaiDataDrawer:
             if pair not in history_data:
                 history_data[pair] = {}
             for tf in self.freqai_info["feature_parameters"].get("include_timeframes"):
-                history_data[pair][tf] = load_pair_history(
-                    datadir=self.config["datadir"],
-                    timeframe=tf,
-                    pair=pair,
-                    timerange=timerange,
-                    data_format=self.config.get("dataformat_ohlcv", "feather"),
-                    candle_type=self.config.get("candle_type_def", CandleType.SPOT),
+                history_data[pair][tf] = CandleBuffer(
+                    load_pair_history(
+                        datadir=self.config["datadir"],
+                        timeframe=tf,
+                        pair=pair,
+                        timerange=timerange,
+                        data_format=self.config.get("dataformat_ohlcv", "feather"),
+                        candle_type=self.config.get("candle_type_def", CandleType.SPOT),
+                    )
                 )
 
     def get_base_and_corr_dataframes(
@@ -717,20 +822,20 @@ class FreqaiDataDrawer:
             base_dataframes: Dict[Any, Any] = {}
             historic_data = self.historic_data
             pairs = self.freqai_info["feature_parameters"].get("include_corr_pairlist", [])
+            # same slicing as dk.slice_dataframe()
+            stop = None if dk.live else timerange.stopdt
 
             for tf in self.freqai_info["feature_parameters"].get("include_timeframes"):
-                base_dataframes[tf] = dk.slice_dataframe(
-                    timerange, historic_data[pair][tf]
-                ).reset_index(drop=True)
+                base_dataframes[tf] = historic_data[pair][tf].to_dataframe(timerange.startdt, stop)
                 if pairs:
                     for p in pairs:
                         if pair in p:
                             continue  # dont repeat anything from whitelist
                         if p not in corr_dataframes:
                             corr_dataframes[p] = {}
-                        corr_dataframes[p][tf] = dk.slice_dataframe(
-                            timerange, historic_data[p][tf]
-                        ).reset_index(drop=True)
+                        corr_dataframes[p][tf] = historic_data[p][tf].to_dataframe(
+                            timerange.startdt, stop
+                        )
 
         return corr_dataframes, base_dataframes
 
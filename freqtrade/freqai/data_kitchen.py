@@ -20,6 +20,7 @@ from freqtrade.constants import DOCS_LINK, Config
 from freqtrade.data.converter import reduce_dataframe_footprint
 from freqtrade.exceptions import OperationalException
 from freqtrade.exchange import timeframe_to_seconds
+from freqtrade.freqai.feature_cache import FeatureCache
 from freqtrade.strategy import merge_informative_pair
 from freqtrade.strategy.interface import IStrategy
 
@@ -63,6 +64,7 @@ class FreqaiDataKitchen:
         config: Config,
         live: bool = False,
         pair: str = "",
+        feature_cache: Optional[FeatureCache] = None,
     ):
         self.data: Dict[str, Any] = {}
         self.data_dictionary: Dict[str, DataFrame] = {}
@@ -107,6 +109,8 @@ class FreqaiDataKitchen:
         self.unique_classes: Dict[str, list] = {}
         self.unique_class_list: list = []
         self.backtest_live_models_data: Dict[str, Any] = {}
+        # shared (persistent) cache of corr pair features, owned by the datadrawer
+        self.feature_cache = feature_cache
 
     def set_paths(
         self,
@@ -319,6 +323,43 @@ class FreqaiDataKitchen:
 
         return self.data_dictionary
 
+    def write_feature_store(
+        self, data_dictionary: Dict[str, Any], splits: List[str], chunk_size: int = 10_000
+    ) -> Dict[str, Path]:
+        """
+        Write the features of each split to a memory-mapped `.npy` file in the model folder,
+        allowing PyTorch trainers to read batches from disk instead of keeping a second full
+        copy of the features in memory. Written in chunks to avoid a full float32 copy.
+        :param data_dictionary: Dict = the data dictionary holding `{split}_features`
+        :param splits: List[str] = splits to write (e.g. ["train", "test"])
+        :param chunk_size: int = number of rows converted and written at once
+        :return: dictionary of split -> path of the written features
+        """
+        store_path = self.data_path / "feature_store"
+        store_path.mkdir(parents=True, exist_ok=True)
+        feature_store: Dict[str, Path] = {}
+        for split in splits:
+            features = data_dictionary[f"{split}_features"]
+            path = store_path / f"{split}_features.npy"
+            store = np.lib.format.open_memmap(
+                path, mode="w+", dtype=np.float32, shape=features.shape
+            )
+            for start in range(0, len(features), chunk_size):
+                store[start : start + chunk_size] = features.iloc[
+                    start : start + chunk_size
+                ].to_numpy(dtype=np.float32)
+            store.flush()
+            del store
+            feature_store[split] = path
+
+        return feature_store
+
+    def remove_feature_store(self) -> None:
+        """
+        Remove the feature store written by `write_feature_store()`.
+        """
+        shutil.rmtree(self.data_path / "feature_store", ignore_errors=True)
+
     def split_timerange(
         self, tr: str, train_split: int = 28, bt_split: float = 7
     ) -> Tuple[list, list]:
@@ -712,6 +753,76 @@ class FreqaiDataKitchen:
         dataframe = dataframe.drop(columns=skip_columns)
         return dataframe
 
+    def concat_features(
+        self, df_main: DataFrame, feature_dfs: List[Tuple[DataFrame, str]], tf: str
+    ) -> DataFrame:
+        """
+        Attach the features of multiple dataframes (all of the same timeframe as df_main)
+        to df_main in a single concat. Equivalent to calling `merge_features()` for each
+        dataframe - but avoids copying and merging df_main once per dataframe.
+        Falls back to `merge_features()` if the dataframes are not aligned on date.
+        :param df_main: DataFrame = main dataframe
+        :param feature_dfs: list of (dataframe, suffix) tuples to attach
+        :param tf: str = timeframe of all dataframes
+        :return: dataframe = dataframe with all features attached
+        """
+        dates = df_main["date"].reset_index(drop=True)
+        if not all(
+            len(df) == len(dates) and df["date"].reset_index(drop=True).equals(dates)
+            for df, _ in feature_dfs
+        ):
+            for df, suffix in feature_dfs:
+                df_main = self.merge_features(df_main, df, tf, tf, suffix)
+            return df_main
+
+        skip_columns = ["date", "open", "high", "low", "close", "volume"]
+        to_concat = [df_main.reset_index(drop=True)]
+        for df, suffix in feature_dfs:
+            df = df.drop(columns=skip_columns).add_suffix(f"_{suffix}")
+            to_concat.append(df.reset_index(drop=True))
+        return pd.concat(to_concat, axis=1)
+
+    def build_timeframe_features(
+        self, informative_df: DataFrame, pair: str, tf: str, strategy: IStrategy
+    ) -> DataFrame:
+        """
+        Populate all features of one pair/timeframe using the user defined strategy functions,
+        including the shifted candles.
+        :param informative_df: DataFrame = candles of the pair/timeframe
+        :param pair: str = pair to populate
+        :param tf: str = timeframe to populate
+        :param strategy: IStrategy = user defined strategy object
+        :return: dataframe = informative dataframe with all features attached
+        """
+        metadata = {"pair": pair, "tf": tf}
+        feature_dfs: List[Tuple[DataFrame, str]] = []
+
+        logger.debug(f"Populating features for {pair} {tf}")
+
+        for t in self.freqai_config["feature_parameters"]["indicator_periods_candles"]:
+            df_features = strategy.feature_engineering_expand_all(
+                informative_df.copy(), t, metadata=metadata
+            )
+            feature_dfs.append((df_features, f"{t}"))
+
+        generic_df = strategy.feature_engineering_expand_basic(
+            informative_df.copy(), metadata=metadata
+        )
+        feature_dfs.append((generic_df, "gen"))
+
+        informative_df = self.concat_features(informative_df, feature_dfs, tf)
+
+        indicators = [col for col in informative_df if col.startswith("%")]
+        shift_count = self.freqai_config["feature_parameters"]["include_shifted_candles"]
+        shifted = [
+            informative_df[indicators].shift(n).add_suffix("_shift-" + str(n))
+            for n in range(1, shift_count + 1)
+        ]
+        if shifted:
+            informative_df = pd.concat([informative_df, *shifted], axis=1)
+
+        return informative_df
+
     def populate_features(
         self,
         dataframe: DataFrame,
@@ -723,6 +834,8 @@ class FreqaiDataKitchen:
     ) -> DataFrame:
         """
         Use the user defined strategy functions for populating features
+        Corr pair features are taken from / stored in the feature cache (if available),
+        as they don't depend on the base pair they are attached to.
         :param dataframe: DataFrame = dataframe to populate
         :param pair: str = pair to populate
         :param strategy: IStrategy = user defined strategy object
@@ -732,40 +845,32 @@ class FreqaiDataKitchen:
         :return: dataframe = populated dataframe
         """
         tfs: List[str] = self.freqai_config["feature_parameters"].get("include_timeframes")
+        ft_params = self.freqai_config["feature_parameters"]
 
         for tf in tfs:
-            metadata = {"pair": pair, "tf": tf}
             informative_df = self.get_pair_data_for_features(
                 pair, tf, strategy, corr_dataframes, base_dataframes, is_corr_pairs
             )
-            informative_copy = informative_df.copy()
-
-            logger.debug(f"Populating features for {pair} {tf}")
-
-            for t in self.freqai_config["feature_parameters"]["indicator_periods_candles"]:
-                df_features = strategy.feature_engineering_expand_all(
-                    informative_copy.copy(), t, metadata=metadata
+            signature = None
+            features_df = None
+            if is_corr_pairs and self.feature_cache is not None:
+                signature = FeatureCache.build_signature(
+                    informative_df,
+                    tuple(ft_params["indicator_periods_candles"]),
+                    ft_params["include_shifted_candles"],
                 )
-                suffix = f"{t}"
-                informative_df = self.merge_features(informative_df, df_features, tf, tf, suffix)
+                if signature is not None:
+                    features_df = self.feature_cache.get(pair, tf, signature)
 
-            generic_df = strategy.feature_engineering_expand_basic(
-                informative_copy.copy(), metadata=metadata
-            )
-            suffix = "gen"
-
-            informative_df = self.merge_features(informative_df, generic_df, tf, tf, suffix)
-
-            indicators = [col for col in informative_df if col.startswith("%")]
-            for n in range(self.freqai_config["feature_parameters"]["include_shifted_candles"] + 1):
-                if n == 0:
-                    continue
-                df_shift = informative_df[indicators].shift(n)
-                df_shift = df_shift.add_suffix("_shift-" + str(n))
-                informative_df = pd.concat((informative_df, df_shift), axis=1)
+            if features_df is None:
+                features_df = self.build_timeframe_features(informative_df, pair, tf, strategy)
+                if signature is not None and self.feature_cache is not None:
+                    self.feature_cache.store(pair, tf, signature, features_df)
+            else:
+                logger.debug(f"Using cached features for {pair} {tf}")
 
             dataframe = self.merge_features(
-                dataframe.copy(), informative_df, self.config["timeframe"], tf, f"{pair}_{tf}"
+                dataframe, features_df, self.config["timeframe"], tf, f"{pair}_{tf}"
             )
 
         return dataframe
@@ -0,0 +1,72 @@
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from pandas import DataFrame
+
+
+logger = logging.getLogger(__name__)
+
+
+class FeatureCache:
+    """
+    Holds the populated feature dataframes of a (pair, timeframe) combination so that
+    they can be shared between all base pairs which include the same pair as a corr pair.
+
+    Only one entry is kept per (pair, timeframe) - storing a new signature (e.g. after a
+    new candle arrived) replaces the previous entry, which keeps the memory footprint
+    bounded by the number of corr pairs * include_timeframes.
+    This object is owned by the FreqaiDataDrawer and remains persistent throughout live/dry
+    and backtesting.
+    """
+
+    def __init__(self) -> None:
+        self._cache: Dict[Tuple[str, str], Tuple[Tuple[Any, ...], DataFrame]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def build_signature(dataframe: DataFrame, *params: Any) -> Optional[Tuple[Any, ...]]:
+        """
+        Build the signature identifying the candles a feature dataframe was built from.
+        :param dataframe: informative dataframe (OHLCV) the features are built from
+        :param params: additional parameters influencing the features (e.g. periods)
+        :return: signature tuple, or None if the dataframe can't be cached
+        """
+        if dataframe.empty or "date" not in dataframe.columns:
+            return None
+        return (
+            dataframe["date"].iloc[0],
+            dataframe["date"].iloc[-1],
+            len(dataframe),
+            *params,
+        )
+
+    def get(self, pair: str, timeframe: str, signature: Tuple[Any, ...]) -> Optional[DataFrame]:
+        """
+        Get cached features for pair/timeframe, if they were built from the same candles.
+        """
+        with self._lock:
+            entry = self._cache.get((pair, timeframe))
+            if entry is not None and entry[0] == signature:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def store(
+        self, pair: str, timeframe: str, signature: Tuple[Any, ...], dataframe: DataFrame
+    ) -> None:
+        """
+        Store features for pair/timeframe, replacing any previous entry.
+        """
+        with self._lock:
+            self._cache[(pair, timeframe)] = (signature, dataframe)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
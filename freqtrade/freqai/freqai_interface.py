@@ -79,6 +79,7 @@ class IFreqaiModel(ABC):
         self.current_candle: datetime = datetime.fromtimestamp(637887600, tz=timezone.utc)
         self.dd.current_candle = self.current_candle
         self.scanning = False
+        self._prefetch_thread: Optional[threading.Thread] = None
         self.ft_params = self.freqai_info["feature_parameters"]
         self.corr_pairlist: List[str] = self.ft_params.get("include_corr_pairlist", [])
         self.keras: bool = self.freqai_info.get("keras", False)
@@ -145,7 +146,9 @@ class IFreqaiModel(ABC):
 
         if self.live:
             self.inference_timer("start")
-            self.dk = FreqaiDataKitchen(self.config, self.live, metadata["pair"])
+            self.dk = FreqaiDataKitchen(
+                self.config, self.live, metadata["pair"], feature_cache=self.dd.feature_cache
+            )
             dk = self.start_live(dataframe, metadata, strategy, self.dk)
             dataframe = dk.remove_features_from_df(dk.return_dataframe)
 
@@ -155,7 +158,9 @@ class IFreqaiModel(ABC):
         # FreqAI slides the window and sequentially builds the backtesting results before returning
         # the concatenated results for the full backtesting period back to the strategy.
         else:
-            self.dk = FreqaiDataKitchen(self.config, self.live, metadata["pair"])
+            self.dk = FreqaiDataKitchen(
+                self.config, self.live, metadata["pair"], feature_cache=self.dd.feature_cache
+            )
             if not self.config.get("freqai_backtest_live_models", False):
                 logger.info(f"Training {len(self.dk.training_timeranges)} timeranges")
                 dk = self.start_backtesting(dataframe, metadata, self.dk, strategy)
@@ -229,7 +234,9 @@ class IFreqaiModel(ABC):
 
             (_, trained_timestamp) = self.dd.get_pair_dict_info(pair)
 
-            dk = FreqaiDataKitchen(self.config, self.live, pair)
+            dk = FreqaiDataKitchen(
+                self.config, self.live, pair, feature_cache=self.dd.feature_cache
+            )
             (
                 retrain,
                 new_trained_timerange,
@@ -434,6 +441,7 @@ class IFreqaiModel(ABC):
 
         # load the model and associated data into the data kitchen
         self.model = self.dd.load_data(metadata["pair"], dk)
+        self.prefetch_next_model(metadata["pair"], strategy)
 
         dataframe = dk.use_strategy_to_populate_indicators(
             strategy,
@@ -458,6 +466,29 @@ class IFreqaiModel(ABC):
 
         return dk
 
+    def prefetch_next_model(self, pair: str, strategy: IStrategy) -> None:
+        """
+        Warm the model cache for the pair following `pair` in the whitelist on a separate
+        thread, so its model is loaded from disk while the current pair is processed.
+        :param pair: pair currently being processed
+        :param strategy: IStrategy = currently employed strategy
+        """
+        if not self.dd.model_cache.enabled or (
+            self._prefetch_thread and self._prefetch_thread.is_alive()
+        ):
+            return
+        whitelist = strategy.dp.current_whitelist()
+        if pair not in whitelist or len(whitelist) < 2:
+            return
+        next_pair = whitelist[(whitelist.index(pair) + 1) % len(whitelist)]
+        if not self.dd.needs_prefetch(next_pair):
+            return
+        dk = FreqaiDataKitchen(self.config, self.live, next_pair)
+        self._prefetch_thread = threading.Thread(
+            target=self.dd.prefetch_data, args=(next_pair, dk), daemon=True
+        )
+        self._prefetch_thread.start()
+
     def build_strategy_return_arrays(
         self, dataframe: DataFrame, dk: FreqaiDataKitchen, pair: str, trained_timestamp: int
     ) -> None:
@@ -603,6 +634,22 @@ class IFreqaiModel(ABC):
                                     new_trained_timerange does not contain any NaNs)
         """
 
+        self.dd.pairs_in_training.add(pair)
+        try:
+            self._extract_data_and_train_model(
+                new_trained_timerange, pair, strategy, dk, data_load_timerange
+            )
+        finally:
+            self.dd.pairs_in_training.discard(pair)
+
+    def _extract_data_and_train_model(
+        self,
+        new_trained_timerange: TimeRange,
+        pair: str,
+        strategy: IStrategy,
+        dk: FreqaiDataKitchen,
+        data_load_timerange: TimeRange,
+    ):
         corr_dataframes, base_dataframes = self.dd.get_base_and_corr_dataframes(
             data_load_timerange, pair, dk
         )
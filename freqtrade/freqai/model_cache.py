@@ -0,0 +1,103 @@
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, TypedDict
+
+
+logger = logging.getLogger(__name__)
+
+
+class CachedModel(TypedDict):
+    pair: str
+    model: Any
+    metadata: Dict[str, Any]
+    feature_pipeline: Any
+    label_pipeline: Any
+    size: int
+
+
+class ModelCache:
+    """
+    Least recently used cache for trained models, their pipelines and metadata.
+    Entries are keyed by the model path (data_path / model_filename), so models of
+    different training windows (backtesting) or different trainings (live) never collide.
+
+    The cache is bounded by memory size. The size of an entry is estimated using the
+    size of its files on disk, which avoids serializing the objects again just to
+    measure them.
+    This object is owned by the FreqaiDataDrawer and remains persistent throughout live/dry
+    and backtesting.
+    """
+
+    def __init__(self, max_size_mb: float) -> None:
+        self.max_size = int(max_size_mb * 1024 * 1024)
+        self._cache: OrderedDict[str, CachedModel] = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_size = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    @staticmethod
+    def build_key(data_path: Path, model_filename: str) -> str:
+        return str(Path(data_path) / model_filename)
+
+    @staticmethod
+    def estimate_size(data_path: Path, model_filename: str) -> int:
+        """
+        Estimate the in-memory size of a model from the size of its files on disk.
+        """
+        return sum(
+            f.stat().st_size for f in Path(data_path).glob(f"{model_filename}_*") if f.is_file()
+        )
+
+    def get(self, key: str) -> Optional[CachedModel]:
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._cache
+
+    def store(self, key: str, entry: CachedModel) -> None:
+        """
+        Store entry, evicting the least recently used entries until the cache fits
+        within its size limit. Entries larger than the whole cache are not stored.
+        """
+        if not self.enabled or entry["size"] > self.max_size:
+            return
+        with self._lock:
+            if key in self._cache:
+                self.current_size -= self._cache.pop(key)["size"]
+            self._cache[key] = entry
+            self.current_size += entry["size"]
+            while self.current_size > self.max_size:
+                evicted_key, evicted = self._cache.popitem(last=False)
+                self.current_size -= evicted["size"]
+                logger.debug(f"Evicted {evicted_key} from model cache.")
+
+    def invalidate_pair(self, pair: str) -> None:
+        """
+        Remove all entries of a pair - used once a new model was trained for the pair.
+        """
+        with self._lock:
+            for key in [k for k, v in self._cache.items() if v["pair"] == pair]:
+                self.current_size -= self._cache.pop(key)["size"]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.current_size = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
@@ -79,5 +79,5 @@ class PyTorchMLPRegressor(BasePyTorchRegressor):
                 tb_logger=self.tb_logger,
                 **self.trainer_kwargs,
             )
-        trainer.fit(data_dictionary, self.splits)
+        self.fit_trainer(trainer, data_dictionary, dk)
         return trainer
@@ -6,12 +6,18 @@ import pandas as pd
 import torch
 from torch import nn
 from torch.optim import Optimizer
-from torch.utils.data import DataLoader, TensorDataset
+from torch.utils.data import (
+    BatchSampler,
+    DataLoader,
+    RandomSampler,
+    SequentialSampler,
+    TensorDataset,
+)
 
 from freqtrade.freqai.torch.PyTorchDataConvertor import PyTorchDataConvertor
 from freqtrade.freqai.torch.PyTorchTrainerInterface import PyTorchTrainerInterface
 
-from .datasets import WindowDataset
+from .datasets import MemmapDataset, MemmapWindowDataset, WindowDataset
 
 
 logger = logging.getLogger(__name__)
@@ -44,6 +50,9 @@ class PyTorchModelTrainer(PyTorchTrainerInterface):
             ignored if n_epochs is set.
         :param n_epochs: The maximum number batches to use for evaluation.
         :param batch_size: The size of the batches to use during training.
+        :param num_workers: DataLoader workers used to read batches from the feature store.
+        :param pin_memory: Assemble feature store batches in pinned memory.
+            Defaults to True when training on cuda.
         """
         self.model = model
         self.optimizer = optimizer
@@ -56,18 +65,28 @@ class PyTorchModelTrainer(PyTorchTrainerInterface):
             raise Exception("Either `n_steps` or `n_epochs` should be set.")
 
         self.batch_size: int = kwargs.get("batch_size", 64)
+        self.num_workers: int = kwargs.get("num_workers", 0)
+        self.pin_memory: bool = kwargs.get("pin_memory", str(device).startswith("cuda"))
         self.data_convertor = data_convertor
         self.window_size: int = window_size
         self.tb_logger = tb_logger
         self.test_batch_counter = 0
 
-    def fit(self, data_dictionary: Dict[str, pd.DataFrame], splits: List[str]):
+    def fit(
+        self,
+        data_dictionary: Dict[str, pd.DataFrame],
+        splits: List[str],
+        feature_store: Optional[Dict[str, Path]] = None,
+    ):
         """
         :param data_dictionary: the dictionary constructed by DataHandler to hold
         all the training and test data/labels.
         :param splits: splits to use in training, splits must contain "train",
         optional "test" could be added by setting freqai.data_split_parameters.test_size > 0
         in the config file.
+        :param feature_store: optional paths (per split) to memory-mapped features written by
+        `FreqaiDataKitchen.write_feature_store()`. If set, features are read batch-wise from
+        disk instead of being converted to one tensor.
 
          - Calculates the predicted output for the batch using the PyTorch model.
          - Calculates the loss between the predicted and actual output using a loss function.
@@ -77,7 +96,12 @@ class PyTorchModelTrainer(PyTorchTrainerInterface):
         """
         self.model.train()
 
-        data_loaders_dictionary = self.create_data_loaders_dictionary(data_dictionary, splits)
+        if feature_store:
+            data_loaders_dictionary = self.create_feature_store_data_loaders_dictionary(
+                data_dictionary, splits, feature_store
+            )
+        else:
+            data_loaders_dictionary = self.create_data_loaders_dictionary(data_dictionary, splits)
         n_obs = len(data_dictionary["train_features"])
         n_epochs = self.n_epochs or self.calc_n_epochs(n_obs=n_obs)
         batch_counter = 0
@@ -140,6 +164,36 @@ class PyTorchModelTrainer(PyTorchTrainerInterface):
 
         return data_loader_dictionary
 
+    def create_feature_store_data_loaders_dictionary(
+        self,
+        data_dictionary: Dict[str, pd.DataFrame],
+        splits: List[str],
+        feature_store: Dict[str, Path],
+    ) -> Dict[str, DataLoader]:
+        """
+        Creates data loaders reading whole batches from the memory-mapped feature store.
+        Labels are small and kept in memory (on cpu, moved to the device per batch).
+        """
+        data_loader_dictionary = {}
+        for split in splits:
+            y = self.data_convertor.convert_y(data_dictionary[f"{split}_labels"], "cpu")
+            dataset = MemmapDataset(feature_store[split], y)
+            data_loader_dictionary[split] = self._feature_store_data_loader(dataset, shuffle=True)
+
+        return data_loader_dictionary
+
+    def _feature_store_data_loader(self, dataset: MemmapDataset, shuffle: bool) -> DataLoader:
+        sampler = RandomSampler(dataset) if shuffle else SequentialSampler(dataset)
+        return DataLoader(
+            dataset,
+            # batches are assembled by the dataset, disable automatic batching
+            batch_size=None,
+            sampler=BatchSampler(sampler, batch_size=self.batch_size, drop_last=True),
+            num_workers=self.num_workers,
+            pin_memory=self.pin_memory,
+            persistent_workers=self.num_workers > 0,
+        )
+
     def calc_n_epochs(self, n_obs: int) -> int:
         """
         Calculates the number of epochs required to reach the maximum number
@@ -220,3 +274,20 @@ class PyTorchTransformerTrainer(PyTorchModelTrainer):
             data_loader_dictionary[split] = data_loader
 
         return data_loader_dictionary
+
+    def create_feature_store_data_loaders_dictionary(
+        self,
+        data_dictionary: Dict[str, pd.DataFrame],
+        splits: List[str],
+        feature_store: Dict[str, Path],
+    ) -> Dict[str, DataLoader]:
+        """
+        Creates windowed data loaders reading whole batches from the memory-mapped feature store.
+        """
+        data_loader_dictionary = {}
+        for split in splits:
+            y = self.data_convertor.convert_y(data_dictionary[f"{split}_labels"], "cpu")
+            dataset = MemmapWindowDataset(feature_store[split], y, self.window_size)
+            data_loader_dictionary[split] = self._feature_store_data_loader(dataset, shuffle=False)
+
+        return data_loader_dictionary
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import pandas as pd
 import torch
@@ -9,13 +9,19 @@ from torch import nn
 
 class PyTorchTrainerInterface(ABC):
     @abstractmethod
-    def fit(self, data_dictionary: Dict[str, pd.DataFrame], splits: List[str]) -> None:
+    def fit(
+        self,
+        data_dictionary: Dict[str, pd.DataFrame],
+        splits: List[str],
+        feature_store: Optional[Dict[str, Path]] = None,
+    ) -> None:
         """
         :param data_dictionary: the dictionary constructed by DataHandler to hold
         all the training and test data/labels.
         :param splits: splits to use in training, splits must contain "train",
         optional "test" could be added by setting freqai.data_split_parameters.test_size > 0
         in the config file.
+        :param feature_store: optional paths (per split) to memory-mapped features.
 
          - Calculates the predicted output for the batch using the PyTorch model.
          - Calculates the loss between the predicted and actual output using a loss function.
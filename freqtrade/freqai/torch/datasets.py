@@ -1,3 +1,7 @@
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
 import torch
 
 
@@ -17,3 +21,59 @@ class WindowDataset(torch.utils.data.Dataset):
         # this is what happens when you use :
         window_y = self.ys[idx_rev + self.window_size - 1, :].unsqueeze(0)
         return window_x, window_y
+
+
+class MemmapDataset(torch.utils.data.Dataset):
+    """
+    Dataset reading the features from a memory-mapped `.npy` file
+    (written by `FreqaiDataKitchen.write_feature_store()`).
+    Indexed with a list of indices (use a `BatchSampler` as sampler), a whole batch is
+    read with one fancy-index, so only the current batch is held in memory.
+    """
+
+    def __init__(self, xs_path: Path, ys: torch.Tensor):
+        self.xs_path = xs_path
+        self.ys = ys
+        # Opened lazily, so the dataset can be sent to DataLoader workers.
+        self._xs: Optional[np.ndarray] = None
+
+    @property
+    def xs(self) -> np.ndarray:
+        if self._xs is None:
+            self._xs = np.load(self.xs_path, mmap_mode="r")
+        return self._xs
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_xs"] = None
+        return state
+
+    def __len__(self):
+        return len(self.ys)
+
+    def __getitem__(self, index: List[int]):
+        idx = np.asarray(index)
+        return torch.from_numpy(np.ascontiguousarray(self.xs[idx])), self.ys[idx]
+
+
+class MemmapWindowDataset(MemmapDataset):
+    """
+    Memory-mapped equivalent of `WindowDataset`.
+    Windows are strided views on the memory-mapped features, so a batch of windows
+    is assembled with a single read instead of one python slice per window.
+    """
+
+    def __init__(self, xs_path: Path, ys: torch.Tensor, window_size: int):
+        super().__init__(xs_path, ys)
+        self.window_size = window_size
+
+    def __len__(self):
+        return len(self.ys) - self.window_size
+
+    def __getitem__(self, index: List[int]):
+        idx_rev = len(self.ys) - self.window_size - np.asarray(index) - 1
+        # shape: (n_windows, n_features, window_size)
+        windows = np.lib.stride_tricks.sliding_window_view(self.xs, self.window_size, axis=0)
+        window_x = np.ascontiguousarray(windows[idx_rev].swapaxes(1, 2))
+        window_y = self.ys[idx_rev + self.window_size - 1].unsqueeze(1)
+        return torch.from_numpy(window_x), window_y
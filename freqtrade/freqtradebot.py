@@ -4,12 +4,13 @@ Freqtrade is the main module of this bot. It contains the class Freqtrade()
 
 import logging
 import traceback
+from contextlib import nullcontext
 from copy import deepcopy
 from datetime import datetime, time, timedelta, timezone
 from math import isclose
 from threading import Lock
 from time import sleep
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, ContextManager, Dict, List, Optional, Tuple
 
 from schedule import Scheduler
 
@@ -45,7 +46,7 @@ from freqtrade.exchange import (
 )
 from freqtrade.misc import safe_value_fallback, safe_value_fallback2
 from freqtrade.mixins import LoggingMixin
-from freqtrade.persistence import Order, PairLocks, Trade, init_db
+from freqtrade.persistence import Order, PairLocks, Trade, init_db, unit_of_work
 from freqtrade.persistence.key_value_store import set_startup_time
 from freqtrade.plugins.pairlistmanager import PairListManager
 from freqtrade.plugins.protectionmanager import ProtectionManager
@@ -102,7 +103,13 @@ class FreqtradeBot(LoggingMixin):
             self.config, exchange_config=exchange_config, load_leverage_tiers=True
         )
 
-        init_db(self.config["db_url"])
+        db_options = self.config.get("db_options", {})
+        init_db(
+            self.config["db_url"],
+            sqlite_journal_mode=db_options.get("sqlite_journal_mode"),
+            sqlite_synchronous=db_options.get("sqlite_synchronous"),
+        )
+        self._batch_commits: bool = db_options.get("batch_commits", False)
 
         self.wallets = Wallets(self.config, self.exchange)
 
@@ -151,6 +158,12 @@ class FreqtradeBot(LoggingMixin):
 
         # Protect exit-logic from forcesell and vice versa
         self._exit_lock = Lock()
+        # Order states fetched in bulk at the start of the iteration (order_id -> order)
+        self._prefetched_orders: Dict[str, Dict[str, Any]] = {}
+        # Entries / exits prepared during enter_positions / exit_positions, which are placed
+        # concurrently once all pairs / trades were checked.
+        self._pending_entries: Optional[List[Tuple[Dict[str, Any], Dict[str, Any]]]] = None
+        self._pending_exits: Optional[List[Tuple[Dict[str, Any], Trade, Dict[str, Any]]]] = None
         timeframe_secs = timeframe_to_seconds(self.strategy.timeframe)
         LoggingMixin.__init__(self, logger, timeframe_secs)
 
@@ -273,31 +286,53 @@ class FreqtradeBot(LoggingMixin):
         with self._measure_execution:
             self.strategy.analyze(self.active_pair_whitelist)
 
-        with self._exit_lock:
+        with self._exit_lock, self._db_unit_of_work():
+            # Fetch the state of all open orders in bulk
+            self.reconcile_open_orders()
             # Check for exchange cancellations, timeouts and user requested replace
             self.manage_open_orders()
 
         # Protect from collisions with force_exit.
         # Without this, freqtrade may try to recreate stoploss_on_exchange orders
         # while exiting is in process, since telegram messages arrive in an different thread.
-        with self._exit_lock:
+        with self._exit_lock, self._db_unit_of_work():
             trades = Trade.get_open_trades()
             # First process current opened trades (positions)
             self.exit_positions(trades)
+            self._prefetched_orders = {}
 
         # Check if we need to adjust our current positions before attempting to enter new trades.
         if self.strategy.position_adjustment_enable:
-            with self._exit_lock:
+            with self._exit_lock, self._db_unit_of_work():
                 self.process_open_trade_positions()
 
         # Then looking for entry opportunities
         if self.get_free_open_trades():
-            self.enter_positions()
+            with self._db_unit_of_work():
+                self.enter_positions()
         self._schedule.run_pending()
         Trade.commit()
         self.rpc.process_msg_queue(self.dataprovider._msg_queue)
         self.last_process = datetime.now(timezone.utc)
 
+    def process_orders(self) -> None:
+        """
+        Lightweight iteration between candle closes: Updates and manages open orders only.
+        Candles are not refreshed, and neither exits nor entries are evaluated.
+        """
+        with self._exit_lock, self._db_unit_of_work():
+            self.reconcile_open_orders()
+            self.manage_open_orders()
+            self._prefetched_orders = {}
+        Trade.commit()
+        self.rpc.process_msg_queue(self.dataprovider._msg_queue)
+
+    def _db_unit_of_work(self) -> ContextManager[None]:
+        """
+        Commit all database changes of one loop phase at once (db_options.batch_commits).
+        """
+        return unit_of_work(Trade.session) if self._batch_commits else nullcontext()
+
     def process_stopped(self) -> None:
         """
         Close all orders that were left open
@@ -354,7 +389,7 @@ class FreqtradeBot(LoggingMixin):
         Return the number of free open trades slots or 0 if
         max number of open trades reached
         """
-        open_trades = Trade.get_open_trade_count()
+        open_trades = Trade.get_open_trade_count() + len(self._pending_entries or [])
         return max(0, self.config["max_open_trades"] - open_trades)
 
     def update_funding_fees(self) -> None:
@@ -631,19 +666,65 @@ class FreqtradeBot(LoggingMixin):
             else:
                 self.log_once("Global pairlock active. Not creating new trades.", logger.info)
             return trades_created
-        # Create entity and execute trade for each pair from whitelist
-        for pair in whitelist:
+        # Create entity and execute trade for each pair from whitelist.
+        # Entry orders are collected first, and placed concurrently afterwards.
+        with self._exit_lock:
+            self._pending_entries = []
             try:
-                with self._exit_lock:
-                    trades_created += self.create_trade(pair)
-            except DependencyException as exception:
-                logger.warning("Unable to create trade for %s: %s", pair, exception)
+                for pair in whitelist:
+                    try:
+                        self.create_trade(pair)
+                    except DependencyException as exception:
+                        logger.warning("Unable to create trade for %s: %s", pair, exception)
+                trades_created = self._place_pending_entries()
+            finally:
+                self._pending_entries = None
+                self.wallets.release_stake()
 
         if not trades_created:
             logger.debug("Found no enter signals for whitelisted currencies. Trying again...")
 
         return trades_created
 
+    def _place_pending_entries(self) -> int:
+        """
+        Place all entry orders prepared during this iteration concurrently,
+        and store the resulting trades within one transaction.
+        :return: Number of trades created
+        """
+        pending = self._pending_entries or []
+        self._pending_entries = None
+        if not pending:
+            return 0
+
+        orders = self.exchange.create_orders([order_args for order_args, _ in pending])
+        entered = []
+        error: Optional[Exception] = None
+        for (order_args, entry), order in zip(pending, orders):
+            try:
+                if isinstance(order, BaseException):
+                    raise order
+                if res := self._record_entry(order, order_args, **entry):
+                    entered.append((*res, order, order_args))
+            except DependencyException as exception:
+                logger.warning("Unable to create trade for %s: %s", order_args["pair"], exception)
+            except Exception as e:
+                # Store the remaining trades before escalating.
+                logger.error(f"Unable to create trade for {order_args['pair']}: {e}")
+                error = error or e
+
+        if entered:
+            Trade.commit()
+            self.wallets.release_stake()
+            self.wallets.update()
+            for trade, order_obj, order, order_args in entered:
+                self._complete_entry(
+                    trade, order_obj, order, order_args, pos_adjust=False, mode="initial"
+                )
+        if error:
+            raise error
+        return len(entered)
+
     def create_trade(self, pair: str) -> bool:
         """
         Check the implemented trading strategy for entry signals.
@@ -910,16 +991,64 @@ class FreqtradeBot(LoggingMixin):
         ):
             logger.info(f"User denied entry for {pair}.")
             return False
-        order = self.exchange.create_order(
-            pair=pair,
-            ordertype=order_type,
-            side=side,
-            amount=amount,
-            rate=enter_limit_requested,
-            reduceOnly=False,
-            time_in_force=time_in_force,
-            leverage=leverage,
-        )
+        order_args: Dict[str, Any] = {
+            "pair": pair,
+            "ordertype": order_type,
+            "side": side,
+            "amount": amount,
+            "rate": enter_limit_requested,
+            "reduceOnly": False,
+            "time_in_force": time_in_force,
+            "leverage": leverage,
+        }
+        entry: Dict[str, Any] = {
+            "stake_amount": stake_amount,
+            "is_short": is_short,
+            "enter_tag": enter_tag,
+            "trade": trade,
+        }
+        if mode == "initial" and self._pending_entries is not None:
+            # Placed together with the other entries of this iteration.
+            self._pending_entries.append((order_args, entry))
+            self.wallets.reserve_stake(stake_amount)
+            return True
+
+        order = self.exchange.create_order(**order_args)
+        entered = self._record_entry(order, order_args, **entry)
+        if not entered:
+            return False
+        Trade.commit()
+
+        # Updating wallets
+        self.wallets.update()
+
+        self._complete_entry(*entered, order, order_args, pos_adjust=pos_adjust, mode=mode)
+        return True
+
+    def _record_entry(
+        self,
+        order: Dict,
+        order_args: Dict[str, Any],
+        *,
+        stake_amount: float,
+        is_short: bool,
+        enter_tag: Optional[str],
+        trade: Optional[Trade],
+    ) -> Optional[Tuple[Trade, Order]]:
+        """
+        Record a placed entry order - creating the trade if necessary.
+        The trade is added to the session, but not committed.
+        :return: Trade and Order object, or None if the order was not filled at all.
+        """
+        pair = order_args["pair"]
+        side = order_args["side"]
+        amount = order_args["amount"]
+        enter_limit_requested = order_args["rate"]
+        leverage = order_args["leverage"]
+        order_type = order_args["ordertype"]
+        time_in_force = order_args["time_in_force"]
+        name = "Short" if is_short else "Long"
+
         order_obj = Order.parse_from_ccxt_object(order, pair, side, amount, enter_limit_requested)
         order_obj.ft_order_tag = enter_tag
         order_id = order["id"]
@@ -938,7 +1067,7 @@ class FreqtradeBot(LoggingMixin):
                     f"for {pair} is {order_status} by {self.exchange.name}."
                     " zero amount is fulfilled."
                 )
-                return False
+                return None
             else:
                 # the order is partially fulfilled
                 # in case of IOC orders we can check immediately
@@ -1022,12 +1151,24 @@ class FreqtradeBot(LoggingMixin):
         trade.orders.append(order_obj)
         trade.recalc_trade_from_orders()
         Trade.session.add(trade)
-        Trade.commit()
+        return trade, order_obj
 
-        # Updating wallets
-        self.wallets.update()
-
-        self._notify_enter(trade, order_obj, order_type, sub_trade=pos_adjust)
+    def _complete_entry(
+        self,
+        trade: Trade,
+        order_obj: Order,
+        order: Dict,
+        order_args: Dict[str, Any],
+        *,
+        pos_adjust: bool,
+        mode: EntryExecuteMode,
+    ) -> None:
+        """
+        Notify about a recorded (and committed) entry and handle orders which are no longer open.
+        """
+        order_id = order["id"]
+        order_status = order.get("status")
+        self._notify_enter(trade, order_obj, order_args["ordertype"], sub_trade=pos_adjust)
 
         if pos_adjust:
             if order_status == "closed":
@@ -1046,9 +1187,8 @@ class FreqtradeBot(LoggingMixin):
                     trade, order, order_obj, constants.CANCEL_REASON["TIMEOUT"]
                 )
 
-        return True
-
     def cancel_stoploss_on_exchange(self, trade: Trade) -> Trade:
+        self._drop_prefetched_orders(trade)
         # First cancelling stoploss on exchange ...
         for oslo in trade.open_sl_orders:
             try:
@@ -1255,6 +1395,21 @@ class FreqtradeBot(LoggingMixin):
         """
         Tries to execute exit orders for open trades (positions)
         """
+        # Exit orders are collected first, and placed concurrently afterwards.
+        self._pending_exits = []
+        try:
+            trades_closed = self._check_exit_positions(trades)
+            trades_closed -= self._place_pending_exits()
+        finally:
+            self._pending_exits = None
+
+        # Updating wallets if any trade occurred
+        if trades_closed:
+            self.wallets.update()
+
+        return trades_closed
+
+    def _check_exit_positions(self, trades: List[Trade]) -> int:
         trades_closed = 0
         for trade in trades:
             if (
@@ -1284,18 +1439,59 @@ class FreqtradeBot(LoggingMixin):
                         f"Unable to handle stoploss on exchange for {trade.pair}: {exception}"
                     )
                 # Check if we can sell our current pair
-                if not trade.has_open_orders and trade.is_open and self.handle_trade(trade):
+                if (
+                    not trade.has_open_orders
+                    and trade.is_open
+                    and not self._has_pending_exit(trade)
+                    and self.handle_trade(trade)
+                ):
                     trades_closed += 1
 
             except DependencyException as exception:
                 logger.warning(f"Unable to exit trade {trade.pair}: {exception}")
 
-        # Updating wallets if any trade occurred
-        if trades_closed:
-            self.wallets.update()
-
         return trades_closed
 
+    def _has_pending_exit(self, trade: Trade) -> bool:
+        return any(t is trade for _, t, _ in self._pending_exits or [])
+
+    def _place_pending_exits(self) -> int:
+        """
+        Place all exit orders prepared during this iteration concurrently,
+        and store the updated trades within one transaction.
+        :return: Number of exits which could not be placed
+        """
+        pending = self._pending_exits or []
+        self._pending_exits = None
+        if not pending:
+            return 0
+
+        orders = self.exchange.create_orders([order_args for order_args, _, _ in pending])
+        failed = 0
+        error: Optional[Exception] = None
+        for (order_args, trade, exit_), order in zip(pending, orders):
+            try:
+                if isinstance(order, BaseException):
+                    raise order
+                self._record_exit(trade, order, order_args, **exit_)
+                continue
+            except InsufficientFundsError as e:
+                logger.warning(f"Unable to place order {e}.")
+                # Try to figure out what went wrong
+                self.handle_insufficient_funds(trade)
+            except DependencyException as exception:
+                logger.warning(f"Unable to exit trade {trade.pair}: {exception}")
+            except Exception as e:
+                # Store the remaining trades before escalating.
+                logger.error(f"Unable to exit trade {trade.pair}: {e}")
+                error = error or e
+            failed += 1
+
+        Trade.commit()
+        if error:
+            raise error
+        return failed
+
     def handle_trade(self, trade: Trade) -> bool:
         """
         Exits the current pair if the threshold is reached and updates the trade record.
@@ -1410,7 +1606,8 @@ class FreqtradeBot(LoggingMixin):
             try:
                 # First we check if there is already a stoploss on exchange
                 stoploss_order = (
-                    self.exchange.fetch_stoploss_order(slo.order_id, trade.pair)
+                    self._prefetched_orders.pop(slo.order_id, None)
+                    or self.exchange.fetch_stoploss_order(slo.order_id, trade.pair)
                     if slo.order_id
                     else None
                 )
@@ -1533,6 +1730,28 @@ class FreqtradeBot(LoggingMixin):
 
         return
 
+    def reconcile_open_orders(self) -> None:
+        """
+        Fetch the state of all open orders (including stoploss orders) of open trades in bulk.
+        The results are consumed by manage_open_orders() and handle_stoploss_on_exchange()
+        within the same iteration - orders missing from the bulk result are fetched
+        individually as before.
+        :return: None
+        """
+        orders = [
+            (order.order_id, trade.pair, order.ft_order_side == "stoploss")
+            for trade in Trade.get_open_trades()
+            for order in trade.open_orders + trade.open_sl_orders
+        ]
+        self._prefetched_orders = self.exchange.fetch_orders_bulk(orders) if orders else {}
+
+    def _drop_prefetched_orders(self, trade: Trade) -> None:
+        """
+        Forget prefetched order states of a trade - used before acting on its orders.
+        """
+        for order in trade.orders:
+            self._prefetched_orders.pop(order.order_id, None)
+
     def manage_open_orders(self) -> None:
         """
         Management of open orders on exchange. Unfilled orders might be cancelled if timeout
@@ -1544,7 +1763,9 @@ class FreqtradeBot(LoggingMixin):
             open_order: Order
             for open_order in trade.open_orders:
                 try:
-                    order = self.exchange.fetch_order(open_order.order_id, trade.pair)
+                    order = self._prefetched_orders.pop(
+                        open_order.order_id, None
+                    ) or self.exchange.fetch_order(open_order.order_id, trade.pair)
 
                 except ExchangeError:
                     logger.info(
@@ -1930,6 +2151,7 @@ class FreqtradeBot(LoggingMixin):
         :param exit_check: CheckTuple with signal and reason
         :return: True if it succeeds False
         """
+        self._drop_prefetched_orders(trade)
         trade.set_funding_fees(
             self.exchange.get_funding_fees(
                 pair=trade.pair,
@@ -1993,24 +2215,50 @@ class FreqtradeBot(LoggingMixin):
             logger.info(f"User denied exit for {trade.pair}.")
             return False
 
+        order_args: Dict[str, Any] = {
+            "pair": trade.pair,
+            "ordertype": order_type,
+            "side": trade.exit_side,
+            "amount": amount,
+            "rate": limit,
+            "leverage": trade.leverage,
+            "reduceOnly": self.trading_mode == TradingMode.FUTURES,
+            "time_in_force": time_in_force,
+        }
+        exit_: Dict[str, Any] = {"exit_reason": exit_reason, "sub_trade": bool(sub_trade_amt)}
+        if self._pending_exits is not None:
+            # Placed together with the other exits of this iteration.
+            self._pending_exits.append((order_args, trade, exit_))
+            return True
+
         try:
             # Execute sell and update trade record
-            order = self.exchange.create_order(
-                pair=trade.pair,
-                ordertype=order_type,
-                side=trade.exit_side,
-                amount=amount,
-                rate=limit,
-                leverage=trade.leverage,
-                reduceOnly=self.trading_mode == TradingMode.FUTURES,
-                time_in_force=time_in_force,
-            )
+            order = self.exchange.create_order(**order_args)
         except InsufficientFundsError as e:
             logger.warning(f"Unable to place order {e}.")
             # Try to figure out what went wrong
             self.handle_insufficient_funds(trade)
             return False
 
+        self._record_exit(trade, order, order_args, **exit_)
+        Trade.commit()
+
+        return True
+
+    def _record_exit(
+        self,
+        trade: Trade,
+        order: Dict,
+        order_args: Dict[str, Any],
+        *,
+        exit_reason: str,
+        sub_trade: bool,
+    ) -> None:
+        """
+        Record a placed exit order and update the trade record - without committing.
+        """
+        amount = order_args["amount"]
+        limit = order_args["rate"]
         order_obj = Order.parse_from_ccxt_object(order, trade.pair, trade.exit_side, amount, limit)
         order_obj.ft_order_tag = exit_reason
         trade.orders.append(order_obj)
@@ -2019,13 +2267,10 @@ class FreqtradeBot(LoggingMixin):
         trade.close_rate_requested = limit
         trade.exit_reason = exit_reason
 
-        self._notify_exit(trade, order_type, sub_trade=bool(sub_trade_amt), order=order_obj)
+        self._notify_exit(trade, order_args["ordertype"], sub_trade=sub_trade, order=order_obj)
         # In case of market sell orders the order can be closed immediately
         if order.get("status", "unknown") in ("closed", "expired"):
             self.update_trade_state(trade, order_obj.order_id, order)
-        Trade.commit()
-
-        return True
 
     def _notify_exit(
         self,
@@ -3,7 +3,7 @@ import shutil
 from copy import deepcopy
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from pandas import DataFrame
 
@@ -99,7 +99,7 @@ class LookaheadAnalysis(BaseAnalysis):
                                 f"{str(self_value)} != {str(other_value)}"
                             )
 
-    def prepare_data(self, varholder: VarHolder, pairs_to_load: List[DataFrame]):
+    def prepare_data(self, varholder: VarHolder, pairs_to_load: List[str]) -> None:
         if "freqai" in self.local_config and "identifier" in self.local_config["freqai"]:
             # purge previous data if the freqai model is defined
             # (to be sure nothing is carried over from older backtests)
@@ -135,40 +135,52 @@ class LookaheadAnalysis(BaseAnalysis):
         varholder.indicators = backtesting.strategy.advise_all_indicators(varholder.data)
         varholder.result = self.get_result(backtesting, varholder.indicators)
 
-    def fill_entry_and_exit_varHolders(self, result_row):
+    def create_entry_and_exit_varHolders(self, result_row) -> Tuple[VarHolder, VarHolder]:
         # entry_varHolder
         entry_varHolder = VarHolder()
-        self.entry_varHolders.append(entry_varHolder)
         entry_varHolder.from_dt = self.full_varHolder.from_dt
         entry_varHolder.compared_dt = result_row["open_date"]
         # to_dt needs +1 candle since it won't buy on the last candle
         entry_varHolder.to_dt = result_row["open_date"] + timedelta(
             minutes=timeframe_to_minutes(self.full_varHolder.timeframe)
         )
-        self.prepare_data(entry_varHolder, [result_row["pair"]])
 
         # exit_varHolder
         exit_varHolder = VarHolder()
-        self.exit_varHolders.append(exit_varHolder)
         # to_dt needs +1 candle since it will always exit/force-exit trades on the last candle
         exit_varHolder.from_dt = self.full_varHolder.from_dt
         exit_varHolder.to_dt = result_row["close_date"] + timedelta(
             minutes=timeframe_to_minutes(self.full_varHolder.timeframe)
         )
         exit_varHolder.compared_dt = result_row["close_date"]
+        return entry_varHolder, exit_varHolder
+
+    def fill_entry_and_exit_varHolders(self, result_row):
+        entry_varHolder, exit_varHolder = self.create_entry_and_exit_varHolders(result_row)
+        self.entry_varHolders.append(entry_varHolder)
+        self.exit_varHolders.append(exit_varHolder)
+        self.prepare_data(entry_varHolder, [result_row["pair"]])
         self.prepare_data(exit_varHolder, [result_row["pair"]])
 
+    def is_force_sold(self, result_row) -> bool:
+        return result_row.close_date == self.dt_to_timestamp(self.full_varHolder.to_dt)
+
     # now we analyze a full trade of full_varholder and look for analyze its bias
     def analyze_row(self, idx: int, result_row):
         # if force-sold, ignore this signal since here it will unconditionally exit.
-        if result_row.close_date == self.dt_to_timestamp(self.full_varHolder.to_dt):
+        if self.is_force_sold(result_row):
             return
 
-        # keep track of how many signals are processed at total
-        self.current_analysis.total_signals += 1
-
         # fill entry_varHolder and exit_varHolder
         self.fill_entry_and_exit_varHolders(result_row)
+        self.compare_row(idx, result_row)
+
+    def compare_row(self, idx: int, result_row):
+        """
+        Compare the prepared entry and exit varholders of a trade against the full backtest.
+        """
+        # keep track of how many signals are processed at total
+        self.current_analysis.total_signals += 1
 
         # this will trigger a logger-message
         buy_or_sell_biased: bool = False
@@ -223,8 +235,10 @@ class LookaheadAnalysis(BaseAnalysis):
 
         # now we loop through all signals
         # starting from the same datetime to avoid miss-reports of bias
+        rows_to_analyze: List[Tuple[Any, Any]] = []
+        varholder_jobs: List[Tuple[VarHolder, List[str]]] = []
         for idx, result_row in self.full_varHolder.result["results"].iterrows():
-            if self.current_analysis.total_signals == self.targeted_trade_amount:
+            if len(rows_to_analyze) == self.targeted_trade_amount:
                 logger.info(f"Found targeted trade amount = {self.targeted_trade_amount} signals.")
                 break
             if found_signals < self.minimum_trade_amount:
@@ -247,8 +261,23 @@ class LookaheadAnalysis(BaseAnalysis):
                 self.entry_varHolders.append(VarHolder())
                 self.exit_varHolders.append(VarHolder())
                 continue
+            # if force-sold, ignore this signal since here it will unconditionally exit.
+            if self.is_force_sold(result_row):
+                continue
 
-            self.analyze_row(idx, result_row)
+            entry_varHolder, exit_varHolder = self.create_entry_and_exit_varHolders(result_row)
+            self.entry_varHolders.append(entry_varHolder)
+            self.exit_varHolders.append(exit_varHolder)
+            varholder_jobs.append((entry_varHolder, [result_row["pair"]]))
+            varholder_jobs.append((exit_varHolder, [result_row["pair"]]))
+            rows_to_analyze.append((idx, result_row))
+
+        # The backtests of all signals are independent - compare each signal once both of its
+        # backtests are done.
+        prepared = self.fill_varholders(varholder_jobs)
+        # Pairs of (entry, exit) varholders - first, so the iterator gets exhausted.
+        for _, (idx, result_row) in zip(zip(prepared, prepared), rows_to_analyze):
+            self.compare_row(idx, result_row)
 
         if len(self.entry_varHolders) < self.minimum_trade_amount:
             logger.info(
@@ -5,8 +5,6 @@ from datetime import timedelta
 from pathlib import Path
 from typing import Any, Dict, List
 
-from pandas import DataFrame
-
 from freqtrade.exchange import timeframe_to_minutes
 from freqtrade.loggers.set_log_levels import (
     reduce_verbosity_for_bias_tester,
@@ -114,7 +112,7 @@ class RecursiveAnalysis(BaseAnalysis):
         else:
             logger.info("No lookahead bias on indicators found.")
 
-    def prepare_data(self, varholder: VarHolder, pairs_to_load: List[DataFrame]):
+    def prepare_data(self, varholder: VarHolder, pairs_to_load: List[str]) -> None:
         if "freqai" in self.local_config and "identifier" in self.local_config["freqai"]:
             # purge previous data if the freqai model is defined
             # (to be sure nothing is carried over from older backtests)
@@ -133,9 +131,16 @@ class RecursiveAnalysis(BaseAnalysis):
             + str(self.dt_to_timestamp(varholder.to_dt))
         )
         prepare_data_config["exchange"]["pair_whitelist"] = pairs_to_load
+        if hasattr(varholder, "startup_candle"):
+            prepare_data_config["startup_candle_count"] = varholder.startup_candle
+
+        if self._fee is not None:
+            # Don't re-calculate fee per pair, as fee might differ per pair.
+            prepare_data_config["fee"] = self._fee
 
         backtesting = Backtesting(prepare_data_config, self.exchange)
         self.exchange = backtesting.exchange
+        self._fee = backtesting.fee
         backtesting._set_strategy(backtesting.strategylist[0])
 
         varholder.data, varholder.timerange = backtesting.load_bt_data()
@@ -144,28 +149,31 @@ class RecursiveAnalysis(BaseAnalysis):
 
         varholder.indicators = backtesting.strategy.advise_all_indicators(varholder.data)
 
-    def fill_partial_varholder(self, start_date, startup_candle):
-        logger.info(f"Calculating indicators using startup candle of {startup_candle}.")
+    def create_partial_varholder(self, start_date, startup_candle) -> VarHolder:
         partial_varHolder = VarHolder()
 
         partial_varHolder.from_dt = start_date
         partial_varHolder.to_dt = self.full_varHolder.to_dt
         partial_varHolder.startup_candle = startup_candle
+        return partial_varHolder
 
-        self.local_config["startup_candle_count"] = startup_candle
-
+    def fill_partial_varholder(self, start_date, startup_candle):
+        logger.info(f"Calculating indicators using startup candle of {startup_candle}.")
+        partial_varHolder = self.create_partial_varholder(start_date, startup_candle)
         self.prepare_data(partial_varHolder, self.local_config["pairs"])
 
         self.partial_varHolder_array.append(partial_varHolder)
 
-    def fill_partial_varholder_lookahead(self, end_date):
-        logger.info("Calculating indicators to test lookahead on indicators.")
-
+    def create_partial_varholder_lookahead(self, end_date) -> VarHolder:
         partial_varHolder = VarHolder()
 
         partial_varHolder.from_dt = self.full_varHolder.from_dt
         partial_varHolder.to_dt = end_date
+        return partial_varHolder
 
+    def fill_partial_varholder_lookahead(self, end_date):
+        logger.info("Calculating indicators to test lookahead on indicators.")
+        partial_varHolder = self.create_partial_varholder_lookahead(end_date)
         self.prepare_data(partial_varHolder, self.local_config["pairs"])
 
         self.partial_varHolder_lookahead_array.append(partial_varHolder)
@@ -180,15 +188,27 @@ class RecursiveAnalysis(BaseAnalysis):
         timeframe_minutes = timeframe_to_minutes(self.full_varHolder.timeframe)
 
         end_date_partial = start_date_full + timedelta(minutes=int(timeframe_minutes * 10))
-
-        self.fill_partial_varholder_lookahead(end_date_partial)
+        self.partial_varHolder_lookahead_array.append(
+            self.create_partial_varholder_lookahead(end_date_partial)
+        )
 
         # restore_verbosity_for_bias_tester()
 
         start_date_partial = end_date_full - timedelta(minutes=int(timeframe_minutes))
 
         for startup_candle in self._startup_candle:
-            self.fill_partial_varholder(start_date_partial, startup_candle)
+            self.partial_varHolder_array.append(
+                self.create_partial_varholder(start_date_partial, startup_candle)
+            )
+
+        # All partial runs are independent of each other.
+        logger.info(
+            "Calculating indicators to test lookahead on indicators and using startup candles "
+            f"of {', '.join(map(str, self._startup_candle))}."
+        )
+        pairs = self.local_config["pairs"]
+        varholders = self.partial_varHolder_lookahead_array + self.partial_varHolder_array
+        list(self.fill_varholders([(varholder, pairs) for varholder in varholders]))
 
         # Restore verbosity, so it's not too quiet for the next strategy
         restore_verbosity_for_bias_tester()
@@ -41,4 +41,6 @@ def get_strategy_run_id(strategy) -> str:
 def get_backtest_metadata_filename(filename: Union[Path, str]) -> Path:
     """Return metadata filename for specified backtest results file."""
     filename = Path(filename)
-    return filename.parent / Path(f"{filename.stem}.meta{filename.suffix}")
+    # Metadata of zipped results is plain json.
+    suffix = ".json" if filename.suffix == ".zip" else filename.suffix
+    return filename.parent / Path(f"{filename.stem}.meta{suffix}")
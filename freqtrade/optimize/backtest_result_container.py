@@ -0,0 +1,150 @@
+"""
+Zip container for backtest results.
+
+Each strategy's summary and trades are stored as separate (compressed) members,
+so the summary or the trades of one strategy can be loaded without parsing the whole result.
+
+Layout:
+    strategy_comparison.json
+    strategy/<strategy>.json  - strategy stats, without trades
+    trades/<strategy>.json    - trades of the strategy, columnar: {column: [value, ...]}
+"""
+
+import io
+import logging
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+import rapidjson
+
+from freqtrade.ft_types import BacktestResultType
+
+
+logger = logging.getLogger(__name__)
+
+BT_CONTAINER_SUFFIX = ".zip"
+
+_COMPARISON_MEMBER = "strategy_comparison.json"
+_STRATEGY_DIR = "strategy/"
+_TRADES_DIR = "trades/"
+
+
+def _write_json(zf: zipfile.ZipFile, name: str, data: Any) -> None:
+    # Streams into the archive - the serialized member is never held in memory as a whole.
+    with zf.open(name, "w") as member, io.TextIOWrapper(member, encoding="utf-8") as fp:
+        rapidjson.dump(data, fp, default=str, number_mode=rapidjson.NM_NATIVE)
+
+
+def _read_json(zf: zipfile.ZipFile, name: str) -> Any:
+    with zf.open(name) as member, io.TextIOWrapper(member, encoding="utf-8") as fp:
+        return rapidjson.load(fp, number_mode=rapidjson.NM_NATIVE)
+
+
+def trades_to_columns(trades: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """
+    Convert a list of trade dicts to columns - keys missing in a trade become None.
+    """
+    columns: Dict[str, None] = {}
+    for trade in trades:
+        columns.update(dict.fromkeys(trade))
+    return {col: [trade.get(col) for trade in trades] for col in columns}
+
+
+def columns_to_trades(columns: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """
+    Convert columns (as returned by trades_to_columns()) back to a list of trade dicts.
+    """
+    names = list(columns.keys())
+    return [dict(zip(names, row)) for row in zip(*columns.values())]
+
+
+def store_backtest_container(filename: Path, stats: BacktestResultType) -> None:
+    """
+    Write strategy results and strategy comparison of a backtest to a zip container.
+    Metadata is not part of the container, it's stored separately.
+    :param filename: Container file to create
+    :param stats: Backtest results
+    """
+    logger.info(f'dumping backtest result to "{filename}"')
+    with zipfile.ZipFile(filename, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        _write_json(zf, _COMPARISON_MEMBER, stats["strategy_comparison"])
+        for strategy, results in stats["strategy"].items():
+            summary = {k: v for k, v in results.items() if k != "trades"}
+            _write_json(zf, f"{_STRATEGY_DIR}{strategy}.json", summary)
+            _write_json(
+                zf, f"{_TRADES_DIR}{strategy}.json", trades_to_columns(results.get("trades", []))
+            )
+
+
+def _strategy_names(zf: zipfile.ZipFile) -> Iterator[str]:
+    for name in zf.namelist():
+        if name.startswith(_STRATEGY_DIR):
+            yield name[len(_STRATEGY_DIR) :].removesuffix(".json")
+
+
+def get_container_strategies(filename: Path) -> List[str]:
+    """
+    :return: Names of the strategies stored in the container, in storage order.
+    """
+    with zipfile.ZipFile(filename) as zf:
+        return list(_strategy_names(zf))
+
+
+def load_container_comparison(filename: Path) -> List[Dict[str, Any]]:
+    with zipfile.ZipFile(filename) as zf:
+        return _read_json(zf, _COMPARISON_MEMBER)
+
+
+def _check_strategy(zf: zipfile.ZipFile, strategy: str) -> None:
+    if f"{_STRATEGY_DIR}{strategy}.json" not in zf.namelist():
+        raise ValueError(
+            f"Strategy {strategy} not available in the backtest result. "
+            f"Available strategies are '{','.join(_strategy_names(zf))}'"
+        )
+
+
+def load_container_trades(filename: Path, strategy: str) -> Dict[str, List[Any]]:
+    """
+    Load the trades of one strategy.
+    :return: trades in columnar format - {column: [value, ...]}
+    :raise: ValueError if the strategy is not part of the container.
+    """
+    with zipfile.ZipFile(filename) as zf:
+        _check_strategy(zf, strategy)
+        return _read_json(zf, f"{_TRADES_DIR}{strategy}.json")
+
+
+def load_container_strategy(
+    filename: Path, strategy: str, include_trades: bool = True
+) -> Dict[str, Any]:
+    """
+    Load the results of one strategy.
+    :param include_trades: Load the trades of this strategy (as list of dicts) as well.
+    :raise: ValueError if the strategy is not part of the container.
+    """
+    with zipfile.ZipFile(filename) as zf:
+        _check_strategy(zf, strategy)
+        results = _read_json(zf, f"{_STRATEGY_DIR}{strategy}.json")
+        if include_trades:
+            results["trades"] = columns_to_trades(_read_json(zf, f"{_TRADES_DIR}{strategy}.json"))
+        return results
+
+
+def load_backtest_container(filename: Path) -> Dict[str, Any]:
+    """
+    Load all strategy results and the strategy comparison - same structure as the
+    (legacy) json result file.
+    """
+    with zipfile.ZipFile(filename) as zf:
+        strategies = list(_strategy_names(zf))
+        return {
+            "strategy": {
+                strategy: {
+                    **_read_json(zf, f"{_STRATEGY_DIR}{strategy}.json"),
+                    "trades": columns_to_trades(_read_json(zf, f"{_TRADES_DIR}{strategy}.json")),
+                }
+                for strategy in strategies
+            },
+            "strategy_comparison": _read_json(zf, _COMPARISON_MEMBER),
+        }
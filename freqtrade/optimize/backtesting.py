@@ -40,6 +40,7 @@ from freqtrade.ft_types import BacktestResultType, get_BacktestResultType_defaul
 from freqtrade.mixins import LoggingMixin
 from freqtrade.optimize.backtest_caching import get_strategy_run_id
 from freqtrade.optimize.bt_progress import BTProgress
+from freqtrade.optimize.funding_fees import FundingFeeIndex
 from freqtrade.optimize.optimize_reports import (
     generate_backtest_stats,
     generate_rejected_signals,
@@ -245,6 +246,7 @@ class Backtesting:
             self.timeframe_detail_td = timedelta(seconds=0)
         self.detail_data: Dict[str, DataFrame] = {}
         self.futures_data: Dict[str, DataFrame] = {}
+        self._funding_fee_index: Dict[str, FundingFeeIndex] = {}
 
     def init_backtest(self):
         self.prepare_backtest(False)
@@ -894,15 +896,32 @@ class Backtesting:
         if self.trading_mode == TradingMode.FUTURES:
             if force or (current_time.timestamp() % self.funding_fee_timeframe_secs) == 0:
                 # Funding fee interval.
-                trade.set_funding_fees(
-                    self.exchange.calculate_funding_fees(
+                if type(self.exchange).calculate_funding_fees is Exchange.calculate_funding_fees:
+                    funding_fees = self._get_funding_fee_index(trade.pair).funding_fees(
+                        amount=trade.amount,
+                        is_short=trade.is_short,
+                        open_date=trade.date_last_filled_utc,
+                        close_date=current_time,
+                    )
+                else:
+                    funding_fees = self.exchange.calculate_funding_fees(
                         self.futures_data[trade.pair],
                         amount=trade.amount,
                         is_short=trade.is_short,
                         open_date=trade.date_last_filled_utc,
                         close_date=current_time,
                     )
-                )
+                trade.set_funding_fees(funding_fees)
+
+    def _get_funding_fee_index(self, pair: str) -> FundingFeeIndex:
+        """
+        Cumulative funding fees of a pair - built once per futures_data dataframe.
+        """
+        df = self.futures_data[pair]
+        index = self._funding_fee_index.get(pair)
+        if index is None or index.source is not df:
+            index = self._funding_fee_index[pair] = FundingFeeIndex(df)
+        return index
 
     def get_valid_price_and_stake(
         self,
@@ -1,8 +1,10 @@
 import logging
+from abc import ABC, abstractmethod
 from copy import deepcopy
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+from joblib import Parallel, delayed, wrap_non_picklable_objects
 from pandas import DataFrame
 
 from freqtrade.configuration import TimeRange
@@ -24,7 +26,7 @@ class VarHolder:
     startup_candle: int
 
 
-class BaseAnalysis:
+class BaseAnalysis(ABC):
     def __init__(self, config: Dict[str, Any], strategy_obj: Dict):
         self.failed_bias_check = True
         self.full_varHolder = VarHolder()
@@ -36,11 +38,67 @@ class BaseAnalysis:
         self.local_config["strategy"] = strategy_obj["name"]
         self.strategy_obj = strategy_obj
 
+        self._analysis_jobs: int = config.get("analysis_jobs", 1)
+        if self._analysis_jobs != 1 and "freqai" in config:
+            # Each run purges the freqai models of the previous one.
+            logger.info("FreqAI strategies are analyzed without parallel jobs.")
+            self._analysis_jobs = 1
+
     @staticmethod
     def dt_to_timestamp(dt: datetime):
         timestamp = int(dt.replace(tzinfo=timezone.utc).timestamp())
         return timestamp
 
+    @abstractmethod
+    def prepare_data(self, varholder: VarHolder, pairs_to_load: List[str]) -> None:
+        """
+        Run the backtest for varholder and store its results in varholder.
+        """
+
+    def _prepare_varholder(self, varholder: VarHolder, pairs_to_load: List[str]) -> VarHolder:
+        self.prepare_data(varholder, pairs_to_load)
+        return varholder
+
+    def _get_worker(self) -> "BaseAnalysis":
+        """
+        Copy of this analysis for worker processes - with only what prepare_data() needs,
+        so the already prepared varholders don't get pickled.
+        The exchange drops its async connections when pickled.
+        """
+        worker = object.__new__(type(self))
+        worker.local_config = self.local_config
+        worker.strategy_obj = self.strategy_obj
+        worker.exchange = self.exchange
+        worker._fee = self._fee
+        return worker
+
+    def fill_varholders(self, jobs: List[Tuple[VarHolder, List[str]]]) -> Iterator[VarHolder]:
+        """
+        Prepare independent varholders.
+        Uses analysis_jobs worker processes - or runs in this process if analysis_jobs is 1.
+        :param jobs: varholders to prepare, with the pairs to load for each of them
+        :return: Iterator of the prepared varholders, in order, as soon as they're available
+        """
+        if self._analysis_jobs == 1 or len(jobs) < 2:
+            for varholder, pairs_to_load in jobs:
+                yield self._prepare_varholder(varholder, pairs_to_load)
+            return
+
+        worker = self._get_worker()
+        with Parallel(n_jobs=self._analysis_jobs, return_as="generator") as parallel:
+            logger.info(
+                f"Preparing {len(jobs)} backtests using "
+                f"{parallel._effective_n_jobs()} parallel workers."
+            )
+            results = parallel(
+                delayed(wrap_non_picklable_objects(worker._prepare_varholder))(varholder, pairs)
+                for varholder, pairs in jobs
+            )
+            for (varholder, _), result in zip(jobs, results):
+                # Workers return a copy - update the varholder known to the caller.
+                varholder.__dict__.update(result.__dict__)
+                yield varholder
+
     def fill_full_varholder(self):
         self.full_varHolder = VarHolder()
 
@@ -0,0 +1,61 @@
+"""
+Cumulative funding fee index for backtesting.
+"""
+
+from datetime import datetime, timezone
+
+import numpy as np
+from pandas import DataFrame
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_ns(date: datetime) -> int:
+    """Exact nanosecond timestamp of a (timezone aware) datetime."""
+    delta = date - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1000
+
+
+class FundingFeeIndex:
+    """
+    Cumulative funding payments (open_fund * open_mark) of one pair.
+    Funding fees accrued between two dates are the difference of two cumulative sums -
+    instead of filtering and summing the combined funding / mark dataframe on every call.
+    Matches Exchange.calculate_funding_fees() (up to floating point summation order).
+    """
+
+    def __init__(self, df: DataFrame) -> None:
+        """
+        :param df: Combined funding and mark rates, as returned by
+                   Exchange.combine_funding_and_mark()
+        """
+        self.source = df
+        if df.empty:
+            dates = np.empty(0, dtype=np.int64)
+            payments = np.empty(0, dtype=np.float64)
+        else:
+            dates = df["date"].to_numpy(dtype="datetime64[ns]").view(np.int64)
+            payments = (df["open_fund"] * df["open_mark"]).to_numpy(dtype=np.float64)
+            if np.any(np.diff(dates) < 0):
+                order = np.argsort(dates, kind="stable")
+                dates, payments = dates[order], payments[order]
+        self._dates = dates
+        nans = np.isnan(payments)
+        self._cum_payments = np.concatenate(([0.0], np.cumsum(np.where(nans, 0.0, payments))))
+        self._cum_nans = np.concatenate(([0], np.cumsum(nans)))
+
+    def funding_fees(
+        self, amount: float, is_short: bool, open_date: datetime, close_date: datetime
+    ) -> float:
+        """
+        Sum of all funding fees between open_date and close_date (both inclusive).
+        :return: Funding fees - negated for longs, like Exchange.calculate_funding_fees()
+        """
+        start = int(np.searchsorted(self._dates, _to_ns(open_date), side="left"))
+        end = int(np.searchsorted(self._dates, _to_ns(close_date), side="right"))
+        if end <= start or self._cum_nans[end] != self._cum_nans[start]:
+            # Missing rates within the window invalidate the sum (same as the dataframe sum)
+            return 0.0
+        fees = float(self._cum_payments[end] - self._cum_payments[start]) * amount
+        return fees if is_short else -fees
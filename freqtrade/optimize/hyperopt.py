@@ -13,7 +13,6 @@ from math import ceil
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-import rapidjson
 from joblib import Parallel, cpu_count, delayed, dump, load, wrap_non_picklable_objects
 from joblib.externals import cloudpickle
 from pandas import DataFrame
@@ -35,9 +34,11 @@ from freqtrade.optimize.hyperopt_output import HyperoptOutput
 from freqtrade.optimize.hyperopt_tools import (
     HyperoptStateContainer,
     HyperoptTools,
-    hyperopt_serializer,
 )
-from freqtrade.optimize.optimize_reports import generate_strategy_stats
+from freqtrade.optimize.optimize_reports import (
+    generate_hyperopt_epoch_stats,
+    generate_strategy_stats,
+)
 from freqtrade.resolvers.hyperopt_resolver import HyperOptLossResolver
 from freqtrade.util import get_progress_tracker
 
@@ -107,6 +108,8 @@ class Hyperopt:
             self.config
         )
         self.calculate_loss = self.custom_hyperoptloss.hyperopt_loss_function
+        # Generate full backtest statistics for the best epochs only
+        self.lean_epoch_stats = not self.custom_hyperoptloss.needs_full_backtest_stats
         time_now = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         strategy = str(self.config["strategy"])
         self.results_file: Path = (
@@ -150,7 +153,11 @@ class Hyperopt:
         """
         Remove hyperopt pickle files to restart hyperopt.
         """
-        for f in [self.data_pickle_file, self.results_file]:
+        for f in [
+            self.data_pickle_file,
+            self.results_file,
+            HyperoptTools.get_index_filename(self.results_file),
+        ]:
             p = Path(f)
             if p.is_file():
                 logger.info(f"Removing `{p}`.")
@@ -187,14 +194,7 @@ class Hyperopt:
         :param epoch: result dictionary for this epoch.
         """
         epoch[FTHYPT_FILEVERSION] = 2
-        with self.results_file.open("a") as f:
-            rapidjson.dump(
-                epoch,
-                f,
-                default=hyperopt_serializer,
-                number_mode=rapidjson.NM_NATIVE | rapidjson.NM_NAN,
-            )
-            f.write("\n")
+        HyperoptTools.save_epoch(self.results_file, epoch)
 
         self.num_epochs_saved += 1
         logger.debug(
@@ -414,15 +414,12 @@ class Hyperopt:
     ) -> Dict[str, Any]:
         params_details = self._get_params_details(params_dict)
 
-        strat_stats = generate_strategy_stats(
-            self.pairlist,
-            self.backtesting.strategy.get_strategy_name(),
-            backtesting_results,
-            min_date,
-            max_date,
-            market_change=self.market_change,
-            is_hyperopt=True,
-        )
+        if self.lean_epoch_stats:
+            strat_stats = generate_hyperopt_epoch_stats(
+                self.backtesting.strategy.get_strategy_name(), backtesting_results
+            )
+        else:
+            strat_stats = self._generate_strategy_stats(backtesting_results, min_date, max_date)
         results_explanation = HyperoptTools.format_results_explanation_string(
             strat_stats, self.config["stake_currency"]
         )
@@ -448,7 +445,7 @@ class Hyperopt:
                 processed=processed,
                 backtest_stats=strat_stats,
             )
-        return {
+        result = {
             "loss": loss,
             "params_dict": params_dict,
             "params_details": params_details,
@@ -457,6 +454,23 @@ class Hyperopt:
             "results_explanation": results_explanation,
             "total_profit": total_profit,
         }
+        if self.lean_epoch_stats:
+            # Kept to generate the full statistics should this epoch become the best one.
+            result["backtest_results"] = backtesting_results
+        return result
+
+    def _generate_strategy_stats(
+        self, backtesting_results: Dict[str, Any], min_date: datetime, max_date: datetime
+    ) -> Dict[str, Any]:
+        return generate_strategy_stats(
+            self.pairlist,
+            self.backtesting.strategy.get_strategy_name(),
+            backtesting_results,
+            min_date,
+            max_date,
+            market_change=self.market_change,
+            is_hyperopt=True,
+        )
 
     def get_optimizer(self, dimensions: List[Dimension], cpu_count) -> Optimizer:
         estimator = self.custom_hyperopt.generate_estimator(dimensions=dimensions)
@@ -589,6 +603,11 @@ class Hyperopt:
         # order they will be shown to the user.
         val["is_best"] = is_best
         val["is_random"] = is_random
+        backtesting_results = val.pop("backtest_results", None)
+        if is_best and backtesting_results is not None:
+            val["results_metrics"] = self._generate_strategy_stats(
+                backtesting_results, self.min_date, self.max_date
+            )
         self.print_results(val)
 
         if is_best:
@@ -21,6 +21,8 @@ class MaxDrawDownHyperOptLoss(IHyperOptLoss):
     Less max drawdown more profit -> Lower return value
     """
 
+    needs_full_backtest_stats = False
+
     @staticmethod
     def hyperopt_loss_function(
         results: DataFrame,
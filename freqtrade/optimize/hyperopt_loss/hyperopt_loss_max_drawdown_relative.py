@@ -20,6 +20,8 @@ class MaxDrawDownRelativeHyperOptLoss(IHyperOptLoss):
     Less max drawdown more profit -> Lower return value
     """
 
+    needs_full_backtest_stats = False
+
     @staticmethod
     def hyperopt_loss_function(results: DataFrame, config: Config, *args, **kwargs) -> float:
         """
@@ -17,6 +17,8 @@ class OnlyProfitHyperOptLoss(IHyperOptLoss):
     This implementation takes only absolute profit into account, not looking at any other indicator.
     """
 
+    needs_full_backtest_stats = False
+
     @staticmethod
     def hyperopt_loss_function(results: DataFrame, trade_count: int, *args, **kwargs) -> float:
         """
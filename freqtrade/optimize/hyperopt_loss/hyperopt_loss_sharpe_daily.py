@@ -20,6 +20,8 @@ class SharpeHyperOptLossDaily(IHyperOptLoss):
     This implementation uses the Sharpe Ratio calculation.
     """
 
+    needs_full_backtest_stats = False
+
     @staticmethod
     def hyperopt_loss_function(
         results: DataFrame,
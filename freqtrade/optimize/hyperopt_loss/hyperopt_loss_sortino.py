@@ -21,6 +21,8 @@ class SortinoHyperOptLoss(IHyperOptLoss):
     This implementation uses the Sortino Ratio calculation.
     """
 
+    needs_full_backtest_stats = False
+
     @staticmethod
     def hyperopt_loss_function(
         results: DataFrame,
@@ -20,6 +20,8 @@ class SortinoHyperOptLossDaily(IHyperOptLoss):
     This implementation uses the Sortino Ratio calculation.
     """
 
+    needs_full_backtest_stats = False
+
     @staticmethod
     def hyperopt_loss_function(
         results: DataFrame,
@@ -19,6 +19,10 @@ class IHyperOptLoss(ABC):
     """
 
     timeframe: str
+    # Set to False if hyperopt_loss_function() only uses the metrics of
+    # generate_hyperopt_epoch_stats() from backtest_stats.
+    # Full backtest statistics are then only generated for the best epochs.
+    needs_full_backtest_stats: bool = True
 
     @staticmethod
     @abstractmethod
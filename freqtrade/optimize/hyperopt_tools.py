@@ -2,7 +2,7 @@ import logging
 from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import rapidjson
@@ -21,6 +21,21 @@ NON_OPT_PARAM_APPENDIX = "  # value loaded from strategy"
 
 HYPER_PARAMS_FILE_FORMAT = rapidjson.NM_NATIVE | rapidjson.NM_NAN
 
+# Metrics kept in the epoch index - all that's needed to list and filter epochs.
+HYPEROPT_INDEX_METRICS = (
+    "total_trades",
+    "wins",
+    "draws",
+    "losses",
+    "profit_mean",
+    "profit_total",
+    "profit_total_abs",
+    "holding_avg",
+    "holding_avg_s",
+    "max_drawdown_account",
+    "max_drawdown_abs",
+)
+
 
 def hyperopt_serializer(x):
     if isinstance(x, np.integer):
@@ -31,6 +46,14 @@ def hyperopt_serializer(x):
     return str(x)
 
 
+def _json_line(data: Dict[str, Any]) -> str:
+    """One line of the (line based) hyperopt results or epoch index file."""
+    return (
+        rapidjson.dumps(data, default=hyperopt_serializer, number_mode=HYPER_PARAMS_FILE_FORMAT)
+        + "\n"
+    )
+
+
 class HyperoptStateContainer:
     """Singleton class to track state of hyperopt"""
 
@@ -113,21 +136,102 @@ class HyperoptTools:
             return any(s in config["spaces"] for s in [space, "all", "default"])
 
     @staticmethod
-    def _read_results(results_file: Path, batch_size: int = 10) -> Iterator[List[Any]]:
+    def get_index_filename(results_file: Path) -> Path:
+        """
+        Epoch index, stored alongside the hyperopt results file.
+        """
+        return results_file.with_name(f"{results_file.name}.idx")
+
+    @staticmethod
+    def _epoch_index_entry(epoch: Dict[str, Any], offset: int, length: int) -> Dict[str, Any]:
+        """
+        Compact version of an epoch - with the position of the full epoch in the results file.
+        Has the same structure as the epoch, so it can be filtered and listed the same way.
+        """
+        metrics = epoch.get("results_metrics", {})
+        return {
+            "offset": offset,
+            "length": length,
+            "current_epoch": epoch.get("current_epoch"),
+            "loss": epoch["loss"],
+            "is_best": epoch["is_best"],
+            "is_initial_point": epoch.get("is_initial_point", False),
+            "is_random": epoch.get("is_random", False),
+            "results_metrics": {k: metrics[k] for k in HYPEROPT_INDEX_METRICS if k in metrics},
+        }
+
+    @staticmethod
+    def save_epoch(results_file: Path, epoch: Dict[str, Any]) -> None:
         """
-        Stream hyperopt results from file
+        Append one epoch to the results file - and its entry to the epoch index.
         """
-        import rapidjson
+        line = _json_line(epoch).encode("utf-8")
+        with results_file.open("ab") as f:
+            offset = f.tell()
+            f.write(line)
+        entry = HyperoptTools._epoch_index_entry(epoch, offset, len(line))
+        with HyperoptTools.get_index_filename(results_file).open("a") as f:
+            f.write(_json_line(entry))
 
+    @staticmethod
+    def _build_index(results_file: Path) -> List[Dict[str, Any]]:
+        """
+        Build the epoch index by streaming the results file.
+        """
         logger.info(f"Reading epochs from '{results_file}'")
-        with results_file.open("r") as f:
-            data = []
+        index = []
+        offset = 0
+        with results_file.open("rb") as f:
             for line in f:
-                data += [rapidjson.loads(line)]
-                if len(data) >= batch_size:
-                    yield data
-                    data = []
-        yield data
+                epoch = rapidjson.loads(line, number_mode=HYPER_PARAMS_FILE_FORMAT)
+                if offset == 0 and epoch.get("is_best") is None:
+                    raise OperationalException(
+                        "The file with HyperoptTools results is incompatible with this version "
+                        "of Freqtrade and cannot be loaded."
+                    )
+                index.append(HyperoptTools._epoch_index_entry(epoch, offset, len(line)))
+                offset += len(line)
+        return index
+
+    @staticmethod
+    def _load_index(results_file: Path) -> List[Dict[str, Any]]:
+        """
+        Load the epoch index of a results file.
+        (Re)builds the index if it's missing or does not cover the whole results file
+        (results from older versions, or an interrupted write).
+        """
+        index_file = HyperoptTools.get_index_filename(results_file)
+        if index_file.is_file():
+            with index_file.open("r") as f:
+                index = [rapidjson.loads(line, number_mode=HYPER_PARAMS_FILE_FORMAT) for line in f]
+            if index and index[-1]["offset"] + index[-1]["length"] == results_file.stat().st_size:
+                return index
+            logger.info(f"Epoch index '{index_file}' is outdated, rebuilding.")
+
+        index = HyperoptTools._build_index(results_file)
+        try:
+            with index_file.open("w") as f:
+                f.writelines(_json_line(entry) for entry in index)
+        except OSError as e:
+            logger.warning(f"Could not write epoch index '{index_file}': {e}")
+        return index
+
+    @staticmethod
+    def load_epochs(results_file: Path, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Load full epochs for index entries - seeking directly to each epoch.
+        :param entries: Entries of the epoch index, as returned by load_filtered_index()
+        """
+        epochs: List[Dict[str, Any]] = []
+        if not entries:
+            return epochs
+        with results_file.open("rb") as f:
+            for entry in entries:
+                f.seek(entry["offset"])
+                epochs.append(
+                    rapidjson.loads(f.read(entry["length"]), number_mode=HYPER_PARAMS_FILE_FORMAT)
+                )
+        return epochs
 
     @staticmethod
     def _test_hyperopt_results_exist(results_file) -> bool:
@@ -143,7 +247,12 @@ class HyperoptTools:
             return False
 
     @staticmethod
-    def load_filtered_results(results_file: Path, config: Config) -> Tuple[List, int]:
+    def load_filtered_index(results_file: Path, config: Config) -> Tuple[List, int]:
+        """
+        Load and filter the epoch index - without reading the full epochs.
+        Use load_epochs() to load the full epochs for (some of) the returned entries.
+        :return: Tuple of filtered index entries and total number of epochs
+        """
         filteroptions = {
             "only_best": config.get("hyperopt_list_best", False),
             "only_profitable": config.get("hyperopt_list_profitable", False),
@@ -163,23 +272,20 @@ class HyperoptTools:
             logger.warning(f"Hyperopt file {results_file} not found.")
             return [], 0
 
-        epochs = []
-        total_epochs = 0
-        for epochs_tmp in HyperoptTools._read_results(results_file):
-            if total_epochs == 0 and epochs_tmp[0].get("is_best") is None:
-                raise OperationalException(
-                    "The file with HyperoptTools results is incompatible with this version "
-                    "of Freqtrade and cannot be loaded."
-                )
-            total_epochs += len(epochs_tmp)
-            epochs += hyperopt_filter_epochs(epochs_tmp, filteroptions, log=False)
-
-        logger.info(f"Loaded {total_epochs} previous evaluations from disk.")
+        index = HyperoptTools._load_index(results_file)
+        logger.info(f"Loaded {len(index)} previous evaluations from disk.")
 
-        # Final filter run ...
-        epochs = hyperopt_filter_epochs(epochs, filteroptions, log=True)
+        return hyperopt_filter_epochs(index, filteroptions, log=True), len(index)
 
-        return epochs, total_epochs
+    @staticmethod
+    def load_filtered_results(results_file: Path, config: Config) -> Tuple[List, int]:
+        """
+        Load and filter hyperopt results.
+        Filters on the epoch index - only matching epochs are loaded completely.
+        :return: Tuple of filtered epochs and total number of epochs
+        """
+        entries, total_epochs = HyperoptTools.load_filtered_index(results_file, config)
+        return HyperoptTools.load_epochs(results_file, entries), total_epochs
 
     @staticmethod
     def show_epoch_details(
@@ -19,6 +19,7 @@ from freqtrade.optimize.optimize_reports.optimize_reports import (
     generate_all_periodic_breakdown_stats,
     generate_backtest_stats,
     generate_daily_stats,
+    generate_hyperopt_epoch_stats,
     generate_pair_metrics,
     generate_periodic_breakdown_stats,
     generate_rejected_signals,
@@ -8,6 +8,10 @@ from freqtrade.constants import LAST_BT_RESULT_FN
 from freqtrade.ft_types import BacktestResultType
 from freqtrade.misc import file_dump_joblib, file_dump_json
 from freqtrade.optimize.backtest_caching import get_backtest_metadata_filename
+from freqtrade.optimize.backtest_result_container import (
+    BT_CONTAINER_SUFFIX,
+    store_backtest_container,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -41,21 +45,15 @@ def store_backtest_stats(
     Stores backtest results
     :param recordfilename: Path object, which can either be a filename or a directory.
         Filenames will be appended with a timestamp right before the suffix
-        while for directories, <directory>/backtest-result-<datetime>.json will be used as filename
+        while for directories, <directory>/backtest-result-<datetime>.zip will be used as filename
     :param stats: Dataframe containing the backtesting statistics
     :param dtappendix: Datetime to use for the filename
     """
-    filename = _generate_filename(recordfilename, dtappendix, ".json")
+    filename = _generate_filename(recordfilename, dtappendix, BT_CONTAINER_SUFFIX)
 
     # Store metadata separately.
     file_dump_json(get_backtest_metadata_filename(filename), stats["metadata"])
-    # Don't mutate the original stats dict.
-    stats_copy = {
-        "strategy": stats["strategy"],
-        "strategy_comparison": stats["strategy_comparison"],
-    }
-
-    file_dump_json(filename, stats_copy)
+    store_backtest_container(filename, stats)
 
     latest_filename = Path.joinpath(filename.parent, LAST_BT_RESULT_FN)
     file_dump_json(latest_filename, {"latest_backtest": str(filename.name)})
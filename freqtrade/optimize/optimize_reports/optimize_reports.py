@@ -8,14 +8,10 @@ from pandas import DataFrame, Series, concat, to_datetime
 
 from freqtrade.constants import BACKTEST_BREAKDOWNS, DATETIME_PRINT_FORMAT
 from freqtrade.data.metrics import (
+    TradeMetrics,
     calculate_cagr,
-    calculate_calmar,
     calculate_csum,
-    calculate_expectancy,
     calculate_market_change,
-    calculate_max_drawdown,
-    calculate_sharpe,
-    calculate_sortino,
 )
 from freqtrade.ft_types import BacktestResultType
 from freqtrade.util import decimals_per_coin, fmt_coin
@@ -429,7 +425,8 @@ def generate_strategy_stats(
     losing_profit = results.loc[results["profit_abs"] < 0, "profit_abs"].sum()
     profit_factor = winning_profit / abs(losing_profit) if losing_profit else 0.0
 
-    expectancy, expectancy_ratio = calculate_expectancy(results)
+    metrics = TradeMetrics(results, starting_balance=start_balance)
+    expectancy, expectancy_ratio = metrics.expectancy()
     backtest_days = (max_date - min_date).days or 1
     strat_stats = {
         "trades": results.to_dict(orient="records"),
@@ -457,9 +454,9 @@ def generate_strategy_stats(
         "cagr": calculate_cagr(backtest_days, start_balance, content["final_balance"]),
         "expectancy": expectancy,
         "expectancy_ratio": expectancy_ratio,
-        "sortino": calculate_sortino(results, min_date, max_date, start_balance),
-        "sharpe": calculate_sharpe(results, min_date, max_date, start_balance),
-        "calmar": calculate_calmar(results, min_date, max_date, start_balance),
+        "sortino": metrics.sortino(min_date, max_date),
+        "sharpe": metrics.sharpe(min_date, max_date),
+        "calmar": metrics.calmar(min_date, max_date),
         "profit_factor": profit_factor,
         "backtest_start": min_date.strftime(DATETIME_PRINT_FORMAT),
         "backtest_start_ts": int(min_date.timestamp() * 1000),
@@ -512,13 +509,9 @@ def generate_strategy_stats(
     }
 
     try:
-        drawdown = calculate_max_drawdown(
-            results, value_col="profit_abs", starting_balance=start_balance
-        )
+        drawdown = metrics.max_drawdown()
         # max_relative_drawdown = Underwater
-        underwater = calculate_max_drawdown(
-            results, value_col="profit_abs", starting_balance=start_balance, relative=True
-        )
+        underwater = metrics.max_drawdown(relative=True)
 
         strat_stats.update(
             {
@@ -557,6 +550,67 @@ def generate_strategy_stats(
     return strat_stats
 
 
+def generate_hyperopt_epoch_stats(strategy: str, content: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Lean version of generate_strategy_stats() for hyperopt epochs.
+    Contains the metrics shown in the hyperopt result tables (with identical values),
+    but skips per pair / per tag tables, daily stats, ratios and the list of trades.
+    :param strategy: Strategy name
+    :param content: Backtest result data, as passed to generate_strategy_stats()
+    :return: Dictionary containing the subset of the strategy summary.
+    """
+    results = content["results"]
+    if not isinstance(results, DataFrame):
+        return {}
+    start_balance = content["config"]["dry_run_wallet"]
+    trade_count = len(results)
+
+    profit_ratio = results["profit_ratio"].to_numpy(dtype=np.float64)
+    is_short = results["is_short"].to_numpy(dtype=bool)
+    wins = int(np.count_nonzero(profit_ratio > 0))
+    profit_total_abs = results["profit_abs"].sum()
+    holding_avg = (
+        timedelta(minutes=round(results["trade_duration"].mean())) if trade_count else timedelta()
+    )
+    stats = {
+        "strategy_name": strategy,
+        "stake_currency": content["config"]["stake_currency"],
+        "total_trades": trade_count,
+        "trade_count_long": trade_count - int(np.count_nonzero(is_short)),
+        "trade_count_short": int(np.count_nonzero(is_short)),
+        "wins": wins,
+        "draws": int(np.count_nonzero(profit_ratio == 0)),
+        "losses": int(np.count_nonzero(profit_ratio < 0)),
+        "winrate": wins / trade_count if trade_count else 0.0,
+        "profit_mean": results["profit_ratio"].mean() if trade_count > 0 else 0,
+        "profit_median": results["profit_ratio"].median() if trade_count > 0 else 0,
+        "profit_total": profit_total_abs / start_balance,
+        "profit_total_abs": profit_total_abs,
+        "holding_avg": holding_avg,
+        "starting_balance": start_balance,
+        "final_balance": content["final_balance"],
+    }
+    if trade_count:
+        stats["holding_avg_s"] = holding_avg.total_seconds()
+    try:
+        metrics = TradeMetrics(results, starting_balance=start_balance)
+        drawdown = metrics.max_drawdown()
+        stats.update(
+            {
+                "max_drawdown_account": drawdown.relative_account_drawdown,
+                "max_relative_drawdown": metrics.max_drawdown(
+                    relative=True
+                ).relative_account_drawdown,
+                "max_drawdown_abs": drawdown.drawdown_abs,
+            }
+        )
+    except ValueError:
+        stats.update(
+            {"max_drawdown_account": 0.0, "max_relative_drawdown": 0.0, "max_drawdown_abs": 0.0}
+        )
+    return stats
+
+
 def generate_backtest_stats(
     btdata: Dict[str, DataFrame],
     all_results: Dict[str, Dict[str, Union[DataFrame, Dict]]],
@@ -1,10 +1,12 @@
 # flake8: noqa: F401
 
+from freqtrade.persistence.closed_trade_index import ClosedTrade, ClosedTradeIndex
 from freqtrade.persistence.custom_data import CustomDataWrapper
 from freqtrade.persistence.key_value_store import KeyStoreKeys, KeyValueStore
 from freqtrade.persistence.models import init_db
 from freqtrade.persistence.pairlock_middleware import PairLocks
 from freqtrade.persistence.trade_model import LocalTrade, Order, Trade
+from freqtrade.persistence.unit_of_work import unit_of_work
 from freqtrade.persistence.usedb_context import (
     FtNoDBContext,
     disable_database_use,
@@ -0,0 +1,145 @@
+"""
+In-memory index of closed trades, sorted by close date.
+"""
+
+import threading
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import datetime, timezone
+from math import fsum
+from typing import Dict, List, NamedTuple, Optional
+
+from freqtrade.constants import LongShort
+
+
+class ClosedTrade(NamedTuple):
+    """
+    Snapshot of a closed trade - the fields protections and wallets need.
+    """
+
+    id: int
+    pair: str
+    is_short: bool
+    close_date: datetime
+    close_profit: Optional[float]
+    close_profit_abs: Optional[float]
+    exit_reason: Optional[str]
+
+    @property
+    def trade_direction(self) -> LongShort:
+        return "short" if self.is_short else "long"
+
+    @classmethod
+    def from_trade(cls, trade) -> "ClosedTrade":
+        """
+        :param trade: closed Trade or LocalTrade
+        """
+        close_date = trade.close_date
+        if close_date.tzinfo is None:
+            # coming from Database, tzinfo is not set.
+            close_date = close_date.replace(tzinfo=timezone.utc)
+        return cls(
+            id=trade.id,
+            pair=trade.pair,
+            is_short=trade.is_short,
+            close_date=close_date,
+            close_profit=trade.close_profit,
+            close_profit_abs=trade.close_profit_abs,
+            exit_reason=trade.exit_reason,
+        )
+
+
+class _SortedTrades:
+    """
+    Trades sorted by close date, with a parallel list of close dates to bisect on.
+    """
+
+    __slots__ = ("dates", "trades")
+
+    def __init__(self) -> None:
+        self.dates: List[datetime] = []
+        self.trades: List[ClosedTrade] = []
+
+    def insert(self, trade: ClosedTrade) -> None:
+        # Trades usually close in chronological order - appending is the common case.
+        index = bisect_right(self.dates, trade.close_date)
+        self.dates.insert(index, trade.close_date)
+        self.trades.insert(index, trade)
+
+    def remove(self, trade: ClosedTrade) -> None:
+        index = self.trades.index(trade)
+        del self.dates[index]
+        del self.trades[index]
+
+    def closed_after(self, close_date: Optional[datetime]) -> List[ClosedTrade]:
+        if close_date is None:
+            return list(self.trades)
+        return self.trades[bisect_right(self.dates, close_date) :]
+
+
+class ClosedTradeIndex:
+    """
+    Closed trades sorted by close date - overall and per pair,
+    plus the total realized profit of all closed trades.
+    Lookbacks ("closed after date") bisect the sorted close dates.
+    """
+
+    def __init__(self, trades: Optional[List[ClosedTrade]] = None) -> None:
+        self._lock = threading.Lock()
+        self._by_id: Dict[int, ClosedTrade] = {}
+        self._all = _SortedTrades()
+        self._per_pair: Dict[str, _SortedTrades] = defaultdict(_SortedTrades)
+        for trade in sorted(trades or [], key=lambda t: t.close_date):
+            self._by_id[trade.id] = trade
+            self._all.insert(trade)
+            self._per_pair[trade.pair].insert(trade)
+        self.total_profit: float = fsum(t.close_profit_abs or 0.0 for t in self._all.trades)
+
+    def __len__(self) -> int:
+        return len(self._all.trades)
+
+    def add(self, trade: ClosedTrade) -> None:
+        """
+        Add a closed trade. Use remove() first to replace a trade.
+        """
+        with self._lock:
+            self._by_id[trade.id] = trade
+            self._all.insert(trade)
+            self._per_pair[trade.pair].insert(trade)
+            self.total_profit += trade.close_profit_abs or 0.0
+
+    def remove(self, trade_id: int) -> None:
+        """
+        Remove a trade from the index - a no-op for unknown trades.
+        Expects unique trade ids.
+        """
+        with self._lock:
+            self._remove(trade_id)
+
+    def get_trades(
+        self, *, pair: Optional[str] = None, close_date: Optional[datetime] = None
+    ) -> List[ClosedTrade]:
+        """
+        :param pair: Only trades of this pair
+        :param close_date: Only trades closed after this date (trade.close_date > close_date)
+        :return: closed trades, sorted by close date
+        """
+        if close_date is not None and close_date.tzinfo is None:
+            close_date = close_date.replace(tzinfo=timezone.utc)
+        with self._lock:
+            if pair:
+                if pair not in self._per_pair:
+                    return []
+                return self._per_pair[pair].closed_after(close_date)
+            return self._all.closed_after(close_date)
+
+    def _remove(self, trade_id: int) -> None:
+        trade = self._by_id.pop(trade_id, None)
+        if trade is None:
+            return
+        self._all.remove(trade)
+        pair_trades = self._per_pair[trade.pair]
+        pair_trades.remove(trade)
+        if not pair_trades.trades:
+            del self._per_pair[trade.pair]
+        self.total_profit -= trade.close_profit_abs or 0.0
@@ -5,15 +5,18 @@ This module contains the class to persist trades into SQLite
 import logging
 import threading
 from contextvars import ContextVar
-from typing import Any, Dict, Final, Optional
+from itertools import chain
+from typing import Any, Dict, Final, List, Optional, Tuple
 
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, event, inspect
 from sqlalchemy.exc import NoSuchModuleError
-from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
+from freqtrade.constants import SQLITE_JOURNAL_MODES, SQLITE_SYNCHRONOUS_LEVELS
 from freqtrade.exceptions import OperationalException
 from freqtrade.persistence.base import ModelBase
+from freqtrade.persistence.closed_trade_index import ClosedTrade
 from freqtrade.persistence.custom_data import _CustomData
 from freqtrade.persistence.key_value_store import _KeyValueStoreModel
 from freqtrade.persistence.migrations import check_migrate
@@ -42,13 +45,92 @@ def get_request_or_thread_id() -> Optional[str]:
 
 _SQL_DOCS_URL = "http://docs.sqlalchemy.org/en/latest/core/engines.html#database-urls"
 
+_CLOSED_TRADE_CHANGES: Final[str] = "closed_trade_changes"
+_TRADES_CHANGED: Final[str] = "trades_changed"
 
-def init_db(db_url: str) -> None:
+
+def _apply_closed_trade_changes(changes: List[Tuple[int, Optional[ClosedTrade]]]) -> None:
+    index = Trade._closed_trade_index
+    if index is None:
+        # Not loaded yet - will be loaded from the database on first use.
+        return
+    for trade_id, closed_trade in changes:
+        index.remove(trade_id)
+        if closed_trade is not None:
+            index.add(closed_trade)
+
+
+def _on_flush(session: Session, flush_context) -> None:
+    """
+    Apply flushed trade changes to the closed trade index,
+    and remember that this transaction changes trades (see Trade.data_version).
+    Flushed changes are visible to queries of the same transaction - so they must be
+    visible in the index, too (e.g. for protections within a unit of work).
+    """
+    changes: List[Tuple[int, Optional[ClosedTrade]]] = []
+    for obj in chain(session.new, session.dirty):
+        if isinstance(obj, Trade):
+            closed = not obj.is_open and obj.close_date is not None
+            changes.append((obj.id, ClosedTrade.from_trade(obj) if closed else None))
+    for obj in session.deleted:
+        if isinstance(obj, Trade):
+            changes.append((obj.id, None))
+    if changes:
+        _apply_closed_trade_changes(changes)
+        session.info.setdefault(_CLOSED_TRADE_CHANGES, []).extend(changes)
+    if changes or any(
+        isinstance(obj, Order) for obj in chain(session.new, session.dirty, session.deleted)
+    ):
+        session.info[_TRADES_CHANGED] = True
+
+
+def _on_commit(session: Session) -> None:
+    # Re-apply - the index may have been reloaded since the flush.
+    _apply_closed_trade_changes(session.info.pop(_CLOSED_TRADE_CHANGES, []))
+    if session.info.pop(_TRADES_CHANGED, False):
+        Trade.data_version += 1
+
+
+def _on_rollback(session: Session) -> None:
+    session.info.pop(_TRADES_CHANGED, None)
+    if session.info.pop(_CLOSED_TRADE_CHANGES, None):
+        # Flushed changes were discarded - reload the index on next use.
+        Trade._closed_trade_index = None
+
+
+def _configure_sqlite(engine, journal_mode: Optional[str], synchronous: Optional[str]) -> None:
+    """
+    Apply journal mode and synchronous level to every new sqlite connection.
+    """
+    if journal_mode and journal_mode.upper() not in SQLITE_JOURNAL_MODES:
+        raise OperationalException(f"Invalid sqlite journal mode {journal_mode}.")
+    if synchronous and synchronous.upper() not in SQLITE_SYNCHRONOUS_LEVELS:
+        raise OperationalException(f"Invalid sqlite synchronous level {synchronous}.")
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        if journal_mode:
+            cursor.execute(f"PRAGMA journal_mode={journal_mode}")
+        if synchronous:
+            cursor.execute(f"PRAGMA synchronous={synchronous}")
+        cursor.close()
+
+
+def init_db(
+    db_url: str,
+    *,
+    sqlite_journal_mode: Optional[str] = None,
+    sqlite_synchronous: Optional[str] = None,
+) -> None:
     """
     Initializes this module with the given config,
     registers all known command handlers
     and starts polling for message updates
     :param db_url: Database to use
+    :param sqlite_journal_mode: SQLite journal mode (e.g. "WAL"). Ignored for other databases.
+    :param sqlite_synchronous: SQLite synchronous level (e.g. "NORMAL").
+        Ignored for other databases.
     :return: None
     """
     kwargs: Dict[str, Any] = {}
@@ -78,6 +160,8 @@ def init_db(db_url: str) -> None:
             f"Given value for db_url: '{db_url}' "
             f"is no valid database URL! (See {_SQL_DOCS_URL})"
         )
+    if db_url.startswith("sqlite://") and (sqlite_journal_mode or sqlite_synchronous):
+        _configure_sqlite(engine, sqlite_journal_mode, sqlite_synchronous)
 
     # https://docs.sqlalchemy.org/en/13/orm/contextual.html#thread-local-scope
     # Scoped sessions proxy requests to the appropriate thread-local session.
@@ -86,6 +170,12 @@ def init_db(db_url: str) -> None:
         sessionmaker(bind=engine, autoflush=False), scopefunc=get_request_or_thread_id
     )
     Order.session = Trade.session
+    # Write-through for the in-memory closed trade index
+    Trade._closed_trade_index = None
+    session_factory = Trade.session.session_factory
+    event.listen(session_factory, "after_flush", _on_flush)
+    event.listen(session_factory, "after_commit", _on_commit)
+    event.listen(session_factory, "after_rollback", _on_rollback)
     PairLock.session = Trade.session
     _KeyValueStoreModel.session = Trade.session
     _CustomData.session = scoped_session(
@@ -1,11 +1,14 @@
 import logging
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from datetime import datetime, timezone
-from typing import List, Optional, Sequence
+from typing import Dict, List, Optional, Sequence
 
 from sqlalchemy import select
 
 from freqtrade.exchange import timeframe_to_next_date
 from freqtrade.persistence.models import PairLock
+from freqtrade.persistence.unit_of_work import commit_session
 
 
 logger = logging.getLogger(__name__)
@@ -20,6 +23,9 @@ class PairLocks:
 
     use_db = True
     locks: List[PairLock] = []
+    # Backtesting only: locks per pair sorted by lock end time, with a parallel list of end times
+    _pair_locks: Dict[str, List[PairLock]] = defaultdict(list)
+    _pair_lock_ends: Dict[str, List[datetime]] = defaultdict(list)
 
     timeframe: str = ""
 
@@ -30,6 +36,8 @@ class PairLocks:
         """
         if not PairLocks.use_db:
             PairLocks.locks = []
+            PairLocks._pair_locks = defaultdict(list)
+            PairLocks._pair_lock_ends = defaultdict(list)
 
     @staticmethod
     def lock_pair(
@@ -60,9 +68,13 @@ class PairLocks:
         )
         if PairLocks.use_db:
             PairLock.session.add(lock)
-            PairLock.session.commit()
+            commit_session(PairLock.session)
         else:
             PairLocks.locks.append(lock)
+            ends = PairLocks._pair_lock_ends[pair]
+            index = bisect_right(ends, lock.lock_end_time)
+            ends.insert(index, lock.lock_end_time)
+            PairLocks._pair_locks[pair].insert(index, lock)
         return lock
 
     @staticmethod
@@ -80,18 +92,26 @@ class PairLocks:
 
         if PairLocks.use_db:
             return PairLock.query_pair_locks(pair, now, side).all()
-        else:
-            locks = [
+        elif pair is None:
+            return [
                 lock
                 for lock in PairLocks.locks
                 if (
                     lock.lock_end_time >= now
                     and lock.active is True
-                    and (pair is None or lock.pair == pair)
                     and (lock.side == "*" or lock.side == side)
                 )
             ]
-            return locks
+        else:
+            if pair not in PairLocks._pair_lock_ends:
+                return []
+            # Skip expired locks - these sort before the first lock ending at / after now
+            start = bisect_left(PairLocks._pair_lock_ends[pair], now)
+            return [
+                lock
+                for lock in PairLocks._pair_locks[pair][start:]
+                if lock.active is True and (lock.side == "*" or lock.side == side)
+            ]
 
     @staticmethod
     def get_pair_longest_lock(
@@ -120,7 +140,7 @@ class PairLocks:
         for lock in locks:
             lock.active = False
         if PairLocks.use_db:
-            PairLock.session.commit()
+            commit_session(PairLock.session)
 
     @staticmethod
     def unlock_reason(reason: str, now: Optional[datetime] = None) -> None:
@@ -145,7 +165,7 @@ class PairLocks:
             for lock in locks:
                 logger.info(f"Releasing lock for {lock.pair} with reason '{reason}'.")
                 lock.active = False
-            PairLock.session.commit()
+            commit_session(PairLock.session)
         else:
             # used in backtesting mode; don't show log messages for speed
             locksb = PairLocks.get_pair_locks(None)
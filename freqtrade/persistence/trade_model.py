@@ -5,9 +5,9 @@ This module contains the class to persist trades into SQLite
 import logging
 from collections import defaultdict
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from math import isclose
-from typing import Any, ClassVar, Dict, List, Optional, Sequence, cast
+from typing import Any, ClassVar, Dict, List, Optional, Sequence, Tuple, cast
 
 from sqlalchemy import (
     Enum,
@@ -18,6 +18,7 @@ from sqlalchemy import (
     Select,
     String,
     UniqueConstraint,
+    case,
     desc,
     func,
     select,
@@ -45,7 +46,9 @@ from freqtrade.exchange import (
 from freqtrade.leverage import interest
 from freqtrade.misc import safe_value_fallback
 from freqtrade.persistence.base import ModelBase, SessionType
+from freqtrade.persistence.closed_trade_index import ClosedTrade, ClosedTradeIndex
 from freqtrade.persistence.custom_data import CustomDataWrapper, _CustomData
+from freqtrade.persistence.unit_of_work import commit_session
 from freqtrade.util import FtPrecise, dt_from_ts, dt_now, dt_ts, dt_ts_none
 
 
@@ -379,6 +382,8 @@ class LocalTrade:
     bt_trades_open_pp: Dict[str, List["LocalTrade"]] = defaultdict(list)
     bt_open_open_trade_count: int = 0
     bt_total_profit: float = 0
+    # Closed trades, sorted by close date - for protection lookbacks
+    bt_closed_index: ClosedTradeIndex = ClosedTradeIndex()
     realized_profit: float = 0
 
     id: int = 0
@@ -747,6 +752,7 @@ class LocalTrade:
         LocalTrade.bt_trades_open_pp = defaultdict(list)
         LocalTrade.bt_open_open_trade_count = 0
         LocalTrade.bt_total_profit = 0
+        LocalTrade.bt_closed_index = ClosedTradeIndex()
 
     def adjust_min_max_rates(self, current_price: float, current_price_low: float) -> None:
         """
@@ -1436,6 +1442,18 @@ class LocalTrade:
 
         return sel_trades
 
+    @staticmethod
+    def get_closed_trades(
+        *, pair: Optional[str] = None, close_date: Optional[datetime] = None
+    ) -> List[ClosedTrade]:
+        """
+        Closed trades, as used by protections.
+        :param pair: Filter by pair
+        :param close_date: Filter by close_date (filters via trade.close_date > input)
+        :return: List of ClosedTrade snapshots, sorted by close date
+        """
+        return LocalTrade.bt_closed_index.get_trades(pair=pair, close_date=close_date)
+
     @staticmethod
     def close_bt_trade(trade):
         LocalTrade.bt_trades_open.remove(trade)
@@ -1443,6 +1461,7 @@ class LocalTrade:
         LocalTrade.bt_open_open_trade_count -= 1
         LocalTrade.bt_trades.append(trade)
         LocalTrade.bt_total_profit += trade.close_profit_abs
+        LocalTrade.bt_closed_index.add(ClosedTrade.from_trade(trade))
 
     @staticmethod
     def add_bt_trade(trade):
@@ -1452,6 +1471,8 @@ class LocalTrade:
             LocalTrade.bt_open_open_trade_count += 1
         else:
             LocalTrade.bt_trades.append(trade)
+            if trade.close_date:
+                LocalTrade.bt_closed_index.add(ClosedTrade.from_trade(trade))
 
     @staticmethod
     def remove_bt_trade(trade):
@@ -1606,6 +1627,11 @@ class Trade(ModelBase, LocalTrade):
     session: ClassVar[SessionType]
 
     use_db: bool = True
+    # Committed closed trades - loaded once, then kept up to date by the session listeners
+    # registered in init_db().
+    _closed_trade_index: ClassVar[Optional[ClosedTradeIndex]] = None
+    # Incremented on every commit which changed trades or orders (within this process).
+    data_version: ClassVar[int] = 0
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)  # type: ignore
 
@@ -1746,7 +1772,7 @@ class Trade(ModelBase, LocalTrade):
 
     @staticmethod
     def commit():
-        Trade.session.commit()
+        commit_session(Trade.session)
 
     @staticmethod
     def rollback():
@@ -1784,6 +1810,46 @@ class Trade(ModelBase, LocalTrade):
                 pair=pair, is_open=is_open, open_date=open_date, close_date=close_date
             )
 
+    @staticmethod
+    def get_closed_trade_index() -> ClosedTradeIndex:
+        """
+        In-memory index of all closed trades.
+        Loaded from the database on first use.
+        NOTE: Not supported in Backtesting.
+        """
+        if Trade._closed_trade_index is None:
+            rows = Trade.session.execute(
+                select(
+                    Trade.id,
+                    Trade.pair,
+                    Trade.is_short,
+                    Trade.close_date,
+                    Trade.close_profit,
+                    Trade.close_profit_abs,
+                    Trade.exit_reason,
+                ).filter(Trade.is_open.is_(False), Trade.close_date.isnot(None))
+            )
+            Trade._closed_trade_index = ClosedTradeIndex(
+                [ClosedTrade.from_trade(row) for row in rows]
+            )
+        return Trade._closed_trade_index
+
+    @staticmethod
+    def get_closed_trades(
+        *, pair: Optional[str] = None, close_date: Optional[datetime] = None
+    ) -> List[ClosedTrade]:
+        """
+        Closed trades, as used by protections.
+        In live mode, served from the closed trade index without querying the database.
+        :param pair: Filter by pair
+        :param close_date: Filter by close_date (filters via trade.close_date > input)
+        :return: List of ClosedTrade snapshots, sorted by close date
+        """
+        if Trade.use_db:
+            return Trade.get_closed_trade_index().get_trades(pair=pair, close_date=close_date)
+        else:
+            return LocalTrade.get_closed_trades(pair=pair, close_date=close_date)
+
     @staticmethod
     def get_trades_query(trade_filter=None, include_orders: bool = True) -> Select:
         """
@@ -1859,9 +1925,7 @@ class Trade(ModelBase, LocalTrade):
         Retrieves total realized profit
         """
         if Trade.use_db:
-            total_profit = Trade.session.execute(
-                select(func.sum(Trade.close_profit_abs)).filter(Trade.is_open.is_(False))
-            ).scalar_one()
+            total_profit = Trade.get_closed_trade_index().total_profit
         else:
             total_profit = sum(
                 t.close_profit_abs  # type: ignore
@@ -1885,6 +1949,108 @@ class Trade(ModelBase, LocalTrade):
             )
         return total_open_stake_amount or 0
 
+    @staticmethod
+    def get_closed_profit_summary(start_date: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Aggregated profit of closed trades, calculated by the database.
+        Trades with a profit ratio >= 0 count as winning trades.
+        NOTE: Not supported in Backtesting.
+        :param start_date: Only trades closed at or after this date
+        :return: Dict with trade_count, winning_trades, losing_trades, profit_abs,
+            profit_ratio_sum, winning_profit_abs and losing_profit_abs
+        """
+        filters: List = [Trade.is_open.is_(False)]
+        if start_date:
+            filters.append(Trade.close_date >= start_date)
+
+        profit_ratio = func.coalesce(Trade.close_profit, 0.0)
+        profit_abs = func.coalesce(Trade.close_profit_abs, 0.0)
+        is_win = profit_ratio >= 0
+        summary = Trade.session.execute(
+            select(
+                func.count(Trade.id).label("trade_count"),
+                func.count(case((is_win, 1))).label("winning_trades"),
+                func.sum(profit_abs).label("profit_abs"),
+                func.sum(profit_ratio).label("profit_ratio_sum"),
+                func.sum(case((is_win, profit_abs), else_=0.0)).label("winning_profit_abs"),
+                func.sum(case((is_win, 0.0), else_=profit_abs)).label("losing_profit_abs"),
+            ).filter(*filters)
+        ).one()
+        return {
+            "trade_count": summary.trade_count,
+            "winning_trades": summary.winning_trades,
+            "losing_trades": summary.trade_count - summary.winning_trades,
+            "profit_abs": summary.profit_abs or 0.0,
+            "profit_ratio_sum": summary.profit_ratio_sum or 0.0,
+            "winning_profit_abs": summary.winning_profit_abs or 0.0,
+            "losing_profit_abs": summary.losing_profit_abs or 0.0,
+        }
+
+    @staticmethod
+    def get_exit_reason_results() -> Dict[Optional[str], Dict[str, int]]:
+        """
+        Wins, losses and draws (by profit ratio) of closed trades, per exit reason.
+        NOTE: Not supported in Backtesting.
+        :return: Dict of exit_reason -> {"wins": x, "losses": y, "draws": z}
+        """
+        rows = Trade.session.execute(
+            select(
+                Trade.exit_reason,
+                func.count(case((Trade.close_profit > 0, 1))).label("wins"),
+                func.count(case((Trade.close_profit < 0, 1))).label("losses"),
+                func.count(Trade.id).label("trade_count"),
+            )
+            .filter(Trade.is_open.is_(False))
+            .group_by(Trade.exit_reason)
+        ).all()
+        return {
+            row.exit_reason: {
+                "wins": row.wins,
+                "losses": row.losses,
+                "draws": row.trade_count - row.wins - row.losses,
+            }
+            for row in rows
+        }
+
+    @staticmethod
+    def get_closed_profit_per_period(
+        periods: List[Tuple[date, date]],
+    ) -> List[Tuple[float, int]]:
+        """
+        Absolute profit and trade count of trades closed within each period - in one query.
+        NOTE: Not supported in Backtesting.
+        :param periods: List of (start, end) tuples - start inclusive, end exclusive.
+            Periods must not overlap.
+        :return: List of (profit_abs, trade_count) - one per period
+        """
+        if not periods:
+            return []
+        period_index = case(
+            *(
+                ((Trade.close_date >= start) & (Trade.close_date < end), idx)
+                for idx, (start, end) in enumerate(periods)
+            ),
+            else_=None,
+        ).label("period_index")
+        rows = Trade.session.execute(
+            select(
+                period_index,
+                func.sum(Trade.close_profit_abs).label("profit_abs"),
+                func.count(Trade.id).label("trade_count"),
+            )
+            .filter(
+                Trade.is_open.is_(False),
+                Trade.close_date >= min(start for start, _ in periods),
+                Trade.close_date < max(end for _, end in periods),
+            )
+            .group_by(period_index)
+        ).all()
+        result: List[Tuple[float, int]] = [(0, 0)] * len(periods)
+        for row in rows:
+            if row.period_index is not None:
+                result[row.period_index] = (row.profit_abs or 0, row.trade_count)
+        return result
+
     @staticmethod
     def get_overall_performance(minutes=None) -> List[Dict[str, Any]]:
         """
@@ -0,0 +1,47 @@
+"""
+Batching of database commits - one transaction per unit of work.
+"""
+
+from contextlib import contextmanager
+from typing import Final, Iterator
+
+from freqtrade.persistence.base import SessionType
+
+
+_DEFER_COMMITS: Final[str] = "defer_commits"
+_COMMIT_PENDING: Final[str] = "commit_pending"
+
+
+def commit_session(session: SessionType) -> None:
+    """
+    Commit the session - unless a unit of work is active for it.
+    Within a unit of work, changes are only flushed (so queries see them),
+    and committed once the unit of work ends.
+    """
+    if session.info.get(_DEFER_COMMITS):
+        session.flush()
+        session.info[_COMMIT_PENDING] = True
+    else:
+        session.commit()
+
+
+@contextmanager
+def unit_of_work(session: SessionType) -> Iterator[None]:
+    """
+    Defer all commits (via commit_session()) within this context to one commit at its end.
+    Crash consistency: until the unit of work ends, the database holds the state of the last
+    commit - a crash loses all changes of the current unit of work, but never part of them.
+    Also commits if the context is left with an exception - same as the individual commits
+    up to that point would have done.
+    Nested units of work are merged into the outermost one.
+    """
+    if session.info.get(_DEFER_COMMITS):
+        yield
+        return
+    session.info[_DEFER_COMMITS] = True
+    try:
+        yield
+    finally:
+        session.info.pop(_DEFER_COMMITS, None)
+        if session.info.pop(_COMMIT_PENDING, False):
+            session.commit()
@@ -13,7 +13,12 @@ from freqtrade.constants import ListPairsWithTimeframes
 from freqtrade.exceptions import OperationalException
 from freqtrade.exchange.exchange_types import Tickers
 from freqtrade.misc import plural
-from freqtrade.plugins.pairlist.IPairList import IPairList, PairlistParameter, SupportsBacktesting
+from freqtrade.plugins.pairlist.IPairList import (
+    CandleRequest,
+    IPairList,
+    PairlistParameter,
+    SupportsBacktesting,
+)
 from freqtrade.util import PeriodicCache, dt_floor_day, dt_now, dt_ts
 
 
@@ -94,26 +99,30 @@ class AgeFilter(IPairList):
             },
         }
 
-    def filter_pairlist(self, pairlist: List[str], tickers: Tickers) -> List[str]:
-        """
-        :param pairlist: pairlist to filter or sort
-        :param tickers: Tickers (from exchange.get_tickers). May be cached.
-        :return: new allowlist
-        """
+    def candle_request(self, pairlist: List[str]) -> CandleRequest:
         needed_pairs: ListPairsWithTimeframes = [
             (p, "1d", self._config["candle_type_def"])
             for p in pairlist
             if p not in self._symbolsChecked and p not in self._symbolsCheckFailed
         ]
-        if not needed_pairs:
-            # Remove pairs that have been removed before
-            return [p for p in pairlist if p not in self._symbolsCheckFailed]
-
         since_days = (
             -(self._max_days_listed if self._max_days_listed else self._min_days_listed) - 1
         )
         since_ms = dt_ts(dt_floor_day(dt_now()) + timedelta(days=since_days))
-        candles = self._exchange.refresh_latest_ohlcv(needed_pairs, since_ms=since_ms, cache=False)
+        return CandleRequest(needed_pairs, since_ms, cache=False)
+
+    def filter_pairlist(self, pairlist: List[str], tickers: Tickers) -> List[str]:
+        """
+        :param pairlist: pairlist to filter or sort
+        :param tickers: Tickers (from exchange.get_tickers). May be cached.
+        :return: new allowlist
+        """
+        request = self.candle_request(pairlist)
+        if not request.pairs:
+            # Remove pairs that have been removed before
+            return [p for p in pairlist if p not in self._symbolsCheckFailed]
+
+        candles = self._fetch_candles(request)
         if self._enabled:
             for p in deepcopy(pairlist):
                 daily_candles = (
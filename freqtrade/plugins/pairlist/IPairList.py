@@ -6,9 +6,11 @@ import logging
 from abc import ABC, abstractmethod
 from copy import deepcopy
 from enum import Enum
-from typing import Any, Dict, List, Literal, Optional, TypedDict, Union
+from typing import Any, Dict, List, Literal, NamedTuple, Optional, TypedDict, Union
 
-from freqtrade.constants import Config
+from pandas import DataFrame
+
+from freqtrade.constants import Config, ListPairsWithTimeframes, PairWithTimeframe
 from freqtrade.exceptions import OperationalException
 from freqtrade.exchange import Exchange, market_is_active
 from freqtrade.exchange.exchange_types import Ticker, Tickers
@@ -63,6 +65,17 @@ class SupportsBacktesting(str, Enum):
     BIASED = "biased"
 
 
+class CandleRequest(NamedTuple):
+    """
+    Candles a Pairlist Handler needs to filter a pairlist.
+    """
+
+    pairs: ListPairsWithTimeframes
+    since_ms: int
+    # Use the exchange's expiring candle cache (refresh_ohlcv_with_cache)
+    cache: bool = True
+
+
 class IPairList(LoggingMixin, ABC):
     is_pairlist_generator = False
     supports_backtesting: SupportsBacktesting = SupportsBacktesting.NO
@@ -203,6 +216,37 @@ class IPairList(LoggingMixin, ABC):
 
         return pairlist
 
+    def candle_request(self, pairlist: List[str]) -> Optional[CandleRequest]:
+        """
+        Candles this Pairlist Handler needs to filter pairlist.
+        Allows the pairlist manager to download the candles of all Pairlist Handlers
+        in the chain at once.
+        Pairlist Handlers implementing this should load their candles via `_fetch_candles()`.
+        :param pairlist: pairlist to filter
+        :return: CandleRequest, or None if no candles are needed
+        """
+        return None
+
+    def _fetch_candles(self, request: CandleRequest) -> Dict[PairWithTimeframe, DataFrame]:
+        """
+        Get candles for a CandleRequest.
+        Uses the candles prefetched by the pairlist manager where available,
+        and downloads the remaining pairs.
+        """
+        planned = self._pairlistmanager.get_planned_candles(request)
+        candles = {pair: df for pair, df in planned.items() if df is not None}
+        missing = [p for p in request.pairs if p not in planned]
+        if missing:
+            if request.cache:
+                candles.update(self._exchange.refresh_ohlcv_with_cache(missing, request.since_ms))
+            else:
+                candles.update(
+                    self._exchange.refresh_latest_ohlcv(
+                        missing, since_ms=request.since_ms, cache=False
+                    )
+                )
+        return candles
+
     def verify_blacklist(self, pairlist: List[str], logmethod) -> List[str]:
         """
         Proxy method to verify_blacklist for easy access for child classes.
@@ -17,7 +17,12 @@ from freqtrade.constants import ListPairsWithTimeframes, PairWithTimeframe
 from freqtrade.exceptions import OperationalException
 from freqtrade.exchange import timeframe_to_minutes, timeframe_to_prev_date
 from freqtrade.exchange.exchange_types import Ticker, Tickers
-from freqtrade.plugins.pairlist.IPairList import IPairList, PairlistParameter, SupportsBacktesting
+from freqtrade.plugins.pairlist.IPairList import (
+    CandleRequest,
+    IPairList,
+    PairlistParameter,
+    SupportsBacktesting,
+)
 from freqtrade.util import dt_now, format_ms_time
 
 
@@ -239,9 +244,7 @@ class PercentChangePairList(IPairList):
 
         return pairs
 
-    def fetch_candles_for_lookback_period(
-        self, filtered_tickers: List[Dict[str, str]]
-    ) -> Dict[PairWithTimeframe, DataFrame]:
+    def _range_candle_request(self, pairlist: List[str]) -> CandleRequest:
         since_ms = (
             int(
                 timeframe_to_prev_date(
@@ -254,6 +257,21 @@ class PercentChangePairList(IPairList):
             )
             * 1000
         )
+        needed_pairs: ListPairsWithTimeframes = [
+            (p, self._lookback_timeframe, self._def_candletype)
+            for p in pairlist
+            if p not in self._pair_cache
+        ]
+        return CandleRequest(needed_pairs, since_ms)
+
+    def candle_request(self, pairlist: List[str]) -> Optional[CandleRequest]:
+        return self._range_candle_request(pairlist) if self._use_range else None
+
+    def fetch_candles_for_lookback_period(
+        self, filtered_tickers: List[Dict[str, str]]
+    ) -> Dict[PairWithTimeframe, DataFrame]:
+        request = self._range_candle_request([s["symbol"] for s in filtered_tickers])
+        since_ms = request.since_ms
         to_ms = (
             int(
                 timeframe_to_prev_date(
@@ -269,13 +287,7 @@ class PercentChangePairList(IPairList):
             f"till {format_ms_time(to_ms)}",
             logger.info,
         )
-        needed_pairs: ListPairsWithTimeframes = [
-            (p, self._lookback_timeframe, self._def_candletype)
-            for p in [s["symbol"] for s in filtered_tickers]
-            if p not in self._pair_cache
-        ]
-        candles = self._exchange.refresh_ohlcv_with_cache(needed_pairs, since_ms)
-        return candles
+        return self._fetch_candles(request)
 
     def fetch_percent_change_from_lookback_period(self, filtered_tickers: List[Dict[str, Any]]):
         # get lookback period in ms, for exchange ohlcv fetch
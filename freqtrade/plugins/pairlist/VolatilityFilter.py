@@ -15,7 +15,12 @@ from freqtrade.constants import ListPairsWithTimeframes
 from freqtrade.exceptions import OperationalException
 from freqtrade.exchange.exchange_types import Tickers
 from freqtrade.misc import plural
-from freqtrade.plugins.pairlist.IPairList import IPairList, PairlistParameter, SupportsBacktesting
+from freqtrade.plugins.pairlist.IPairList import (
+    CandleRequest,
+    IPairList,
+    PairlistParameter,
+    SupportsBacktesting,
+)
 from freqtrade.util import dt_floor_day, dt_now, dt_ts
 
 
@@ -109,6 +114,13 @@ class VolatilityFilter(IPairList):
             **IPairList.refresh_period_parameter(),
         }
 
+    def candle_request(self, pairlist: List[str]) -> CandleRequest:
+        needed_pairs: ListPairsWithTimeframes = [
+            (p, "1d", self._def_candletype) for p in pairlist if p not in self._pair_cache
+        ]
+        since_ms = dt_ts(dt_floor_day(dt_now()) - timedelta(days=self._days))
+        return CandleRequest(needed_pairs, since_ms)
+
     def filter_pairlist(self, pairlist: List[str], tickers: Tickers) -> List[str]:
         """
         Validate trading range
@@ -116,12 +128,7 @@ class VolatilityFilter(IPairList):
         :param tickers: Tickers (from exchange.get_tickers). May be cached.
         :return: new allowlist
         """
-        needed_pairs: ListPairsWithTimeframes = [
-            (p, "1d", self._def_candletype) for p in pairlist if p not in self._pair_cache
-        ]
-
-        since_ms = dt_ts(dt_floor_day(dt_now()) - timedelta(days=self._days))
-        candles = self._exchange.refresh_ohlcv_with_cache(needed_pairs, since_ms=since_ms)
+        candles = self._fetch_candles(self.candle_request(pairlist))
 
         resulting_pairlist: List[str] = []
         volatilitys: Dict[str, float] = {}
@@ -6,7 +6,7 @@ Provides dynamic pair list based on trade volumes
 
 import logging
 from datetime import timedelta
-from typing import Any, Dict, List, Literal
+from typing import Any, Dict, List, Literal, Optional
 
 from cachetools import TTLCache
 
@@ -14,7 +14,12 @@ from freqtrade.constants import ListPairsWithTimeframes
 from freqtrade.exceptions import OperationalException
 from freqtrade.exchange import timeframe_to_minutes, timeframe_to_prev_date
 from freqtrade.exchange.exchange_types import Tickers
-from freqtrade.plugins.pairlist.IPairList import IPairList, PairlistParameter, SupportsBacktesting
+from freqtrade.plugins.pairlist.IPairList import (
+    CandleRequest,
+    IPairList,
+    PairlistParameter,
+    SupportsBacktesting,
+)
 from freqtrade.util import dt_now, format_ms_time
 
 
@@ -212,6 +217,29 @@ class VolumePairList(IPairList):
 
         return pairlist
 
+    def _range_candle_request(self, pairlist: List[str]) -> CandleRequest:
+        since_ms = (
+            int(
+                timeframe_to_prev_date(
+                    self._lookback_timeframe,
+                    dt_now()
+                    + timedelta(
+                        minutes=-(self._lookback_period * self._tf_in_min) - self._tf_in_min
+                    ),
+                ).timestamp()
+            )
+            * 1000
+        )
+        needed_pairs: ListPairsWithTimeframes = [
+            (p, self._lookback_timeframe, self._def_candletype)
+            for p in pairlist
+            if p not in self._pair_cache
+        ]
+        return CandleRequest(needed_pairs, since_ms)
+
+    def candle_request(self, pairlist: List[str]) -> Optional[CandleRequest]:
+        return self._range_candle_request(pairlist) if self._use_range else None
+
     def filter_pairlist(self, pairlist: List[str], tickers: Dict) -> List[str]:
         """
         Filters and sorts pairlist and returns the whitelist again.
@@ -225,18 +253,8 @@ class VolumePairList(IPairList):
             filtered_tickers: List[Dict[str, Any]] = [{"symbol": k} for k in pairlist]
 
             # get lookback period in ms, for exchange ohlcv fetch
-            since_ms = (
-                int(
-                    timeframe_to_prev_date(
-                        self._lookback_timeframe,
-                        dt_now()
-                        + timedelta(
-                            minutes=-(self._lookback_period * self._tf_in_min) - self._tf_in_min
-                        ),
-                    ).timestamp()
-                )
-                * 1000
-            )
+            request = self._range_candle_request(pairlist)
+            since_ms = request.since_ms
 
             to_ms = (
                 int(
@@ -254,13 +272,7 @@ class VolumePairList(IPairList):
                 f"till {format_ms_time(to_ms)}",
                 logger.info,
             )
-            needed_pairs: ListPairsWithTimeframes = [
-                (p, self._lookback_timeframe, self._def_candletype)
-                for p in [s["symbol"] for s in filtered_tickers]
-                if p not in self._pair_cache
-            ]
-
-            candles = self._exchange.refresh_ohlcv_with_cache(needed_pairs, since_ms)
+            candles = self._fetch_candles(request)
 
             for i, p in enumerate(filtered_tickers):
                 contract_size = self._exchange.markets[p["symbol"]].get("contractSize", 1.0) or 1.0
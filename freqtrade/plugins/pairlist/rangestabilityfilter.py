@@ -13,7 +13,12 @@ from freqtrade.constants import ListPairsWithTimeframes
 from freqtrade.exceptions import OperationalException
 from freqtrade.exchange.exchange_types import Tickers
 from freqtrade.misc import plural
-from freqtrade.plugins.pairlist.IPairList import IPairList, PairlistParameter, SupportsBacktesting
+from freqtrade.plugins.pairlist.IPairList import (
+    CandleRequest,
+    IPairList,
+    PairlistParameter,
+    SupportsBacktesting,
+)
 from freqtrade.util import dt_floor_day, dt_now, dt_ts
 
 
@@ -106,6 +111,13 @@ class RangeStabilityFilter(IPairList):
             **IPairList.refresh_period_parameter(),
         }
 
+    def candle_request(self, pairlist: List[str]) -> CandleRequest:
+        needed_pairs: ListPairsWithTimeframes = [
+            (p, "1d", self._def_candletype) for p in pairlist if p not in self._pair_cache
+        ]
+        since_ms = dt_ts(dt_floor_day(dt_now()) - timedelta(days=self._days + 1))
+        return CandleRequest(needed_pairs, since_ms)
+
     def filter_pairlist(self, pairlist: List[str], tickers: Tickers) -> List[str]:
         """
         Validate trading range
@@ -113,12 +125,7 @@ class RangeStabilityFilter(IPairList):
         :param tickers: Tickers (from exchange.get_tickers). May be cached.
         :return: new allowlist
         """
-        needed_pairs: ListPairsWithTimeframes = [
-            (p, "1d", self._def_candletype) for p in pairlist if p not in self._pair_cache
-        ]
-
-        since_ms = dt_ts(dt_floor_day(dt_now()) - timedelta(days=self._days + 1))
-        candles = self._exchange.refresh_ohlcv_with_cache(needed_pairs, since_ms=since_ms)
+        candles = self._fetch_candles(self.candle_request(pairlist))
 
         resulting_pairlist: List[str] = []
         pct_changes: Dict[str, float] = {}
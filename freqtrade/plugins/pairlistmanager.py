@@ -3,19 +3,21 @@ PairList manager class
 """
 
 import logging
+from collections import defaultdict
 from functools import partial
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from cachetools import TTLCache, cached
+from pandas import DataFrame, to_datetime
 
-from freqtrade.constants import Config, ListPairsWithTimeframes
+from freqtrade.constants import Config, ListPairsWithTimeframes, PairWithTimeframe
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.enums import CandleType
 from freqtrade.enums.runmode import RunMode
 from freqtrade.exceptions import OperationalException
 from freqtrade.exchange.exchange_types import Tickers
 from freqtrade.mixins import LoggingMixin
-from freqtrade.plugins.pairlist.IPairList import IPairList, SupportsBacktesting
+from freqtrade.plugins.pairlist.IPairList import CandleRequest, IPairList, SupportsBacktesting
 from freqtrade.plugins.pairlist.pairlist_helpers import expand_pairlist
 from freqtrade.resolvers import PairListResolver
 
@@ -34,6 +36,8 @@ class PairListManager(LoggingMixin):
         self._pairlist_handlers: List[IPairList] = []
         self._tickers_needed = False
         self._dataprovider: Optional[DataProvider] = dataprovider
+        # Candles prefetched for the Pairlist Handlers - with the since_ms they were fetched with
+        self._planned_candles: Dict[PairWithTimeframe, Tuple[int, Optional[DataFrame]]] = {}
         for pairlist_handler_config in self._config.get("pairlists", []):
             pairlist_handler = PairListResolver.load_pairlist(
                 pairlist_handler_config["method"],
@@ -139,8 +143,18 @@ class PairListManager(LoggingMixin):
 
         # Process all Pairlist Handlers in the chain
         # except for the first one, which is the generator.
-        for pairlist_handler in self._pairlist_handlers[1:]:
-            pairlist = pairlist_handler.filter_pairlist(pairlist, tickers)
+        planned = False
+        try:
+            for pos, pairlist_handler in enumerate(self._pairlist_handlers[1:], start=1):
+                request = None if planned else pairlist_handler.candle_request(pairlist)
+                if request is not None and request.pairs:
+                    # Download candles for this and all following handlers at once.
+                    # Planned only here, so pairs removed by earlier handlers are not fetched.
+                    self._plan_candles(pairlist, self._pairlist_handlers[pos:], request)
+                    planned = True
+                pairlist = pairlist_handler.filter_pairlist(pairlist, tickers)
+        finally:
+            self._planned_candles = {}
 
         # Validation against blacklist happens after the chain of Pairlist Handlers
         # to ensure blacklist is respected.
@@ -150,6 +164,57 @@ class PairListManager(LoggingMixin):
 
         self._whitelist = pairlist
 
+    def _plan_candles(
+        self, pairlist: List[str], handlers: Sequence[IPairList], first_request: CandleRequest
+    ) -> None:
+        """
+        Collect the candle requests of handlers and download them with as few calls as possible.
+        Candles requested by multiple handlers are downloaded once, from the earliest since_ms.
+        :param pairlist: pairlist passed to the first of handlers
+        :param handlers: Pairlist Handlers to plan for
+        :param first_request: candle_request() of the first handler
+        """
+        needs: Dict[PairWithTimeframe, Tuple[int, bool]] = {}
+        requests = [first_request] + [h.candle_request(pairlist) for h in handlers[1:]]
+        for request in requests:
+            if request is None:
+                continue
+            for pair in request.pairs:
+                since_ms, cache = needs.get(pair, (request.since_ms, request.cache))
+                needs[pair] = (min(since_ms, request.since_ms), cache and request.cache)
+
+        grouped: Dict[Tuple[int, bool], ListPairsWithTimeframes] = defaultdict(list)
+        for pair, need in needs.items():
+            grouped[need].append(pair)
+
+        for (since_ms, cache), pairs in grouped.items():
+            if cache:
+                candles = self._exchange.refresh_ohlcv_with_cache(pairs, since_ms)
+            else:
+                candles = self._exchange.refresh_latest_ohlcv(pairs, since_ms=since_ms, cache=False)
+            for pair in pairs:
+                # Pairs without candles are planned too - so they're not downloaded again.
+                self._planned_candles[pair] = (since_ms, candles.get(pair))
+
+    def get_planned_candles(
+        self, request: CandleRequest
+    ) -> Dict[PairWithTimeframe, Optional[DataFrame]]:
+        """
+        Prefetched candles for a CandleRequest, starting at the request's since_ms.
+        Pairs which were prefetched without result map to None,
+        pairs which were not prefetched are not part of the result.
+        """
+        candles: Dict[PairWithTimeframe, Optional[DataFrame]] = {}
+        for pair in request.pairs:
+            if (planned := self._planned_candles.get(pair)) is None:
+                continue
+            since_ms, dataframe = planned
+            if dataframe is not None and since_ms < request.since_ms and not dataframe.empty:
+                start = to_datetime(request.since_ms, unit="ms", utc=True)
+                dataframe = dataframe.loc[dataframe["date"] >= start].reset_index(drop=True)
+            candles[pair] = dataframe
+        return candles
+
     def verify_blacklist(self, pairlist: List[str], logmethod) -> List[str]:
         """
         Verify and remove items from pairlist - returning a filtered pairlist.
@@ -37,11 +37,10 @@ class CooldownPeriod(IProtection):
         #     Trade.pair == pair,
         # ]
         # trade = Trade.get_trades(filters).first()
-        trades = Trade.get_trades_proxy(pair=pair, is_open=False, close_date=look_back_until)
+        trades = Trade.get_closed_trades(pair=pair, close_date=look_back_until)
         if trades:
-            # Get latest trade
-            # Ignore type error as we know we only get closed trades.
-            trade = sorted(trades, key=lambda t: t.close_date)[-1]  # type: ignore
+            # Get latest trade - closed trades are sorted by close date
+            trade = trades[-1]
             self.log_once(f"Cooldown for {pair} {self.unlock_reason_time_element}.", logger.info)
             until = self.calculate_lock_end([trade])
 
@@ -2,13 +2,13 @@ import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional, Sequence, Union
 
 from freqtrade.constants import Config, LongShort
 from freqtrade.exchange import timeframe_to_minutes
 from freqtrade.misc import plural
 from freqtrade.mixins import LoggingMixin
-from freqtrade.persistence import LocalTrade
+from freqtrade.persistence import ClosedTrade, LocalTrade
 
 
 logger = logging.getLogger(__name__)
@@ -119,7 +119,7 @@ class IProtection(LoggingMixin, ABC):
             If true, this pair will be locked with <reason> until <until>
         """
 
-    def calculate_lock_end(self, trades: List[LocalTrade]) -> datetime:
+    def calculate_lock_end(self, trades: Sequence[Union[ClosedTrade, LocalTrade]]) -> datetime:
         """
         Get lock end time
         Implicitly uses `self._stop_duration` or `self._unlock_at` depending on the configuration.
@@ -48,14 +48,19 @@ class MaxDrawdown(IProtection):
         """
         look_back_until = date_now - timedelta(minutes=self._lookback_period)
 
-        trades = Trade.get_trades_proxy(is_open=False, close_date=look_back_until)
-
-        trades_df = pd.DataFrame([trade.to_json() for trade in trades])
+        trades = Trade.get_closed_trades(close_date=look_back_until)
 
         if len(trades) < self._trade_limit:
             # Not enough trades in the relevant period
             return None
 
+        trades_df = pd.DataFrame(
+            {
+                "close_date": [trade.close_date for trade in trades],
+                "close_profit": [trade.close_profit for trade in trades],
+            }
+        )
+
         # Drawdown is always positive
         try:
             # TODO: This should use absolute profit calculation, considering account balance.
@@ -14,6 +14,7 @@ from freqtrade.data.btanalysis import (
     delete_backtest_result,
     get_backtest_market_change,
     get_backtest_result,
+    get_backtest_result_file,
     get_backtest_resultlist,
     load_and_merge_backtest_result,
     update_backtest_metadata,
@@ -274,7 +275,7 @@ def api_backtest_history(config=Depends(get_config)):
 def api_backtest_history_result(filename: str, strategy: str, config=Depends(get_config)):
     # Get backtest result history, read from metadata files
     bt_results_base: Path = config["user_data_dir"] / "backtest_results"
-    fn = (bt_results_base / filename).with_suffix(".json")
+    fn = get_backtest_result_file(bt_results_base, filename)
 
     results: Dict[str, Any] = {
         "metadata": {},
@@ -302,7 +303,7 @@ def api_backtest_history_result(filename: str, strategy: str, config=Depends(get
 def api_delete_backtest_history_entry(file: str, config=Depends(get_config)):
     # Get backtest result history, read from metadata files
     bt_results_base: Path = config["user_data_dir"] / "backtest_results"
-    file_abs = (bt_results_base / file).with_suffix(".json")
+    file_abs = get_backtest_result_file(bt_results_base, file)
     # Ensure file is in backtest_results directory
     if not is_file_in_dir(file_abs, bt_results_base):
         raise HTTPException(status_code=404, detail="File not found.")
@@ -321,7 +322,7 @@ def api_update_backtest_history_entry(
 ):
     # Get backtest result history, read from metadata files
     bt_results_base: Path = config["user_data_dir"] / "backtest_results"
-    file_abs = (bt_results_base / file).with_suffix(".json")
+    file_abs = get_backtest_result_file(bt_results_base, file)
     # Ensure file is in backtest_results directory
     if not is_file_in_dir(file_abs, bt_results_base):
         raise HTTPException(status_code=404, detail="File not found.")
@@ -1,14 +1,17 @@
+import hashlib
 import logging
+import secrets
 from copy import deepcopy
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from fastapi.exceptions import HTTPException
 
 from freqtrade import __version__
 from freqtrade.data.history import get_datahandler
 from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exceptions import OperationalException
+from freqtrade.persistence import Trade
 from freqtrade.rpc import RPC
 from freqtrade.rpc.api_server.api_schemas import (
     AvailablePairs,
@@ -82,7 +85,11 @@ logger = logging.getLogger(__name__)
 # 2.33: Additional weekly/monthly metrics
 # 2.34: new entries/exits/mix_tags endpoints
 # 2.35: pair_candles and pair_history endpoints as Post variant
-API_VERSION = 2.35
+# 2.36: /trades supports after_id, include_orders, fields and ETags
+API_VERSION = 2.36
+
+# ETags of trade responses must not match across restarts of the bot.
+_ETAG_PREFIX = secrets.token_hex(4)
 
 # Public API, requires no auth.
 router_public = APIRouter()
@@ -175,11 +182,45 @@ def status(rpc: RPC = Depends(get_rpc)):
         return []
 
 
+def _trades_etag(*args) -> str:
+    digest = hashlib.sha256(repr(args).encode()).hexdigest()[:16]
+    return f'"{_ETAG_PREFIX}-{digest}"'
+
+
 # Using the responsemodel here will cause a ~100% increase in response time (from 1s to 2s)
 # on big databases. Correct response model: response_model=TradeResponse,
 @router.get("/trades", tags=["info", "trading"])
-def trades(limit: int = 500, offset: int = 0, rpc: RPC = Depends(get_rpc)):
-    return rpc._rpc_trade_history(limit, offset=offset, order_by_id=True)
+def trades(
+    request: Request,
+    response: Response,
+    limit: int = 500,
+    offset: int = 0,
+    after_id: Optional[int] = None,
+    include_orders: bool = True,
+    fields: Optional[str] = None,
+    rpc: RPC = Depends(get_rpc),
+):
+    """
+    :param after_id: Keyset pagination - trades with an id above after_id.
+    :param fields: Comma separated list of fields to return per trade.
+    """
+    field_list = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+    # Trades only change with commits of this process - unchanged pages can be answered
+    # without querying the database.
+    etag = _trades_etag(
+        Trade.data_version, limit, offset, after_id, include_orders, ",".join(field_list or [])
+    )
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return rpc._rpc_trade_history(
+        limit,
+        offset=offset,
+        order_by_id=True,
+        after_id=after_id,
+        include_orders=include_orders,
+        fields=field_list,
+    )
 
 
 @router.get("/trade/{tradeid}", response_model=OpenTradeSchema, tags=["info", "trading"])
@@ -11,9 +11,10 @@ from typing import Any, Dict, Generator, List, Optional, Sequence, Tuple, Union
 import psutil
 from dateutil.relativedelta import relativedelta
 from dateutil.tz import tzlocal
-from numpy import inf, int64, mean, nan
+from numpy import inf, int64, nan
 from pandas import DataFrame, NaT
 from sqlalchemy import func, select
+from sqlalchemy.orm import noload
 
 from freqtrade import __version__
 from freqtrade.configuration.timerange import TimeRange
@@ -376,29 +377,19 @@ class RPC:
         profit_units: Dict[date, Dict] = {}
         daily_stake = self._freqtrade.wallets.get_total_stake_amount()
 
-        for day in range(0, timescale):
-            profitday = start_date - time_offset(day)
-            # Only query for necessary columns for performance reasons.
-            trades = Trade.session.execute(
-                select(Trade.close_profit_abs)
-                .filter(
-                    Trade.is_open.is_(False),
-                    Trade.close_date >= profitday,
-                    Trade.close_date < (profitday + time_offset(1)),
-                )
-                .order_by(Trade.close_date)
-            ).all()
-
-            curdayprofit = sum(
-                trade.close_profit_abs for trade in trades if trade.close_profit_abs is not None
-            )
+        profit_days = [start_date - time_offset(day) for day in range(0, timescale)]
+        # Aggregated by the database - one query for all periods.
+        period_profits = Trade.get_closed_profit_per_period(
+            [(profitday, profitday + time_offset(1)) for profitday in profit_days]
+        )
+        for profitday, (curdayprofit, trade_count) in zip(profit_days, period_profits):
             # Calculate this periods starting balance
             daily_stake = daily_stake - curdayprofit
             profit_units[profitday] = {
                 "amount": curdayprofit,
                 "daily_stake": daily_stake,
                 "rel_profit": round(curdayprofit / daily_stake, 8) if daily_stake > 0 else 0,
-                "trades": len(trades),
+                "trades": trade_count,
             }
 
         data = [
@@ -424,22 +415,43 @@ class RPC:
             "data": data,
         }
 
-    def _rpc_trade_history(self, limit: int, offset: int = 0, order_by_id: bool = False) -> Dict:
-        """Returns the X last trades"""
+    def _rpc_trade_history(
+        self,
+        limit: int,
+        offset: int = 0,
+        order_by_id: bool = False,
+        *,
+        after_id: Optional[int] = None,
+        include_orders: bool = True,
+        fields: Optional[List[str]] = None,
+    ) -> Dict:
+        """
+        Returns the X last trades
+        :param after_id: Keyset pagination - only trades with a higher id, ordered by id.
+            Cheaper than an offset for deep pages.
+        :param include_orders: Include the orders of each trade
+        :param fields: Only return these fields of each trade (trade_id is always returned)
+        """
+        trade_filter: List[Any] = [Trade.is_open.is_(False)]
+        if after_id is not None:
+            trade_filter.append(Trade.id > after_id)
+            order_by_id = True
         order_by: Any = Trade.id if order_by_id else Trade.close_date.desc()
+        query = Trade.get_trades_query(trade_filter)
+        if not include_orders:
+            query = query.options(noload(Trade.orders))
         if limit:
-            trades = Trade.session.scalars(
-                Trade.get_trades_query([Trade.is_open.is_(False)])
-                .order_by(order_by)
-                .limit(limit)
-                .offset(offset)
-            )
+            trades = Trade.session.scalars(query.order_by(order_by).limit(limit).offset(offset))
         else:
-            trades = Trade.session.scalars(
-                Trade.get_trades_query([Trade.is_open.is_(False)]).order_by(Trade.close_date.desc())
-            )
+            trades = Trade.session.scalars(query.order_by(order_by))
 
         output = [trade.to_json() for trade in trades]
+        if not include_orders:
+            for trade_json in output:
+                trade_json.pop("orders")
+        if fields:
+            keep = set(fields) | {"trade_id"}
+            output = [{k: v for k, v in trade_json.items() if k in keep} for trade_json in output]
         total_trades = Trade.session.scalar(
             select(func.count(Trade.id)).filter(Trade.is_open.is_(False))
         )
@@ -456,27 +468,28 @@ class RPC:
         Generate generic stats for trades in database
         """
 
-        def trade_win_loss(trade):
-            if trade.close_profit > 0:
+        def trade_win_loss(close_profit):
+            if close_profit > 0:
                 return "wins"
-            elif trade.close_profit < 0:
+            elif close_profit < 0:
                 return "losses"
             else:
                 return "draws"
 
-        trades = Trade.get_trades([Trade.is_open.is_(False)], include_orders=False)
-        # Duration
-        dur: Dict[str, List[float]] = {"wins": [], "draws": [], "losses": []}
         # Exit reason
-        exit_reasons = {}
+        exit_reasons = Trade.get_exit_reason_results()
+        # Duration - only the necessary columns are loaded.
+        trades = Trade.session.execute(
+            select(Trade.open_date, Trade.close_date, Trade.close_profit).filter(
+                Trade.is_open.is_(False),
+                Trade.close_date.isnot(None),
+                Trade.open_date.isnot(None),
+            )
+        )
+        dur: Dict[str, List[float]] = {"wins": [], "draws": [], "losses": []}
         for trade in trades:
-            if trade.exit_reason not in exit_reasons:
-                exit_reasons[trade.exit_reason] = {"wins": 0, "losses": 0, "draws": 0}
-            exit_reasons[trade.exit_reason][trade_win_loss(trade)] += 1
-
-            if trade.close_date is not None and trade.open_date is not None:
-                trade_dur = (trade.close_date - trade.open_date).total_seconds()
-                dur[trade_win_loss(trade)].append(trade_dur)
+            trade_dur = (trade.close_date - trade.open_date).total_seconds()
+            dur[trade_win_loss(trade.close_profit or 0)].append(trade_dur)
 
         wins_dur = sum(dur["wins"]) / len(dur["wins"]) if len(dur["wins"]) > 0 else None
         draws_dur = sum(dur["draws"]) / len(dur["draws"]) if len(dur["draws"]) > 0 else None
@@ -495,68 +508,67 @@ class RPC:
         trade_filter = (
             Trade.is_open.is_(False) & (Trade.close_date >= start_date)
         ) | Trade.is_open.is_(True)
-        trades: Sequence[Trade] = Trade.session.scalars(
-            Trade.get_trades_query(trade_filter, include_orders=False).order_by(Trade.id)
+        # Closed trades are aggregated by the database,
+        # only open trades are loaded - these need the current rate.
+        closed = Trade.get_closed_profit_summary(start_date)
+        open_trades: Sequence[Trade] = Trade.session.scalars(
+            Trade.get_trades_query(Trade.is_open.is_(True)).order_by(Trade.id)
+        ).all()
+        # Drawdown and durations need the individual closed trades - load only these columns.
+        closed_trades = Trade.session.execute(
+            select(Trade.open_date, Trade.close_date, Trade.close_profit_abs)
+            .filter(Trade.is_open.is_(False), Trade.close_date >= start_date)
+            .order_by(Trade.id)
         ).all()
 
-        profit_all_coin = []
-        profit_all_ratio = []
-        profit_closed_coin = []
-        profit_closed_ratio = []
-        durations = []
-        winning_trades = 0
-        losing_trades = 0
-        winning_profit = 0.0
-        losing_profit = 0.0
+        profit_all_coin = [closed["profit_abs"]]
+        profit_all_ratio_sum = closed["profit_ratio_sum"]
+        profit_all_count = closed["trade_count"]
+        durations = [
+            (trade.close_date - trade.open_date).total_seconds()
+            for trade in closed_trades
+            if trade.close_date
+        ]
+        winning_trades = closed["winning_trades"]
+        losing_trades = closed["losing_trades"]
+        winning_profit = closed["winning_profit_abs"]
+        losing_profit = closed["losing_profit_abs"]
 
-        for trade in trades:
+        for trade in open_trades:
             current_rate: float = 0.0
-
-            if trade.close_date:
-                durations.append((trade.close_date - trade.open_date).total_seconds())
-
-            if not trade.is_open:
-                profit_ratio = trade.close_profit or 0.0
-                profit_abs = trade.close_profit_abs or 0.0
-                profit_closed_coin.append(profit_abs)
-                profit_closed_ratio.append(profit_ratio)
-                if profit_ratio >= 0:
-                    winning_trades += 1
-                    winning_profit += profit_abs
-                else:
-                    losing_trades += 1
-                    losing_profit += profit_abs
+            # Get current rate
+            if len(trade.select_filled_orders(trade.entry_side)) == 0:
+                # Skip trades with no filled orders
+                continue
+            try:
+                current_rate = self._freqtrade.exchange.get_rate(
+                    trade.pair, side="exit", is_short=trade.is_short, refresh=False
+                )
+            except (PricingError, ExchangeError):
+                current_rate = nan
+                profit_ratio = nan
+                profit_abs = nan
             else:
-                # Get current rate
-                if len(trade.select_filled_orders(trade.entry_side)) == 0:
-                    # Skip trades with no filled orders
-                    continue
-                try:
-                    current_rate = self._freqtrade.exchange.get_rate(
-                        trade.pair, side="exit", is_short=trade.is_short, refresh=False
-                    )
-                except (PricingError, ExchangeError):
-                    current_rate = nan
-                    profit_ratio = nan
-                    profit_abs = nan
-                else:
-                    _profit = trade.calculate_profit(trade.close_rate or current_rate)
+                _profit = trade.calculate_profit(trade.close_rate or current_rate)
 
-                    profit_ratio = _profit.profit_ratio
-                    profit_abs = _profit.total_profit
+                profit_ratio = _profit.profit_ratio
+                profit_abs = _profit.total_profit
 
             profit_all_coin.append(profit_abs)
-            profit_all_ratio.append(profit_ratio)
+            profit_all_ratio_sum += profit_ratio
+            profit_all_count += 1
 
-        closed_trade_count = len([t for t in trades if not t.is_open])
+        closed_trade_count = closed["trade_count"]
 
         best_pair = Trade.get_best_pair(start_date)
         trading_volume = Trade.get_trading_volume(start_date)
 
         # Prepare data to display
-        profit_closed_coin_sum = round(sum(profit_closed_coin), 8)
-        profit_closed_ratio_mean = float(mean(profit_closed_ratio) if profit_closed_ratio else 0.0)
-        profit_closed_ratio_sum = sum(profit_closed_ratio) if profit_closed_ratio else 0.0
+        profit_closed_coin_sum = round(closed["profit_abs"], 8)
+        profit_closed_ratio_sum = closed["profit_ratio_sum"]
+        profit_closed_ratio_mean = (
+            float(profit_closed_ratio_sum / closed_trade_count) if closed_trade_count else 0.0
+        )
 
         profit_closed_fiat = (
             self._fiat_converter.convert_amount(
@@ -567,9 +579,10 @@ class RPC:
         )
 
         profit_all_coin_sum = round(sum(profit_all_coin), 8)
-        profit_all_ratio_mean = float(mean(profit_all_ratio) if profit_all_ratio else 0.0)
+        profit_all_ratio_mean = (
+            float(profit_all_ratio_sum / profit_all_count) if profit_all_count else 0.0
+        )
         # Doing the sum is not right - overall profit needs to be based on initial capital
-        profit_all_ratio_sum = sum(profit_all_ratio) if profit_all_ratio else 0.0
         starting_balance = self._freqtrade.wallets.get_starting_balance()
         profit_closed_ratio_fromstart = 0
         profit_all_ratio_fromstart = 0
@@ -582,15 +595,10 @@ class RPC:
         winrate = (winning_trades / closed_trade_count) if closed_trade_count > 0 else 0
 
         trades_df = DataFrame(
-            [
-                {
-                    "close_date": format_date(trade.close_date),
-                    "close_date_dt": trade.close_date,
-                    "profit_abs": trade.close_profit_abs,
-                }
-                for trade in trades
-                if not trade.is_open and trade.close_date
-            ]
+            {
+                "close_date_dt": [trade.close_date for trade in closed_trades],
+                "profit_abs": [trade.close_profit_abs for trade in closed_trades],
+            }
         )
 
         expectancy, expectancy_ratio = calculate_expectancy(trades_df)
@@ -616,8 +624,7 @@ class RPC:
             else 0
         )
 
-        first_date = trades[0].open_date_utc if trades else None
-        last_date = trades[-1].open_date_utc if trades else None
+        first_date, last_date = self._first_and_last_open_date(trade_filter)
         num = float(len(durations) or 1)
         bot_start = KeyValueStore.get_datetime_value(KeyStoreKeys.BOT_START_TIME)
         return {
@@ -637,7 +644,7 @@ class RPC:
             "profit_all_ratio": profit_all_ratio_fromstart,
             "profit_all_percent": round(profit_all_ratio_fromstart * 100, 2),
             "profit_all_fiat": profit_all_fiat,
-            "trade_count": len(trades),
+            "trade_count": closed_trade_count + len(open_trades),
             "closed_trade_count": closed_trade_count,
             "first_trade_date": format_date(first_date),
             "first_trade_humanized": dt_humanize_delta(first_date) if first_date else "",
@@ -668,6 +675,19 @@ class RPC:
             "bot_start_date": format_date(bot_start),
         }
 
+    @staticmethod
+    def _first_and_last_open_date(trade_filter) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """
+        Open dates of the first and the last trade (by trade id) matching trade_filter.
+        """
+        dates = []
+        for order_by in (Trade.id, Trade.id.desc()):
+            open_date = Trade.session.scalar(
+                select(Trade.open_date).filter(trade_filter).order_by(order_by).limit(1)
+            )
+            dates.append(open_date.replace(tzinfo=timezone.utc) if open_date else None)
+        return dates[0], dates[1]
+
     def __balance_get_est_stake(
         self, coin: str, stake_currency: str, amount: float, balance: Wallet, tickers
     ) -> Tuple[float, float]:
@@ -41,6 +41,7 @@ class Wallets:
         self._exchange = exchange
         self._wallets: Dict[str, Wallet] = {}
         self._positions: Dict[str, PositionWallet] = {}
+        self._reserved_stake = 0.0
         self.start_cap = config["dry_run_wallet"]
         self._last_wallet_refresh: Optional[datetime] = None
         self.update()
@@ -277,8 +278,26 @@ class Wallets:
         (<open_trade stakes> + free amount) * tradable_balance_ratio - <open_trade stakes>
         """
 
-        free = self.get_free(self._config["stake_currency"])
-        return min(self.get_total_stake_amount() - Trade.total_open_trades_stakes(), free)
+        free = self.get_free(self._config["stake_currency"]) - self._reserved_stake
+        return min(
+            self.get_total_stake_amount() - Trade.total_open_trades_stakes() - self._reserved_stake,
+            free,
+        )
+
+    def reserve_stake(self, stake_amount: float) -> None:
+        """
+        Reserve stake for an entry which was prepared but not yet placed on the exchange.
+        Reserved stake is treated as tied up in an open trade by the stake calculations,
+        so multiple entries prepared within one iteration don't assign the same balance twice.
+        """
+        self._reserved_stake += stake_amount
+
+    def release_stake(self) -> None:
+        """
+        Release all reservations - to be called once the reserved entries have been placed
+        (or failed) and the resulting trades are stored.
+        """
+        self._reserved_stake = 0.0
 
     def _calculate_unlimited_stake_amount(
         self, available_amount: float, val_tied_up: float, max_open_trades: IntOrInf
@@ -330,13 +349,13 @@ class Wallets:
         # Ensure wallets are up-to-date.
         if update:
             self.update()
-        val_tied_up = Trade.total_open_trades_stakes()
+        val_tied_up = Trade.total_open_trades_stakes() + self._reserved_stake
         available_amount = self.get_available_stake_amount()
 
         if edge:
             stake_amount = edge.stake_amount(
                 pair,
-                self.get_free(self._config["stake_currency"]),
+                self.get_free(self._config["stake_currency"]) - self._reserved_stake,
                 self.get_total(self._config["stake_currency"]),
                 val_tied_up,
             )
@@ -56,6 +56,10 @@ class Worker:
         internals_config = self._config.get("internals", {})
         self._throttle_secs = internals_config.get("process_throttle_secs", PROCESS_THROTTLE_SECS)
         self._heartbeat_interval = internals_config.get("heartbeat_interval", 60)
+        self._candle_close_scheduling = internals_config.get("candle_close_scheduling", False)
+        self._candle_close_offset = internals_config.get("candle_close_offset", 1.0)
+        # Time (epoch seconds) the next full iteration is due in candle close scheduling mode
+        self._next_candle_process = 0.0
 
         self._sd_notify = (
             sdnotify.SystemdNotifier()
@@ -97,6 +101,7 @@ class Worker:
             )
             if state == State.RUNNING:
                 self.freqtrade.startup()
+                self._next_candle_process = 0.0
 
             if state == State.STOPPED:
                 self.freqtrade.check_for_open_trades()
@@ -115,13 +120,16 @@ class Worker:
             # Ping systemd watchdog before throttling
             self._notify("WATCHDOG=1\nSTATUS=State: RUNNING.")
 
-            # Use an offset of 1s to ensure a new candle has been issued
-            self._throttle(
-                func=self._process_running,
-                throttle_secs=self._throttle_secs,
-                timeframe=self._config["timeframe"] if self._config else None,
-                timeframe_offset=1,
-            )
+            if self._candle_close_scheduling:
+                self._process_scheduled()
+            else:
+                # Use an offset of 1s to ensure a new candle has been issued
+                self._throttle(
+                    func=self._process_running,
+                    throttle_secs=self._throttle_secs,
+                    timeframe=self._config["timeframe"] if self._config else None,
+                    timeframe_offset=1,
+                )
 
         if self._heartbeat_interval:
             now = time.time()
@@ -181,6 +189,32 @@ class Worker:
         self._sleep(sleep_duration)
         return result
 
+    def _process_scheduled(self) -> None:
+        """
+        Candle close scheduling: Runs the full iteration (candle refresh, analysis, exits and
+        entries) once per candle, `candle_close_offset` seconds after the candle closed.
+        In between, only open orders are managed - every `process_throttle_secs`, or as soon
+        as an order update arrives via websocket.
+        """
+        start = time.time()
+        logger.debug("========================================")
+        if start >= self._next_candle_process:
+            self._process_running()
+            timeframe = self._config["timeframe"] if self._config else "1m"
+            self._next_candle_process = (
+                timeframe_to_next_date(timeframe).timestamp() + self._candle_close_offset
+            )
+        else:
+            self._process_orders()
+
+        sleep_duration = max(min(self._throttle_secs, self._next_candle_process - time.time()), 0.0)
+        logger.debug(
+            f"Waiting for order updates for up to {sleep_duration:.2f} s, "
+            f"last iteration took {time.time() - start:.2f} s."
+        )
+        if sleep_duration > 0:
+            self.freqtrade.exchange.wait_for_order_update(sleep_duration)
+
     @staticmethod
     def _sleep(sleep_duration: float) -> None:
         """Local sleep method - to improve testability"""
@@ -190,8 +224,18 @@ class Worker:
         self.freqtrade.process_stopped()
 
     def _process_running(self) -> None:
+        self._run_protected(self.freqtrade.process)
+
+    def _process_orders(self) -> None:
+        self._run_protected(self.freqtrade.process_orders)
+
+    def _run_protected(self, func: Callable[[], None]) -> None:
+        """
+        Run one iteration step of the bot.
+        Retries after temporary errors, stops the trader on an OperationalException.
+        """
         try:
-            self.freqtrade.process()
+            func()
         except TemporaryError as error:
             logger.warning(f"Error: {error}, retrying in {RETRY_TIMEOUT} seconds...")
             time.sleep(RETRY_TIMEOUT)
@@ -91,7 +91,7 @@ setup(
         "jinja2",
         "questionary",
         "prompt-toolkit",
-        "joblib>=1.2.0",
+        "joblib>=1.3.0",
         "rich",
         'pyarrow; platform_machine != "armv7l"',
         "fastapi",
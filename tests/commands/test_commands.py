@@ -22,6 +22,7 @@ from freqtrade.commands import (
     start_list_markets,
     start_list_strategies,
     start_list_timeframes,
+    start_market_data_sidecar,
     start_new_strategy,
     start_show_config,
     start_show_trades,
@@ -39,8 +40,10 @@ from freqtrade.commands.deploy_commands import (
 )
 from freqtrade.commands.list_commands import start_list_freqAI_models
 from freqtrade.configuration import setup_utils_configuration
+from freqtrade.constants import FTHYPT_FILEVERSION
 from freqtrade.enums import RunMode
 from freqtrade.exceptions import OperationalException
+from freqtrade.optimize.hyperopt_tools import HyperoptTools
 from freqtrade.persistence.models import init_db
 from freqtrade.persistence.pairlock_middleware import PairLocks
 from freqtrade.util import dt_floor_day, dt_now, dt_utc
@@ -109,6 +112,21 @@ def test_start_webserver(mocker, caplog):
     assert api_server_mock.call_count == 1
 
 
+def test_start_market_data_sidecar(mocker, caplog):
+    patch_exchange(mocker)
+    sidecar_mock = mocker.patch("freqtrade.exchange.market_data_sidecar.MarketDataSidecar")
+    sidecar_mock.return_value.serve_forever.side_effect = KeyboardInterrupt
+    close_mock = mocker.patch(f"{EXMS}.close")
+
+    args = ["market-data-sidecar", "-c", "tests/testdata/testconfigs/main_test_config.json"]
+    assert start_market_data_sidecar(get_args(args)) == 0
+    assert sidecar_mock.call_count == 1
+    assert sidecar_mock.call_args[0][1].endswith("binance_spot.sock")
+    assert sidecar_mock.return_value.stop.call_count == 1
+    assert close_mock.call_count == 1
+    assert log_has("SIGINT received, stopping market data sidecar.", caplog)
+
+
 def test_list_exchanges(capsys):
     args = [
         "list-exchanges",
@@ -1138,20 +1156,27 @@ def test_start_test_pairlist(mocker, caplog, tickers, default_conf, capsys):
         pytest.fail(f"Expected well formed JSON, but failed to parse: {captured.out}")
 
 
-def test_hyperopt_list(mocker, capsys, caplog, tmp_path):
-    saved_hyperopt_results = hyperopt_test_result()
-    csv_file = tmp_path / "test.csv"
+def _patch_hyperopt_results(mocker, saved_hyperopt_results):
     mocker.patch(
         "freqtrade.optimize.hyperopt_tools.HyperoptTools._test_hyperopt_results_exist",
         return_value=True,
     )
+    # Index entries point to their epoch in saved_hyperopt_results
+    index = [
+        HyperoptTools._epoch_index_entry(epoch, offset, 1)
+        for offset, epoch in enumerate(saved_hyperopt_results)
+    ]
+    mocker.patch("freqtrade.optimize.hyperopt_tools.HyperoptTools._load_index", return_value=index)
+    return mocker.patch(
+        "freqtrade.optimize.hyperopt_tools.HyperoptTools.load_epochs",
+        side_effect=lambda _, entries: [saved_hyperopt_results[e["offset"]] for e in entries],
+    )
 
-    def fake_iterator(*args, **kwargs):
-        yield from [saved_hyperopt_results]
 
-    mocker.patch(
-        "freqtrade.optimize.hyperopt_tools.HyperoptTools._read_results", side_effect=fake_iterator
-    )
+def test_hyperopt_list(mocker, capsys, caplog, tmp_path):
+    saved_hyperopt_results = hyperopt_test_result()
+    csv_file = tmp_path / "test.csv"
+    _patch_hyperopt_results(mocker, saved_hyperopt_results)
 
     args = [
         "hyperopt-list",
@@ -1511,17 +1536,7 @@ def test_hyperopt_list(mocker, capsys, caplog, tmp_path):
 
 def test_hyperopt_show(mocker, capsys):
     saved_hyperopt_results = hyperopt_test_result()
-    mocker.patch(
-        "freqtrade.optimize.hyperopt_tools.HyperoptTools._test_hyperopt_results_exist",
-        return_value=True,
-    )
-
-    def fake_iterator(*args, **kwargs):
-        yield from [saved_hyperopt_results]
-
-    mocker.patch(
-        "freqtrade.optimize.hyperopt_tools.HyperoptTools._read_results", side_effect=fake_iterator
-    )
+    _patch_hyperopt_results(mocker, saved_hyperopt_results)
     mocker.patch("freqtrade.commands.hyperopt_commands.show_backtest_result")
 
     args = [
@@ -1578,6 +1593,30 @@ def test_hyperopt_show(mocker, capsys):
         start_hyperopt_show(pargs)
 
 
+def test_hyperopt_show_lean_epoch(mocker, tmp_path):
+    saved_hyperopt_results = hyperopt_test_result()
+    epoch = saved_hyperopt_results[1]
+    assert not epoch["is_best"]
+    # Lean statistics, as stored for epochs which never became the best epoch.
+    epoch.update({FTHYPT_FILEVERSION: 2, "params_not_optimized": {}})
+    epoch["results_metrics"].update({"strategy_name": "StrategyTestV3", "stake_currency": "BTC"})
+    _patch_hyperopt_results(mocker, saved_hyperopt_results)
+    show_mock = mocker.patch("freqtrade.commands.hyperopt_commands.show_backtest_result")
+    mocker.patch(
+        "freqtrade.optimize.hyperopt_tools.HyperoptTools.get_strategy_filename",
+        return_value=tmp_path / "StrategyTestV3.py",
+    )
+
+    pargs = get_args(["hyperopt-show", "-n", "2"])
+    pargs["config"] = None
+    start_hyperopt_show(pargs)
+
+    assert show_mock.call_count == 0
+    params = HyperoptTools.load_params(tmp_path / "StrategyTestV3.json")
+    assert params["strategy_name"] == "StrategyTestV3"
+    assert params["params"]["buy"] == epoch["params_details"]["buy"]
+
+
 def test_convert_data(mocker, testdatadir):
     ohlcv_mock = mocker.patch("freqtrade.commands.data_commands.convert_ohlcv_format")
     trades_mock = mocker.patch("freqtrade.commands.data_commands.convert_trades_format")
@@ -1,9 +1,12 @@
+import shutil
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 from pandas import DataFrame, DateOffset, Timestamp, to_datetime
+from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import LAST_BT_RESULT_FN
@@ -11,15 +14,20 @@ from freqtrade.data.btanalysis import (
     BT_DATA_COLUMNS,
     analyze_trade_parallelism,
     extract_trades_of_period,
+    find_existing_backtest_stats,
+    get_backtest_result_file,
+    get_backtest_resultlist,
     get_latest_backtest_filename,
     get_latest_hyperopt_file,
     load_backtest_data,
     load_backtest_metadata,
+    load_backtest_stats,
     load_trades,
     load_trades_from_db,
 )
 from freqtrade.data.history import load_data, load_pair_history
 from freqtrade.data.metrics import (
+    TradeMetrics,
     calculate_cagr,
     calculate_calmar,
     calculate_csum,
@@ -34,6 +42,10 @@ from freqtrade.data.metrics import (
     create_cum_profit,
 )
 from freqtrade.exceptions import OperationalException
+from freqtrade.optimize.backtest_result_container import (
+    load_container_strategy,
+    store_backtest_container,
+)
 from freqtrade.util import dt_utc
 from tests.conftest import CURRENT_TEST_STRATEGY, create_mock_trades
 from tests.conftest_trades import MOCK_TRADE_COUNT
@@ -91,6 +103,7 @@ def test_load_backtest_metadata(mocker, testdatadir):
 
 def test_load_backtest_data_old_format(testdatadir, mocker):
     filename = testdatadir / "backtest-result_test222.json"
+    mocker.patch("freqtrade.data.btanalysis._resolve_backtest_filename", return_value=filename)
     mocker.patch("freqtrade.data.btanalysis.load_backtest_stats", return_value=[])
 
     with pytest.raises(
@@ -141,6 +154,64 @@ def test_load_backtest_data_multi(testdatadir):
         load_backtest_data(filename)
 
 
+def test_backtest_result_container(testdatadir, tmp_path, mocker):
+    source = testdatadir / "backtest_results/backtest-result_multistrat.json"
+    stats = load_backtest_stats(source)
+    filename = tmp_path / "backtest-result-2022-04-02_12-53-26.zip"
+    store_backtest_container(filename, stats)
+    shutil.copy(source.with_suffix(".meta.json"), tmp_path / f"{filename.stem}.meta.json")
+
+    def without_trades(results):
+        return {k: v for k, v in results.items() if k != "trades"}
+
+    loaded = load_backtest_stats(filename)
+    assert loaded["strategy"].keys() == stats["strategy"].keys()
+    for strategy, results in stats["strategy"].items():
+        assert without_trades(loaded["strategy"][strategy]) == without_trades(results)
+        # NM_NATIVE parsing may differ in the last digit of floats
+        assert_frame_equal(
+            DataFrame(loaded["strategy"][strategy]["trades"]), DataFrame(results["trades"])
+        )
+    assert loaded["strategy_comparison"] == stats["strategy_comparison"]
+    assert loaded["metadata"] == stats["metadata"]
+    # json filenames fall back to the container
+    assert (
+        load_backtest_stats(filename.with_suffix(".json"))["strategy_comparison"]
+        == (stats["strategy_comparison"])
+    )
+
+    summary = load_container_strategy(filename, "TestStrategy", include_trades=False)
+    assert "trades" not in summary
+    assert summary["total_trades"] == stats["strategy"]["TestStrategy"]["total_trades"]
+
+    # Trades of one strategy only - without loading the full result
+    expected = {s: load_backtest_data(source, strategy=s) for s in stats["strategy"]}
+    stats_mock = mocker.patch("freqtrade.data.btanalysis.load_backtest_stats")
+    for strategy, trades in expected.items():
+        assert_frame_equal(load_backtest_data(filename, strategy=strategy), trades)
+    with pytest.raises(ValueError, match=r"Strategy XYZ not available in the backtest result\."):
+        load_backtest_data(filename, strategy="XYZ")
+    with pytest.raises(ValueError, match=r"Detected backtest result with more than one strategy"):
+        load_backtest_data(filename)
+
+    assert get_backtest_result_file(tmp_path, filename.stem) == filename
+    assert [r["strategy"] for r in get_backtest_resultlist(tmp_path)] == [
+        "StrategyTestV2",
+        "TestStrategy",
+    ]
+    results = find_existing_backtest_stats(
+        tmp_path, {"TestStrategy": "110d0271075ef327edbb23085102b4ebe51a3d55"}
+    )
+    assert stats_mock.call_count == 0
+    assert list(results["strategy"]) == ["TestStrategy"]
+    assert without_trades(results["strategy"]["TestStrategy"]) == without_trades(
+        stats["strategy"]["TestStrategy"]
+    )
+    assert len(results["strategy"]["TestStrategy"]["trades"]) == 179
+    assert results["metadata"]["TestStrategy"]["filename"] == filename.stem
+    assert [c["key"] for c in results["strategy_comparison"]] == ["TestStrategy"]
+
+
 @pytest.mark.usefixtures("init_persistence")
 @pytest.mark.parametrize("is_short", [False, True])
 def test_load_trades_from_db(default_conf, fee, is_short, mocker):
@@ -455,6 +526,91 @@ def test_calculate_calmar(testdatadir):
     assert pytest.approx(calmar) == 559.040508
 
 
+def _reference_max_drawdown(trades, starting_balance, relative):
+    """Max drawdown calculated on DataFrames, as done before the TradeMetrics kernel."""
+    results = trades.sort_values("close_date").reset_index(drop=True)
+    df = DataFrame()
+    df["cumulative"] = results["profit_abs"].cumsum()
+    df["high_value"] = df["cumulative"].cummax()
+    df["drawdown"] = df["cumulative"] - df["high_value"]
+    max_balance = starting_balance + df["high_value"]
+    df["drawdown_relative"] = (max_balance - (starting_balance + df["cumulative"])) / max_balance
+    idx = df["drawdown_relative"].idxmax() if relative else df["drawdown"].idxmin()
+    high_idx = df.iloc[:idx]["high_value"].idxmax()
+    return (
+        abs(df.loc[idx, "drawdown"]),
+        results.loc[high_idx, "close_date"],
+        results.loc[idx, "close_date"],
+        df.loc[high_idx, "cumulative"],
+        df.loc[idx, "cumulative"],
+        df.loc[idx, "drawdown_relative"],
+    )
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_trade_metrics_matches_dataframe_metrics(seed):
+    rng = np.random.default_rng(seed)
+    count = 500
+    # Few distinct close dates - sorting must keep the order of DataFrame.sort_values()
+    close_dates = to_datetime(1640995200 + 3600 * rng.integers(0, 100, count), unit="s", utc=True)
+    trades = DataFrame(
+        {
+            "close_date": close_dates,
+            "profit_abs": rng.normal(0.1, 5, count),
+        }
+    )
+    trades["profit_ratio"] = trades["profit_abs"] / 100
+    min_date = Timestamp("2022-01-01", tz="UTC")
+    max_date = Timestamp("2022-01-10", tz="UTC")
+    metrics = TradeMetrics(trades, starting_balance=1000)
+
+    for relative in (False, True):
+        drawdown = metrics.max_drawdown(relative=relative)
+        assert (
+            drawdown.drawdown_abs,
+            drawdown.high_date,
+            drawdown.low_date,
+            drawdown.high_value,
+            drawdown.low_value,
+            drawdown.relative_account_drawdown,
+        ) == _reference_max_drawdown(trades, 1000, relative)
+        assert calculate_max_drawdown(trades, starting_balance=1000, relative=relative) == drawdown
+
+    underwater = calculate_underwater(trades, value_col="profit_abs", starting_balance=1000)
+    assert list(underwater.columns) == [
+        "cumulative",
+        "high_value",
+        "drawdown",
+        "date",
+        "drawdown_relative",
+    ]
+    assert underwater["drawdown_relative"].max() == pytest.approx(
+        metrics.max_drawdown(relative=True).relative_account_drawdown
+    )
+
+    # Ratios match the previous pandas based calculation to float tolerance
+    total_profit = trades["profit_abs"] / 1000
+    assert metrics.sharpe(min_date, max_date) == pytest.approx(
+        total_profit.sum() / 9 / np.std(total_profit) * np.sqrt(365)
+    )
+    down_stdev = np.std(trades.loc[trades["profit_abs"] < 0, "profit_abs"] / 1000)
+    assert metrics.sortino(min_date, max_date) == pytest.approx(
+        total_profit.sum() / 9 / down_stdev * np.sqrt(365)
+    )
+    assert metrics.calmar(min_date, max_date) == pytest.approx(
+        total_profit.sum()
+        / 9
+        * 100
+        / metrics.max_drawdown().relative_account_drawdown
+        * np.sqrt(365)
+    )
+    winning = trades.loc[trades["profit_abs"] > 0, "profit_abs"]
+    losing = trades.loc[trades["profit_abs"] < 0, "profit_abs"]
+    winrate = len(winning) / count
+    expectancy = winrate * winning.mean() - (1 - winrate) * abs(losing.mean())
+    assert metrics.expectancy()[0] == pytest.approx(expectancy)
+
+
 @pytest.mark.parametrize(
     "start,end,days, expected",
     [
@@ -172,3 +172,26 @@ def test_bybit_fetch_order_canceled_empty(default_conf_usdt, mocker):
     assert res2["filled"] == 0.0
     assert res2["amount"] == 20.0
     assert res2["status"] == "open"
+
+
+def test_bybit_fetch_orders_bulk_canceled_empty(default_conf_usdt, mocker):
+    default_conf_usdt["dry_run"] = False
+    api_mock = MagicMock()
+    api_mock.fetch_open_orders = get_mock_coro([])
+    api_mock.fetch_order = get_mock_coro(
+        {
+            "id": "123",
+            "symbol": "BTC/USDT",
+            "status": "canceled",
+            "filled": 0.0,
+            "remaining": 0.0,
+            "amount": 20.0,
+        }
+    )
+    mocker.patch(f"{EXMS}.exchange_has", return_value=True)
+    exchange = get_patched_exchange(mocker, default_conf_usdt, api_mock, exchange="bybit")
+
+    res = exchange.fetch_orders_bulk([("123", "BTC/USDT", False)])
+    # Orders reconciled in bulk get the same fixes as orders fetched one by one
+    assert res["123"]["remaining"] is None
+    assert res["123"]["status"] == "canceled"
@@ -1,5 +1,7 @@
+import asyncio
 import copy
 import logging
+import pickle
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from random import randint
@@ -42,6 +44,7 @@ from freqtrade.util import dt_now, dt_ts
 from tests.conftest import (
     EXMS,
     generate_test_data_raw,
+    get_markets,
     get_mock_coro,
     get_patched_exchange,
     log_has,
@@ -230,6 +233,25 @@ def test_destroy(default_conf, mocker, caplog):
     assert log_has("Exchange object destroyed, closing async loop", caplog)
 
 
+def test_exchange_pickle(default_conf):
+    exchange = Exchange(default_conf, validate=False)
+    exchange._markets = get_markets()
+
+    copied = pickle.loads(pickle.dumps(exchange))  # noqa: S301
+    assert copied.markets == exchange.markets
+    assert copied._api.id == exchange._api.id
+    assert copied._api_async is None
+    assert not copied.loop.is_closed()
+    with copied._loop_lock, copied._cache_lock:
+        pass
+    copied.close()
+
+    # The pickled instance is left untouched
+    assert exchange._api_async is not None
+    assert not exchange.loop.is_closed()
+    exchange.close()
+
+
 def test_init_exception(default_conf, mocker):
     default_conf["exchange"]["name"] = "wrong_exchange_name"
 
@@ -1314,6 +1336,64 @@ def test_create_order(default_conf, mocker, side, ordertype, rate, marketprice,
     assert order["amount"] == 0.01
 
 
+def test_create_orders(default_conf, mocker):
+    orders = [
+        {"pair": pair, "ordertype": "limit", "side": "buy", "amount": 1, "rate": 2, "leverage": 1.0}
+        for pair in ["ETH/BTC", "XRP/BTC", "NEO/BTC"]
+    ]
+    default_conf["dry_run"] = True
+    exchange = get_patched_exchange(mocker, default_conf)
+    res = exchange.create_orders(orders)
+    assert len(res) == 3
+    assert [o["symbol"] for o in res] == ["ETH/BTC", "XRP/BTC", "NEO/BTC"]
+
+    default_conf["dry_run"] = False
+    api_mock = MagicMock()
+    api_mock.options = {}
+    in_flight = []
+    max_in_flight = 0
+
+    async def create_order(pair, ordertype, side, amount, rate, params):
+        nonlocal max_in_flight
+        in_flight.append(pair)
+        max_in_flight = max(max_in_flight, len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(pair)
+        if pair == "XRP/BTC":
+            raise ccxt.InsufficientFunds("0 balance")
+        return {"id": f"{pair}-id", "symbol": pair, "amount": amount, "info": {}}
+
+    api_mock.create_order = create_order
+    mocker.patch(f"{EXMS}.amount_to_precision", lambda s, x, y: y)
+    mocker.patch(f"{EXMS}.price_to_precision", lambda s, x, y: y)
+    exchange = get_patched_exchange(mocker, default_conf, api_mock)
+    exchange._ft_has["order_concurrency"] = 2
+    exchange._lev_prep = MagicMock()
+
+    res = exchange.create_orders(orders)
+    assert res[0]["id"] == "ETH/BTC-id"
+    # Missing status / type are mapped as for create_order
+    assert res[0]["status"] == "open"
+    assert res[0]["type"] == "limit"
+    assert isinstance(res[1], InsufficientFundsError)
+    assert res[2]["id"] == "NEO/BTC-id"
+    assert max_in_flight == 2
+    assert exchange._lev_prep.call_count == 3
+
+    # Failing leverage preparation only fails the affected order
+    exchange._lev_prep = MagicMock(side_effect=[None, TemporaryError("lev"), None])
+    res = exchange.create_orders(orders)
+    assert isinstance(res[1], TemporaryError)
+    assert res[2]["id"] == "NEO/BTC-id"
+
+    # Single orders are placed via create_order
+    exchange._lev_prep = MagicMock()
+    api_mock.create_order = MagicMock(return_value={"id": "single", "symbol": "ETH/BTC"})
+    res = exchange.create_orders(orders[:1])
+    assert res[0]["id"] == "single"
+    assert api_mock.create_order.call_count == 1
+
+
 @pytest.mark.parametrize("exchange_name", EXCHANGES)
 def test_buy_dry_run(default_conf, mocker, exchange_name):
     default_conf["dry_run"] = True
@@ -1694,6 +1774,26 @@ def test_get_balances_prod(default_conf, mocker, exchange_name):
     )
 
 
+def test_get_balances_ws(default_conf, mocker):
+    balance_item = {"free": 10.0, "total": 10.0, "used": 0.0}
+    api_mock = MagicMock()
+    api_mock.fetch_balance = MagicMock(return_value={"1ST": balance_item, "info": {}})
+    default_conf["dry_run"] = False
+    exchange = get_patched_exchange(mocker, default_conf, api_mock)
+    exchange._exchange_ws = MagicMock()
+    exchange._exchange_ws.get_balances = MagicMock(return_value={"2ND": balance_item})
+
+    assert exchange.get_balances() == {"2ND": balance_item}
+    assert exchange._exchange_ws.schedule_private_streams.call_count == 1
+    assert api_mock.fetch_balance.call_count == 0
+
+    # Stale / missing websocket state - falls back to REST and refreshes the cache
+    exchange._exchange_ws.get_balances = MagicMock(return_value=None)
+    assert exchange.get_balances() == {"1ST": balance_item}
+    assert api_mock.fetch_balance.call_count == 1
+    exchange._exchange_ws.store_balances.assert_called_once_with({"1ST": balance_item})
+
+
 @pytest.mark.parametrize("exchange_name", EXCHANGES)
 def test_fetch_positions(default_conf, mocker, exchange_name):
     mocker.patch(f"{EXMS}.validate_trading_mode_and_margin_mode")
@@ -2815,6 +2915,41 @@ def test_fetch_l2_order_book(default_conf, mocker, order_book_l2, exchange_name)
             assert api_mock.fetch_l2_order_book.call_args_list[0][0][1] == next_limit
 
 
+def test_fetch_ticker_order_book_ws(default_conf, mocker, order_book_l2):
+    api_mock = MagicMock()
+    api_mock.fetch_l2_order_book = order_book_l2
+    api_mock.fetch_ticker = MagicMock(return_value={"symbol": "ETH/BTC", "bid": 1, "ask": 2})
+    default_conf["entry_pricing"]["check_depth_of_market"] = {"enabled": True}
+    default_conf["entry_pricing"]["price_side"] = "same"
+    exchange = get_patched_exchange(mocker, default_conf, api_mock)
+    exchange._exchange_ws = MagicMock()
+    ws_ticker = {"symbol": "ETH/BTC", "bid": 1.5, "ask": 1.6, "last": 1.55}
+    exchange._exchange_ws.get_ticker = MagicMock(return_value=ws_ticker)
+    exchange._exchange_ws.get_order_book = MagicMock(
+        return_value={"symbol": "ETH/BTC", "bids": [[1.5, 1]], "asks": [[1.6, 1]]}
+    )
+
+    assert exchange.fetch_ticker("ETH/BTC") == ws_ticker
+    exchange._exchange_ws.schedule_ticker.assert_called_once_with("ETH/BTC")
+    assert api_mock.fetch_ticker.call_count == 0
+
+    assert exchange.fetch_l2_order_book("ETH/BTC", 1)["bids"] == [[1.5, 1]]
+    # Subscribed deep enough for the depth of market check
+    exchange._exchange_ws.schedule_order_book.assert_called_once_with("ETH/BTC", 1000)
+    assert api_mock.fetch_l2_order_book.call_count == 0
+
+    # Rates are calculated from websocket data
+    assert exchange.get_rate("ETH/BTC", refresh=True, side="entry", is_short=False) == 1.5
+
+    # Fall back to REST if websocket data is not available
+    exchange._exchange_ws.get_ticker = MagicMock(return_value=None)
+    exchange._exchange_ws.get_order_book = MagicMock(return_value=None)
+    assert exchange.fetch_ticker("ETH/BTC")["bid"] == 1
+    assert api_mock.fetch_ticker.call_count == 1
+    assert len(exchange.fetch_l2_order_book("ETH/BTC", 10)["bids"]) == 10
+    assert api_mock.fetch_l2_order_book.call_count == 1
+
+
 @pytest.mark.parametrize("exchange_name", EXCHANGES)
 def test_fetch_l2_order_book_exception(default_conf, mocker, exchange_name):
     api_mock = MagicMock()
@@ -3740,6 +3875,42 @@ def test_fetch_order(default_conf, mocker, exchange_name, caplog):
     )
 
 
+def test_fetch_order_ws(default_conf, mocker):
+    default_conf["dry_run"] = False
+    api_mock = MagicMock()
+    api_mock.fetch_order = MagicMock(return_value={"id": "123", "amount": 2, "status": "closed"})
+    mocker.patch(f"{EXMS}.exchange_has", return_value=True)
+    exchange = get_patched_exchange(mocker, default_conf, api_mock)
+    exchange._exchange_ws = MagicMock()
+    exchange._exchange_ws.get_order = MagicMock(
+        return_value={"id": "123", "amount": 2, "status": "open"}
+    )
+
+    assert exchange.fetch_order("123", "TKN/BTC")["status"] == "open"
+    assert exchange._exchange_ws.schedule_private_streams.call_count == 1
+    assert api_mock.fetch_order.call_count == 0
+
+    # Orders requiring special parameters are always fetched via REST
+    assert exchange.fetch_order("123", "TKN/BTC", params={"stop": True})["status"] == "closed"
+    assert api_mock.fetch_order.call_count == 1
+    assert exchange._exchange_ws.store_order.call_count == 0
+
+    exchange._exchange_ws.get_order = MagicMock(return_value=None)
+    assert exchange.fetch_order("123", "TKN/BTC")["status"] == "closed"
+    assert api_mock.fetch_order.call_count == 2
+    exchange._exchange_ws.store_order.assert_called_once_with(
+        {"id": "123", "amount": 2, "status": "closed"}
+    )
+
+    # Bulk reconciliation doesn't fetch orders known from the websocket
+    exchange._exchange_ws.get_order = MagicMock(
+        side_effect=lambda order_id: {"id": "123", "status": "open"} if order_id == "123" else None
+    )
+    api_mock.fetch_open_orders = get_mock_coro(return_value=[{"id": "456", "status": "open"}])
+    res = exchange.fetch_orders_bulk([("123", "TKN/BTC", False), ("456", "TKN/BTC", False)])
+    assert res == {"123": {"id": "123", "status": "open"}, "456": {"id": "456", "status": "open"}}
+
+
 @pytest.mark.usefixtures("init_persistence")
 @pytest.mark.parametrize("exchange_name", EXCHANGES)
 def test_fetch_order_emulated(default_conf, mocker, exchange_name, caplog):
@@ -3814,7 +3985,84 @@ def test_fetch_order_emulated(default_conf, mocker, exchange_name, caplog):
     )
 
 
+def test_wait_for_order_update(default_conf, mocker):
+    sleep_mock = mocker.patch("freqtrade.exchange.exchange.time.sleep")
+    exchange = get_patched_exchange(mocker, default_conf)
+    assert exchange.wait_for_order_update(2) is False
+    sleep_mock.assert_called_once_with(2)
+
+    sleep_mock.reset_mock()
+    exchange._exchange_ws = MagicMock(order_stream_running=True)
+    exchange._exchange_ws.wait_for_order_update.return_value = True
+    assert exchange.wait_for_order_update(2) is True
+    exchange._exchange_ws.wait_for_order_update.assert_called_once_with(2)
+    assert sleep_mock.call_count == 0
+
+
 @pytest.mark.usefixtures("init_persistence")
+@pytest.mark.parametrize("open_orders_all_pairs", [True, False])
+def test_fetch_orders_bulk(default_conf, mocker, caplog, open_orders_all_pairs):
+    default_conf["dry_run"] = True
+    exchange = get_patched_exchange(mocker, default_conf)
+    # Dry-run orders are local - nothing to fetch
+    assert exchange.fetch_orders_bulk([("X", "ETH/BTC", False)]) == {}
+
+    default_conf["dry_run"] = False
+    api_mock = MagicMock()
+    api_mock.fetch_open_orders = get_mock_coro(
+        side_effect=lambda pair: [
+            {"id": "1", "symbol": "ETH/BTC", "status": "open", "amount": 1},
+            {"id": "2", "symbol": "ETH/BTC", "status": "open", "amount": 2},
+            {"id": "unrelated", "symbol": "ETH/BTC", "status": "open", "amount": 2},
+        ]
+        if pair in ("ETH/BTC", None)
+        else []
+    )
+
+    def fetch_order(order_id, pair):
+        if order_id == "4":
+            raise ccxt.OrderNotFound("Order not found")
+        return {"id": order_id, "symbol": pair, "status": "closed", "amount": 3}
+
+    api_mock.fetch_order = get_mock_coro(side_effect=fetch_order)
+    mocker.patch(f"{EXMS}.exchange_has", return_value=True)
+    exchange = get_patched_exchange(mocker, default_conf, api_mock)
+    exchange._ft_has["open_orders_all_pairs"] = open_orders_all_pairs
+
+    res = exchange.fetch_orders_bulk(
+        [
+            ("1", "ETH/BTC", False),
+            ("2", "ETH/BTC", True),
+            ("3", "XRP/BTC", False),
+            ("4", "XRP/BTC", False),
+        ]
+    )
+    assert set(res.keys()) == {"1", "2", "3"}
+    assert res["1"]["status"] == "open"
+    assert res["3"]["status"] == "closed"
+    # One call per pair, or one account-wide call
+    assert api_mock.fetch_open_orders.call_count == (1 if open_orders_all_pairs else 2)
+    # Only orders no longer open are fetched one by one
+    assert api_mock.fetch_order.call_count == 2
+
+    # Stoploss orders requiring special handling are not fetched in bulk
+    api_mock.fetch_order.reset_mock()
+    exchange._ft_has["stoploss_query_bulk"] = False
+    res = exchange.fetch_orders_bulk([("2", "ETH/BTC", True), ("3", "XRP/BTC", False)])
+    assert set(res.keys()) == {"3"}
+
+    # Failing open-order calls fall back to fetch_order
+    api_mock.fetch_order.reset_mock()
+    api_mock.fetch_open_orders = get_mock_coro(side_effect=ccxt.NetworkError("deadbeef"))
+    res = exchange.fetch_orders_bulk([("1", "ETH/BTC", False)])
+    assert res["1"]["status"] == "closed"
+    assert api_mock.fetch_order.call_count == 1
+    assert log_has_re(r"Could not fetch open orders: TemporaryError.*", caplog)
+
+    exchange._ft_has["fetch_orders_bulk"] = False
+    assert exchange.fetch_orders_bulk([("1", "ETH/BTC", False)]) == {}
+
+
 @pytest.mark.parametrize("exchange_name", EXCHANGES)
 def test_fetch_stoploss_order(default_conf, mocker, exchange_name):
     default_conf["dry_run"] = True
@@ -1,4 +1,5 @@
 # pragma pylint: disable=missing-docstring, protected-access, invalid-name
+import random
 from datetime import datetime, timedelta, timezone
 
 import pytest
@@ -10,6 +11,7 @@ from ccxt import (
     SIGNIFICANT_DIGITS,
     TICK_SIZE,
     TRUNCATE,
+    decimal_to_precision,
 )
 
 from freqtrade.enums import RunMode
@@ -27,6 +29,12 @@ from freqtrade.exchange import (
     timeframe_to_seconds,
 )
 from freqtrade.exchange.check_exchange import check_exchange
+from freqtrade.exchange.exchange_utils_precision import (
+    CompiledPrecision,
+    precise_div,
+    precise_mul,
+)
+from freqtrade.util import FtPrecise
 from tests.conftest import log_has_re
 
 
@@ -382,3 +390,72 @@ def test_amount_to_contract_precision_standalone(
 ):
     res = amount_to_contract_precision(amount, precision, precision_mode, contract_size)
     assert pytest.approx(res) == expected
+
+
+def _random_number(rng: random.Random) -> float:
+    """Random prices / amounts across many magnitudes, including values on the tick."""
+    value = rng.choice(
+        [
+            rng.uniform(0, 10),
+            rng.uniform(0, 1) * 10 ** rng.randint(-9, 6),
+            round(rng.uniform(0, 100), rng.randint(0, 8)),
+            rng.randint(0, 100000) * 0.0005,
+        ]
+    )
+    return value if rng.random() > 0.1 else -value
+
+
+def test_compiled_precision_matches_ccxt():
+    rng = random.Random(42)
+    ticks = [1e-8, 1e-5, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 1.0, 5, 10, 25]
+    for _ in range(20000):
+        value = _random_number(rng)
+        tick = rng.choice(ticks)
+        digits = rng.randint(-2, 10)
+        for rounding_mode in (TRUNCATE, ROUND):
+            assert CompiledPrecision(tick, TICK_SIZE).to_precision(value, rounding_mode) == float(
+                decimal_to_precision(
+                    value, rounding_mode=rounding_mode, precision=tick, counting_mode=TICK_SIZE
+                )
+            ), (value, tick, rounding_mode)
+            assert CompiledPrecision(digits, DECIMAL_PLACES).to_precision(
+                value, rounding_mode
+            ) == float(
+                decimal_to_precision(
+                    value,
+                    rounding_mode=rounding_mode,
+                    precision=digits,
+                    counting_mode=DECIMAL_PLACES,
+                )
+            ), (value, digits, rounding_mode)
+
+        value = abs(value)
+        tick_p = FtPrecise(tick)
+        missing = FtPrecise(value) % tick_p
+        # Former FtPrecise based price_to_precision(rounding_mode=ROUND_UP / ROUND_DOWN)
+        up = float(FtPrecise(value) - missing + tick_p) if missing != FtPrecise(0) else value
+        down = float(FtPrecise(value) - missing) if missing != FtPrecise(0) else value
+        assert CompiledPrecision(tick, TICK_SIZE).to_precision(value, ROUND_UP) == up
+        assert CompiledPrecision(tick, TICK_SIZE).to_precision(value, ROUND_DOWN) == down
+
+
+def test_precise_div_mul():
+    rng = random.Random(42)
+    for _ in range(5000):
+        value = _random_number(rng)
+        contract_size = rng.choice([0.0001, 0.001, 0.01, 0.1, 3, 10, 100, 0.3])
+        assert precise_div(value, contract_size) == float(
+            FtPrecise(value) / FtPrecise(contract_size)
+        )
+        assert precise_mul(value, contract_size) == float(
+            FtPrecise(value) * FtPrecise(contract_size)
+        )
+
+
+def test_compiled_precision_invalid():
+    with pytest.raises(ValueError, match=r"Unsupported counting mode"):
+        CompiledPrecision(3, SIGNIFICANT_DIGITS)
+    with pytest.raises(ValueError, match=r"Invalid tick size"):
+        CompiledPrecision(0, TICK_SIZE)
+    with pytest.raises(ValueError, match=r"Unknown rounding_mode"):
+        CompiledPrecision(0.01, TICK_SIZE).to_precision(1.005, 42)
@@ -3,8 +3,16 @@ import threading
 from time import sleep
 from unittest.mock import AsyncMock, MagicMock
 
+import ccxt
+
 from freqtrade.enums import CandleType
-from freqtrade.exchange.exchange_ws import ExchangeWS
+from freqtrade.exchange.exchange_ws import (
+    MARKET_DATA_EXPIRY,
+    MARKET_DATA_MAX_AGE,
+    PRIVATE_STREAM_TTL,
+    ExchangeWS,
+)
+from tests.conftest import log_has_re
 
 
 def test_exchangews_init(mocker):
@@ -67,3 +75,193 @@ async def test_exchangews_ohlcv(mocker):
     finally:
         # Cleanup
         exchange_ws.cleanup()
+
+
+class FakeCcxtPro:
+    """
+    Minimal stand-in for a ccxt.pro exchange, returning one batch of messages per stream
+    and blocking afterwards (like a quiet websocket connection).
+    """
+
+    has = {"watchOrders": True, "watchMyTrades": True, "watchBalance": True}
+
+    def __init__(self, orders, trades, balance):
+        self._messages = {"orders": [orders], "trades": [trades], "balance": [balance]}
+        self.close = AsyncMock()
+
+    async def _next(self, stream):
+        if self._messages[stream]:
+            msg = self._messages[stream].pop(0)
+            if isinstance(msg, Exception):
+                raise msg
+            return msg
+        await asyncio.sleep(10)
+
+    async def watch_orders(self):
+        return await self._next("orders")
+
+    async def watch_my_trades(self):
+        # Trades arrive after the order updates
+        await asyncio.sleep(0.1)
+        return await self._next("trades")
+
+    async def watch_balance(self):
+        return await self._next("balance")
+
+
+async def test_exchangews_private_streams(mocker):
+    config = MagicMock()
+    ccxt_object = FakeCcxtPro(
+        orders=[
+            {"id": "1", "symbol": "ETH/BTC", "status": "open"},
+            {"id": "2", "symbol": "ETH/BTC", "status": "open"},
+        ],
+        trades=[{"id": "t1", "order": "2", "symbol": "ETH/BTC"}],
+        balance={"info": {}, "free": {}, "BTC": {"free": 1.0, "used": 0.5, "total": 1.5}},
+    )
+    mocker.patch("freqtrade.exchange.exchange_ws.ExchangeWS._start_forever", MagicMock())
+
+    exchange_ws = ExchangeWS(config, ccxt_object)
+    patch_eventloop_threading(exchange_ws)
+    try:
+        # Nothing is returned before the streams run
+        assert exchange_ws.get_order("1") is None
+        assert exchange_ws.get_balances() is None
+
+        exchange_ws.schedule_private_streams()
+        await asyncio.sleep(0.3)
+        assert exchange_ws._private_scheduled == {"orders", "my_trades", "balance"}
+
+        assert exchange_ws.get_order("1") == {"id": "1", "symbol": "ETH/BTC", "status": "open"}
+        # Filled order has been invalidated by the trade
+        assert exchange_ws.get_order("2") is None
+        assert exchange_ws.order_stream_running
+        # Updates arrived - the wait returns immediately, and only once
+        assert exchange_ws.wait_for_order_update(5) is True
+        assert exchange_ws.wait_for_order_update(0.01) is False
+        assert exchange_ws.get_balances() == {"BTC": {"free": 1.0, "used": 0.5, "total": 1.5}}
+
+        # Stale states are no longer returned
+        exchange_ws._orders_last_update["1"] -= (PRIVATE_STREAM_TTL + 1) * 1000
+        exchange_ws.balances_last_refresh -= (PRIVATE_STREAM_TTL + 1) * 1000
+        assert exchange_ws.get_order("1") is None
+        assert exchange_ws.get_balances() is None
+        # REST results refresh the cache
+        exchange_ws.store_order({"id": "1", "symbol": "ETH/BTC", "status": "closed"})
+        assert exchange_ws.get_order("1")["status"] == "closed"
+        # Outdated REST results don't overwrite newer states
+        exchange_ws.store_order({"id": "1", "symbol": "ETH/BTC", "status": "open"})
+        assert exchange_ws.get_order("1")["status"] == "closed"
+
+        exchange_ws.store_order({"id": "3", "status": "open", "filled": 2.0})
+        exchange_ws.store_order({"id": "3", "status": "open", "filled": 1.0})
+        assert exchange_ws.get_order("3")["filled"] == 2.0
+        exchange_ws.store_order({"id": "4", "status": "open", "lastUpdateTimestamp": 200})
+        exchange_ws.store_order({"id": "4", "status": "closed", "lastUpdateTimestamp": 100})
+        assert exchange_ws.get_order("4")["status"] == "open"
+        exchange_ws.store_order({"id": "4", "status": "closed", "lastUpdateTimestamp": 300})
+        assert exchange_ws.get_order("4")["status"] == "closed"
+    finally:
+        exchange_ws.cleanup()
+
+
+async def test_exchangews_private_stream_failure(mocker, caplog):
+    config = MagicMock()
+    ccxt_object = FakeCcxtPro(
+        orders=[{"id": "1", "symbol": "ETH/BTC", "status": "open"}],
+        trades=[],
+        balance={"BTC": {"free": 1.0, "used": 0.0, "total": 1.0}},
+    )
+    ccxt_object._messages["orders"].append(ccxt.NetworkError("connection lost"))
+    mocker.patch("freqtrade.exchange.exchange_ws.ExchangeWS._start_forever", MagicMock())
+
+    exchange_ws = ExchangeWS(config, ccxt_object)
+    patch_eventloop_threading(exchange_ws)
+    try:
+        exchange_ws.schedule_private_streams()
+        await asyncio.sleep(0.3)
+        # Order stream failed - order states can't be trusted anymore
+        assert "orders" not in exchange_ws._private_scheduled
+        assert exchange_ws.get_order("1") is None
+        assert exchange_ws._orders == {}
+        assert exchange_ws.get_balances() is not None
+        assert log_has_re("Exception in continuously_async_watch_private for orders", caplog)
+
+        # Not restarted immediately
+        exchange_ws.schedule_private_streams()
+        await asyncio.sleep(0.1)
+        assert "orders" not in exchange_ws._private_scheduled
+    finally:
+        exchange_ws.cleanup()
+
+
+class FakeCcxtProMarketData:
+    has = {"watchTicker": True, "watchOrderBook": True}
+
+    def __init__(self):
+        self.close = AsyncMock()
+        self.order_book_limits = []
+
+    async def watch_ticker(self, pair):
+        await asyncio.sleep(0.05)
+        return {"symbol": pair, "bid": 1.0, "ask": 1.1, "last": 1.05}
+
+    async def watch_order_book(self, pair, limit):
+        self.order_book_limits.append(limit)
+        await asyncio.sleep(0.05)
+        return {
+            "symbol": pair,
+            "bids": [[1.0 - i * 0.01, 2.0] for i in range(limit)],
+            "asks": [[1.1 + i * 0.01, 2.0] for i in range(limit)],
+            "timestamp": 1,
+            "datetime": None,
+            "nonce": None,
+        }
+
+
+async def test_exchangews_market_data(mocker):
+    config = MagicMock()
+    ccxt_object = FakeCcxtProMarketData()
+    mocker.patch("freqtrade.exchange.exchange_ws.ExchangeWS._start_forever", MagicMock())
+
+    exchange_ws = ExchangeWS(config, ccxt_object)
+    patch_eventloop_threading(exchange_ws)
+    try:
+        assert exchange_ws.get_ticker("ETH/BTC") is None
+        exchange_ws.schedule_ticker("ETH/BTC")
+        exchange_ws.schedule_order_book("ETH/BTC", 20)
+        await asyncio.sleep(0.3)
+        assert exchange_ws._market_data_scheduled == {
+            ("ticker", "ETH/BTC"),
+            ("orderbook", "ETH/BTC"),
+        }
+
+        assert exchange_ws.get_ticker("ETH/BTC")["bid"] == 1.0
+        ob = exchange_ws.get_order_book("ETH/BTC", 5)
+        assert len(ob["bids"]) == 5
+        assert len(ob["asks"]) == 5
+        assert ob["bids"][0] == [1.0, 2.0]
+        # Not deep enough
+        assert exchange_ws.get_order_book("ETH/BTC", 100) is None
+        # Subscription depth doesn't change
+        exchange_ws.schedule_order_book("ETH/BTC", 100)
+        await asyncio.sleep(0.1)
+        assert set(ccxt_object.order_book_limits) == {20}
+
+        # Outdated data isn't returned
+        exchange_ws.market_data_last_refresh[("ticker", "ETH/BTC")] -= (
+            MARKET_DATA_MAX_AGE + 1
+        ) * 1000
+        assert exchange_ws.get_ticker("ETH/BTC") is None
+
+        # Not requested for a while - unsubscribed
+        exchange_ws.market_data_last_request[("orderbook", "ETH/BTC")] -= (
+            MARKET_DATA_EXPIRY + 1
+        ) * 1000
+        exchange_ws.cleanup_expired_market_data()
+        assert ("orderbook", "ETH/BTC") not in exchange_ws._market_data_watching
+        await asyncio.sleep(0.2)
+        assert ("orderbook", "ETH/BTC") not in exchange_ws._market_data_scheduled
+        assert exchange_ws.get_order_book("ETH/BTC", 5) is None
+    finally:
+        exchange_ws.cleanup()
@@ -0,0 +1,99 @@
+import json
+import random
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from freqtrade.exchange import Exchange
+from freqtrade.exchange.leverage_tiers import LeverageTiers
+from tests.conftest import get_patched_exchange
+
+
+def _loop_max_leverage(pair_tiers, stake_amount):
+    """Tier walk as done before tiers were compiled."""
+    if stake_amount == 0:
+        return pair_tiers[0]["maxLeverage"]
+    for tier_index, tier in enumerate(pair_tiers):
+        if tier_index < len(pair_tiers) - 1:
+            next_tier = pair_tiers[tier_index + 1]
+            if next_tier["minNotional"] / next_tier["maxLeverage"] > stake_amount:
+                return min(tier["maxNotional"] / stake_amount, tier["maxLeverage"])
+        elif stake_amount > tier["maxNotional"]:
+            return None
+        else:
+            return tier["maxLeverage"]
+
+
+def _loop_maintenance(pair_tiers, notional_value):
+    for tier in reversed(pair_tiers):
+        if notional_value >= tier["minNotional"]:
+            return (tier["maintenanceMarginRate"], tier["maintAmt"])
+    return None
+
+
+@pytest.fixture(scope="module")
+def binance_tiers():
+    path = Path(__file__).parents[2] / "freqtrade/exchange/binance_leverage_tiers.json"
+    tiers = json.loads(path.read_text())
+    return {
+        pair: [Exchange.parse_leverage_tier(None, tier) for tier in pair_tiers]
+        for pair, pair_tiers in tiers.items()
+    }
+
+
+def test_leverage_tiers_match_tier_walk(binance_tiers):
+    rng = random.Random(42)
+    for pair_tiers in binance_tiers.values():
+        compiled = LeverageTiers(pair_tiers)
+        top = pair_tiers[-1]["maxNotional"]
+        values = [0.0, top, top * 1.01] + [t["minNotional"] for t in pair_tiers]
+        values += [rng.uniform(0, top) for _ in range(20)]
+        for value in values:
+            assert compiled.get_max_leverage(value) == _loop_max_leverage(pair_tiers, value)
+            assert compiled.maintenance_ratio_and_amt(value) == _loop_maintenance(pair_tiers, value)
+
+        rates, amts = compiled.maintenance_ratio_and_amt_array(np.array(values))
+        expected = [_loop_maintenance(pair_tiers, v) for v in values]
+        assert rates.tolist() == [e[0] for e in expected]
+        assert amts.tolist() == [e[1] for e in expected]
+
+
+def test_leverage_tiers_unsorted(leverage_tiers):
+    pair_tiers = leverage_tiers["ADA/USDT:USDT"]
+    compiled = LeverageTiers(list(reversed(pair_tiers)))
+    assert not compiled._sorted
+    for value in (0, 500, 20000000):
+        assert compiled.maintenance_ratio_and_amt(value) == _loop_maintenance(
+            list(reversed(pair_tiers)), value
+        )
+    rates, _ = compiled.maintenance_ratio_and_amt_array(np.array([0, 500, 20000000]))
+    assert rates.tolist() == [
+        _loop_maintenance(list(reversed(pair_tiers)), v)[0] for v in (0, 500, 20000000)
+    ]
+
+    with pytest.raises(ValueError, match=r"nominal value can not be lower than 0"):
+        compiled.maintenance_ratio_and_amt(-1)
+    with pytest.raises(ValueError, match=r"nominal value can not be lower than 0"):
+        compiled.maintenance_ratio_and_amt_array(np.array([1, -1]))
+    with pytest.raises(ValueError, match=r"At least one leverage tier"):
+        LeverageTiers([])
+
+
+def test_get_compiled_leverage_tiers(mocker, default_conf, leverage_tiers):
+    default_conf["trading_mode"] = "futures"
+    default_conf["margin_mode"] = "isolated"
+    exchange = get_patched_exchange(mocker, default_conf, exchange="binance")
+    exchange._leverage_tiers = leverage_tiers
+    compiled = exchange.get_compiled_leverage_tiers("ADA/USDT:USDT")
+    assert compiled.source is leverage_tiers["ADA/USDT:USDT"]
+    # Compiled only once
+    assert exchange.get_compiled_leverage_tiers("ADA/USDT:USDT") is compiled
+    assert exchange.get_compiled_leverage_tiers("SPONGE/USDT:USDT") is None
+
+    # Reloaded tiers are compiled again
+    exchange._leverage_tiers = {
+        "ADA/USDT:USDT": leverage_tiers["ADA/USDT:USDT"][:2],
+    }
+    assert exchange.get_compiled_leverage_tiers("ADA/USDT:USDT") is not compiled
+    assert len(exchange.get_compiled_leverage_tiers("ADA/USDT:USDT").min_notional) == 2
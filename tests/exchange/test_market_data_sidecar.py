@@ -0,0 +1,284 @@
+import time
+from copy import deepcopy
+from datetime import timedelta
+from multiprocessing.connection import Client
+from multiprocessing.context import AuthenticationError
+from pathlib import Path
+from threading import Thread, get_ident
+from unittest.mock import MagicMock
+
+import pytest
+
+from freqtrade.enums import CandleType
+from freqtrade.exceptions import OperationalException, TemporaryError
+from freqtrade.exchange.market_data_sidecar import (
+    InProcessMarketDataClient,
+    MarketDataClient,
+    MarketDataSidecar,
+    TokenBucket,
+    default_socket_path,
+    install_shared_throttler,
+)
+from freqtrade.resolvers.exchange_resolver import ExchangeResolver
+from freqtrade.util import dt_now, dt_ts
+from tests.conftest import (
+    EXMS,
+    get_markets,
+    get_mock_coro,
+    get_patched_exchange,
+    patch_exchange,
+)
+
+
+def _ohlcv():
+    return [
+        [dt_ts(dt_now() - timedelta(minutes=5)), 1, 2, 3, 4, 5],
+        [dt_ts(), 3, 1, 4, 6, 5],
+    ]
+
+
+@pytest.fixture
+def sidecar(mocker, default_conf):
+    api_mock = MagicMock()
+    api_mock.rateLimit = 50
+    api_mock.timeframes = {"5m": "5m"}
+    api_mock.fetch_tickers = MagicMock(return_value={"ETH/BTC": {"last": 1.0}})
+    api_mock.fetch_ohlcv = get_mock_coro(_ohlcv())
+    api_mock.markets = get_markets()
+    api_mock.currencies = {"BTC": {}}
+    api_mock.options = {"foo": "bar"}
+    exchange = get_patched_exchange(mocker, deepcopy(default_conf), api_mock)
+    exchange.exchange_has = MagicMock(return_value=True)
+    return MarketDataSidecar(exchange, "sidecar.sock")
+
+
+def get_bot_exchange(mocker, default_conf, sidecar):
+    api_mock = MagicMock()
+    api_mock.timeframes = {"5m": "5m"}
+    api_mock.fetch_ohlcv = get_mock_coro(_ohlcv())
+    exchange = get_patched_exchange(mocker, deepcopy(default_conf), api_mock)
+    exchange._market_data = InProcessMarketDataClient(sidecar)
+    return exchange
+
+
+def test_token_bucket(mocker):
+    now = mocker.patch("freqtrade.exchange.market_data_sidecar.time.monotonic", return_value=100)
+    bucket = TokenBucket(refill_rate=2, capacity=2)
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    # Bucket is empty - requests are queued
+    assert bucket.acquire() == 0.5
+    assert bucket.acquire() == 1.0
+    now.return_value = 101
+    assert bucket.acquire() == 0.5
+    now.return_value = 110
+    # Capacity is limited
+    assert bucket.acquire(2) == 0
+    assert bucket.acquire(1) == 0.5
+
+
+def test_default_socket_path():
+    path = Path(default_socket_path("Binance", "futures"))
+    assert path.name == "binance_futures.sock"
+    assert path.parent.name.startswith("freqtrade-")
+
+
+def test_sidecar_ohlcv_shared(mocker, default_conf, sidecar):
+    bot1 = get_bot_exchange(mocker, default_conf, sidecar)
+    bot2 = get_bot_exchange(mocker, default_conf, sidecar)
+    pairs = [("ETH/BTC", "5m", CandleType.SPOT), ("XRP/BTC", "5m", CandleType.SPOT)]
+
+    res = bot1.refresh_latest_ohlcv(pairs)
+    assert len(res) == 2
+    # The incomplete candle is dropped
+    assert len(bot1.klines(pairs[0])) == 1
+    assert sidecar._exchange._api_async.fetch_ohlcv.call_count == 2
+
+    res = bot2.refresh_latest_ohlcv(pairs)
+    assert len(res) == 2
+    # Served from the sidecar's cache
+    assert sidecar._exchange._api_async.fetch_ohlcv.call_count == 2
+    # Bots never fetch candles themselves
+    assert bot1._api_async.fetch_ohlcv.call_count == 0
+    assert bot2._api_async.fetch_ohlcv.call_count == 0
+
+    # Cached candles not containing the current candle are refreshed
+    cached = sidecar._ohlcv[pairs[0]]
+    sidecar._ohlcv[pairs[0]] = (*cached[:3], cached[3][:-1], *cached[4:])
+    bot2.refresh_latest_ohlcv(pairs, cache=False)
+    assert sidecar._exchange._api_async.fetch_ohlcv.call_count == 3
+
+    # Errors are returned per pair
+    sidecar._exchange._api_async.fetch_ohlcv = get_mock_coro(side_effect=TemporaryError("bad"))
+    res = bot2.refresh_latest_ohlcv([("LTC/BTC", "5m", CandleType.SPOT), pairs[1]], cache=False)
+    assert list(res.keys()) == [pairs[1]]
+
+
+def test_sidecar_ohlcv_fallback(mocker, default_conf, sidecar, caplog):
+    bot = get_bot_exchange(mocker, default_conf, sidecar)
+    bot._market_data = MarketDataClient("does-not-exist.sock")
+    pairs = [("ETH/BTC", "5m", CandleType.SPOT), ("XRP/BTC", "5m", CandleType.SPOT)]
+    res = bot.refresh_latest_ohlcv(pairs)
+    assert len(res) == 2
+    assert bot._api_async.fetch_ohlcv.call_count == 2
+    assert caplog.text.count("Fetching candles directly.") == 1
+
+
+def test_sidecar_tickers_and_markets(mocker, default_conf, sidecar, caplog):
+    bot1 = get_bot_exchange(mocker, default_conf, sidecar)
+    bot2 = get_bot_exchange(mocker, default_conf, sidecar)
+    bot1._api.fetch_tickers = MagicMock()
+    mocker.patch(f"{EXMS}.exchange_has", return_value=True)
+
+    assert bot1.get_tickers() == {"ETH/BTC": {"last": 1.0}}
+    assert bot2.get_tickers() == {"ETH/BTC": {"last": 1.0}}
+    assert sidecar._exchange._api.fetch_tickers.call_count == 1
+    assert bot1._api.fetch_tickers.call_count == 0
+    # Tickers are refreshed once too old
+    sidecar._tickers_time -= 11
+    bot1.get_tickers()
+    assert sidecar._exchange._api.fetch_tickers.call_count == 2
+    # Tickers for a subset of pairs are fetched directly
+    bot1.get_tickers(["ETH/BTC"])
+    assert bot1._api.fetch_tickers.call_count == 1
+
+    bot1._load_async_markets = MagicMock()
+    bot1.reload_markets(True)
+    assert bot1._load_async_markets.call_count == 0
+    bot1._api_async.set_markets.assert_any_call(get_markets(), {"BTC": {}})
+    assert bot1._api_async.options == {"foo": "bar"}
+
+    # Sidecar not available
+    bot1._market_data = MarketDataClient("does-not-exist.sock")
+    bot1.reload_markets(True)
+    assert bot1._load_async_markets.call_count == 1
+    assert "Market data sidecar not available" in caplog.text
+
+    # Sidecar serving a different exchange
+    bot2.trading_mode = "futures"
+    with pytest.raises(OperationalException, match=r"Market data sidecar serves binance \(spot\)"):
+        bot2.reload_markets(True)
+
+
+def test_sidecar_leverage_tiers(mocker, default_conf, sidecar):
+    tiers = {"ETH/USDT:USDT": [{"minNotional": 0}]}
+    sidecar._exchange.load_leverage_tiers = MagicMock(return_value=tiers)
+    bot = get_bot_exchange(mocker, default_conf, sidecar)
+    assert bot._load_shared_leverage_tiers() is None
+    bot.trading_mode = "futures"
+    assert bot._load_shared_leverage_tiers() == tiers
+    assert bot._load_shared_leverage_tiers() == tiers
+    assert sidecar._exchange.load_leverage_tiers.call_count == 1
+
+    bot._market_data = MarketDataClient("does-not-exist.sock")
+    assert bot._load_shared_leverage_tiers() is None
+
+
+def test_sidecar_socket(sidecar, tmp_path):
+    sidecar.socket_path = str(tmp_path / "sidecar.sock")
+    sidecar.bucket = TokenBucket(refill_rate=0.01)
+    thread = Thread(target=sidecar.serve_forever, daemon=True)
+    thread.start()
+    for _ in range(100):
+        if (tmp_path / "sidecar.sock").exists():
+            break
+        time.sleep(0.01)
+
+    key_path = tmp_path / "sidecar.sock.key"
+    assert key_path.stat().st_mode & 0o777 == 0o600
+
+    client = MarketDataClient(sidecar.socket_path)
+    try:
+        # Connections without the key are rejected before any message is exchanged
+        with pytest.raises(AuthenticationError):
+            Client(sidecar.socket_path, family="AF_UNIX", authkey=b"wrong")
+        assert client.throttle() == 0
+        # Bucket is empty - the next request has to wait
+        assert client.throttle() > 50
+        assert client.tickers() == {"ETH/BTC": {"last": 1.0}}
+        res = client.ohlcv([("ETH/BTC", "5m", CandleType.SPOT, None)])
+        assert res[0][0] == "ETH/BTC"
+        assert len(res[0][3]) == 2
+        # Exceptions raised within the sidecar are re-raised
+        with pytest.raises(ValueError, match=r"Unknown method foo"):
+            client._request("foo")
+    finally:
+        sidecar.stop()
+        thread.join(5)
+
+    assert not thread.is_alive()
+    assert not (tmp_path / "sidecar.sock").exists()
+    assert not key_path.exists()
+    with pytest.raises(ConnectionError, match=r"Market data sidecar not available"):
+        client.tickers()
+    client.close()
+
+
+def test_sidecar_socket_dir_not_private(sidecar, tmp_path):
+    socket_dir = tmp_path / "shared"
+    socket_dir.mkdir(mode=0o777)
+    socket_dir.chmod(0o777)
+    sidecar.socket_path = str(socket_dir / "sidecar.sock")
+    with pytest.raises(PermissionError, match=r"accessible by other users"):
+        sidecar.serve_forever()
+
+    # Clients refuse keys other users could have written
+    key_path = socket_dir / "sidecar.sock.key"
+    key_path.write_bytes(b"key")
+    key_path.chmod(0o644)
+    with pytest.raises(ConnectionError, match=r"accessible by other users"):
+        MarketDataClient(sidecar.socket_path).tickers()
+
+
+async def test_sidecar_async_throttle(sidecar):
+    client = InProcessMarketDataClient(sidecar)
+    sidecar.bucket = TokenBucket(refill_rate=1000, capacity=1)
+    threads = []
+    orig = sidecar.handle
+
+    def handle(method, *args):
+        threads.append(get_ident())
+        return orig(method, *args)
+
+    sidecar.handle = handle
+    local = get_mock_coro()
+    api_async = MagicMock(throttle=local)
+    install_shared_throttler(client, MagicMock(), api_async)
+    await api_async.throttle()
+    await api_async.throttle()
+    # The socket round trip runs outside of the event loop's thread
+    assert len(threads) == 2
+    assert get_ident() not in threads
+    assert local.call_count == 0
+
+
+def test_sidecar_shared_throttle(mocker, default_conf, sidecar):
+    sleep_mock = mocker.patch("freqtrade.exchange.market_data_sidecar.time.sleep")
+    default_conf["exchange"]["market_data_sidecar"] = {
+        "enabled": True,
+        "socket": "does-not-exist.sock",
+    }
+    local_throttles = []
+
+    def init_ccxt(*args, **kwargs):
+        api_mock = MagicMock()
+        local_throttles.append(api_mock.throttle)
+        return api_mock
+
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}._init_ccxt", side_effect=init_ccxt)
+    exchange = ExchangeResolver.load_exchange(default_conf)
+    local_throttle = local_throttles[0]
+    assert exchange._market_data.socket_path == "does-not-exist.sock"
+    # Sidecar not available - ccxt's own throttling is used
+    exchange._api.throttle(2)
+    local_throttle.assert_called_once_with(2)
+
+    exchange._market_data = InProcessMarketDataClient(sidecar)
+    install_shared_throttler(exchange._market_data, exchange._api, exchange._api_async)
+    sidecar.bucket = TokenBucket(refill_rate=10, capacity=1)
+    exchange._api.throttle()
+    assert sleep_mock.call_count == 0
+    exchange._api.throttle(2)
+    sleep_mock.assert_called_once()
+    assert sleep_mock.call_args[0][0] == pytest.approx(0.2, abs=0.01)
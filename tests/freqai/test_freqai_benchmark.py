@@ -0,0 +1,124 @@
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from freqtrade.commands.freqai_commands import start_freqai_benchmark
+from freqtrade.exceptions import OperationalException
+from freqtrade.freqai.benchmark import BENCHMARK_STAGES, FreqaiBenchmark, StageProfiler
+from tests.conftest import get_args
+from tests.freqai.conftest import (
+    is_mac,
+    make_rl_config,
+    mock_pytorch_mlp_model_training_parameters,
+)
+
+
+def test_start_freqai_benchmark(mocker):
+    benchmark_mock = MagicMock()
+    mocker.patch("freqtrade.freqai.benchmark.FreqaiBenchmark", benchmark_mock)
+    args = [
+        "freqai-benchmark",
+        "--strategy",
+        "freqai_test_strat",
+        "--strategy-path",
+        str(Path(__file__).parent.parent / "strategy/strats"),
+        "--freqaimodel",
+        "LightGBMRegressor",
+        "--benchmark-pairs",
+        "3",
+        "--benchmark-candles",
+        "500",
+    ]
+    pargs = get_args(args)
+    pargs["config"] = None
+
+    start_freqai_benchmark(pargs)
+    assert benchmark_mock.call_count == 1
+    config = benchmark_mock.call_args[0][0]
+    assert config["freqai_benchmark_pairs"] == 3
+    assert config["freqai_benchmark_candles"] == 500
+    assert benchmark_mock.return_value.start.call_count == 1
+    assert benchmark_mock.return_value.print_results.call_count == 1
+
+
+def test_freqai_benchmark_disabled(freqai_conf):
+    freqai_conf["freqai"]["enabled"] = False
+    with pytest.raises(OperationalException, match=r"FreqAI must be enabled.*"):
+        FreqaiBenchmark(freqai_conf)
+
+
+def test_stage_profiler():
+    profiler = StageProfiler(sample_interval=0.001)
+    calls = []
+
+    class Model:
+        def fit(self, data):
+            calls.append(data)
+            time.sleep(0.05)
+            return np.ones(1_000_000)
+
+    model = Model()
+    with profiler:
+        for _ in range(2):
+            with profiler.instrument(model, "fit", "train"):
+                with profiler.measure("data_cleaning_train"):
+                    time.sleep(0.01)
+                    model.fit(1)
+                    model.fit(2)
+            profiler.finish_run()
+
+    assert calls == [1, 2, 1, 2]
+    # Instrumentation is removed again
+    assert "fit" not in vars(model)
+    assert len(profiler.results["train"]) == 2
+    assert len(profiler.results["data_cleaning_train"]) == 2
+    for train, cleaning in zip(profiler.results["train"], profiler.results["data_cleaning_train"]):
+        # Time spent in fit() isn't attributed to the surrounding stage
+        assert train["time"] >= 0.1
+        assert cleaning["time"] < train["time"]
+        # Allocations within fit() are attributed to the "train" stage
+        assert train["memory"] >= 8_000_000
+        assert cleaning["memory"] < train["memory"]
+        assert train["rss"] >= 0
+
+
+@pytest.mark.parametrize(
+    "model", ["LightGBMRegressor", "PyTorchMLPRegressor", "ReinforcementLearner"]
+)
+def test_freqai_benchmark(freqai_conf, model, capsys):
+    if model != "LightGBMRegressor" and is_mac():
+        pytest.skip("Reinforcement learning / PyTorch module not available on intel based Mac OS.")
+    freqai_conf.update(
+        {
+            "freqaimodel": model,
+            "freqai_benchmark_pairs": 2,
+            "freqai_benchmark_candles": 600,
+            "strategy-path": "tests/strategy/strats",
+        }
+    )
+    if "PyTorch" in model:
+        freqai_conf["freqai"]["model_training_parameters"].update(
+            mock_pytorch_mlp_model_training_parameters()
+        )
+    if "ReinforcementLearner" in model:
+        freqai_conf = make_rl_config(freqai_conf)
+    benchmark = FreqaiBenchmark(freqai_conf)
+    assert benchmark.pairs == ["BENCH0/USDT", "BENCH1/USDT"]
+    ohlcv = benchmark.generate_ohlcv("1h")
+    assert len(ohlcv) == 50
+    assert (ohlcv["high"] >= ohlcv[["open", "close"]].max(axis=1)).all()
+    assert (ohlcv["low"] <= ohlcv[["open", "close"]].min(axis=1)).all()
+
+    results = benchmark.start()
+    for stage in BENCHMARK_STAGES:
+        assert len(results[stage]) == 2
+        assert all(r["time"] > 0 and r["memory"] >= 0 and r["rss"] >= 0 for r in results[stage])
+    assert not benchmark.freqai.full_path.exists()
+
+    benchmark.print_results()
+    captured = capsys.readouterr()
+    assert "FreqAI benchmark" in captured.out
+    assert "populate_features" in captured.out
@@ -1,6 +1,7 @@
 import shutil
+from datetime import timedelta
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pytest
@@ -15,6 +16,8 @@ from tests.freqai.conftest import get_patched_freqai_strategy
 
 def test_update_historic_data(mocker, freqai_conf):
     freqai_conf["runmode"] = "backtest"
+    # retention window larger than the available data - no trimming
+    freqai_conf["freqai"]["train_period_days"] = 30
     strategy = get_patched_freqai_strategy(mocker, freqai_conf)
     exchange = get_patched_exchange(mocker, freqai_conf)
     strategy.dp = DataProvider(freqai_conf, exchange)
@@ -37,6 +40,78 @@ def test_update_historic_data(mocker, freqai_conf):
     shutil.rmtree(Path(freqai.dk.full_path))
 
 
+def test_update_historic_data_trims_history(mocker, freqai_conf):
+    freqai_conf["runmode"] = "backtest"
+    freqai_conf["freqai"]["train_period_days"] = 1
+    freqai_conf["startup_candle_count"] = 10
+    strategy = get_patched_freqai_strategy(mocker, freqai_conf)
+    exchange = get_patched_exchange(mocker, freqai_conf)
+    strategy.dp = DataProvider(freqai_conf, exchange)
+    freqai = strategy.freqai
+    freqai.live = True
+    freqai.dk = FreqaiDataKitchen(freqai_conf)
+    freqai.dk.live = True
+    timerange = TimeRange.parse_timerange("20180110-20180114")
+    freqai.dd.load_all_pair_histories(timerange, freqai.dk)
+    freqai.dk.pair = "ADA/BTC"
+
+    assert freqai.dd.get_history_retention() == timedelta(days=1, minutes=100)
+    freqai.dd.update_historic_data(strategy, freqai.dk)
+
+    dp_df = strategy.dp.get_pair_dataframe("ADA/BTC", "5m")
+    hist_df = freqai.dd.historic_data["ADA/BTC"]["5m"].to_dataframe()
+    assert hist_df["date"].iloc[-1] == dp_df["date"].iloc[-1]
+    assert hist_df["date"].iloc[0] == dp_df["date"].iloc[-1] - timedelta(days=1, minutes=100)
+    assert freqai.dd.current_candle == dp_df["date"].iloc[-1]
+    pd.testing.assert_frame_equal(
+        hist_df, dp_df.loc[dp_df["date"] >= hist_df["date"].iloc[0]].reset_index(drop=True)
+    )
+    # No new candles - nothing changes
+    freqai.dd.update_historic_data(strategy, freqai.dk)
+    assert len(freqai.dd.historic_data["ADA/BTC"]["5m"]) == len(hist_df)
+    shutil.rmtree(Path(freqai.dk.full_path))
+
+
+def test_candle_buffer():
+    from freqtrade.freqai.candle_buffer import CandleBuffer
+
+    dates = pd.date_range("2023-01-01", periods=100, freq="5min", tz="UTC")
+    df = pd.DataFrame({"date": dates, "close": range(100), "volume": 1.0})
+    buffer = CandleBuffer(df.iloc[:10], min_capacity=16)
+    assert len(buffer) == 10
+    assert buffer.capacity == 20
+    assert buffer.last_date == dates[9]
+
+    for i in range(10, 100, 5):
+        buffer.append(df.iloc[i : i + 5])
+    assert len(buffer) == 100
+    pd.testing.assert_frame_equal(buffer.to_dataframe(), df)
+
+    buffer.trim(dates[40])
+    assert len(buffer) == 60
+    pd.testing.assert_frame_equal(buffer.to_dataframe(), df.iloc[40:].reset_index(drop=True))
+    capacity = buffer.capacity
+    # trimmed rows are reused once the buffer has to grow
+    buffer.append(df.iloc[:0])
+    buffer.trim(dates[90])
+    buffer.append(
+        pd.DataFrame(
+            {
+                "date": pd.date_range(dates[-1], periods=11, freq="5min", tz="UTC")[1:],
+                "close": range(100, 110),
+                "volume": 1.0,
+            }
+        )
+    )
+    assert len(buffer) == 20
+    assert buffer.capacity <= capacity
+    assert buffer.to_dataframe()["close"].tolist() == list(range(90, 110))
+
+    sliced = buffer.to_dataframe(dates[95], dates[98])
+    assert sliced["close"].tolist() == [95, 96, 97]
+    assert str(sliced["date"].dtype) == "datetime64[ns, UTC]"
+
+
 def test_load_all_pairs_histories(mocker, freqai_conf):
     strategy = get_patched_freqai_strategy(mocker, freqai_conf)
     exchange = get_patched_exchange(mocker, freqai_conf)
@@ -237,3 +312,124 @@ def test_set_initial_return_values_warning(mocker, freqai_conf):
 
     # Ensure logger error is not called
     mock_logger_warning.assert_called()
+
+
+def test_model_cache_lru_eviction():
+    from freqtrade.freqai.model_cache import ModelCache
+
+    def entry(pair, size):
+        return {
+            "pair": pair,
+            "model": object(),
+            "metadata": {},
+            "feature_pipeline": None,
+            "label_pipeline": None,
+            "size": size,
+        }
+
+    cache = ModelCache(max_size_mb=3 / 1024)  # 3 kB
+    cache.store("a", entry("ADA/BTC", 1024))
+    cache.store("b", entry("ETH/BTC", 1024))
+    cache.store("c", entry("LTC/BTC", 1024))
+    assert len(cache) == 3
+    # access "a" so "b" becomes the least recently used entry
+    assert cache.get("a") is not None
+    cache.store("d", entry("DASH/BTC", 1024))
+    assert "b" not in cache
+    assert "a" in cache
+    assert cache.current_size == 3 * 1024
+    assert cache.get("b") is None
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+    # entries larger than the cache are not stored
+    cache.store("e", entry("XRP/BTC", 4 * 1024))
+    assert "e" not in cache
+
+    cache.invalidate_pair("ADA/BTC")
+    assert "a" not in cache
+    assert cache.current_size == 2 * 1024
+
+    disabled = ModelCache(max_size_mb=0)
+    assert not disabled.enabled
+    disabled.store("a", entry("ADA/BTC", 1))
+    assert len(disabled) == 0
+
+
+def test_load_data_model_cache(mocker, freqai_conf):
+    freqai_conf.update({"timerange": "20180110-20180130"})
+    strategy = get_patched_freqai_strategy(mocker, freqai_conf)
+    exchange = get_patched_exchange(mocker, freqai_conf)
+    strategy.dp = DataProvider(freqai_conf, exchange)
+    strategy.freqai_info = freqai_conf.get("freqai", {})
+    freqai = strategy.freqai
+    freqai.live = True
+    freqai.dk = FreqaiDataKitchen(freqai_conf)
+    freqai.dk.live = True
+    timerange = TimeRange.parse_timerange("20180110-20180130")
+    freqai.dd.load_all_pair_histories(timerange, freqai.dk)
+    freqai.dd.pair_dict = {"ADA/BTC": dict(freqai.dd.empty_pair_dict)}
+
+    data_load_timerange = TimeRange.parse_timerange("20180125-20180130")
+    new_timerange = TimeRange.parse_timerange("20180127-20180130")
+    freqai.dk.set_paths("ADA/BTC", None)
+    freqai.extract_data_and_train_model(
+        new_timerange, "ADA/BTC", strategy, freqai.dk, data_load_timerange
+    )
+    # Training stores the new model in the cache
+    assert len(freqai.dd.model_cache) == 1
+    assert freqai.dd.model_cache.current_size > 0
+
+    # Simulate a restart of the drawer's in-memory model state
+    freqai.dd.model_dictionary = {}
+    freqai.dd.meta_data_dictionary = {}
+    load_mock = mocker.spy(freqai.dd, "_load_metadata_and_pipelines")
+    model_mock = mocker.spy(freqai.dd, "_load_model")
+
+    dk = FreqaiDataKitchen(freqai_conf, live=True)
+    model = freqai.dd.load_data("ADA/BTC", dk)
+    assert model is not None
+    assert dk.feature_pipeline is not None
+    assert dk.training_features_list
+    assert load_mock.call_count == 0
+    assert model_mock.call_count == 0
+    assert freqai.dd.model_cache.hits == 1
+
+    # cache miss loads from disk and fills the cache
+    freqai.dd.model_cache.clear()
+    freqai.dd.model_dictionary = {}
+    dk = FreqaiDataKitchen(freqai_conf, live=True)
+    assert freqai.dd.load_data("ADA/BTC", dk) is not None
+    assert load_mock.call_count == 1
+    assert model_mock.call_count == 1
+    assert len(freqai.dd.model_cache) == 1
+
+    # prefetch is a no-op once the model is cached
+    freqai.dd.prefetch_data("ADA/BTC", FreqaiDataKitchen(freqai_conf, live=True))
+    assert load_mock.call_count == 1
+    freqai.dd.model_cache.clear()
+    # Model files of pairs in training are about to be rewritten
+    freqai.dd.pairs_in_training.add("ADA/BTC")
+    assert not freqai.dd.needs_prefetch("ADA/BTC")
+    freqai.dd.prefetch_data("ADA/BTC", FreqaiDataKitchen(freqai_conf, live=True))
+    assert load_mock.call_count == 1
+    freqai.dd.pairs_in_training.clear()
+    assert freqai.dd.needs_prefetch("ADA/BTC")
+    freqai.dd.prefetch_data("ADA/BTC", FreqaiDataKitchen(freqai_conf, live=True))
+    assert load_mock.call_count == 2
+    assert len(freqai.dd.model_cache) == 1
+    assert not freqai.dd.needs_prefetch("ADA/BTC")
+
+    # Only one prefetch thread runs at a time, and only for pairs not cached yet
+    thread_mock = mocker.patch("freqtrade.freqai.freqai_interface.threading.Thread")
+    strategy.dp.current_whitelist = MagicMock(return_value=["ETH/BTC", "ADA/BTC"])
+    freqai.prefetch_next_model("ETH/BTC", strategy)
+    assert thread_mock.call_count == 0
+    freqai.dd.model_cache.clear()
+    freqai.prefetch_next_model("ETH/BTC", strategy)
+    assert thread_mock.call_count == 1
+    thread_mock.return_value.is_alive.return_value = True
+    freqai.prefetch_next_model("ETH/BTC", strategy)
+    assert thread_mock.call_count == 1
+
+    shutil.rmtree(Path(freqai.dk.full_path))
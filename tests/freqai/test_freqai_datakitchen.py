@@ -201,3 +201,122 @@ def test_populate_features(mocker, freqai_conf):
     )
 
     assert df.iloc[0]["date"].strftime("%Y-%m-%d %H:%M:%S") == "2018-01-15 00:00:00"
+
+
+def test_concat_features_matches_merge_features(mocker, freqai_conf):
+    strategy = get_patched_freqai_strategy(mocker, freqai_conf)
+    exchange = get_patched_exchange(mocker, freqai_conf)
+    strategy.dp = DataProvider(freqai_conf, exchange)
+    strategy.freqai_info = freqai_conf.get("freqai", {})
+    freqai = strategy.freqai
+    freqai.dk = FreqaiDataKitchen(freqai_conf)
+    timerange = TimeRange.parse_timerange("20180115-20180130")
+    freqai.dd.load_all_pair_histories(timerange, freqai.dk)
+    _, base_df = freqai.dd.get_base_and_corr_dataframes(timerange, "LTC/BTC", freqai.dk)
+    informative = base_df["5m"]
+
+    feature_dfs = []
+    for t in [10, 20]:
+        feature_dfs.append(
+            (
+                strategy.feature_engineering_expand_all(
+                    informative.copy(), t, metadata={"pair": "LTC/BTC", "tf": "5m"}
+                ),
+                f"{t}",
+            )
+        )
+    expected = informative
+    for df, suffix in feature_dfs:
+        expected = freqai.dk.merge_features(expected, df, "5m", "5m", suffix)
+
+    result = freqai.dk.concat_features(informative, feature_dfs, "5m")
+    pd.testing.assert_frame_equal(result, expected)
+
+    # Misaligned dataframes fall back to merging
+    feature_dfs[0] = (feature_dfs[0][0].iloc[5:], feature_dfs[0][1])
+    merge_mock = mocker.spy(freqai.dk, "merge_features")
+    freqai.dk.concat_features(informative, feature_dfs, "5m")
+    assert merge_mock.call_count == 2
+
+
+def test_populate_features_feature_cache(mocker, freqai_conf):
+    strategy = get_patched_freqai_strategy(mocker, freqai_conf)
+    exchange = get_patched_exchange(mocker, freqai_conf)
+    strategy.dp = DataProvider(freqai_conf, exchange)
+    strategy.freqai_info = freqai_conf.get("freqai", {})
+    freqai = strategy.freqai
+    freqai.dk = FreqaiDataKitchen(freqai_conf)
+    timerange = TimeRange.parse_timerange("20180115-20180130")
+    freqai.dd.load_all_pair_histories(timerange, freqai.dk)
+
+    expand_all = mocker.spy(strategy, "feature_engineering_expand_all")
+    results = []
+    for pair in ["LTC/BTC", "ETH/BTC"]:
+        dk = FreqaiDataKitchen(freqai_conf, feature_cache=freqai.dd.feature_cache)
+        corr_df, base_df = freqai.dd.get_base_and_corr_dataframes(timerange, pair, dk)
+        results.append(
+            dk.populate_features(
+                base_df["5m"], "ADA/BTC", strategy, corr_df, base_df, is_corr_pairs=True
+            )
+        )
+
+    # Features of the corr pair are only calculated once for both base pairs.
+    assert expand_all.call_count == 1
+    assert freqai.dd.feature_cache.hits == 1
+    assert freqai.dd.feature_cache.misses == 1
+    assert len(freqai.dd.feature_cache) == 1
+    assert "%-rsi-period_10_ADA/BTC_5m" in results[0].columns
+    pd.testing.assert_frame_equal(
+        results[0].filter(like="ADA/BTC"), results[1].filter(like="ADA/BTC")
+    )
+
+    # Without feature cache, features are recalculated
+    dk = FreqaiDataKitchen(freqai_conf)
+    corr_df, base_df = freqai.dd.get_base_and_corr_dataframes(timerange, "LTC/BTC", dk)
+    dk.populate_features(base_df["5m"], "ADA/BTC", strategy, corr_df, base_df, True)
+    assert expand_all.call_count == 2
+
+
+@pytest.mark.skipif(is_mac(), reason="PyTorch module not available on intel based Mac OS.")
+def test_write_feature_store(mocker, freqai_conf, tmp_path):
+    import numpy as np
+    import torch
+
+    from freqtrade.freqai.torch.datasets import (
+        MemmapDataset,
+        MemmapWindowDataset,
+        WindowDataset,
+    )
+
+    dk = get_patched_data_kitchen(mocker, freqai_conf)
+    dk.data_path = tmp_path / "sub-train-ADA_1"
+    features = pd.DataFrame(np.random.rand(50, 4), columns=[f"%-f{i}" for i in range(4)])
+    labels = pd.DataFrame({"&-s_close": np.random.rand(50)})
+    data_dictionary = {"train_features": features, "train_labels": labels}
+
+    feature_store = dk.write_feature_store(data_dictionary, ["train"], chunk_size=7)
+    assert feature_store["train"].is_file()
+    stored = np.load(feature_store["train"], mmap_mode="r")
+    assert stored.dtype == np.float32
+    np.testing.assert_array_equal(stored, features.to_numpy(dtype=np.float32))
+
+    x = torch.tensor(features.values, dtype=torch.float32)
+    y = torch.tensor(labels.values, dtype=torch.float32)
+    indices = [0, 3, 4, 17]
+    dataset = MemmapDataset(feature_store["train"], y)
+    xb, yb = dataset[indices]
+    assert torch.equal(xb, x[indices])
+    assert torch.equal(yb, y[indices])
+
+    window_dataset = WindowDataset(x, y, 10)
+    memmap_window_dataset = MemmapWindowDataset(feature_store["train"], y, 10)
+    assert len(memmap_window_dataset) == len(window_dataset)
+    xb, yb = memmap_window_dataset[indices]
+    assert xb.shape == (4, 10, 4)
+    for i, index in enumerate(indices):
+        window_x, window_y = window_dataset[index]
+        assert torch.equal(xb[i], window_x)
+        assert torch.equal(yb[i], window_y)
+
+    dk.remove_feature_store()
+    assert not (dk.data_path / "feature_store").exists()
@@ -128,6 +128,54 @@ def test_extract_data_and_train_model_Standard(
     shutil.rmtree(Path(freqai.dk.full_path))
 
 
+@pytest.mark.parametrize(
+    "model, strat",
+    [
+        ("PyTorchMLPRegressor", "freqai_test_strat"),
+        ("PyTorchTransformerRegressor", "freqai_test_strat"),
+        ("PyTorchMLPClassifier", "freqai_test_classifier"),
+    ],
+)
+def test_extract_data_and_train_model_feature_store(mocker, freqai_conf, model, strat):
+    can_run_model(model)
+
+    freqai_conf.update({"freqaimodel": model})
+    freqai_conf.update({"timerange": "20180110-20180130"})
+    freqai_conf.update({"strategy": strat})
+    pytorch_mlp_mtp = mock_pytorch_mlp_model_training_parameters()
+    pytorch_mlp_mtp["trainer_kwargs"]["use_feature_store"] = True
+    freqai_conf["freqai"]["model_training_parameters"].update(pytorch_mlp_mtp)
+    if "Transformer" in model:
+        freqai_conf.update({"conv_width": 10})
+
+    strategy = get_patched_freqai_strategy(mocker, freqai_conf)
+    exchange = get_patched_exchange(mocker, freqai_conf)
+    strategy.dp = DataProvider(freqai_conf, exchange)
+    strategy.freqai_info = freqai_conf.get("freqai", {})
+    freqai = strategy.freqai
+    freqai.live = True
+    freqai.activate_tensorboard = False
+    freqai.dk = FreqaiDataKitchen(freqai_conf)
+    freqai.dk.live = True
+    timerange = TimeRange.parse_timerange("20180110-20180130")
+    freqai.dd.load_all_pair_histories(timerange, freqai.dk)
+    freqai.dd.pair_dict = MagicMock()
+
+    write_mock = mocker.spy(freqai.dk, "write_feature_store")
+    data_load_timerange = TimeRange.parse_timerange("20180125-20180130")
+    new_timerange = TimeRange.parse_timerange("20180127-20180130")
+    freqai.dk.set_paths("ADA/BTC", None)
+    freqai.extract_data_and_train_model(
+        new_timerange, "ADA/BTC", strategy, freqai.dk, data_load_timerange
+    )
+
+    assert write_mock.call_count == 1
+    assert Path(freqai.dk.data_path / f"{freqai.dk.model_filename}_model.zip").is_file()
+    assert not (freqai.dk.data_path / "feature_store").exists()
+
+    shutil.rmtree(Path(freqai.dk.full_path))
+
+
 @pytest.mark.parametrize(
     "model, strat",
     [
@@ -107,6 +107,29 @@ def test_process_calls_sendmsg(mocker, default_conf_usdt) -> None:
     assert freqtrade.rpc.process_msg_queue.call_count == 1
 
 
+def test_process_batch_commits(mocker, default_conf_usdt) -> None:
+    uow_mock = mocker.patch("freqtrade.freqtradebot.unit_of_work")
+    freqtrade = get_patched_freqtradebot(mocker, default_conf_usdt)
+    freqtrade.process()
+    assert uow_mock.call_count == 0
+
+    init_mock = mocker.patch("freqtrade.freqtradebot.init_db")
+    default_conf_usdt["db_options"] = {
+        "sqlite_journal_mode": "WAL",
+        "sqlite_synchronous": "NORMAL",
+        "batch_commits": True,
+    }
+    freqtrade = get_patched_freqtradebot(mocker, default_conf_usdt)
+    init_mock.assert_called_once_with(
+        default_conf_usdt["db_url"], sqlite_journal_mode="WAL", sqlite_synchronous="NORMAL"
+    )
+    freqtrade.process()
+    # Order management, exits and entries
+    assert uow_mock.call_count == 3
+    freqtrade.process_orders()
+    assert uow_mock.call_count == 4
+
+
 def test_bot_cleanup(mocker, default_conf_usdt, caplog) -> None:
     mock_cleanup = mocker.patch("freqtrade.freqtradebot.Trade.commit")
     coo_mock = mocker.patch("freqtrade.freqtradebot.FreqtradeBot.cancel_all_open_orders")
@@ -627,6 +650,88 @@ def test_create_trades_multiple_trades(
     assert len(trades) == max(int(max_open * modifier), 0)
 
 
+def test_enter_exit_positions_concurrent(
+    default_conf_usdt, ticker_usdt, fee, mocker, limit_buy_order_usdt, caplog
+) -> None:
+    patch_RPCManager(mocker)
+    patch_exchange(mocker)
+    default_conf_usdt["max_open_trades"] = 3
+    default_conf_usdt["stake_amount"] = 60
+    default_conf_usdt["dry_run_wallet"] = 150
+
+    def create_orders(orders):
+        res = []
+        for o in orders:
+            if o["pair"] == "LTC/USDT":
+                res.append(ExchangeError("Something happened"))
+                continue
+            order = deepcopy(limit_buy_order_usdt)
+            order.update({"id": f"{o['pair']}-{o['side']}", "symbol": o["pair"], "side": o["side"]})
+            res.append(order)
+        return res
+
+    create_orders_mock = MagicMock(side_effect=create_orders)
+    create_order_mock = MagicMock()
+    mocker.patch.multiple(
+        EXMS,
+        fetch_ticker=ticker_usdt,
+        create_order=create_order_mock,
+        create_orders=create_orders_mock,
+        get_fee=fee,
+        _dry_is_price_crossed=MagicMock(return_value=False),
+    )
+    freqtrade = FreqtradeBot(default_conf_usdt)
+    freqtrade.active_pair_whitelist = ["LTC/USDT", "ETH/USDT", "XRP/USDT", "NEO/USDT"]
+    patch_get_signal(freqtrade)
+
+    n = freqtrade.enter_positions()
+    # All entries were placed with one call
+    assert create_orders_mock.call_count == 1
+    assert create_order_mock.call_count == 0
+    orders = create_orders_mock.call_args[0][0]
+    # Stake is reserved for prepared entries - 150 USDT are sufficient for 2 entries only.
+    assert [o["pair"] for o in orders] == ["LTC/USDT", "ETH/USDT"]
+    assert log_has_re(r"Unable to create trade for XRP/USDT: Available balance.*", caplog)
+    # The failed order doesn't create a trade
+    assert log_has("Unable to create trade for LTC/USDT: Something happened", caplog)
+    assert n == 1
+    trades = Trade.get_open_trades()
+    assert len(trades) == 1
+    assert trades[0].pair == "ETH/USDT"
+    assert freqtrade.wallets._reserved_stake == 0
+    assert freqtrade.get_free_open_trades() == 2
+
+    # Retry LTC/USDT - which was reserved, but failed.
+    freqtrade.active_pair_whitelist = ["LTC/USDT", "ETH/USDT"]
+    caplog.clear()
+    create_orders_mock.side_effect = None
+    ltc_order = deepcopy(limit_buy_order_usdt)
+    ltc_order.update({"id": "LTC/USDT-buy", "symbol": "LTC/USDT"})
+    create_orders_mock.return_value = [ltc_order]
+    n = freqtrade.enter_positions()
+    assert n == 1
+    assert len(Trade.get_open_trades()) == 2
+    create_orders_mock.side_effect = create_orders
+
+    create_orders_mock.reset_mock()
+    patch_get_signal(freqtrade, enter_long=False, exit_long=True)
+    n = freqtrade.exit_positions(Trade.get_open_trades())
+    assert create_orders_mock.call_count == 1
+    orders = create_orders_mock.call_args[0][0]
+    assert [(o["pair"], o["side"]) for o in orders] == [("ETH/USDT", "sell"), ("LTC/USDT", "sell")]
+    assert create_order_mock.call_count == 0
+    # Failed exits are not counted, and retried in the next iteration
+    assert n == 1
+    assert log_has("Unable to exit trade LTC/USDT: Something happened", caplog)
+    trades = Trade.get_open_trades()
+    assert len(trades) == 1
+    assert trades[0].pair == "LTC/USDT"
+    assert not trades[0].has_open_orders
+    trade = Trade.get_trades_proxy(pair="ETH/USDT")[0]
+    assert trade.is_open is False
+    assert trade.exit_reason == ExitType.EXIT_SIGNAL.value
+
+
 def test_create_trades_preopen(
     default_conf_usdt, ticker_usdt, fee, mocker, limit_buy_order_usdt_open, caplog
 ) -> None:
@@ -1955,6 +2060,68 @@ def test_manage_open_orders_entry(
     assert freqtrade.strategy.adjust_entry_price.call_count == 0
 
 
+def test_reconcile_open_orders(
+    default_conf_usdt, ticker_usdt, limit_buy_order_old, open_trade, fee, mocker
+) -> None:
+    patch_RPCManager(mocker)
+    order = Order.parse_from_ccxt_object(limit_buy_order_old, "mocked", "buy")
+    open_trade.orders[0] = order
+    fetch_order_mock = MagicMock(return_value=limit_buy_order_old)
+    fetch_orders_bulk_mock = MagicMock(return_value={order.order_id: limit_buy_order_old})
+    patch_exchange(mocker)
+    mocker.patch.multiple(
+        EXMS,
+        fetch_ticker=ticker_usdt,
+        fetch_order=fetch_order_mock,
+        fetch_orders_bulk=fetch_orders_bulk_mock,
+        cancel_order_with_result=MagicMock(return_value=limit_buy_order_old),
+        get_fee=fee,
+    )
+    freqtrade = FreqtradeBot(default_conf_usdt)
+    Trade.session.add(open_trade)
+    Trade.commit()
+    freqtrade.strategy.ft_check_timed_out = MagicMock(return_value=False)
+    freqtrade.replace_order = MagicMock()
+
+    freqtrade.reconcile_open_orders()
+    fetch_orders_bulk_mock.assert_called_once_with([(order.order_id, open_trade.pair, False)])
+    assert freqtrade._prefetched_orders == {order.order_id: limit_buy_order_old}
+
+    # Prefetched order is used instead of fetching it again
+    freqtrade.manage_open_orders()
+    assert fetch_order_mock.call_count == 0
+    assert freqtrade.replace_order.call_count == 1
+    assert freqtrade._prefetched_orders == {}
+
+    # Without prefetched state, the order is fetched individually
+    freqtrade.manage_open_orders()
+    assert fetch_order_mock.call_count == 1
+    assert freqtrade.replace_order.call_count == 2
+
+    # Nothing to reconcile without open orders
+    fetch_orders_bulk_mock.reset_mock()
+    mocker.patch("freqtrade.freqtradebot.Trade.get_open_trades", return_value=[])
+    freqtrade.reconcile_open_orders()
+    assert fetch_orders_bulk_mock.call_count == 0
+
+
+def test_process_orders(default_conf_usdt, mocker) -> None:
+    freqtrade = get_patched_freqtradebot(mocker, default_conf_usdt)
+    reconcile_mock = mocker.patch.object(freqtrade, "reconcile_open_orders")
+    manage_mock = mocker.patch.object(freqtrade, "manage_open_orders")
+    refresh_mock = mocker.patch.object(freqtrade.dataprovider, "refresh")
+    enter_mock = mocker.patch.object(freqtrade, "enter_positions")
+    exit_mock = mocker.patch.object(freqtrade, "exit_positions")
+
+    freqtrade.process_orders()
+    assert reconcile_mock.call_count == 1
+    assert manage_mock.call_count == 1
+    # No candle refresh, analysis, exits or entries
+    assert refresh_mock.call_count == 0
+    assert enter_mock.call_count == 0
+    assert exit_mock.call_count == 0
+
+
 @pytest.mark.parametrize("is_short", [False, True])
 def test_adjust_entry_cancel(
     default_conf_usdt,
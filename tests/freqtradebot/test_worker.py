@@ -7,6 +7,7 @@ import time_machine
 
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.enums import State
+from freqtrade.exceptions import OperationalException, TemporaryError
 from freqtrade.worker import Worker
 from tests.conftest import EXMS, get_patched_worker, log_has, log_has_re
 
@@ -189,3 +190,62 @@ def test_worker_heartbeat_stopped(default_conf, mocker, caplog):
     worker._heartbeat_msg -= 70
     worker._worker(old_state=State.STOPPED)
     assert log_has_re(message, caplog)
+
+
+def test_worker_candle_close_scheduling(mocker, default_conf) -> None:
+    default_conf["timeframe"] = "5m"
+    default_conf["internals"] = {
+        "process_throttle_secs": 10,
+        "candle_close_scheduling": True,
+        "candle_close_offset": 2,
+    }
+    worker = get_patched_worker(mocker, default_conf)
+    process_mock = mocker.patch("freqtrade.freqtradebot.FreqtradeBot.process")
+    orders_mock = mocker.patch("freqtrade.freqtradebot.FreqtradeBot.process_orders")
+    wait_mock = mocker.patch(f"{EXMS}.wait_for_order_update")
+    throttle_mock = mocker.patch("freqtrade.worker.Worker._throttle")
+
+    with time_machine.travel("2022-09-01 05:01:00 +00:00", tick=False) as t:
+        worker._worker(old_state=State.RUNNING)
+        # Full iteration right away - then wait for order updates until the next interval
+        assert process_mock.call_count == 1
+        assert orders_mock.call_count == 0
+        assert throttle_mock.call_count == 0
+        assert wait_mock.call_args[0][0] == 10
+
+        t.move_to("2022-09-01 05:04:55 +00:00")
+        worker._worker(old_state=State.RUNNING)
+        # Only orders are managed between candles
+        assert process_mock.call_count == 1
+        assert orders_mock.call_count == 1
+        # Wakes up at candle close + offset
+        assert wait_mock.call_args[0][0] == 7
+
+        t.move_to("2022-09-01 05:05:02 +00:00")
+        worker._worker(old_state=State.RUNNING)
+        assert process_mock.call_count == 2
+        assert orders_mock.call_count == 1
+        assert wait_mock.call_args[0][0] == 10
+
+        # Restarting the bot runs a full iteration immediately
+        worker._worker(old_state=State.STOPPED)
+        assert process_mock.call_count == 3
+
+
+def test_worker_process_orders_exceptions(mocker, default_conf) -> None:
+    worker = get_patched_worker(mocker, default_conf)
+    notify_mock = mocker.patch("freqtrade.freqtradebot.FreqtradeBot.notify_status")
+    sleep_mock = mocker.patch("freqtrade.worker.time.sleep")
+    orders_mock = mocker.patch(
+        "freqtrade.freqtradebot.FreqtradeBot.process_orders", side_effect=TemporaryError
+    )
+
+    worker._process_orders()
+    assert sleep_mock.call_count == 1
+    assert worker.freqtrade.state is State.RUNNING
+
+    # e.g. invalid credentials while reconciling orders
+    orders_mock.side_effect = OperationalException("Invalid API key")
+    worker._process_orders()
+    assert worker.freqtrade.state is State.STOPPED
+    assert "OperationalException" in notify_mock.call_args[0][0]
@@ -24,6 +24,7 @@ from freqtrade.exceptions import DependencyException, OperationalException
 from freqtrade.exchange import timeframe_to_next_date, timeframe_to_prev_date
 from freqtrade.optimize.backtest_caching import get_backtest_metadata_filename, get_strategy_run_id
 from freqtrade.optimize.backtesting import Backtesting
+from freqtrade.optimize.funding_fees import FundingFeeIndex
 from freqtrade.persistence import LocalTrade, Trade
 from freqtrade.resolvers import StrategyResolver
 from freqtrade.util.datetime_helpers import dt_utc
@@ -32,6 +33,7 @@ from tests.conftest import (
     EXMS,
     generate_test_data,
     get_args,
+    get_patched_exchange,
     log_has,
     log_has_re,
     patch_exchange,
@@ -975,7 +977,7 @@ def test_backtest_one_detail_futures(
     default_conf_usdt["max_open_trades"] = 10
 
     backtesting = Backtesting(default_conf_usdt)
-    ff_spy = mocker.spy(backtesting.exchange, "calculate_funding_fees")
+    ff_spy = mocker.spy(FundingFeeIndex, "funding_fees")
 
     backtesting._set_strategy(backtesting.strategylist[0])
     backtesting.strategy.populate_entry_trend = advise_entry
@@ -1102,7 +1104,7 @@ def test_backtest_one_detail_futures_funding_fees(
     default_conf_usdt["max_open_trades"] = 1
 
     backtesting = Backtesting(default_conf_usdt)
-    ff_spy = mocker.spy(backtesting.exchange, "calculate_funding_fees")
+    ff_spy = mocker.spy(FundingFeeIndex, "funding_fees")
     backtesting._set_strategy(backtesting.strategylist[0])
     backtesting.strategy.populate_entry_trend = advise_entry
     backtesting.strategy.adjust_trade_position = adjust_trade_position
@@ -2559,3 +2561,35 @@ def test_get_backtest_metadata_filename():
     filename = "backtest_results.json"
     expected = Path("backtest_results.meta.json")
     assert get_backtest_metadata_filename(filename) == expected
+
+
+@pytest.mark.parametrize("is_short", [True, False])
+def test_funding_fee_index(default_conf, mocker, is_short):
+    exchange = get_patched_exchange(mocker, default_conf)
+    dates = pd.date_range("2021-09-01", periods=48, freq="1h", tz="UTC")
+    funding = pd.DataFrame({"date": dates, "open": np.linspace(-0.0005, 0.0008, 48)})
+    mark = pd.DataFrame({"date": dates, "open": np.linspace(2.2, 1.8, 48)})
+    funding.loc[40, "open"] = np.nan
+    df = exchange.combine_funding_and_mark(funding, mark)
+    index = FundingFeeIndex(df)
+
+    for start, end in [(0, 47), (3, 3), (5, 17), (4, 4), (30, 39), (30, 41), (47, 0)]:
+        kwargs = {
+            "amount": 123.0,
+            "is_short": is_short,
+            "open_date": dates[start].to_pydatetime(),
+            "close_date": dates[end].to_pydatetime() + timedelta(minutes=30),
+        }
+        assert pytest.approx(index.funding_fees(**kwargs)) == exchange.calculate_funding_fees(
+            df, **kwargs
+        )
+
+    # Dates between funding intervals
+    assert pytest.approx(
+        index.funding_fees(
+            1, is_short, dates[0].to_pydatetime() + timedelta(minutes=1), dates[1].to_pydatetime()
+        )
+    ) == exchange.calculate_funding_fees(
+        df, 1, is_short, dates[0].to_pydatetime() + timedelta(minutes=1), dates[1].to_pydatetime()
+    )
+    assert FundingFeeIndex(df.iloc[:0]).funding_fees(1, is_short, dates[0], dates[-1]) == 0.0
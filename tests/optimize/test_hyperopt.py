@@ -591,6 +591,7 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
         "params_not_optimized": {"buy": {}, "protection": {}, "sell": {}},
         "results_metrics": ANY,
         "total_profit": 3.1e-08,
+        "backtest_results": backtest_result,
     }
 
     hyperopt = Hyperopt(hyperopt_conf)
@@ -599,6 +600,27 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
     hyperopt.init_spaces()
     generate_optimizer_value = hyperopt.generate_optimizer(list(optimizer_param.values()))
     assert generate_optimizer_value == response_expected
+    assert "trades" not in generate_optimizer_value["results_metrics"]
+
+    # Full statistics are generated for new best epochs
+    hyperopt.current_best_loss = 100
+    mocker.patch.object(hyperopt, "_save_result")
+    mocker.patch.object(hyperopt, "print_results")
+    hyperopt.evaluate_result(generate_optimizer_value, 1, False)
+    assert "backtest_results" not in generate_optimizer_value
+    assert len(generate_optimizer_value["results_metrics"]["trades"]) == 4
+
+    val = hyperopt.generate_optimizer(list(optimizer_param.values()))
+    hyperopt.evaluate_result(val, 2, False)
+    assert "backtest_results" not in val
+    assert not val["is_best"]
+    assert "trades" not in val["results_metrics"]
+
+    # Loss functions may require the full statistics for every epoch
+    hyperopt.lean_epoch_stats = False
+    val = hyperopt.generate_optimizer(list(optimizer_param.values()))
+    assert "backtest_results" not in val
+    assert len(val["results_metrics"]["trades"]) == 4
 
 
 def test_clean_hyperopt(mocker, hyperopt_conf, caplog):
@@ -612,7 +634,7 @@ def test_clean_hyperopt(mocker, hyperopt_conf, caplog):
     unlinkmock = mocker.patch("freqtrade.optimize.hyperopt.Path.unlink", MagicMock())
     h = Hyperopt(hyperopt_conf)
 
-    assert unlinkmock.call_count == 2
+    assert unlinkmock.call_count == 3
     assert log_has(f"Removing `{h.data_pickle_file}`.", caplog)
 
 
@@ -42,16 +42,66 @@ def test_save_results_saves_epochs(hyperopt, tmp_path, caplog) -> None:
     assert hyperopt_epochs[1] == 2
     assert len(hyperopt_epochs[0]) == 2
 
-    result_gen = HyperoptTools._read_results(hyperopt.results_file, 1)
-    epoch = next(result_gen)
-    assert len(epoch) == 1
-    assert epoch[0] == epochs[0]
-    epoch = next(result_gen)
-    assert len(epoch) == 1
-    epoch = next(result_gen)
-    assert len(epoch) == 0
-    with pytest.raises(StopIteration):
-        next(result_gen)
+    assert hyperopt_epochs[0][0] == epochs[0]
+
+    index_file = HyperoptTools.get_index_filename(hyperopt.results_file)
+    assert index_file == tmp_path / "ut_results.fthypt.idx"
+    assert index_file.is_file()
+    hyperopt.clean_hyperopt()
+    assert not hyperopt.results_file.is_file()
+    assert not index_file.is_file()
+
+
+def test_hyperopt_epoch_index(tmp_path, caplog, mocker) -> None:
+    results_file = tmp_path / "ut_results.fthypt"
+    epochs = [
+        {
+            "loss": 10 - i,
+            "current_epoch": i + 1,
+            "is_best": i % 3 == 0,
+            "is_initial_point": i < 2,
+            "is_random": False,
+            "params_details": {"buy": {"buy_rsi": i}},
+            "results_metrics": {"total_trades": i * 10, "profit_total_abs": i - 5.0, "sharpe": i},
+        }
+        for i in range(10)
+    ]
+    for epoch in epochs:
+        HyperoptTools.save_epoch(results_file, epoch)
+    index_file = HyperoptTools.get_index_filename(results_file)
+
+    config = {"hyperopt_list_best": True, "hyperopt_list_min_trades": 20}
+    entries, total = HyperoptTools.load_filtered_index(results_file, config)
+    assert total == 10
+    assert [e["current_epoch"] for e in entries] == [4, 7, 10]
+    assert entries[0]["results_metrics"] == {"total_trades": 30, "profit_total_abs": -2.0}
+    assert "params_details" not in entries[0]
+
+    # Seek to single epochs
+    assert HyperoptTools.load_epochs(results_file, entries[1:2]) == [epochs[6]]
+    assert HyperoptTools.load_filtered_results(results_file, config) == (
+        [epochs[3], epochs[6], epochs[9]],
+        10,
+    )
+
+    # Results from older versions - or an interrupted write - rebuild the index
+    index_file.unlink()
+    assert HyperoptTools.load_filtered_index(results_file, config) == (entries, 10)
+    assert index_file.is_file()
+    with results_file.open("a") as f:
+        f.write(rapidjson.dumps(epochs[0]) + "\n")
+    assert HyperoptTools.load_filtered_index(results_file, {})[1] == 11
+    assert log_has_re(r"Epoch index .* is outdated, rebuilding\.", caplog)
+
+    # Index is not written again if it's up to date
+    build_mock = mocker.spy(HyperoptTools, "_build_index")
+    assert HyperoptTools.load_filtered_index(results_file, {})[1] == 11
+    assert build_mock.call_count == 0
+
+    index_file.unlink()
+    results_file.write_text(rapidjson.dumps({"loss": 1}) + "\n")
+    with pytest.raises(OperationalException, match=r"The file with HyperoptTools results is incom"):
+        HyperoptTools.load_filtered_index(results_file, {})
 
 
 def test_load_previous_results2(mocker, testdatadir, caplog) -> None:
@@ -1,15 +1,19 @@
 # pragma pylint: disable=missing-docstring, W0212, line-too-long, C0103, unused-argument
+import pickle
 from copy import deepcopy
 from pathlib import Path
 from unittest.mock import MagicMock, PropertyMock
 
+import ccxt
 import pytest
+from joblib import parallel_config
 
 from freqtrade.commands.optimize_commands import start_lookahead_analysis
 from freqtrade.data.history import get_timerange
 from freqtrade.exceptions import OperationalException
 from freqtrade.optimize.analysis.lookahead import Analysis, LookaheadAnalysis
 from freqtrade.optimize.analysis.lookahead_helpers import LookaheadAnalysisSubFunctions
+from freqtrade.optimize.base_analysis import VarHolder
 from tests.conftest import EXMS, get_args, log_has_re, patch_exchange
 
 
@@ -447,8 +451,58 @@ def test_initialize_single_lookahead_analysis(lookahead_conf, mocker, caplog):
     assert instance.strategy_obj["name"] == "strategy_test_v3_with_lookahead_bias"
 
 
+def test_lookahead_analysis_jobs(lookahead_conf, caplog):
+    strategy_obj = {"name": "strategy_test_v3_with_lookahead_bias"}
+    assert LookaheadAnalysis(lookahead_conf, strategy_obj)._analysis_jobs == 1
+
+    lookahead_conf["analysis_jobs"] = -1
+    assert LookaheadAnalysis(lookahead_conf, strategy_obj)._analysis_jobs == -1
+
+    lookahead_conf["freqai"] = {"enabled": True}
+    assert LookaheadAnalysis(lookahead_conf, strategy_obj)._analysis_jobs == 1
+    assert log_has_re("FreqAI strategies are analyzed without parallel jobs.", caplog)
+
+
+def test_lookahead_analysis_worker(lookahead_conf, mocker):
+    patch_exchange(mocker)
+    mocker.patch("freqtrade.data.history.get_timerange", get_timerange)
+    mocker.patch(f"{EXMS}.get_fee", return_value=0.0)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(
+        "freqtrade.plugins.pairlistmanager.PairListManager.whitelist",
+        PropertyMock(return_value=["UNITTEST/BTC"]),
+    )
+    lookahead_conf["pairs"] = ["UNITTEST/USDT"]
+    lookahead_conf["timeframe"] = "5m"
+    lookahead_conf["timerange"] = "20180119-20180122"
+
+    instance = LookaheadAnalysis(lookahead_conf, {"name": "strategy_test_v3_with_lookahead_bias"})
+    instance.fill_full_varholder()
+    # Real ccxt object - mocks can't be pickled
+    instance.exchange._api = ccxt.binance()
+
+    # Same as passing the worker to worker processes
+    worker = pickle.loads(pickle.dumps(instance._get_worker()))  # noqa: S301
+    assert worker.exchange is not instance.exchange
+    assert worker.exchange.markets == instance.exchange.markets
+
+    varholder = VarHolder()
+    varholder.from_dt = instance.full_varHolder.from_dt
+    varholder.to_dt = instance.full_varHolder.to_dt
+    prepared = worker._prepare_varholder(varholder, lookahead_conf["pairs"])
+    assert prepared.timerange == instance.full_varHolder.timerange
+    assert len(prepared.result["results"]) == len(instance.full_varHolder.result["results"]) > 0
+
+    # The exchange of the analysis is left intact
+    assert not instance.exchange.loop.is_closed()
+    with instance.exchange._loop_lock:
+        pass
+
+
 @pytest.mark.parametrize("scenario", ["no_bias", "bias1"])
-def test_biased_strategy(lookahead_conf, mocker, caplog, scenario) -> None:
+@pytest.mark.parametrize("analysis_jobs", [1, 2])
+def test_biased_strategy(lookahead_conf, mocker, caplog, scenario, analysis_jobs) -> None:
     patch_exchange(mocker)
     mocker.patch("freqtrade.data.history.get_timerange", get_timerange)
     mocker.patch(f"{EXMS}.get_fee", return_value=0.0)
@@ -470,9 +524,13 @@ def test_biased_strategy(lookahead_conf, mocker, caplog, scenario) -> None:
     )
 
     strategy_obj = {"name": "strategy_test_v3_with_lookahead_bias"}
+    lookahead_conf["analysis_jobs"] = analysis_jobs
     instance = LookaheadAnalysis(lookahead_conf, strategy_obj)
-    instance.start()
+    # Workers run in this process - mocks are not available in worker processes.
+    with parallel_config(backend="sequential"):
+        instance.start()
     # Assert init correct
+    assert log_has_re("Preparing .* backtests using", caplog) == (analysis_jobs > 1)
     assert log_has_re(f"Strategy Parameter: scenario = {scenario}", caplog)
 
     # check non-biased strategy
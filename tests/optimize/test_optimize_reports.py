@@ -21,9 +21,11 @@ from freqtrade.optimize.optimize_reports import (
     generate_backtest_stats,
     generate_daily_stats,
     generate_edge_table,
+    generate_hyperopt_epoch_stats,
     generate_pair_metrics,
     generate_periodic_breakdown_stats,
     generate_strategy_comparison,
+    generate_strategy_stats,
     generate_trading_stats,
     show_sorted_pairlist,
     store_backtest_analysis_results,
@@ -229,16 +231,16 @@ def test_generate_backtest_stats(default_conf, testdatadir, tmp_path):
 
     store_backtest_stats(filename, stats, "2022_01_01_15_05_13")
 
-    # get real Filename (it's btresult-<date>.json)
+    # get real Filename (it's btresult-<date>.zip)
     last_fn = get_latest_backtest_filename(filename_last.parent)
-    assert re.match(r"btresult-.*\.json", last_fn)
+    assert re.match(r"btresult-.*\.zip", last_fn)
 
     filename1 = tmp_path / last_fn
     assert filename1.is_file()
-    content = filename1.read_text()
-    assert "max_drawdown_account" in content
-    assert "strategy" in content
-    assert "pairlist" in content
+    content = load_backtest_stats(filename1)
+    assert content["strategy"]["DefStrat"]["max_drawdown_account"] == pytest.approx(1.399999e-08)
+    assert content["strategy"]["DefStrat"]["pairlist"] == ["UNITTEST/BTC"]
+    assert len(content["strategy"]["DefStrat"]["trades"]) == len(strat_stats["trades"])
 
     assert filename_last.is_file()
 
@@ -250,41 +252,48 @@ def test_store_backtest_stats(testdatadir, mocker):
     dump_mock = mocker.patch("freqtrade.optimize.optimize_reports.bt_storage.file_dump_json")
 
     data = {"metadata": {}, "strategy": {}, "strategy_comparison": []}
+    container_mock = mocker.patch(
+        "freqtrade.optimize.optimize_reports.bt_storage.store_backtest_container"
+    )
     store_backtest_stats(testdatadir, data, "2022_01_01_15_05_13")
 
-    assert dump_mock.call_count == 3
+    assert dump_mock.call_count == 2
+    assert container_mock.call_count == 1
     assert isinstance(dump_mock.call_args_list[0][0][0], Path)
     assert str(dump_mock.call_args_list[0][0][0]).startswith(str(testdatadir / "backtest-result"))
 
     dump_mock.reset_mock()
     filename = testdatadir / "testresult.json"
     store_backtest_stats(filename, data, "2022_01_01_15_05_13")
-    assert dump_mock.call_count == 3
+    assert dump_mock.call_count == 2
     assert isinstance(dump_mock.call_args_list[0][0][0], Path)
-    # result will be testdatadir / testresult-<timestamp>.json
+    # result will be testdatadir / testresult-<timestamp>.zip
     assert str(dump_mock.call_args_list[0][0][0]).startswith(str(testdatadir / "testresult"))
+    assert (
+        container_mock.call_args_list[1][0][0] == testdatadir / "testresult-2022_01_01_15_05_13.zip"
+    )
 
 
 def test_store_backtest_stats_real(tmp_path):
     data = {"metadata": {}, "strategy": {}, "strategy_comparison": []}
     store_backtest_stats(tmp_path, data, "2022_01_01_15_05_13")
 
-    assert (tmp_path / "backtest-result-2022_01_01_15_05_13.json").is_file()
+    assert (tmp_path / "backtest-result-2022_01_01_15_05_13.zip").is_file()
     assert (tmp_path / "backtest-result-2022_01_01_15_05_13.meta.json").is_file()
     assert not (tmp_path / "backtest-result-2022_01_01_15_05_13_market_change.feather").is_file()
     assert (tmp_path / LAST_BT_RESULT_FN).is_file()
     fn = get_latest_backtest_filename(tmp_path)
-    assert fn == "backtest-result-2022_01_01_15_05_13.json"
+    assert fn == "backtest-result-2022_01_01_15_05_13.zip"
 
     store_backtest_stats(tmp_path, data, "2024_01_01_15_05_25", market_change_data=pd.DataFrame())
-    assert (tmp_path / "backtest-result-2024_01_01_15_05_25.json").is_file()
+    assert (tmp_path / "backtest-result-2024_01_01_15_05_25.zip").is_file()
     assert (tmp_path / "backtest-result-2024_01_01_15_05_25.meta.json").is_file()
     assert (tmp_path / "backtest-result-2024_01_01_15_05_25_market_change.feather").is_file()
     assert (tmp_path / LAST_BT_RESULT_FN).is_file()
 
     # Last file reference should be updated
     fn = get_latest_backtest_filename(tmp_path)
-    assert fn == "backtest-result-2024_01_01_15_05_25.json"
+    assert fn == "backtest-result-2024_01_01_15_05_25.zip"
 
 
 def test_store_backtest_candles(testdatadir, mocker):
@@ -411,6 +420,40 @@ def test_generate_trading_stats(testdatadir):
     assert res["losses"] == 0
 
 
+@pytest.mark.parametrize("trades", [None, 0])
+def test_generate_hyperopt_epoch_stats(default_conf, testdatadir, trades):
+    default_conf.update({"strategy": CURRENT_TEST_STRATEGY})
+    StrategyResolver.load_strategy(default_conf)
+    bt_data = load_backtest_data(testdatadir / "backtest_results/backtest-result.json")
+    if trades is not None:
+        bt_data = bt_data.iloc[:trades]
+    content = {
+        "results": bt_data,
+        "config": default_conf,
+        "locks": [],
+        "final_balance": 1000.02,
+        "rejected_signals": 20,
+        "timedout_entry_orders": 0,
+        "timedout_exit_orders": 0,
+        "canceled_trade_entries": 0,
+        "canceled_entry_orders": 0,
+        "replaced_entry_orders": 0,
+        "backtest_start_time": dt_ts() // 1000,
+        "backtest_end_time": dt_ts() // 1000,
+    }
+    min_date = dt_utc(2018, 1, 10)
+    max_date = dt_utc(2018, 1, 30)
+    full = generate_strategy_stats(["ETH/BTC"], "DefStrat", content, min_date, max_date, 0.0)
+    lean = generate_hyperopt_epoch_stats("DefStrat", content)
+
+    assert "trades" not in lean
+    for key, value in lean.items():
+        assert full[key] == value, key
+    if trades is None:
+        assert lean["max_drawdown_abs"] > 0
+    assert generate_hyperopt_epoch_stats("DefStrat", {"results": []}) == {}
+
+
 def test_calc_streak(testdatadir):
     df = pd.DataFrame(
         {
@@ -4,6 +4,7 @@ from pathlib import Path
 from unittest.mock import MagicMock, PropertyMock
 
 import pytest
+from joblib import parallel_config
 
 from freqtrade.commands.optimize_commands import start_recursive_analysis
 from freqtrade.data.history import get_timerange
@@ -147,7 +148,8 @@ def test_initialize_single_recursive_analysis(recursive_conf, mocker, caplog):
 
 
 @pytest.mark.parametrize("scenario", ["no_bias", "bias1", "bias2"])
-def test_recursive_biased_strategy(recursive_conf, mocker, caplog, scenario) -> None:
+@pytest.mark.parametrize("analysis_jobs", [1, 2])
+def test_recursive_biased_strategy(recursive_conf, mocker, caplog, scenario, analysis_jobs) -> None:
     patch_exchange(mocker)
     mocker.patch(f"{EXMS}.get_fee", return_value=0.0)
     mocker.patch("freqtrade.data.history.get_timerange", get_timerange)
@@ -168,9 +170,13 @@ def test_recursive_biased_strategy(recursive_conf, mocker, caplog, scenario) ->
     )
 
     strategy_obj = {"name": "strategy_test_v3_recursive_issue"}
+    recursive_conf["analysis_jobs"] = analysis_jobs
     instance = RecursiveAnalysis(recursive_conf, strategy_obj)
-    instance.start()
+    # Workers run in this process - mocks are not available in worker processes.
+    with parallel_config(backend="sequential"):
+        instance.start()
     # Assert init correct
+    assert log_has_re("Preparing .* backtests using", caplog) == (analysis_jobs > 1)
     assert log_has_re(f"Strategy Parameter: scenario = {scenario}", caplog)
 
     if scenario == "bias2":
@@ -0,0 +1,133 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from freqtrade.persistence import ClosedTrade, ClosedTradeIndex, LocalTrade, Trade
+from tests.conftest import create_mock_trades
+
+
+def _closed_trade(trade_id, pair, close_date, profit_abs=1.0, exit_reason="roi"):
+    return ClosedTrade(
+        id=trade_id,
+        pair=pair,
+        is_short=False,
+        close_date=close_date,
+        close_profit=profit_abs / 100,
+        close_profit_abs=profit_abs,
+        exit_reason=exit_reason,
+    )
+
+
+def test_closed_trade_index():
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    index = ClosedTradeIndex(
+        [
+            _closed_trade(1, "ETH/USDT", start + timedelta(hours=2)),
+            _closed_trade(2, "XRP/USDT", start),
+        ]
+    )
+    # Out of order insert
+    index.add(_closed_trade(3, "ETH/USDT", start + timedelta(hours=1), profit_abs=-2.0))
+    assert len(index) == 3
+    assert [t.id for t in index.get_trades()] == [2, 3, 1]
+    assert [t.id for t in index.get_trades(pair="ETH/USDT")] == [3, 1]
+    assert index.get_trades(pair="ADA/USDT") == []
+    assert pytest.approx(index.total_profit) == 0.0
+
+    # Strictly closed after close_date
+    assert [t.id for t in index.get_trades(close_date=start)] == [3, 1]
+    assert [t.id for t in index.get_trades(pair="ETH/USDT", close_date=start)] == [3, 1]
+    assert index.get_trades(close_date=start + timedelta(hours=2)) == []
+    # Naive dates are UTC
+    assert [t.id for t in index.get_trades(close_date=datetime(2024, 1, 1, 1))] == [1]
+
+    # Replace a trade
+    index.remove(2)
+    index.add(_closed_trade(2, "XRP/USDT", start + timedelta(hours=3), profit_abs=5.0))
+    assert [t.id for t in index.get_trades()] == [3, 1, 2]
+    assert pytest.approx(index.total_profit) == 4.0
+
+    index.remove(3)
+    index.remove(55)
+    assert [t.id for t in index.get_trades()] == [1, 2]
+    assert index.get_trades(pair="ETH/USDT", close_date=start) == [index.get_trades()[0]]
+    assert pytest.approx(index.total_profit) == 6.0
+    assert index.get_trades()[0].trade_direction == "long"
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_closed_trade_index_write_through(fee, mocker):
+    create_mock_trades(fee)
+    closed = Trade.get_trades_proxy(is_open=False)
+    index = Trade.get_closed_trade_index()
+
+    assert {t.id for t in index.get_trades()} == {t.id for t in closed}
+    assert Trade.get_total_closed_profit() == pytest.approx(sum(t.close_profit_abs for t in closed))
+    assert all(t.close_date.tzinfo is not None for t in index.get_trades())
+
+    # Served from memory from now on
+    execute_mock = mocker.spy(Trade.session, "execute")
+    assert len(Trade.get_closed_trades()) == len(closed)
+    assert Trade.get_closed_trades(pair=closed[0].pair)[0].pair == closed[0].pair
+    assert execute_mock.call_count == 0
+
+    trade = Trade.get_trades_proxy(is_open=True)[0]
+    close_date = datetime.now(timezone.utc) + timedelta(hours=1)
+    trade.is_open = False
+    trade.close_date = close_date
+    trade.close_profit = 0.05
+    trade.close_profit_abs = 2.5
+    trade.exit_reason = "stop_loss"
+
+    # Flushed changes are visible (same as for queries) - until they're rolled back
+    Trade.session.flush()
+    assert trade.id in {t.id for t in Trade.get_closed_trades()}
+    Trade.rollback()
+    assert Trade._closed_trade_index is None
+    assert trade.id not in {t.id for t in Trade.get_closed_trades()}
+    index = Trade.get_closed_trade_index()
+
+    trade = Trade.get_trades_proxy(is_open=True)[0]
+    trade.is_open = False
+    trade.close_date = close_date
+    trade.close_profit = 0.05
+    trade.close_profit_abs = 2.5
+    trade.exit_reason = "stop_loss"
+    Trade.commit()
+    assert Trade.get_closed_trade_index() is index
+    recent = Trade.get_closed_trades(close_date=close_date - timedelta(minutes=1))
+    assert [(t.id, t.exit_reason, t.close_profit_abs) for t in recent] == [
+        (trade.id, "stop_loss", 2.5)
+    ]
+    assert Trade.get_total_closed_profit() == pytest.approx(
+        sum(t.close_profit_abs for t in closed) + 2.5
+    )
+
+    trade.delete()
+    assert Trade.get_closed_trades(close_date=close_date - timedelta(minutes=1)) == []
+    assert len(Trade.get_closed_trades()) == len(closed)
+
+
+@pytest.mark.parametrize("is_short", [False, True])
+def test_closed_trade_index_backtesting(fee, is_short):
+    Trade.use_db = False
+    Trade.reset_trades()
+    create_mock_trades(fee, is_short=is_short, use_db=False)
+    closed = LocalTrade.get_trades_proxy(is_open=False)
+    assert len(LocalTrade.bt_closed_index) == len(closed)
+
+    def key(trade):
+        return (trade.pair, trade.close_date, trade.close_profit_abs)
+
+    for trade in closed:
+        lookback = trade.close_date - timedelta(minutes=1)
+        expected = LocalTrade.get_trades_proxy(is_open=False, close_date=lookback)
+        assert sorted(map(key, Trade.get_closed_trades(close_date=lookback))) == sorted(
+            map(key, expected)
+        )
+        assert sorted(
+            map(key, Trade.get_closed_trades(pair=trade.pair, close_date=lookback))
+        ) == sorted(key(t) for t in expected if t.pair == trade.pair)
+    Trade.reset_trades()
+    assert Trade.get_closed_trades() == []
+    Trade.use_db = True
@@ -1946,6 +1946,56 @@ def test_get_best_pair(fee, is_short, pair, profit):
     assert res[1] == profit
 
 
+@pytest.mark.usefixtures("init_persistence")
+@pytest.mark.parametrize("is_short", [True, False, None])
+def test_get_closed_profit_aggregates(fee, is_short):
+    assert Trade.get_closed_profit_summary() == {
+        "trade_count": 0,
+        "winning_trades": 0,
+        "losing_trades": 0,
+        "profit_abs": 0.0,
+        "profit_ratio_sum": 0.0,
+        "winning_profit_abs": 0.0,
+        "losing_profit_abs": 0.0,
+    }
+    assert Trade.get_exit_reason_results() == {}
+
+    create_mock_trades_usdt(fee, is_short)
+    closed = Trade.get_trades_proxy(is_open=False)
+    wins = [t for t in closed if t.close_profit >= 0]
+    losses = [t for t in closed if t.close_profit < 0]
+    summary = Trade.get_closed_profit_summary()
+    assert summary["trade_count"] == len(closed)
+    assert summary["winning_trades"] == len(wins)
+    assert summary["losing_trades"] == len(losses) > 0
+    assert summary["profit_abs"] == pytest.approx(sum(t.close_profit_abs for t in closed))
+    assert summary["profit_ratio_sum"] == pytest.approx(sum(t.close_profit for t in closed))
+    assert summary["winning_profit_abs"] == pytest.approx(sum(t.close_profit_abs for t in wins))
+    assert summary["losing_profit_abs"] == pytest.approx(sum(t.close_profit_abs for t in losses))
+
+    latest = max(t.close_date for t in closed)
+    assert Trade.get_closed_profit_summary(latest)["trade_count"] == 1
+
+    results = Trade.get_exit_reason_results()
+    assert sum(r["wins"] + r["losses"] + r["draws"] for r in results.values()) == len(closed)
+    for exit_reason, result in results.items():
+        trades = [t for t in closed if t.exit_reason == exit_reason]
+        assert result["wins"] == len([t for t in trades if t.close_profit > 0])
+        assert result["losses"] == len([t for t in trades if t.close_profit < 0])
+
+    # Periods of 1 hour, newest first
+    now = dt_now()
+    periods = [(now - timedelta(hours=i + 1), now - timedelta(hours=i)) for i in range(4)]
+    per_period = Trade.get_closed_profit_per_period(periods)
+    assert len(per_period) == 4
+    for (start, end), (profit_abs, trade_count) in zip(periods, per_period):
+        trades = [t for t in closed if start <= t.close_date_utc < end]
+        assert trade_count == len(trades)
+        assert profit_abs == pytest.approx(sum(t.close_profit_abs for t in trades))
+    assert sum(count for _, count in per_period) > 0
+    assert Trade.get_closed_profit_per_period([]) == []
+
+
 @pytest.mark.usefixtures("init_persistence")
 def test_get_best_pair_lev(fee):
     res = Trade.get_best_pair()
@@ -2132,6 +2182,11 @@ def test_Trade_object_idem():
         "get_open_trades_without_assigned_fees",
         "get_trades",
         "get_trades_query",
+        "get_closed_trade_index",
+        "data_version",
+        "get_closed_profit_summary",
+        "get_exit_reason_results",
+        "get_closed_profit_per_period",
         "get_exit_reason_performance",
         "get_enter_tag_performance",
         "get_mix_tag_performance",
@@ -2145,6 +2200,7 @@ def test_Trade_object_idem():
         "bt_trades_open_pp",
         "bt_open_open_trade_count",
         "bt_total_profit",
+        "bt_closed_index",
         "from_json",
     )
 
@@ -0,0 +1,90 @@
+import sqlite3
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import text
+
+from freqtrade.exceptions import OperationalException
+from freqtrade.persistence import PairLocks, Trade, init_db, unit_of_work
+from freqtrade.util import dt_now
+from tests.conftest import create_mock_trades
+
+
+def _open_trade_ids(db_file):
+    # Separate connection - sees what a restarted bot would see after a crash.
+    with sqlite3.connect(db_file) as conn:
+        return {row[0] for row in conn.execute("SELECT id FROM trades WHERE is_open = 1")}
+
+
+def _lock_count(db_file):
+    with sqlite3.connect(db_file) as conn:
+        return conn.execute("SELECT count(*) FROM pairlocks").fetchone()[0]
+
+
+@pytest.fixture
+def file_db(tmp_path):
+    db_file = tmp_path / "tradesv3.sqlite"
+    init_db(f"sqlite:///{db_file}", sqlite_journal_mode="WAL", sqlite_synchronous="NORMAL")
+    PairLocks.timeframe = "5m"
+    yield db_file
+    Trade.session.remove()
+
+
+def test_init_db_sqlite_options(file_db):
+    assert Trade.session.execute(text("PRAGMA journal_mode")).scalar_one() == "wal"
+    # NORMAL
+    assert Trade.session.execute(text("PRAGMA synchronous")).scalar_one() == 1
+
+    with pytest.raises(OperationalException, match=r"Invalid sqlite journal mode"):
+        init_db("sqlite://", sqlite_journal_mode="WAL; DROP TABLE trades")
+    with pytest.raises(OperationalException, match=r"Invalid sqlite synchronous level"):
+        init_db("sqlite://", sqlite_synchronous="sometimes")
+
+
+def test_unit_of_work_crash_consistency(file_db, fee):
+    create_mock_trades(fee)
+    open_ids = _open_trade_ids(file_db)
+    trades = Trade.get_open_trades()
+    assert len(trades) == len(open_ids) == 4
+
+    with unit_of_work(Trade.session):
+        for trade in trades[:2]:
+            trade.is_open = False
+            trade.close_date = dt_now()
+            Trade.commit()
+        PairLocks.lock_pair("ETH/BTC", dt_now() + timedelta(minutes=10))
+        with unit_of_work(Trade.session):
+            trades[2].is_open = False
+            Trade.commit()
+
+        # Visible to queries of the bot ...
+        assert len(Trade.get_open_trades()) == 1
+        assert PairLocks.is_pair_locked("ETH/BTC")
+        # ... but not committed - a crash now keeps the state from before this unit of work.
+        assert _open_trade_ids(file_db) == open_ids
+        assert _lock_count(file_db) == 0
+
+    # All changes committed at once
+    assert _open_trade_ids(file_db) == {trades[3].id}
+    assert _lock_count(file_db) == 1
+
+
+def test_unit_of_work_exception(file_db, fee, mocker):
+    create_mock_trades(fee)
+    trades = Trade.get_open_trades()
+
+    with pytest.raises(ValueError, match=r"Something went wrong"):
+        with unit_of_work(Trade.session):
+            trades[0].is_open = False
+            Trade.commit()
+            raise ValueError("Something went wrong")
+
+    # Changes "committed" before the exception are stored - same as without unit of work.
+    assert trades[0].id not in _open_trade_ids(file_db)
+    assert len(_open_trade_ids(file_db)) == 3
+
+    # No commit without changes
+    commit_mock = mocker.patch.object(Trade.session, "commit")
+    with unit_of_work(Trade.session):
+        pass
+    assert commit_mock.call_count == 0
@@ -15,10 +15,11 @@ from freqtrade.data.dataprovider import DataProvider
 from freqtrade.enums import CandleType, RunMode
 from freqtrade.exceptions import OperationalException
 from freqtrade.persistence import LocalTrade, Trade
+from freqtrade.plugins.pairlist.IPairList import CandleRequest
 from freqtrade.plugins.pairlist.pairlist_helpers import dynamic_expand_pairlist, expand_pairlist
 from freqtrade.plugins.pairlistmanager import PairListManager
 from freqtrade.resolvers import PairListResolver
-from freqtrade.util.datetime_helpers import dt_now
+from freqtrade.util.datetime_helpers import dt_now, dt_ts, dt_utc
 from tests.conftest import (
     EXMS,
     create_mock_trades_usdt,
@@ -1269,6 +1270,81 @@ def test_VolatilityFilter_RangeStabilityFilter_sort(
     assert ohlcv_mock.call_count == 1
 
 
+def test_pairlistmanager_candle_planning(mocker, whitelist_conf, tickers, time_machine) -> None:
+    whitelist_conf["pairlists"] = [
+        {"method": "VolumePairList", "number_assets": 10},
+        {"method": "AgeFilter", "min_days_listed": 5},
+        {"method": "VolatilityFilter", "lookback_days": 3},
+        {"method": "RangeStabilityFilter", "lookback_days": 8},
+    ]
+    time_machine.move_to("2022-01-15 00:00:00+00:00")
+    pairs = ["ETH/BTC", "TKN/BTC", "LTC/BTC", "XRP/BTC", "HOT/BTC"]
+    ohlcv_data = {
+        (pair, "1d", CandleType.SPOT): generate_test_data(
+            "1d", 9, "2022-01-06 00:00:00+00:00", random_seed=seed
+        )
+        for seed, pair in enumerate(pairs)
+    }
+    ohlcv_mock = MagicMock(return_value=ohlcv_data)
+    mocker.patch.multiple(
+        EXMS,
+        exchange_has=MagicMock(return_value=True),
+        refresh_latest_ohlcv=ohlcv_mock,
+        get_tickers=tickers,
+    )
+    exchange = get_patched_exchange(mocker, whitelist_conf)
+    exchange.ohlcv_candle_limit = MagicMock(return_value=1000)
+    plm = PairListManager(exchange, whitelist_conf, MagicMock())
+    volatility_spy = mocker.spy(plm._pairlist_handlers[2], "_calculate_volatility")
+    range_spy = mocker.spy(plm._pairlist_handlers[3], "_calculate_rate_of_change")
+
+    plm.refresh_pairlist()
+    # All handlers share one download, starting at the earliest since_ms (RangeStabilityFilter)
+    assert ohlcv_mock.call_count == 1
+    assert ohlcv_mock.call_args[1]["since_ms"] == dt_ts(dt_utc(2022, 1, 6))
+    assert ohlcv_mock.call_args[1]["cache"] is False
+    assert ohlcv_mock.call_args[0][0] == [(p, "1d", CandleType.SPOT) for p in pairs[:4]]
+    assert plm._planned_candles == {}
+    # Each handler only sees its own lookback window
+    assert {len(c[0][1]) for c in volatility_spy.call_args_list} == {3}
+    assert {len(c[0][1]) for c in range_spy.call_args_list} == {9}
+    assert plm.whitelist == pairs[:4]
+
+
+def test_pairlistmanager_get_planned_candles(mocker, whitelist_conf) -> None:
+    mocker.patch(f"{EXMS}.exchange_has", MagicMock(return_value=True))
+    plm = PairListManager(get_patched_exchange(mocker, whitelist_conf), whitelist_conf)
+    df = generate_test_data("1d", 10, "2022-01-05 00:00:00+00:00")
+    plm._planned_candles = {
+        ("ETH/BTC", "1d", CandleType.SPOT): (dt_ts(dt_utc(2022, 1, 5)), df),
+        ("XRP/BTC", "1d", CandleType.SPOT): (dt_ts(dt_utc(2022, 1, 5)), None),
+    }
+    request = CandleRequest(
+        [
+            ("ETH/BTC", "1d", CandleType.SPOT),
+            ("XRP/BTC", "1d", CandleType.SPOT),
+            ("LTC/BTC", "1d", CandleType.SPOT),
+        ],
+        dt_ts(dt_utc(2022, 1, 10)),
+    )
+    candles = plm.get_planned_candles(request)
+    assert list(candles.keys()) == request.pairs[:2]
+    assert candles[("XRP/BTC", "1d", CandleType.SPOT)] is None
+    eth = candles[("ETH/BTC", "1d", CandleType.SPOT)]
+    assert len(eth) == 5
+    assert eth["date"].iloc[0] == dt_utc(2022, 1, 10)
+    assert eth.index[0] == 0
+
+    # Not planned pairs are downloaded by the handler
+    ohlcv_mock = mocker.patch(f"{EXMS}.refresh_latest_ohlcv", return_value={})
+    handler = plm._pairlist_handlers[0]
+    candles = handler._fetch_candles(request._replace(cache=False))
+    assert list(candles.keys()) == [("ETH/BTC", "1d", CandleType.SPOT)]
+    ohlcv_mock.assert_called_once_with(
+        [("LTC/BTC", "1d", CandleType.SPOT)], since_ms=request.since_ms, cache=False
+    )
+
+
 def test_ShuffleFilter_init(mocker, whitelist_conf, caplog) -> None:
     whitelist_conf["pairlists"] = [
         {"method": "StaticPairList"},
@@ -1,3 +1,4 @@
+import random
 from datetime import datetime, timedelta, timezone
 
 import pytest
@@ -155,3 +156,42 @@ def test_PairLocks_reason(use_db):
 
     PairLocks.reset_locks()
     PairLocks.use_db = True
+
+
+def test_PairLocks_backtesting_lookups():
+    PairLocks.timeframe = "5m"
+    PairLocks.use_db = False
+    PairLocks.reset_locks()
+    rng = random.Random(5)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    pairs = ["ETH/BTC", "XRP/BTC", "*"]
+    for i in range(300):
+        now = start + timedelta(minutes=5 * i)
+        PairLocks.lock_pair(
+            rng.choice(pairs),
+            now + timedelta(minutes=rng.randint(1, 120)),
+            f"reason{rng.randint(1, 3)}",
+            now=now,
+            side=rng.choice(["*", "long", "short"]),
+        )
+        if i % 50 == 0:
+            PairLocks.unlock_reason("reason1", now)
+
+    for i in range(0, 320, 7):
+        now = start + timedelta(minutes=5 * i)
+        for pair in pairs:
+            for side in ("*", "long", "short"):
+                expected = [
+                    lock
+                    for lock in PairLocks.locks
+                    if lock.lock_end_time >= now
+                    and lock.active is True
+                    and lock.pair == pair
+                    and (lock.side == "*" or lock.side == side)
+                ]
+                locks = PairLocks.get_pair_locks(pair, now, side)
+                assert sorted(locks, key=id) == sorted(expected, key=id)
+
+    PairLocks.reset_locks()
+    assert PairLocks.get_pair_locks("ETH/BTC", start) == []
+    PairLocks.use_db = True
@@ -35,6 +35,7 @@ from tests.conftest import (
     CURRENT_TEST_STRATEGY,
     EXMS,
     create_mock_trades,
+    create_mock_trades_usdt,
     get_mock_coro,
     get_patched_freqtradebot,
     log_has,
@@ -776,6 +777,57 @@ def test_api_trades(botclient, mocker, fee, markets, is_short):
     assert rc.json()["total_trades"] == 2
 
 
+def test_api_trades_keyset_fields_etag(botclient, mocker, fee, markets):
+    ftbot, client = botclient
+    patch_get_signal(ftbot)
+    mocker.patch.multiple(EXMS, markets=PropertyMock(return_value=markets))
+    create_mock_trades_usdt(fee)
+    closed_ids = sorted(t.id for t in Trade.get_trades_proxy(is_open=False))
+    assert len(closed_ids) >= 3
+
+    rc = client_get(client, f"{BASE_URI}/trades?limit=2&after_id=0")
+    assert_response(rc)
+    assert [t["trade_id"] for t in rc.json()["trades"]] == closed_ids[:2]
+    assert rc.json()["total_trades"] == len(closed_ids)
+    rc = client_get(client, f"{BASE_URI}/trades?limit=2&after_id={closed_ids[1]}")
+    assert [t["trade_id"] for t in rc.json()["trades"]] == closed_ids[2:4]
+    # Without limit - same order as the limited pages
+    rc = client_get(client, f"{BASE_URI}/trades?limit=0&after_id={closed_ids[0]}")
+    assert_response(rc)
+    assert [t["trade_id"] for t in rc.json()["trades"]] == closed_ids[1:]
+
+    rc = client_get(client, f"{BASE_URI}/trades?include_orders=false")
+    assert_response(rc)
+    assert "orders" not in rc.json()["trades"][0]
+    assert rc.json()["trades"][0]["pair"]
+
+    rc = client_get(client, f"{BASE_URI}/trades?fields=pair,%20profit_abs")
+    assert_response(rc)
+    assert set(rc.json()["trades"][0].keys()) == {"trade_id", "pair", "profit_abs"}
+
+    # ETag
+    rc = client_get(client, f"{BASE_URI}/trades")
+    etag = rc.headers["ETag"]
+    # Depends on the parameters
+    assert client_get(client, f"{BASE_URI}/trades?limit=1").headers["ETag"] != etag
+
+    headers = {"Authorization": _basic_auth_str(_TEST_USER, _TEST_PASS), "If-None-Match": etag}
+    rpc_mock = mocker.spy(RPC, "_rpc_trade_history")
+    rc = client.get(f"{BASE_URI}/trades", headers=headers)
+    assert rc.status_code == 304
+    assert rc.headers["ETag"] == etag
+    assert rpc_mock.call_count == 0
+
+    # Changed trades change the ETag
+    trade = Trade.get_trades_proxy(is_open=False)[0]
+    trade.exit_reason = "changed"
+    Trade.commit()
+    rc = client.get(f"{BASE_URI}/trades", headers=headers)
+    assert_response(rc, needs_cors=False)
+    assert rc.headers["ETag"] != etag
+    assert rpc_mock.call_count == 1
+
+
 @pytest.mark.parametrize("is_short", [True, False])
 def test_api_trade_single(botclient, mocker, fee, ticker, markets, is_short):
     ftbot, client = botclient
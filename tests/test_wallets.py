@@ -177,6 +177,27 @@ def test_get_trade_stake_amount_unlimited_amount(
     assert result == 0
 
 
+def test_get_trade_stake_amount_reserved(default_conf, mocker) -> None:
+    conf = deepcopy(default_conf)
+    conf["stake_amount"] = UNLIMITED_STAKE_AMOUNT
+    conf["dry_run_wallet"] = 100
+    conf["tradable_balance_ratio"] = 1.0
+    freqtrade = get_patched_freqtradebot(mocker, conf)
+    wallets = freqtrade.wallets
+
+    assert wallets.get_trade_stake_amount("ETH/USDT", 4) == 25
+    # Reserved stake counts as tied up - the split stays the same.
+    wallets.reserve_stake(25)
+    assert wallets.get_available_stake_amount() == 75
+    assert wallets.get_trade_stake_amount("LTC/USDT", 4) == 25
+    wallets.reserve_stake(70)
+    assert wallets.get_available_stake_amount() == 5
+    assert wallets.get_trade_stake_amount("XRP/USDT", 4) == 5
+
+    wallets.release_stake()
+    assert wallets.get_available_stake_amount() == 100
+
+
 @pytest.mark.parametrize(
     "stake_amount,min_stake,stake_available,max_stake,trade_amount,expected",
     [